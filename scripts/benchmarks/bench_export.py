@@ -0,0 +1,76 @@
+"""
+Export benchmark — times tokenizing and rendering a long court document.
+
+Builds a synthetic brief by repeating the sample-case complaint body until it
+reaches the requested number of lines, then reports tokenizer and renderer
+throughput for exporter._tokenize / exporter._render_tokens, and full
+export_text time with the python-docx and streaming backends.
+
+Usage (from scripts/):
+  python benchmarks/bench_export.py
+  python benchmarks/bench_export.py --lines 20000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ftc_engine import exporter  # noqa: E402
+from ftc_engine.drafter import generate_complaint  # noqa: E402
+
+
+def build_document(min_lines: int) -> str:
+    """Sample complaint with its body repeated to at least min_lines lines."""
+    case_path = Path(exporter.__file__).parent / "sample_case.json"
+    complaint = generate_complaint(json.loads(case_path.read_text()))
+    lines = complaint.split("\n")
+    body = lines[len(lines) // 4:]
+    out = list(lines)
+    while len(out) < min_lines:
+        out.extend(body)
+    return "\n".join(out)
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark DOCX export of long documents")
+    parser.add_argument("--lines", type=int, default=10000, help="Approximate document length in lines")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    text = build_document(args.lines)
+    n_lines = text.count("\n") + 1
+    tokens = exporter._tokenize(text)
+
+    t_tok = _best_of(args.repeat, lambda: exporter._tokenize(text))
+    t_render = _best_of(args.repeat, lambda: exporter._render_tokens(exporter._setup_document(), tokens))
+    t_total = _best_of(args.repeat, lambda: exporter._parse_and_render(exporter._setup_document(), text))
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / "bench.docx")
+        t_docx = _best_of(args.repeat, lambda: exporter.export_text(text, out))
+        t_stream = _best_of(args.repeat, lambda: exporter.export_text(text, out, stream=True))
+
+    print(f"  Document:   {n_lines:,} lines, {len(text):,} chars")
+    print(f"  Tokenize:   {t_tok * 1000:8.1f} ms  ({n_lines / t_tok:,.0f} lines/s)")
+    print(f"  Render:     {t_render * 1000:8.1f} ms")
+    print(f"  Total:      {t_total * 1000:8.1f} ms  ({n_lines / t_total:,.0f} lines/s)")
+    print(f"  Export:     {t_docx * 1000:8.1f} ms  (python-docx, incl. save)")
+    print(f"  Stream:     {t_stream * 1000:8.1f} ms  (streaming writer)")
+
+
+if __name__ == "__main__":
+    main()
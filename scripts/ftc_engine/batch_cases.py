@@ -0,0 +1,269 @@
+"""
+Batch Case Processing — Runs an analysis command over a JSONL stream of cases.
+
+Each input line is one case JSON object (blank lines are skipped). Each output
+line is one JSON result, written in input order (results are serialized as
+by `--format json`, see output.py):
+
+  {"line": 1, "case": "6:24-cv-01234", "command": "risk", "ok": true, "result": {...}}
+  {"line": 2, "case": null, "command": "risk", "ok": false, "error": "Invalid JSON: ..."}
+
+Cases are read lazily and at most a fixed window of them (twice the worker
+count) is in flight at once. A result is written as soon as it and every
+earlier result are done. Memory use is therefore bounded by the window, not
+the size of the input. A case that fails records its error and the rest of
+the stream carries on; if a worker process dies (e.g. killed for memory), the
+cases it had in flight are recorded as failed and a fresh pool takes over.
+
+Usage:
+  ftc risk --batch intake.jsonl --jsonl-out risk.jsonl
+  ftc analyze --batch intake.jsonl --jsonl-out results.jsonl --workers 4
+  cat intake.jsonl | ftc suggest --batch - > suggestions.jsonl
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from .output import to_data
+
+
+BATCH_COMMANDS = ("analyze", "suggest", "risk", "monitor", "calendar", "pacer")
+
+
+@dataclass
+class BatchSummary:
+    processed: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def cases_per_second(self) -> float:
+        return self.processed / self.seconds if self.seconds else 0.0
+
+
+# ── Per-command results ─────────────────────────────────────────────────────
+
+def _claim_keys(case_data: dict, options: dict) -> list[str]:
+    if options.get("claims"):
+        return [c.strip() for c in options["claims"].split(",") if c.strip()]
+    return case_data.get("claims_requested", [])
+
+
+def _analyze(case_data: dict, options: dict) -> dict:
+    """The data behind `ftc analyze`: jurisdiction, suggestions, risk and SOL."""
+    from .suggest import suggest_claims
+    from .risk import calculate_mtd_risk
+    from .sol import calculate_sol
+    from .drafter import analyze_jurisdiction
+
+    suggestions = suggest_claims(case_data)
+    claims = case_data.get("claims_requested", [])
+    if not claims or claims == ["auto_suggest"]:
+        claims = [s.claim_key for s in suggestions[:3] if not s.showstoppers]
+
+    sol = {}
+    injury_date = case_data.get("limitations", {}).get("key_dates", {}).get("injury_date")
+    if injury_date:
+        for ck in claims:
+            try:
+                sol[ck] = calculate_sol(ck, injury_date)
+            except Exception as e:
+                sol[ck] = {"error": str(e)}
+
+    return {
+        "jurisdiction": analyze_jurisdiction(case_data, suggestions),
+        "suggestions": suggestions,
+        "risk_scores": {ck: calculate_mtd_risk(case_data, ck) for ck in claims},
+        "sol": sol,
+    }
+
+
+def _suggest(case_data: dict, options: dict):
+    from .suggest import suggest_claims
+    max_results = options.get("max")
+    return suggest_claims(case_data, max_results if max_results is not None else 10)
+
+
+def _risk(case_data: dict, options: dict):
+    from .risk import calculate_mtd_risk
+    return {ck: calculate_mtd_risk(case_data, ck) for ck in _claim_keys(case_data, options)}
+
+
+def _monitor(case_data: dict, options: dict):
+    from .rule11_monitor import generate_monitor_report
+    claim_keys = _claim_keys(case_data, options) if options.get("claims") else None
+    return generate_monitor_report(case_data, claim_keys=claim_keys, mode=options.get("mode", "offline"),
+                                   source=options.get("source"))
+
+
+def _calendar(case_data: dict, options: dict):
+    from .filing_calendar import generate_filing_calendar
+    return generate_filing_calendar(
+        case_data,
+        filing_date_str=options.get("filing_date"),
+        district_code=options.get("district"),
+    )
+
+
+def _pacer(case_data: dict, options: dict):
+    from .pacer_meta import generate_filing_package
+    return generate_filing_package(case_data)
+
+
+_HANDLERS: dict[str, Callable[[dict, dict], Any]] = {
+    "analyze": _analyze,
+    "suggest": _suggest,
+    "risk": _risk,
+    "monitor": _monitor,
+    "calendar": _calendar,
+    "pacer": _pacer,
+}
+
+
+def command_result(command: str, case_data: dict, options: dict | None = None) -> Any:
+    """Run an analysis command on one case and return its result objects.
+
+    This is what `--batch` writes per line and what `--format json` emits for
+    a single case (after output.to_data()).
+    """
+    return _HANDLERS[command](case_data, options or {})
+
+
+def _case_label(case_data: dict) -> str | None:
+    return case_data.get("case_number") or case_data.get("case_name") or None
+
+
+def process_line(command: str, options: dict, line_no: int, line: str) -> tuple[bool, str]:
+    """Run one command on one JSONL case line.
+
+    Returns (ok, result line). Never raises: bad input and engine errors
+    become {"ok": false, "error": ...}.
+    """
+    record = {"line": line_no, "case": None, "command": command}
+    try:
+        case_data = json.loads(line)
+    except json.JSONDecodeError as e:
+        return False, json.dumps({**record, "ok": False, "error": f"Invalid JSON: {e}"})
+    if not isinstance(case_data, dict):
+        return False, json.dumps({**record, "ok": False, "error": "Case must be a JSON object"})
+
+    record["case"] = _case_label(case_data)
+    try:
+        result = to_data(command_result(command, case_data, options))
+    except Exception as e:
+        return False, json.dumps({**record, "ok": False, "error": f"{type(e).__name__}: {e}"})
+    return True, json.dumps({**record, "ok": True, "result": result}, ensure_ascii=False)
+
+
+def _worker_died(command: str, options: dict, line_no: int, line: str) -> tuple[bool, str]:
+    """Result for a case whose worker process died before answering."""
+    try:
+        case = _case_label(json.loads(line))
+    except (json.JSONDecodeError, AttributeError):
+        case = None
+    return False, json.dumps({"line": line_no, "case": case, "command": command, "ok": False,
+                              "error": "Worker process died while processing this case"})
+
+
+# ── Streaming ───────────────────────────────────────────────────────────────
+
+def iter_case_lines(stream: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Yield (line number, text) for every non-blank line."""
+    for line_no, line in enumerate(stream, 1):
+        if line.strip():
+            yield line_no, line
+
+
+def _ordered_map(submit: Callable, items: Iterator, window: int,
+                 on_broken: Callable | None = None) -> Iterator:
+    """Submit items with at most `window` in flight; yield results in order.
+
+    If the executor breaks, an unfinished item yields on_broken(*item) instead
+    of raising BrokenExecutor (when on_broken is given).
+    """
+    from concurrent.futures import BrokenExecutor
+
+    def result(item, future):
+        try:
+            return future.result()
+        except BrokenExecutor:
+            if on_broken is None:
+                raise
+            return on_broken(*item)
+
+    pending: deque = deque()
+    for item in items:
+        pending.append((item, submit(*item)))
+        if len(pending) >= window:
+            yield result(*pending.popleft())
+    while pending:
+        yield result(*pending.popleft())
+
+
+def run_batch(command: str, source: IO[str], out: IO[str], options: dict | None = None,
+              workers: int | None = None) -> BatchSummary:
+    """Process every case in a JSONL stream and write JSONL results in input order.
+
+    Args:
+        command: One of BATCH_COMMANDS
+        source: Text stream of case JSON lines
+        out: Text stream the result lines are written to
+        options: Command options (claims, max, mode, source, filing_date, district)
+        workers: Worker processes (default: CPU count); 1 runs in this process
+
+    Raises:
+        ValueError: Unknown command
+    """
+    if command not in _HANDLERS:
+        raise ValueError(f"Batch mode supports {', '.join(BATCH_COMMANDS)}, not '{command}'")
+    options = options or {}
+    workers = max(1, workers or os.cpu_count() or 1)
+    summary = BatchSummary(workers=workers)
+    start = time.perf_counter()
+    lines = ((command, options, line_no, text) for line_no, text in iter_case_lines(source))
+
+    def emit(ok: bool, result_line: str) -> None:
+        out.write(result_line + "\n")
+        summary.processed += 1
+        summary.failed += not ok
+
+    if workers == 1:
+        for item in lines:
+            emit(*process_line(*item))
+    else:
+        from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers)
+
+        def submit(*item):
+            nonlocal pool
+            try:
+                return pool.submit(process_line, *item)
+            except BrokenExecutor:  # a worker died; its cases in flight are reported failed
+                pool.shutdown()
+                pool = ProcessPoolExecutor(max_workers=workers)
+                return pool.submit(process_line, *item)
+
+        try:
+            for result in _ordered_map(submit, lines, workers * 2, _worker_died):
+                emit(*result)
+        finally:
+            pool.shutdown()
+
+    out.flush()
+    summary.seconds = time.perf_counter() - start
+    return summary
+
+
+def format_batch_summary(summary: BatchSummary, destination: str) -> str:
+    """One-line summary for the CLI."""
+    text = (f"{summary.processed} case(s) processed in {summary.seconds:.2f}s with "
+            f"{summary.workers} worker(s) — {summary.cases_per_second:.1f} cases/s -> {destination}")
+    if summary.failed:
+        text += f"\n{summary.failed} case(s) failed"
+    return text
@@ -0,0 +1,232 @@
+"""
+Batch Export — Export many documents in one run across a process pool.
+
+Each job is a template, text file, or complaint draft plus an optional case
+and an output path. Jobs run in worker processes that import python-docx and
+build the base document once, so the per-file cost is just rendering.
+A failing job records its error and the rest of the batch carries on.
+
+Manifest format (paths are relative to the manifest file):
+
+  {
+    "jobs": [
+      {"template": "motions/motion_to_dismiss", "case": "smith/case.json", "output": "out/mtd.docx"},
+      {"text": "appendix.md", "output": "out/appendix.docx", "stream": true},
+      {"draft": true, "case": "smith/case.json", "output": "out/complaint.docx"}
+    ]
+  }
+
+A bare JSON list of jobs is accepted too.
+
+Usage:
+  ftc export --batch manifest.json
+  ftc export --batch manifest.json --workers 4
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+
+@dataclass
+class ExportJob:
+    kind: str                   # "template" | "text" | "draft"
+    output: str
+    source: str = ""            # template name or text file path
+    case: str | dict = ""       # case JSON path or inline case data
+    stream: bool = False
+
+
+@dataclass
+class BatchJobResult:
+    index: int
+    output_path: str
+    ok: bool
+    seconds: float
+    error: str = ""
+    sections: int = 0
+    unknown_placeholders: list[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchReport:
+    results: list[BatchJobResult]
+    total_seconds: float
+    workers: int
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.succeeded / self.total_seconds if self.total_seconds else 0.0
+
+
+# ── Manifest ────────────────────────────────────────────────────────────────
+
+def _resolve(base: Path, value: str) -> str:
+    path = Path(value).expanduser()
+    return str(path if path.is_absolute() else base / path)
+
+
+def parse_job(spec: dict, base_dir: Path) -> ExportJob:
+    """Build an ExportJob from one manifest entry.
+
+    Raises:
+        ValueError: The entry isn't an object, or names no source or no output
+    """
+    if not isinstance(spec, dict):
+        raise ValueError(f"Job must be an object, not {type(spec).__name__}: {spec!r}")
+    output = spec.get("output")
+    if not output:
+        raise ValueError(f"Job is missing 'output': {spec}")
+    if not isinstance(output, str):
+        raise ValueError(f"Job 'output' must be a path: {spec}")
+    case = spec.get("case", "")
+    if isinstance(case, str) and case:
+        case = _resolve(base_dir, case)
+    stream = bool(spec.get("stream", False))
+    output = _resolve(base_dir, output)
+
+    if spec.get("template"):
+        return ExportJob("template", output, spec["template"], case, stream)
+    if spec.get("text"):
+        return ExportJob("text", output, _resolve(base_dir, spec["text"]), case, stream)
+    if spec.get("draft"):
+        if not case:
+            raise ValueError(f"Draft job needs a 'case': {spec}")
+        return ExportJob("draft", output, "", case, stream)
+    raise ValueError(f"Job needs one of 'template', 'text' or 'draft': {spec}")
+
+
+def load_manifest(path: str) -> list[ExportJob]:
+    """Read a batch manifest into jobs.
+
+    Raises:
+        ValueError: Malformed manifest or job entry
+    """
+    manifest_path = Path(path)
+    try:
+        data = json.loads(manifest_path.read_text())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {path}: {e}")
+    specs = data.get("jobs", []) if isinstance(data, dict) else data
+    if not isinstance(specs, list):
+        raise ValueError(f"Manifest {path} must hold a list of jobs")
+    base_dir = manifest_path.resolve().parent
+    jobs = []
+    for i, spec in enumerate(specs, 1):
+        try:
+            jobs.append(parse_job(spec, base_dir))
+        except ValueError as e:
+            raise ValueError(f"Job {i} in {path}: {e}") from e
+    return jobs
+
+
+# ── Execution ───────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=64)
+def _load_case_file(path: str) -> str:
+    return Path(path).read_text()
+
+
+def _case_data(case: str | dict) -> dict:
+    if isinstance(case, dict):
+        return case
+    if not case:
+        return {}
+    return json.loads(_load_case_file(case))
+
+
+def _warm_worker() -> None:
+    """Import python-docx and build the default base document once per worker."""
+    from .exporter import _base_document_bytes
+    _base_document_bytes()
+
+
+def run_job(index: int, job: ExportJob) -> BatchJobResult:
+    """Run one export job, capturing any error instead of raising."""
+    from .exporter import export_draft, export_template, export_text
+
+    start = time.perf_counter()
+    try:
+        Path(job.output).parent.mkdir(parents=True, exist_ok=True)
+        if job.kind == "template":
+            result = export_template(job.source, _case_data(job.case), job.output, stream=job.stream)
+        elif job.kind == "text":
+            result = export_text(Path(job.source).read_text(), job.output, stream=job.stream)
+        else:
+            result = export_draft(_case_data(job.case), job.output, stream=job.stream)
+    except Exception as e:
+        return BatchJobResult(index, job.output, False, time.perf_counter() - start,
+                              error=f"{type(e).__name__}: {e}")
+    return BatchJobResult(
+        index, job.output, True, time.perf_counter() - start,
+        sections=result.sections,
+        unknown_placeholders=list(result.unknown_placeholders),
+    )
+
+
+def export_batch(jobs: list[ExportJob], workers: int | None = None) -> BatchReport:
+    """Export every job, in parallel across worker processes.
+
+    Args:
+        jobs: Jobs to run
+        workers: Worker processes (default: CPU count, capped at the job
+                 count); 1 runs the batch in this process
+
+    Returns:
+        BatchReport with one result per job, in job order
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    start = time.perf_counter()
+
+    if workers == 1:
+        results = [run_job(i, job) for i, job in enumerate(jobs)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as pool:
+            futures = [pool.submit(run_job, i, job) for i, job in enumerate(jobs)]
+            results = []
+            for i, (job, future) in enumerate(zip(jobs, futures)):
+                try:
+                    results.append(future.result())
+                except Exception as e:  # worker died (e.g. killed, out of memory)
+                    results.append(BatchJobResult(i, job.output, False, 0.0,
+                                                  error=f"{type(e).__name__}: {e}"))
+
+    return BatchReport(results=results, total_seconds=time.perf_counter() - start, workers=workers)
+
+
+# ── Formatting ──────────────────────────────────────────────────────────────
+
+def format_batch_report(report: BatchReport) -> str:
+    """Format a batch export report for CLI output."""
+    lines = []
+    lines.append(f"  {'#':>4}  {'Status':<7} {'Time':>7}  {'Output'}")
+    lines.append("  " + "-" * 76)
+    for r in report.results:
+        status = "OK" if r.ok else "FAILED"
+        lines.append(f"  {r.index + 1:>4}  {status:<7} {r.seconds:>6.2f}s  {r.output_path}")
+        if r.error:
+            lines.append(f"              {r.error}")
+        if r.unknown_placeholders:
+            keys = ", ".join("{{" + k + "}}" for k in r.unknown_placeholders)
+            lines.append(f"              unknown placeholders: {keys}")
+    lines.append("  " + "-" * 76)
+    lines.append(
+        f"  {report.succeeded}/{len(report.results)} exported in {report.total_seconds:.2f}s "
+        f"with {report.workers} worker(s) — {report.docs_per_second:.1f} docs/s"
+    )
+    if report.failed:
+        lines.append(f"  {report.failed} job(s) failed")
+    return "\n".join(lines)
@@ -0,0 +1,189 @@
+"""
+Bates Ledger — Persistent per-case Bates numbering keyed by document hash.
+
+Every document produced in a case gets a contiguous range of Bates numbers,
+one per page, recorded in ~/.ftc/cases/<case>/bates_ledger.json against the
+document's SHA-256. Re-scanning the same documents returns the same ranges,
+new documents are appended after the last number used, and a reordered or
+partially re-produced set keeps its original numbers. Each Bates prefix
+(e.g. one per producing party) is its own series.
+
+A sorted index of range starts answers "which document holds SMITH-004213?"
+with a binary search.
+
+Usage:
+  ftc exhibits -i case.json --scan ./production/ --numbering bates --prefix SMITH --case 6:24-cv-01234
+  ftc exhibits --case 6:24-cv-01234 --bates-lookup SMITH-004213
+"""
+from __future__ import annotations
+
+import json
+import os
+from bisect import bisect_right
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+
+from . import case_manager
+
+
+LEDGER_FILENAME = "bates_ledger.json"
+
+
+@dataclass
+class BatesAllocation:
+    prefix: str
+    start: int
+    end: int
+    sha256: str
+    pages: int = 0          # 0 if unknown (allocated one number)
+    source_file: str = ""
+    production: str = ""    # date (or label) of the production that first allocated it
+
+    @property
+    def bates_range(self) -> str:
+        return f"{bates_label(self.start, self.prefix)} to {bates_label(self.end, self.prefix)}"
+
+
+def bates_label(number: int, prefix: str = "") -> str:
+    """A Bates number as printed, e.g. SMITH-000042 (prefix EX if none)."""
+    return f"{prefix or 'EX'}-{number:06d}"
+
+
+def parse_bates_label(label: str) -> tuple[str, int]:
+    """Split "SMITH-004213" into ("SMITH", 4213).
+
+    Raises:
+        ValueError: Not a PREFIX-NUMBER label
+    """
+    prefix, _, number = label.strip().rpartition("-")
+    if not prefix or not number.isdigit():
+        raise ValueError(f"Invalid Bates number '{label}' (expected PREFIX-NUMBER, e.g. SMITH-000042)")
+    return prefix, int(number)
+
+
+def ledger_path(case_number: str) -> Path:
+    return case_manager.get_case_path(case_number) / LEDGER_FILENAME
+
+
+class BatesLedger:
+    """Bates allocations for one case, with a sorted range index per prefix."""
+
+    def __init__(self, path: Path | None = None, allocations: list[BatesAllocation] | None = None):
+        self.path = path
+        self.modified = False  # allocations added since load
+        self._series: dict[str, list[BatesAllocation]] = {}  # prefix -> allocations by start
+        self._starts: dict[str, list[int]] = {}
+        self._by_hash: dict[tuple[str, str], BatesAllocation] = {}
+        for a in sorted(allocations or [], key=lambda a: (a.prefix, a.start)):
+            self._add(a)
+
+    @classmethod
+    def load(cls, path: Path) -> "BatesLedger":
+        """Read a ledger file; a missing file is an empty ledger.
+
+        Raises:
+            ValueError: The file exists but isn't a readable ledger. Bates
+                numbers can't be re-derived, so it is never silently reset.
+        """
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != 1:
+                raise ValueError(f"unsupported version {data.get('version')!r}")
+            allocations = [BatesAllocation(**a) for a in data["allocations"]]
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Bates ledger {path} is unreadable: {e}") from e
+        return cls(path, allocations)
+
+    @classmethod
+    def for_case(cls, case_number: str) -> "BatesLedger":
+        return cls.load(ledger_path(case_number))
+
+    def save(self) -> None:
+        """Write the ledger atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({
+            "version": 1,
+            "allocations": [asdict(a) for a in self],
+        }, indent=1) + "\n")
+        tmp.replace(self.path)
+        self.modified = False
+
+    def _add(self, allocation: BatesAllocation) -> None:
+        series = self._series.setdefault(allocation.prefix, [])
+        if series and allocation.start <= series[-1].end:
+            raise ValueError(f"Overlapping Bates ranges at {bates_label(allocation.start, allocation.prefix)}")
+        series.append(allocation)
+        self._starts.setdefault(allocation.prefix, []).append(allocation.start)
+        self._by_hash[(allocation.prefix, allocation.sha256)] = allocation
+
+    def __iter__(self):
+        for prefix in sorted(self._series):
+            yield from self._series[prefix]
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def next_number(self, prefix: str = "") -> int:
+        series = self._series.get(prefix or "EX")
+        return series[-1].end + 1 if series else 1
+
+    def get(self, sha256: str, prefix: str = "") -> BatesAllocation | None:
+        return self._by_hash.get((prefix or "EX", sha256))
+
+    def allocate(self, sha256: str, pages: int, prefix: str = "", source_file: str = "",
+                 production: str = "") -> BatesAllocation:
+        """The document's Bates range, allocating the next free range if it has none.
+
+        Args:
+            sha256: Document content hash (the ledger key)
+            pages: Page count; documents of unknown length get one number
+            production: Label recorded for new allocations (default: today)
+        """
+        prefix = prefix or "EX"
+        existing = self._by_hash.get((prefix, sha256))
+        if existing:
+            return existing
+        start = self.next_number(prefix)
+        allocation = BatesAllocation(
+            prefix=prefix,
+            start=start,
+            end=start + max(pages, 1) - 1,
+            sha256=sha256,
+            pages=pages,
+            source_file=source_file,
+            production=production or str(date.today()),
+        )
+        self._add(allocation)
+        self.modified = True
+        return allocation
+
+    def lookup(self, label: str) -> BatesAllocation | None:
+        """The document holding a Bates number such as "SMITH-004213".
+
+        Raises:
+            ValueError: Not a PREFIX-NUMBER label
+        """
+        prefix, number = parse_bates_label(label)
+        starts = self._starts.get(prefix, [])
+        i = bisect_right(starts, number) - 1
+        if i < 0:
+            return None
+        allocation = self._series[prefix][i]
+        return allocation if number <= allocation.end else None
+
+
+def format_lookup(label: str, allocation: BatesAllocation | None) -> str:
+    if allocation is None:
+        return f"{label}: not allocated in this case's Bates ledger"
+    page = parse_bates_label(label)[1] - allocation.start + 1
+    lines = [f"{label}: page {page} of {allocation.source_file or allocation.sha256[:12]}",
+             f"  Range:      {allocation.bates_range} ({allocation.pages or '?'} page(s))",
+             f"  SHA-256:    {allocation.sha256}"]
+    if allocation.production:
+        lines.append(f"  Production: {allocation.production}")
+    return "\n".join(lines)
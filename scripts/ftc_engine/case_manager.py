@@ -5,13 +5,19 @@ Stores cases at ~/.ftc/cases/<case_number>/ with:
   case.json   — Master case data (same schema as sample_case.json)
   state.json  — Workflow state: current step, completed steps, timestamps
   intake_docs/ — User-provided documents for research
-  output/     — Generated documents (complaint, calendar, etc.)
+  output/     — Generated documents (complaint, calendar, etc.), plus
+                .fingerprints.json recording the inputs each was built from
+
+and a portfolio-level case index at ~/.ftc/cases/.index.json holding the few
+fields cross-case tools need (name, district, injury date, claims), so they
+can avoid re-parsing every case.json.
 
 Usage:
   from ftc_engine.case_manager import create_case, open_case, list_cases
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import shutil
 from dataclasses import dataclass, field, asdict
@@ -45,6 +51,9 @@ WORKFLOW_STEPS: list[tuple[str, str]] = [
 
 STEP_KEYS = [s[0] for s in WORKFLOW_STEPS]
 
+INDEX_FILENAME = ".index.json"
+FINGERPRINTS_FILENAME = ".fingerprints.json"
+
 
 # ── Dataclasses ─────────────────────────────────────────────────────────────
 
@@ -189,10 +198,95 @@ def delete_case(case_number: str) -> bool:
     case_path = get_case_path(case_number)
     if case_path.exists():
         shutil.rmtree(case_path)
+        _remove_from_index(case_number)
+        from .sol_watch import remove_case_from_watchlist
+        remove_case_from_watchlist(case_number)
         return True
     return False
 
 
+# ── Case index ──────────────────────────────────────────────────────────────
+
+def _index_path() -> Path:
+    return CASES_DIR / INDEX_FILENAME
+
+
+def _index_entry(case_number: str, case_data: dict, mtime_ns: int) -> dict:
+    """Summarize the case fields portfolio tools need."""
+    court = case_data.get("court", {})
+    return {
+        "case_number": case_number,
+        "case_name": _extract_case_name(case_data),
+        "district": court.get("district", ""),
+        "injury_date": case_data.get("limitations", {}).get("key_dates", {}).get("injury_date", ""),
+        "claims": list(case_data.get("claims_requested", [])),
+        "filing_date": case_data.get("filing_date", ""),
+        "mtime_ns": mtime_ns,
+    }
+
+
+def _read_index() -> dict[str, dict]:
+    path = _index_path()
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text()).get("cases", {})
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def _write_index(entries: dict[str, dict]) -> None:
+    path = _index_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"version": 1, "cases": entries}, indent=2) + "\n")
+
+
+def _update_index(case_number: str, case_data: dict, mtime_ns: int) -> dict:
+    entries = _read_index()
+    entry = _index_entry(case_number, case_data, mtime_ns)
+    entries[_sanitize_case_number(case_number)] = entry
+    _write_index(entries)
+    return entry
+
+
+def _remove_from_index(case_number: str) -> None:
+    entries = _read_index()
+    if entries.pop(_sanitize_case_number(case_number), None) is not None:
+        _write_index(entries)
+
+
+def load_case_index() -> dict[str, dict]:
+    """Return the case index, keyed by case folder name.
+
+    Entries are reused as long as the case.json modification time still
+    matches; only new or changed cases are re-parsed. Cases deleted outside
+    the engine are dropped.
+    """
+    if not CASES_DIR.exists():
+        return {}
+
+    entries = _read_index()
+    fresh: dict[str, dict] = {}
+    changed = False
+
+    for folder in sorted(CASES_DIR.iterdir()):
+        if not folder.is_dir() or not (folder / "state.json").exists():
+            continue
+        case_file = folder / "case.json"
+        mtime_ns = case_file.stat().st_mtime_ns if case_file.exists() else 0
+        entry = entries.get(folder.name)
+        if entry is None or entry.get("mtime_ns") != mtime_ns:
+            state_data = json.loads((folder / "state.json").read_text())
+            case_data = json.loads(case_file.read_text()) if case_file.exists() else {}
+            entry = _index_entry(state_data.get("case_number", folder.name), case_data, mtime_ns)
+            changed = True
+        fresh[folder.name] = entry
+
+    if changed or fresh.keys() != entries.keys():
+        _write_index(fresh)
+    return fresh
+
+
 # ── State management ────────────────────────────────────────────────────────
 
 def save_state(state: CaseState) -> None:
@@ -211,6 +305,10 @@ def save_case_data(case_number: str, case_data: dict) -> Path:
     case_path.mkdir(parents=True, exist_ok=True)
     out = case_path / "case.json"
     out.write_text(json.dumps(case_data, indent=2) + "\n")
+
+    entry = _update_index(case_number, case_data, out.stat().st_mtime_ns)
+    from .sol_watch import update_watchlist_for_case
+    update_watchlist_for_case(entry)
     return out
 
 
@@ -335,4 +433,72 @@ def list_outputs(case_number: str) -> list[str]:
     out_dir = get_case_path(case_number) / "output"
     if not out_dir.exists():
         return []
-    return [str(f.relative_to(out_dir)) for f in out_dir.rglob("*") if f.is_file()]
+    return [str(f.relative_to(out_dir)) for f in out_dir.rglob("*")
+            if f.is_file() and not f.name.startswith(".")]
+
+
+# ── Output fingerprints ─────────────────────────────────────────────────────
+
+def output_fingerprint(case_data: dict, fields: tuple[str, ...] | None = None, extra: str = "") -> str:
+    """Hash of the case-data fields an output is built from, plus the engine version.
+
+    Args:
+        case_data: The case JSON data
+        fields: Top-level case fields the output reads (None = the whole case)
+        extra: Any other input, e.g. today's date for date-relative reports
+    """
+    from . import __version__
+
+    inputs = case_data if fields is None else {f: case_data.get(f) for f in fields}
+    payload = json.dumps({"engine": __version__, "inputs": inputs, "extra": extra},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _fingerprints_path(case_number: str) -> Path:
+    return get_case_path(case_number) / "output" / FINGERPRINTS_FILENAME
+
+
+def load_output_fingerprints(case_number: str) -> dict[str, dict]:
+    """Recorded outputs by doc type: {"fingerprint", "files", "generated"}."""
+    path = _fingerprints_path(case_number)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text()).get("outputs", {})
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def record_outputs(case_number: str, outputs: dict[str, tuple[str, list[str]]]) -> None:
+    """Record the fingerprint and files of freshly generated outputs.
+
+    Args:
+        outputs: doc type -> (fingerprint, output file names)
+    """
+    if not outputs:
+        return
+    recorded = load_output_fingerprints(case_number)
+    stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    for doc_type, (fingerprint, files) in outputs.items():
+        recorded[doc_type] = {"fingerprint": fingerprint, "files": sorted(files), "generated": stamp}
+    path = _fingerprints_path(case_number)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"version": 1, "outputs": recorded}, indent=2) + "\n")
+
+
+def output_is_current(case_number: str, doc_type: str, fingerprint: str,
+                      files: list[str], recorded: dict[str, dict] | None = None) -> bool:
+    """True if an output was generated from the same inputs and its files still exist.
+
+    Args:
+        files: Output file names the caller needs (e.g. the .md and .docx)
+        recorded: Preloaded load_output_fingerprints() result
+    """
+    if recorded is None:
+        recorded = load_output_fingerprints(case_number)
+    entry = recorded.get(doc_type)
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    out_dir = get_case_path(case_number) / "output"
+    return all(name in entry.get("files", []) and (out_dir / name).exists() for name in files)
@@ -0,0 +1,341 @@
+"""
+Case-Law Mirror — Local SQLite full-text corpus of opinions for offline
+viability checks.
+
+A drop-in replacement for CourtListener in online monitor mode, for machines
+with no outbound network. Opinions are loaded from bulk exports into
+~/.ftc/caselaw/opinions.db (or $FTC_CASELAW_DB): a plain table indexed by
+(court, date_filed), plus an FTS5 index over case names and opinion text.
+
+A claim's search asks the same question as the CourtListener query (same
+terms, courts, date cutoff and result count; see courtlistener.py) and
+returns results in the CourtListener search-response shape, so the monitor
+turns them into the same ViabilityIssues.
+
+Import accepts JSON Lines, JSON arrays (e.g. saved search responses with a
+"results" list) and CSV, optionally gzipped. Column names follow
+CourtListener's bulk data and API: case_name/caseName, court/court_id,
+date_filed/dateFiled, plain_text/text/snippet, citation, absolute_url, and
+cluster_id or id for de-duplication (re-importing updates in place). The
+two are separate CourtListener id spaces, so they are keyed as
+"cluster:<cluster_id>" and "opinion:<id>".
+
+Usage:
+  ftc caselaw import opinions-2025.jsonl.gz clusters.csv
+  ftc caselaw search "qualified immunity excessive force" --court ca11 --after 2023-01-01
+  ftc caselaw stats
+  FTC_VIABILITY_SOURCE=local ftc monitor -i case.json --mode online
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+
+DB_PATH = Path.home() / ".ftc" / "caselaw" / "opinions.db"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS opinions (
+    id INTEGER PRIMARY KEY,
+    source_id TEXT UNIQUE NOT NULL,
+    case_name TEXT NOT NULL,
+    court TEXT NOT NULL DEFAULT '',
+    date_filed TEXT NOT NULL DEFAULT '',
+    citation TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS opinions_court_date ON opinions (court, date_filed);
+CREATE VIRTUAL TABLE IF NOT EXISTS opinions_fts USING fts5 (
+    case_name, text, content='opinions', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS opinions_ai AFTER INSERT ON opinions BEGIN
+    INSERT INTO opinions_fts (rowid, case_name, text) VALUES (new.id, new.case_name, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS opinions_ad AFTER DELETE ON opinions BEGIN
+    INSERT INTO opinions_fts (opinions_fts, rowid, case_name, text)
+    VALUES ('delete', old.id, old.case_name, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS opinions_au AFTER UPDATE ON opinions BEGIN
+    INSERT INTO opinions_fts (opinions_fts, rowid, case_name, text)
+    VALUES ('delete', old.id, old.case_name, old.text);
+    INSERT INTO opinions_fts (rowid, case_name, text) VALUES (new.id, new.case_name, new.text);
+END;
+"""
+
+# Our column -> accepted input field names, first match wins
+_FIELDS = {
+    "case_name": ("case_name", "caseName", "case_name_full"),
+    "court": ("court", "court_id"),
+    "date_filed": ("date_filed", "dateFiled"),
+    "citation": ("citation", "citations"),
+    "url": ("url", "absolute_url"),
+    "text": ("plain_text", "text", "snippet", "html_with_citations"),
+}
+
+_TOKEN_RE = re.compile(r"\w+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@dataclass
+class MirrorStats:
+    path: str
+    opinions: int
+    courts: dict[str, int]
+    earliest: str
+    latest: str
+
+
+def db_path() -> Path:
+    return Path(os.environ.get("FTC_CASELAW_DB") or DB_PATH)
+
+
+def connect(path: Path | None = None) -> sqlite3.Connection:
+    """Open (creating if needed) the mirror database. Import uses this."""
+    path = Path(path) if path else db_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def open_mirror(path: Path | None = None) -> sqlite3.Connection:
+    """Open an imported mirror for reading.
+
+    Raises:
+        FileNotFoundError: No mirror has been imported at this path
+    """
+    path = Path(path) if path else db_path()
+    if not path.exists():
+        raise FileNotFoundError(f"No case-law mirror imported at {path} (run: ftc caselaw import FILE...)")
+    return connect(path)
+
+
+def mirror_generation(db: Path | None = None) -> str:
+    """A stamp that changes whenever the mirror's contents do ("" if none imported)."""
+    path = Path(db) if db else db_path()
+    try:
+        st = path.stat()
+    except OSError:
+        return ""
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+# ── Import ──────────────────────────────────────────────────────────────────
+
+def _open_text(path: Path):
+    if path.suffix == ".gz":
+        import gzip
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _records(path: Path) -> Iterator[dict]:
+    """Raw records from a JSONL, JSON or CSV export (optionally .gz)."""
+    kind = path.suffixes[-2] if path.suffix == ".gz" and len(path.suffixes) > 1 else path.suffix
+    with _open_text(path) as f:
+        if kind == ".csv":
+            import csv
+            import sys
+            csv.field_size_limit(sys.maxsize)
+            yield from csv.DictReader(f)
+        elif kind == ".json":
+            data = json.load(f)
+            yield from (data.get("results", []) if isinstance(data, dict) else data)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _field(record: dict, column: str) -> str:
+    for name in _FIELDS[column]:
+        value = record.get(name)
+        if value:
+            if isinstance(value, list):
+                value = "; ".join(str(v) for v in value)
+            return str(value)
+    return ""
+
+
+def normalize_record(record: dict) -> tuple | None:
+    """A row for the opinions table, or None if the record has no case name."""
+    case_name = _field(record, "case_name")
+    if not case_name:
+        return None
+    court = _field(record, "court").lower()
+    date_filed = _field(record, "date_filed")[:10]
+    text = _field(record, "text")
+    if "<" in text:
+        text = _TAG_RE.sub(" ", text)
+    return (_source_id(record, case_name, court, date_filed), case_name, court, date_filed,
+            _field(record, "citation"), _field(record, "url"), text)
+
+
+def _source_id(record: dict, case_name: str, court: str, date_filed: str) -> str:
+    """De-duplication key, namespaced so cluster and opinion ids can't collide."""
+    if record.get("source_id"):
+        return str(record["source_id"])
+    if record.get("cluster_id"):
+        return f"cluster:{record['cluster_id']}"
+    if record.get("id"):
+        return f"opinion:{record['id']}"
+    return hashlib.sha256(f"{case_name}|{court}|{date_filed}".encode()).hexdigest()[:24]
+
+
+def import_records(records: Iterable[dict], conn: sqlite3.Connection) -> int:
+    """Insert or update opinions; returns how many records were loaded."""
+    count = 0
+
+    def rows() -> Iterator[tuple]:
+        nonlocal count
+        for record in records:
+            row = normalize_record(record)
+            if row is not None:
+                count += 1
+                yield row
+
+    with conn:  # one transaction per file
+        conn.executemany(
+            """INSERT INTO opinions (source_id, case_name, court, date_filed, citation, url, text)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (source_id) DO UPDATE SET
+                 case_name = excluded.case_name, court = excluded.court,
+                 date_filed = excluded.date_filed, citation = excluded.citation,
+                 url = excluded.url, text = excluded.text""",
+            rows(),
+        )
+    return count
+
+
+def import_files(paths: Iterable[str | Path], db: Path | None = None) -> int:
+    """Load bulk export files into the mirror; returns the number of records loaded.
+
+    Raises:
+        OSError: A file can't be read
+        ValueError: A file isn't valid JSON
+    """
+    conn = connect(db)
+    try:
+        return sum(import_records(_records(Path(p)), conn) for p in paths)
+    finally:
+        conn.close()
+
+
+# ── Search ──────────────────────────────────────────────────────────────────
+
+def fts_query(terms: str) -> str:
+    """An FTS5 query matching every word of `terms` (operators are not interpreted)."""
+    return " ".join(f'"{t}"' for t in _TOKEN_RE.findall(terms))
+
+
+def search(terms: str, courts: Iterable[str] = (), filed_after: str = "", limit: int = 3,
+           conn: sqlite3.Connection | None = None) -> list[dict]:
+    """Newest opinions matching every term, in CourtListener result shape.
+
+    Returns:
+        [{"caseName", "court_id", "dateFiled", "citation", "absolute_url", "snippet"}]
+
+    Raises:
+        FileNotFoundError: No mirror has been imported (conn not given)
+    """
+    query = fts_query(terms)
+    if not query:
+        return []
+    own = conn is None
+    conn = conn or open_mirror()
+    try:
+        sql = ["""SELECT o.case_name, o.court, o.date_filed, o.citation, o.url,
+                         snippet(opinions_fts, 1, '', '', '…', 32) AS snippet
+                  FROM opinions_fts JOIN opinions o ON o.id = opinions_fts.rowid
+                  WHERE opinions_fts MATCH ?"""]
+        params: list = [query]
+        courts = list(courts)
+        if courts:
+            sql.append(f"AND o.court IN ({', '.join('?' * len(courts))})")
+            params.extend(courts)
+        if filed_after:
+            sql.append("AND o.date_filed >= ?")
+            params.append(filed_after)
+        sql.append("ORDER BY o.date_filed DESC, o.id DESC LIMIT ?")
+        params.append(limit)
+        rows = conn.execute(" ".join(sql), params).fetchall()
+    finally:
+        if own:
+            conn.close()
+    return [
+        {"caseName": r["case_name"], "court_id": r["court"], "dateFiled": r["date_filed"],
+         "citation": r["citation"], "absolute_url": r["url"], "snippet": r["snippet"]}
+        for r in rows
+    ]
+
+
+def search_claims(claim_keys: list[str], db: Path | None = None) -> dict[str, dict]:
+    """The monitor's per-claim searches against the mirror.
+
+    Returns {claim_key: {"results": [...]}}, or {} if no mirror has been
+    imported yet.
+    """
+    from .courtlistener import FILED_AFTER, RESULTS_PER_CLAIM, SEARCH_COURTS, search_terms
+
+    path = Path(db) if db else db_path()
+    if not path.exists():
+        return {}
+    conn = connect(path)
+    try:
+        return {
+            ck: {"results": search(search_terms(ck), SEARCH_COURTS, FILED_AFTER, RESULTS_PER_CLAIM, conn)}
+            for ck in claim_keys
+        }
+    finally:
+        conn.close()
+
+
+def mirror_stats(db: Path | None = None) -> MirrorStats:
+    """Opinion count, courts and date range of the mirror.
+
+    Raises:
+        FileNotFoundError: No mirror has been imported
+    """
+    path = Path(db) if db else db_path()
+    conn = open_mirror(path)
+    try:
+        total, earliest, latest = conn.execute(
+            "SELECT COUNT(*), MIN(date_filed), MAX(date_filed) FROM opinions").fetchone()
+        courts = dict(conn.execute(
+            "SELECT court, COUNT(*) FROM opinions GROUP BY court ORDER BY COUNT(*) DESC").fetchall())
+    finally:
+        conn.close()
+    return MirrorStats(str(path), total, courts, earliest or "", latest or "")
+
+
+def format_mirror_stats(stats: MirrorStats) -> str:
+    lines = [f"Case-law mirror: {stats.path}",
+             f"  Opinions: {stats.opinions}"]
+    if stats.opinions:
+        lines.append(f"  Filed:    {stats.earliest} to {stats.latest}")
+        lines.append("  Courts:   " + ", ".join(f"{c or '?'} ({n})" for c, n in stats.courts.items()))
+    return "\n".join(lines)
+
+
+def format_search_results(results: list[dict]) -> str:
+    if not results:
+        return "No matching opinions."
+    lines = []
+    for r in results:
+        lines.append(f"{r['dateFiled'] or '????-??-??'}  [{r['court_id'] or '?'}]  {r['caseName']}")
+        if r["citation"]:
+            lines.append(f"            {r['citation']}")
+        if r["snippet"]:
+            lines.append(f"            {r['snippet'][:200]}")
+    return "\n".join(lines)
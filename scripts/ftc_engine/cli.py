@@ -12,27 +12,33 @@ Commands:
   analyze    - Full case analysis from JSON input
   suggest    - Auto-suggest claims from case facts
   risk       - MTD risk scoring for specific claims
-  sol        - Statute of limitations calculator
+  sol        - Statute of limitations calculator (--watch: all saved cases)
   draft      - Generate complaint skeleton
   export     - Export to court-formatted .docx (Word/Google Docs/PDF)
   claims     - List all available federal claims
   info       - Show claim metadata
   district   - Manage district configuration
   deposition - Generate deposition question outlines
-  exhibits   - Generate exhibit index with authentication checklist
+  exhibits   - Generate exhibit index with authentication checklist (--case: Bates ledger)
   pacer      - Generate PACER/ECF filing package (JS-44, summons, disclosure)
-  monitor    - Rule 11 duty monitor — claim viability report
-  calendar   - Generate case filing calendar / document map
+  monitor    - Rule 11 duty monitor — claim viability report (--all-cases: docket sweep)
+  caselaw    - Local case-law mirror (import/search/stats) for monitor --source local
+  calendar   - Generate case filing calendar / document map (--all-cases: portfolio)
   new        - Interactive case wizard (new or existing case)
   open       - Open/resume an existing case
   cases      - List all saved cases
   analyze-docs - Analyze intake documents for a case
   setup      - Auto-install dependencies and configure environment
-  doctor     - Diagnostic health check
+  doctor     - Diagnostic health check (--startup: import-time profile)
+  serve      - Background daemon; other commands use it while it runs
 
 Flags:
   -q, --questions  Show post-generation verification questions
   -v, --verbose    Show detailed context for each question
+  --batch FILE     analyze/suggest/risk/monitor/calendar/pacer over a JSONL
+                   file of cases, results as JSONL (--jsonl-out, --workers)
+  --format json    Versioned JSON result instead of text (msgpack: binary,
+                   needs the msgpack package); see output.py
 """
 from __future__ import annotations
 import argparse
@@ -40,6 +46,7 @@ import json
 import sys
 from pathlib import Path
 from datetime import date
+from functools import lru_cache
 
 
 def cmd_analyze(args):
@@ -49,7 +56,11 @@ def cmd_analyze(args):
     from .sol import calculate_sol
     from .drafter import analyze_jurisdiction, generate_complaint
 
-    case_data = _load_case(args.input)
+    if args.batch:
+        return _cmd_batch("analyze", args)
+    case_data = _load_case(_input_path(args))
+    if _structured(args):
+        return _emit_result("analyze", case_data, args)
 
     print("=" * 70)
     print("         FEDERAL TRIAL COUNSEL - CASE ANALYSIS")
@@ -149,7 +160,11 @@ def cmd_analyze(args):
 def cmd_suggest(args):
     """Auto-suggest claims based on case facts."""
     from .suggest import suggest_claims
-    case_data = _load_case(args.input)
+    if args.batch:
+        return _cmd_batch("suggest", args)
+    case_data = _load_case(_input_path(args))
+    if _structured(args):
+        return _emit_result("suggest", case_data, args)
     suggestions = suggest_claims(case_data, args.max if args.max is not None else 10)
 
     print(f"{'Score':>5}  {'Claim Key':<45} {'Name'}")
@@ -167,7 +182,11 @@ def cmd_suggest(args):
 def cmd_risk(args):
     """MTD risk scoring."""
     from .risk import calculate_mtd_risk
-    case_data = _load_case(args.input)
+    if args.batch:
+        return _cmd_batch("risk", args)
+    case_data = _load_case(_input_path(args))
+    if _structured(args):
+        return _emit_result("risk", case_data, args)
     claims = args.claims.split(",") if args.claims else case_data.get("claims_requested", [])
 
     for ck in claims:
@@ -189,12 +208,27 @@ def cmd_risk(args):
 def cmd_sol(args):
     """Statute of limitations calculator."""
     from .sol import calculate_sol, calculate_all_sol
+
+    if args.watch:
+        from .sol_watch import get_watchlist, format_watchlist
+        watchlist = get_watchlist(limit=args.limit)
+        if _structured(args):
+            return _emit(args, "sol_watch", watchlist)
+        print(format_watchlist(watchlist))
+        return
+
+    if not args.claims or not args.date:
+        print("Error: --claims and --date are required (or use --watch)", file=sys.stderr)
+        sys.exit(1)
+
     claims = args.claims.split(",")
     try:
         results = calculate_all_sol([c.strip() for c in claims], args.date)
     except Exception as e:
         print(f"Error calculating SOL: {e}", file=sys.stderr)
         sys.exit(1)
+    if _structured(args):
+        return _emit(args, "sol", results)
 
     print(f"{'Status':<8} {'Claim':<45} {'Deadline':<12} {'Remaining':>10}")
     print("-" * 80)
@@ -212,6 +246,13 @@ def cmd_draft(args):
     case_data = _load_case(args.input)
     complaint = generate_complaint(case_data)
 
+    if _structured(args):
+        result = {"complaint": complaint}
+        if getattr(args, "questions", False):
+            from .questions import generate_questions
+            result["questions"] = generate_questions(case_data, doc_type="draft")
+        return _emit(args, "draft", result, args.output)
+
     if args.output:
         Path(args.output).write_text(complaint)
         print(f"Complaint written to {args.output}")
@@ -227,6 +268,8 @@ def cmd_draft(args):
 def cmd_claims(args):
     """List all available federal claims."""
     from .claims import CLAIM_LIBRARY, list_categories
+    if _structured(args):
+        return _emit(args, "claims", CLAIM_LIBRARY)
     for cat in list_categories():
         print(f"\n## {cat.upper().replace('_', ' ')}")
         for key, meta in CLAIM_LIBRARY.items():
@@ -244,41 +287,80 @@ def cmd_claims(args):
 
 def cmd_export(args):
     """Export to court-formatted .docx (Word/Google Docs/PDF-ready)."""
-    from .exporter import export_draft, export_template, export_text, list_templates
+    from .exporter import (
+        describe_formatting, export_draft, export_template, export_text, list_templates, page_limit_warning,
+    )
 
     if args.list_templates:
         templates = list_templates()
+        if _structured(args):
+            return _emit(args, "templates", templates)
         print(f"{'Category':<15} {'Template Name':<40} {'Path'}")
         print("-" * 80)
         for t in templates:
             print(f"{t['category']:<15} {t['name']:<40} {t['path']}")
         return
 
+    if args.batch:
+        from .batch_export import load_manifest, export_batch, format_batch_report
+        try:
+            jobs = load_manifest(args.batch)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        report = export_batch(jobs, workers=args.workers)
+        if _structured(args):
+            _emit(args, "export_batch", report)
+        else:
+            print(format_batch_report(report))
+        if report.failed:
+            sys.exit(1)
+        return
+
     output = args.output or "output.docx"
 
     if args.draft:
         case_data = _load_case(args.input)
-        result = export_draft(case_data, output)
+        district_code = _export_district(args, case_data)
+        result = export_draft(case_data, output, stream=args.stream, district_code=district_code)
+        if _structured(args):
+            return _emit(args, "export", result)
         print(f"Complaint draft exported to: {result.output_path}")
-        print(f"  Format: .docx (Times New Roman 12pt, double-spaced, 1\" margins)")
+        print(f"  Format: .docx ({describe_formatting(district_code)})")
         print(f"  Sections: {result.sections}")
+        print(f"  Pages (est.): {result.pages_estimate}")
         print(f"  Open in: Microsoft Word, Google Docs, or LibreOffice")
         print(f"  To PDF: File > Export/Print as PDF from any of the above")
     elif args.template:
         case_data = _load_case(args.input) if args.input else {}
-        result = export_template(args.template, case_data, output)
+        district_code = _export_district(args, case_data)
+        result = export_template(args.template, case_data, output, stream=args.stream,
+                                 district_code=district_code)
+        if _structured(args):
+            return _emit(args, "export", result)
         print(f"Template exported to: {result.output_path}")
         print(f"  Template: {args.template}")
-        print(f"  Format: .docx (Times New Roman 12pt, double-spaced, 1\" margins)")
+        print(f"  Format: .docx ({describe_formatting(district_code)})")
         print(f"  Sections: {result.sections}")
+        print(f"  Pages (est.): {result.pages_estimate}")
+        warning = page_limit_warning(args.template, result.pages_estimate, district_code)
+        if warning:
+            print(f"  WARNING: {warning}", file=sys.stderr)
+        if result.unknown_placeholders:
+            keys = ", ".join("{{" + k + "}}" for k in result.unknown_placeholders)
+            print(f"  WARNING: unknown placeholders left unfilled: {keys}", file=sys.stderr)
     elif args.text:
         from pathlib import Path as P
         text = P(args.text).read_text()
-        result = export_text(text, output)
+        district_code = _export_district(args, {})
+        result = export_text(text, output, stream=args.stream, district_code=district_code)
+        if _structured(args):
+            return _emit(args, "export", result)
         print(f"Text exported to: {result.output_path}")
-        print(f"  Format: .docx (court-formatted)")
+        print(f"  Format: .docx ({describe_formatting(district_code)})")
+        print(f"  Pages (est.): {result.pages_estimate}")
     else:
-        print("Error: specify --draft, --template, --text, or --list-templates", file=sys.stderr)
+        print("Error: specify --draft, --template, --text, --batch, or --list-templates", file=sys.stderr)
         sys.exit(1)
 
     if getattr(args, "questions", False) and hasattr(args, "input") and args.input:
@@ -288,6 +370,19 @@ def cmd_export(args):
         print(format_questions(qs, verbose=getattr(args, "verbose", False)))
 
 
+def _export_district(args, case_data: dict) -> str:
+    """District for export formatting and page limits.
+
+    --district, else the case's court, else the active district — resolved
+    once so the layout and the page-limit check agree.
+    """
+    if args.district:
+        return args.district
+    from .districts import find_district, get_active_district
+    district = find_district(case_data.get("court", {}).get("district", ""))
+    return district.code if district else get_active_district().config.code
+
+
 def cmd_info(args):
     """Show detailed claim metadata."""
     from .claims import get_claim
@@ -295,6 +390,8 @@ def cmd_info(args):
     if not meta:
         print(f"Unknown claim: {args.claim}")
         sys.exit(1)
+    if _structured(args):
+        return _emit(args, "info", {"key": args.claim, "claim": meta})
     print(f"Name:           {meta.name}")
     print(f"Category:       {meta.category}")
     print(f"Source:         {meta.source}")
@@ -312,15 +409,19 @@ def cmd_district(args):
     """Manage district configuration."""
     from .districts import (
         get_district, list_districts, get_active_district, set_active_district,
-        format_district_info, format_district_list,
+        format_district_info, format_district_list, reload_districts,
     )
 
     action = args.action
 
     if action == "list":
+        if _structured(args):
+            return _emit(args, "district_list", list_districts())
         print(format_district_list())
     elif action == "current":
         ctx = get_active_district()
+        if _structured(args):
+            return _emit(args, "district", ctx)
         print(f"Active: {ctx.config.code} — {ctx.config.name}")
         if ctx.division:
             print(f"Division: {ctx.division}")
@@ -329,6 +430,8 @@ def cmd_district(args):
             print("Error: district code required for 'set'", file=sys.stderr)
             sys.exit(1)
         ctx = set_active_district(args.code, args.division)
+        if _structured(args):
+            return _emit(args, "district", ctx)
         print(f"Active district set to: {ctx.config.code} — {ctx.config.name}")
         if ctx.division:
             print(f"Division: {ctx.division}")
@@ -338,9 +441,20 @@ def cmd_district(args):
         if not config:
             print(f"Unknown district: {code}", file=sys.stderr)
             sys.exit(1)
+        if _structured(args):
+            return _emit(args, "district_info", config)
         print(format_district_info(config))
+    elif action == "compile":
+        try:
+            count = reload_districts()
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if _structured(args):
+            return _emit(args, "district_compile", {"districts": count})
+        print(f"District snapshot compiled: {count} districts")
     else:
-        print("Usage: ftc district [list|current|set <code>|info <code>]", file=sys.stderr)
+        print("Usage: ftc district [list|current|set <code>|info <code>|compile]", file=sys.stderr)
         sys.exit(1)
 
 
@@ -357,6 +471,8 @@ def cmd_deposition(args):
         claim_keys=claim_keys,
         max_questions=args.max or 50,
     )
+    if _structured(args):
+        return _emit(args, "deposition", outline, args.output)
 
     output_text = format_deposition_outline(outline, verbose=args.verbose)
 
@@ -370,6 +486,37 @@ def cmd_deposition(args):
 def cmd_exhibits(args):
     """Generate exhibit index."""
     from .exhibits import generate_exhibit_index, format_exhibit_index
+    from .bates_ledger import BatesLedger, format_lookup
+
+    ledger = None
+    if args.case:
+        from .case_manager import get_case_path
+        if not get_case_path(args.case).exists():
+            print(f"Error: Case not found: {args.case}", file=sys.stderr)
+            sys.exit(1)
+        try:
+            ledger = BatesLedger.for_case(args.case)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.bates_lookup:
+        if ledger is None:
+            print("Error: --bates-lookup needs --case", file=sys.stderr)
+            sys.exit(1)
+        try:
+            allocation = ledger.lookup(args.bates_lookup)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if _structured(args):
+            return _emit(args, "bates_lookup", allocation, args.output)
+        print(format_lookup(args.bates_lookup, allocation))
+        return
+
+    if not args.input:
+        print("Error: -i/--input is required (except with --bates-lookup)", file=sys.stderr)
+        sys.exit(1)
     case_data = _load_case(args.input)
 
     index = generate_exhibit_index(
@@ -377,7 +524,13 @@ def cmd_exhibits(args):
         scan_directory=args.scan,
         numbering=args.numbering,
         prefix=args.prefix or "",
+        workers=args.workers,
+        ledger=ledger,
     )
+    if ledger is not None and ledger.modified:
+        ledger.save()
+    if _structured(args):
+        return _emit(args, "exhibits", index, args.output)
 
     output_text = format_exhibit_index(index, fmt=args.format)
 
@@ -394,7 +547,11 @@ def cmd_pacer(args):
         generate_filing_package, generate_js44, generate_all_summonses,
         generate_all_disclosures, format_js44, format_summons, format_filing_package,
     )
-    case_data = _load_case(args.input)
+    if args.batch:
+        return _cmd_batch("pacer", args)
+    case_data = _load_case(_input_path(args))
+    if _structured(args):
+        return _emit_result("pacer", case_data, args)
 
     if args.all:
         pkg = generate_filing_package(case_data)
@@ -424,10 +581,20 @@ def cmd_pacer(args):
 def cmd_monitor(args):
     """Rule 11 duty monitor."""
     from .rule11_monitor import generate_monitor_report, format_monitor_report
-    case_data = _load_case(args.input)
+    if args.batch:
+        return _cmd_batch("monitor", args)
+    if args.all_cases:
+        return _cmd_monitor_sweep(args)
+    case_data = _load_case(_input_path(args, "--all-cases or --batch"))
+    if _structured(args):
+        return _emit_result("monitor", case_data, args, args.output)
 
     claim_keys = args.claims.split(",") if args.claims else None
-    report = generate_monitor_report(case_data, claim_keys=claim_keys, mode=args.mode)
+    try:
+        report = generate_monitor_report(case_data, claim_keys=claim_keys, mode=args.mode, source=args.source)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
     output_text = format_monitor_report(report, verbose=args.verbose)
 
@@ -438,10 +605,77 @@ def cmd_monitor(args):
         print(output_text)
 
 
+def _cmd_monitor_sweep(args):
+    """Monitor every saved case and write the docket-level report."""
+    from .monitor_sweep import sweep_cases, format_docket_monitor
+
+    try:
+        report = sweep_cases(mode=args.mode, recheck_all=args.recheck_all, source=args.source)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if _structured(args):
+        return _emit(args, "monitor_sweep", report, args.output)
+
+    output_text = format_docket_monitor(report, verbose=args.verbose)
+    if args.output:
+        Path(args.output).write_text(output_text)
+        print(f"Docket monitor report written to {args.output}")
+    else:
+        print(output_text)
+
+
+def cmd_caselaw(args):
+    """Manage the local case-law mirror used by `monitor --source local`."""
+    from .caselaw_mirror import (
+        import_files, mirror_stats, search, format_mirror_stats, format_search_results,
+    )
+
+    if args.action == "import":
+        if not args.terms:
+            print("Error: give one or more export files to import", file=sys.stderr)
+            sys.exit(1)
+        try:
+            count = import_files(args.terms)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if _structured(args):
+            return _emit(args, "caselaw_import", {"imported": count, "stats": mirror_stats()})
+        print(f"Imported {count} opinion(s)")
+        print(format_mirror_stats(mirror_stats()))
+    elif args.action == "search":
+        courts = [c.strip() for c in args.court.split(",")] if args.court else ()
+        try:
+            results = search(" ".join(args.terms), courts, args.after or "", args.limit)
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if _structured(args):
+            return _emit(args, "caselaw_search", results)
+        print(format_search_results(results))
+    elif args.action == "stats":
+        try:
+            stats = mirror_stats()
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if _structured(args):
+            return _emit(args, "caselaw_stats", stats)
+        print(format_mirror_stats(stats))
+
+
 def cmd_calendar(args):
     """Generate case filing calendar."""
     from .filing_calendar import generate_filing_calendar, format_filing_calendar
-    case_data = _load_case(args.input)
+
+    if args.all_cases:
+        return _cmd_portfolio_calendar(args)
+    if args.batch:
+        return _cmd_batch("calendar", args)
+    case_data = _load_case(_input_path(args, "--all-cases or --batch"))
+    if _structured(args):
+        return _emit_result("calendar", case_data, args, args.output)
 
     calendar = generate_filing_calendar(
         case_data,
@@ -449,6 +683,11 @@ def cmd_calendar(args):
         district_code=args.district,
     )
 
+    if args.format in ("ics", "csv"):
+        from .portfolio_calendar import merge_calendars
+        case_number = case_data.get("case_number") or Path(args.input).stem
+        return _write_calendar_feed(merge_calendars([(case_number, calendar)]), args)
+
     output_text = format_filing_calendar(calendar, fmt=args.format)
 
     if args.output:
@@ -458,6 +697,64 @@ def cmd_calendar(args):
         print(output_text)
 
 
+def _write_calendar_feed(entries, args):
+    """Stream calendar entries as ICS or CSV to a file or stdout."""
+    from .portfolio_calendar import write_ics, write_csv
+
+    writer = write_ics if args.format == "ics" else write_csv
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            count = writer(entries, out)
+        print(f"{count} calendar entries written to {args.output}")
+    else:
+        writer(entries, sys.stdout)
+
+
+def _cmd_portfolio_calendar(args):
+    """Merged calendar, range view, or conflict report across all saved cases."""
+    from .portfolio_calendar import (
+        iter_portfolio_entries, DeadlineIntervalTree,
+        format_portfolio_calendar, format_conflicts,
+    )
+
+    try:
+        start = date.fromisoformat(args.date_from) if args.date_from else None
+        end = date.fromisoformat(args.date_to) if args.date_to else None
+    except ValueError as e:
+        print(f"Error: {e}. Use YYYY-MM-DD", file=sys.stderr)
+        sys.exit(1)
+
+    priorities = set(args.priority.split(",")) if args.priority else None
+    entries = iter_portfolio_entries(priorities)
+
+    if args.conflicts:
+        tree = DeadlineIntervalTree(entries, lead_days=args.window)
+        conflicts = [
+            c for c in tree.conflicts()
+            if (start is None or c.overlap_end >= start) and (end is None or c.overlap_start <= end)
+        ]
+        if _structured(args):
+            return _emit(args, "calendar_conflicts", conflicts, args.output)
+        output_text = format_conflicts(conflicts, args.window)
+    else:
+        if start or end:
+            entries = (
+                p for p in entries
+                if (start is None or p.deadline >= start) and (end is None or p.deadline <= end)
+            )
+        if args.format in ("ics", "csv"):
+            return _write_calendar_feed(entries, args)
+        if _structured(args):
+            return _emit(args, "calendar_portfolio", list(entries), args.output)
+        output_text = format_portfolio_calendar(entries)
+
+    if args.output:
+        Path(args.output).write_text(output_text)
+        print(f"Portfolio calendar written to {args.output}")
+    else:
+        print(output_text)
+
+
 def cmd_setup(args):
     """Auto-install dependencies and configure environment."""
     import subprocess
@@ -519,7 +816,7 @@ def cmd_new(args):
 def cmd_open(args):
     """Open/resume an existing case."""
     from .case_manager import open_case, get_workflow_map
-    from .wizard import run_case_wizard
+    from .wizard import run_case_wizard, output_status, format_output_status
     try:
         state, case_data = open_case(args.case_number)
     except FileNotFoundError:
@@ -537,6 +834,9 @@ def cmd_open(args):
         save_state(state)
 
     print(get_workflow_map(state))
+    outputs = output_status(state, case_data)
+    if outputs:
+        print(format_output_status(state, outputs))
     if state.current_step != "done":
         run_case_wizard(state, case_data)
     else:
@@ -547,6 +847,8 @@ def cmd_cases(args):
     """List all saved cases."""
     from .case_manager import list_cases
     cases = list_cases()
+    if _structured(args):
+        return _emit(args, "cases", cases)
     if not cases:
         print("  No saved cases found. Run 'ftc new' to start one.")
         return
@@ -567,6 +869,8 @@ def cmd_analyze_docs(args):
     """Analyze documents in a case's intake folder."""
     from .doc_analyzer import analyze_intake_docs, format_analysis_report
     report = analyze_intake_docs(args.case_number)
+    if _structured(args):
+        return _emit(args, "analyze_docs", report)
     print(format_analysis_report(report))
 
 
@@ -655,6 +959,11 @@ def cmd_doctor(args):
         checks_passed += 1  # Optional, so still passes
 
     print(f"\n  Result: {checks_passed}/{checks_total} checks passed")
+
+    if args.startup:
+        from .startup import LIGHT_COMMANDS, format_startup_report, profile_command
+        print()
+        print(format_startup_report([profile_command(c) for c in LIGHT_COMMANDS]))
     print("=" * 70)
 
 
@@ -670,6 +979,93 @@ def _load_case(path: str) -> dict:
         sys.exit(1)
 
 
+def _input_path(args, alternative: str = "--batch") -> str:
+    """The -i/--input path; exits if it was not given."""
+    if not args.input:
+        print(f"Error: -i/--input is required (or use {alternative})", file=sys.stderr)
+        sys.exit(1)
+    return args.input
+
+
+def _command_options(args) -> dict:
+    """Options shared by --batch and --format json for the analysis commands."""
+    return {
+        "claims": getattr(args, "claims", None),
+        "max": getattr(args, "max", None),
+        "mode": getattr(args, "mode", "offline"),
+        "source": getattr(args, "source", None),
+        "filing_date": getattr(args, "filing_date", None),
+        "district": getattr(args, "district", None),
+    }
+
+
+def _structured(args) -> bool:
+    """True when --format asks for json or msgpack instead of text."""
+    from .output import STRUCTURED_FORMATS
+    return getattr(args, "format", None) in STRUCTURED_FORMATS
+
+
+def _emit(args, command: str, result, path: str | None = None) -> None:
+    """Write a result in the --format envelope to a file or stdout."""
+    from .output import encode, envelope
+
+    try:
+        data = encode(envelope(command, result), args.format)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if path:
+        Path(path).write_bytes(data)
+        print(f"{args.format.upper()} written to {path}")
+    elif args.format == "json":
+        sys.stdout.write(data.decode("utf-8"))
+    else:
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            print(f"Error: {args.format} output needs a binary stdout; write it to a file instead",
+                  file=sys.stderr)
+            sys.exit(1)
+        sys.stdout.flush()
+        buffer.write(data)
+        buffer.flush()
+
+
+def _emit_result(command: str, case_data: dict, args, path: str | None = None) -> None:
+    """--format json/msgpack for one of the batch-capable analysis commands."""
+    from .batch_cases import command_result
+    try:
+        result = command_result(command, case_data, _command_options(args))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    _emit(args, command, result, path)
+
+
+def _cmd_batch(command: str, args):
+    """Run a command over a JSONL stream of cases (--batch), writing JSONL results."""
+    from .batch_cases import run_batch, format_batch_summary
+
+    options = _command_options(args)
+    to_stdout = args.jsonl_out in (None, "-")
+    try:
+        source = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    with source:
+        if to_stdout:
+            summary = run_batch(command, source, sys.stdout, options, args.workers)
+        else:
+            with open(args.jsonl_out, "w", encoding="utf-8") as out:
+                summary = run_batch(command, source, out, options, args.workers)
+
+    # Keep stdout pure JSONL when results go there
+    print(format_batch_summary(summary, "stdout" if to_stdout else args.jsonl_out),
+          file=sys.stderr if to_stdout else sys.stdout)
+    if summary.failed:
+        sys.exit(1)
+
+
 def _risk_bar(score: int) -> str:
     """Generate ASCII risk bar."""
     score = max(0, min(100, score))
@@ -678,7 +1074,56 @@ def _risk_bar(score: int) -> str:
     return f"[{'#' * filled}{'.' * empty}]"
 
 
-def main():
+def cmd_serve(args):
+    """Run or manage the background daemon."""
+    from .daemon import DaemonError, call, serve, socket_path
+
+    path = Path(args.socket) if args.socket else socket_path()
+    if args.status or args.stop:
+        try:
+            info = call("shutdown" if args.stop else "ping", path=path)
+        except (OSError, DaemonError):
+            print(f"No ftc daemon running on {path}")
+            sys.exit(1)
+        if args.stop:
+            print(f"ftc daemon on {path} stopped")
+        else:
+            print(f"ftc daemon {info['version']} on {path}")
+            print(f"  PID:      {info['pid']}")
+            print(f"  Uptime:   {info['uptime']}s")
+            print(f"  Requests: {info['requests']}")
+        return
+
+    import threading
+    ready = threading.Event()
+
+    def announce():
+        if ready.wait():
+            print(f"ftc daemon listening on {path}", flush=True)
+
+    threading.Thread(target=announce, daemon=True).start()
+    try:
+        serve(path, idle_timeout=args.idle_timeout, ready=ready)
+    except RuntimeError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def _add_format_argument(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--format", choices=["text", "json", "msgpack"], default="text",
+                   help="Output format: formatted text, or versioned JSON/msgpack")
+
+
+def _add_batch_arguments(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--batch", metavar="CASES_JSONL", help="Process a JSONL file of cases, one per line ('-' for stdin)")
+    p.add_argument("--jsonl-out", metavar="PATH", help="With --batch: JSONL results file (default: stdout)")
+    p.add_argument("--workers", type=int, help="With --batch: worker processes (default: CPU count)")
+
+
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="ftc",
         description="Federal Trial Counsel - Local Execution Engine",
@@ -687,27 +1132,36 @@ def main():
 
     # analyze
     p = sub.add_parser("analyze", help="Full case analysis")
-    p.add_argument("-i", "--input", required=True, help="Case JSON file")
+    p.add_argument("-i", "--input", help="Case JSON file")
+    _add_batch_arguments(p)
     p.add_argument("-o", "--output", help="Output directory")
     p.add_argument("-q", "--questions", action="store_true", help="Show post-generation verification questions")
     p.add_argument("-v", "--verbose", action="store_true", help="Show detailed context for questions")
+    _add_format_argument(p)
 
     # suggest
     p = sub.add_parser("suggest", help="Auto-suggest claims")
-    p.add_argument("-i", "--input", required=True, help="Case JSON file")
+    p.add_argument("-i", "--input", help="Case JSON file")
+    _add_batch_arguments(p)
     p.add_argument("-m", "--max", type=int, default=10, help="Max results")
     p.add_argument("-v", "--verbose", action="store_true")
+    _add_format_argument(p)
 
     # risk
     p = sub.add_parser("risk", help="MTD risk scoring")
-    p.add_argument("-i", "--input", required=True, help="Case JSON file")
+    p.add_argument("-i", "--input", help="Case JSON file")
+    _add_batch_arguments(p)
     p.add_argument("-c", "--claims", help="Comma-separated claim keys")
+    _add_format_argument(p)
 
     # sol
     p = sub.add_parser("sol", help="Statute of limitations")
-    p.add_argument("-c", "--claims", required=True, help="Comma-separated claim keys")
-    p.add_argument("-d", "--date", required=True, help="Injury date (YYYY-MM-DD)")
+    p.add_argument("-c", "--claims", help="Comma-separated claim keys")
+    p.add_argument("-d", "--date", help="Injury date (YYYY-MM-DD)")
+    p.add_argument("--watch", action="store_true", help="Portfolio SOL watchlist across all saved cases")
+    p.add_argument("--limit", type=int, help="Max watchlist items (with --watch)")
     p.add_argument("-v", "--verbose", action="store_true")
+    _add_format_argument(p)
 
     # draft
     p = sub.add_parser("draft", help="Generate complaint")
@@ -715,9 +1169,11 @@ def main():
     p.add_argument("-o", "--output", help="Output file path")
     p.add_argument("-q", "--questions", action="store_true", help="Show post-generation verification questions")
     p.add_argument("-v", "--verbose", action="store_true", help="Show detailed context for questions")
+    _add_format_argument(p)
 
     # claims
-    sub.add_parser("claims", help="List all claims")
+    p = sub.add_parser("claims", help="List all claims")
+    _add_format_argument(p)
 
     # export
     p = sub.add_parser("export", help="Export to .docx (Word/Google Docs/PDF)")
@@ -727,18 +1183,25 @@ def main():
     p.add_argument("-i", "--input", help="Case JSON file (for placeholder filling)")
     p.add_argument("-o", "--output", help="Output .docx file path")
     p.add_argument("--list-templates", action="store_true", help="List all available templates")
+    p.add_argument("--stream", action="store_true", help="Stream the document body to disk (for very large exports)")
+    p.add_argument("--batch", metavar="MANIFEST", help="Export every job in a JSON manifest")
+    p.add_argument("--workers", type=int, help="Worker processes for --batch (default: CPU count)")
+    p.add_argument("--district", help="District code for formatting and page limits (default: the case's court)")
+    _add_format_argument(p)
     p.add_argument("-q", "--questions", action="store_true", help="Show post-generation verification questions")
     p.add_argument("-v", "--verbose", action="store_true", help="Show detailed context for questions")
 
     # info
     p = sub.add_parser("info", help="Claim metadata")
     p.add_argument("claim", help="Claim key")
+    _add_format_argument(p)
 
     # district
     p = sub.add_parser("district", help="Manage district configuration")
-    p.add_argument("action", choices=["list", "current", "set", "info"], help="Action")
+    p.add_argument("action", choices=["list", "current", "set", "info", "compile"], help="Action")
     p.add_argument("code", nargs="?", help="District code (e.g., sdfl, ndcal)")
     p.add_argument("--division", help="Division within district")
+    _add_format_argument(p)
 
     # deposition
     p = sub.add_parser("deposition", help="Generate deposition question outline")
@@ -747,41 +1210,69 @@ def main():
     p.add_argument("--type", choices=["direct", "cross"], default="cross", help="Exam type")
     p.add_argument("-c", "--claims", help="Comma-separated claim keys")
     p.add_argument("-m", "--max", type=int, default=50, help="Max questions")
+    _add_format_argument(p)
     p.add_argument("-o", "--output", help="Output file path")
     p.add_argument("-v", "--verbose", action="store_true")
 
     # exhibits
     p = sub.add_parser("exhibits", help="Generate exhibit index")
-    p.add_argument("-i", "--input", required=True, help="Case JSON file")
+    p.add_argument("-i", "--input", help="Case JSON file")
     p.add_argument("--scan", help="Directory to scan for documents")
     p.add_argument("--numbering", choices=["alpha", "numeric", "bates"], default="alpha")
     p.add_argument("--prefix", help="Bates prefix (e.g., SMITH)")
-    p.add_argument("--format", choices=["table", "detailed"], default="table")
+    p.add_argument("--workers", type=int, help="Threads for hashing --scan files (default: auto)")
+    p.add_argument("--case", help="Saved case whose Bates ledger numbers --scan files")
+    p.add_argument("--bates-lookup", metavar="BATES", help="With --case: which document holds e.g. SMITH-004213")
+    p.add_argument("--format", choices=["table", "detailed", "json", "msgpack"], default="table")
     p.add_argument("-o", "--output", help="Output file path")
 
     # pacer
     p = sub.add_parser("pacer", help="Generate PACER/ECF filing package")
-    p.add_argument("-i", "--input", required=True, help="Case JSON file")
+    p.add_argument("-i", "--input", help="Case JSON file")
+    _add_batch_arguments(p)
     p.add_argument("--all", action="store_true", help="Generate complete filing package")
     p.add_argument("--js44", action="store_true", help="Generate JS-44 only")
     p.add_argument("--summons", action="store_true", help="Generate summonses only")
     p.add_argument("--disclosure", action="store_true", help="Generate corporate disclosures only")
+    _add_format_argument(p)
     p.add_argument("-o", "--output", help="Output directory")
 
     # monitor
     p = sub.add_parser("monitor", help="Rule 11 duty monitor — claim viability")
-    p.add_argument("-i", "--input", required=True, help="Case JSON file")
+    p.add_argument("-i", "--input", help="Case JSON file")
+    _add_batch_arguments(p)
     p.add_argument("-c", "--claims", help="Comma-separated claim keys")
     p.add_argument("--mode", choices=["offline", "online"], default="offline")
+    p.add_argument("--source", help="Online case-law source: courtlistener (default) or local "
+                                    "(default: $FTC_VIABILITY_SOURCE)")
+    p.add_argument("--all-cases", action="store_true", help="Sweep every saved case into one docket report")
+    p.add_argument("--recheck-all", action="store_true", help="With --all-cases: re-check unchanged cases too")
+    _add_format_argument(p)
     p.add_argument("-o", "--output", help="Output report file")
     p.add_argument("-v", "--verbose", action="store_true")
 
+    # caselaw
+    p = sub.add_parser("caselaw", help="Local case-law mirror for offline monitor checks")
+    p.add_argument("action", choices=["import", "search", "stats"], help="Action")
+    p.add_argument("terms", nargs="*", help="import: export files (JSONL/JSON/CSV, .gz ok); search: query terms")
+    p.add_argument("--court", help="search: comma-separated court ids (e.g. scotus,ca11)")
+    p.add_argument("--after", help="search: filed on or after (YYYY-MM-DD)")
+    p.add_argument("--limit", type=int, default=10, help="search: max results")
+    _add_format_argument(p)
+
     # calendar
     p = sub.add_parser("calendar", help="Generate case filing calendar / document map")
-    p.add_argument("-i", "--input", required=True, help="Case JSON file")
+    p.add_argument("-i", "--input", help="Case JSON file")
+    _add_batch_arguments(p)
     p.add_argument("--filing-date", help="Filing date (YYYY-MM-DD, default: today)")
     p.add_argument("--district", help="District code for timing rules")
-    p.add_argument("--format", choices=["table", "detailed"], default="table")
+    p.add_argument("--format", choices=["table", "detailed", "ics", "csv", "json", "msgpack"], default="table")
+    p.add_argument("--all-cases", action="store_true", help="Merged calendar across all saved cases")
+    p.add_argument("--from", dest="date_from", help="With --all-cases: first date (YYYY-MM-DD)")
+    p.add_argument("--to", dest="date_to", help="With --all-cases: last date (YYYY-MM-DD)")
+    p.add_argument("--priority", help="With --all-cases: comma-separated priorities (e.g. critical,high)")
+    p.add_argument("--conflicts", action="store_true", help="With --all-cases: report overlapping deadlines")
+    p.add_argument("--window", type=int, default=7, help="Days of work before each deadline for --conflicts (default: 7)")
     p.add_argument("-o", "--output", help="Output file path")
 
     # new (wizard)
@@ -794,47 +1285,76 @@ def main():
     p.add_argument("--step", help="Jump to specific step")
 
     # cases (list)
-    sub.add_parser("cases", help="List all saved cases")
+    p = sub.add_parser("cases", help="List all saved cases")
+    _add_format_argument(p)
 
     # analyze-docs
     p = sub.add_parser("analyze-docs", help="Analyze intake documents for a case")
     p.add_argument("case_number", help="Case number to analyze")
+    _add_format_argument(p)
 
     # setup
     sub.add_parser("setup", help="Auto-install dependencies and configure")
 
     # doctor
-    sub.add_parser("doctor", help="Diagnostic health check")
-
-    args = parser.parse_args()
+    p = sub.add_parser("doctor", help="Diagnostic health check")
+    p.add_argument("--startup", action="store_true", help="Profile cold-start import time of lightweight commands")
+
+    # serve
+    p = sub.add_parser("serve", help="Run a background daemon that answers ftc commands")
+    p.add_argument("--socket", help="Socket path (default: $FTC_SOCKET, $XDG_RUNTIME_DIR/ftc/ftc.sock or ~/.ftc/run/ftc.sock)")
+    p.add_argument("--idle-timeout", type=float, help="Exit after this many idle seconds")
+    p.add_argument("--status", action="store_true", help="Show whether a daemon is running")
+    p.add_argument("--stop", action="store_true", help="Stop the running daemon")
+
+    return parser
+
+
+COMMANDS = {
+    "analyze": cmd_analyze,
+    "suggest": cmd_suggest,
+    "risk": cmd_risk,
+    "sol": cmd_sol,
+    "draft": cmd_draft,
+    "export": cmd_export,
+    "claims": cmd_claims,
+    "info": cmd_info,
+    "district": cmd_district,
+    "deposition": cmd_deposition,
+    "exhibits": cmd_exhibits,
+    "pacer": cmd_pacer,
+    "monitor": cmd_monitor,
+    "caselaw": cmd_caselaw,
+    "calendar": cmd_calendar,
+    "new": cmd_new,
+    "open": cmd_open,
+    "cases": cmd_cases,
+    "analyze-docs": cmd_analyze_docs,
+    "setup": cmd_setup,
+    "doctor": cmd_doctor,
+    "serve": cmd_serve,
+}
+
+
+def run(argv: list[str] | None = None) -> None:
+    """Parse argv and run the command in this process."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    cmd_map = {
-        "analyze": cmd_analyze,
-        "suggest": cmd_suggest,
-        "risk": cmd_risk,
-        "sol": cmd_sol,
-        "draft": cmd_draft,
-        "export": cmd_export,
-        "claims": cmd_claims,
-        "info": cmd_info,
-        "district": cmd_district,
-        "deposition": cmd_deposition,
-        "exhibits": cmd_exhibits,
-        "pacer": cmd_pacer,
-        "monitor": cmd_monitor,
-        "calendar": cmd_calendar,
-        "new": cmd_new,
-        "open": cmd_open,
-        "cases": cmd_cases,
-        "analyze-docs": cmd_analyze_docs,
-        "setup": cmd_setup,
-        "doctor": cmd_doctor,
-    }
-    cmd_map[args.command](args)
+    COMMANDS[args.command](args)
+
+
+def main():
+    from .daemon_client import try_remote
+
+    exit_code = try_remote(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+"""
+Court Days — FRCP 6(a) deadline arithmetic over a precomputed court calendar.
+
+Each calendar year is built once into a day bitmap (one byte per day, 1 when
+the clerk's office is open) plus lookup tables derived from it:
+
+- court days before each day (prefix sums), for O(1) counting
+- the next / previous court day from each day, for O(1) roll-forward/backward
+- the position of every court day, for O(1) "N court days after" arithmetic
+
+Weekends and the federal legal holidays of 5 U.S.C. § 6103 (with their
+observed dates) are closed days. FRCP 6(a)(1): exclude the trigger day, count
+every day, and if the last day is a Saturday, Sunday or legal holiday the
+period runs until the next court day — counting forward for periods measured
+after an event and backward for periods measured before one (FRCP 6(a)(5)).
+
+Usage:
+  from ftc_engine.court_days import compute_deadline
+  compute_deadline(date(2026, 3, 1), 90)   # 2026-06-01 (day 90 is a Saturday)
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+
+
+# ── Federal holidays ────────────────────────────────────────────────────────
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th given weekday (Mon=0) of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed Friday, Sunday holidays Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _statutory_holidays(year: int) -> list[tuple[date, str]]:
+    holidays = [
+        (date(year, 1, 1), "New Year's Day"),
+        (_nth_weekday(year, 1, 0, 3), "Birthday of Martin Luther King, Jr."),
+        (_nth_weekday(year, 2, 0, 3), "Washington's Birthday"),
+        (_nth_weekday(year, 5, 0, -1), "Memorial Day"),
+        (date(year, 7, 4), "Independence Day"),
+        (_nth_weekday(year, 9, 0, 1), "Labor Day"),
+        (_nth_weekday(year, 10, 0, 2), "Columbus Day"),
+        (date(year, 11, 11), "Veterans Day"),
+        (_nth_weekday(year, 11, 3, 4), "Thanksgiving Day"),
+        (date(year, 12, 25), "Christmas Day"),
+    ]
+    if year >= 2021:
+        holidays.append((date(year, 6, 19), "Juneteenth National Independence Day"))
+    return holidays
+
+
+def federal_holidays(year: int) -> dict[date, str]:
+    """Observed federal legal holidays falling within a calendar year.
+
+    Includes December 31 when the following New Year's Day is a Saturday.
+    """
+    observed: dict[date, str] = {}
+    for day, name in _statutory_holidays(year) + _statutory_holidays(year + 1)[:1]:
+        obs = _observed(day)
+        if obs.year == year:
+            observed[obs] = name
+    return observed
+
+
+# ── Per-year calendar ───────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class _CourtYear:
+    year: int
+    first: date
+    open_days: bytearray    # bitmap: open_days[i] == 1 when day i is a court day
+    before: array           # before[i] = court days strictly before day i (len n + 1)
+    next_open: array        # next_open[i] = first court day >= i, or n if none this year
+    prev_open: array        # prev_open[i] = last court day <= i, or -1 if none this year
+    positions: array        # positions[k] = day index of the k-th court day
+    holidays: dict
+
+    @property
+    def total(self) -> int:
+        return len(self.positions)
+
+
+@lru_cache(maxsize=None)
+def _court_year(year: int) -> _CourtYear:
+    first = date(year, 1, 1)
+    n = (date(year + 1, 1, 1) - first).days
+    holidays = federal_holidays(year)
+
+    open_days = bytearray(n)
+    weekday = first.weekday()
+    for i in range(n):
+        if (weekday + i) % 7 < 5:
+            open_days[i] = 1
+    for day in holidays:
+        open_days[(day - first).days] = 0
+
+    before = array("h", [0] * (n + 1))
+    positions = array("h")
+    for i in range(n):
+        before[i + 1] = before[i] + open_days[i]
+        if open_days[i]:
+            positions.append(i)
+
+    next_open = array("h", [n] * n)
+    upcoming = n
+    for i in range(n - 1, -1, -1):
+        if open_days[i]:
+            upcoming = i
+        next_open[i] = upcoming
+
+    prev_open = array("h", [-1] * n)
+    latest = -1
+    for i in range(n):
+        if open_days[i]:
+            latest = i
+        prev_open[i] = latest
+
+    return _CourtYear(year, first, open_days, before, next_open, prev_open, positions, holidays)
+
+
+def _locate(day: date) -> tuple[_CourtYear, int]:
+    cal = _court_year(day.year)
+    return cal, (day - cal.first).days
+
+
+def precompute(start_year: int, end_year: int) -> None:
+    """Build the calendars for a range of years ahead of a bulk computation."""
+    for year in range(start_year, end_year + 1):
+        _court_year(year)
+
+
+# ── Queries ─────────────────────────────────────────────────────────────────
+
+def is_court_day(day: date) -> bool:
+    """True unless the day is a Saturday, Sunday or federal legal holiday."""
+    cal, i = _locate(day)
+    return bool(cal.open_days[i])
+
+
+def holiday_name(day: date) -> str:
+    """Name of the federal holiday observed on a day, or "" if none."""
+    return _court_year(day.year).holidays.get(day, "")
+
+
+def roll_forward(day: date) -> date:
+    """The day itself if it is a court day, otherwise the next court day."""
+    cal, i = _locate(day)
+    j = cal.next_open[i]
+    if j == len(cal.open_days):
+        cal = _court_year(day.year + 1)
+        j = cal.next_open[0]
+    return cal.first + timedelta(days=j)
+
+
+def roll_backward(day: date) -> date:
+    """The day itself if it is a court day, otherwise the previous court day."""
+    cal, i = _locate(day)
+    j = cal.prev_open[i]
+    if j < 0:
+        cal = _court_year(day.year - 1)
+        j = cal.prev_open[len(cal.open_days) - 1]
+    return cal.first + timedelta(days=j)
+
+
+def compute_deadline(trigger: date, days: int) -> date:
+    """Last day of a period of `days` calendar days under FRCP 6(a)(1).
+
+    Negative `days` measure a period before the trigger (e.g. "14 days before
+    trial"); a closed last day then rolls backward instead of forward.
+    """
+    last = trigger + timedelta(days=days)
+    return roll_backward(last) if days < 0 else roll_forward(last)
+
+
+def court_days_between(start: date, end: date) -> int:
+    """Court days after `start` up to and including `end` (negative if end < start)."""
+    if end < start:
+        return -court_days_between(end, start)
+    start_cal, i = _locate(start)
+    end_cal, j = _locate(end)
+    if start_cal.year == end_cal.year:
+        return end_cal.before[j + 1] - start_cal.before[i + 1]
+    count = start_cal.total - start_cal.before[i + 1]
+    for year in range(start.year + 1, end.year):
+        count += _court_year(year).total
+    return count + end_cal.before[j + 1]
+
+
+def add_court_days(start: date, count: int) -> date:
+    """The court day `count` court days after `start` (before it if negative).
+
+    Used for periods stated in court days; `count` of 0 returns `start`.
+    """
+    if count == 0:
+        return start
+    cal, i = _locate(start)
+    if count > 0:
+        k = cal.before[i + 1] + count - 1
+        while k >= cal.total:
+            k -= cal.total
+            cal = _court_year(cal.year + 1)
+    else:
+        k = cal.before[i] + count
+        while k < 0:
+            cal = _court_year(cal.year - 1)
+            k += cal.total
+    return cal.first + timedelta(days=cal.positions[k])
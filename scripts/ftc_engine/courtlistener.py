@@ -0,0 +1,449 @@
+"""
+CourtListener Client — Cached opinion searches for the Rule 11 monitor.
+
+Online monitor runs search CourtListener once per claim. The searches for a
+claim barely change from one day to the next, so every response is kept in a
+disk cache under ~/.ftc/cache/courtlistener (one JSON file per query URL):
+
+- Fresh (younger than the TTL): served from disk, no request.
+- Stale, within the stale window: served from disk at once, and revalidated
+  in a background thread (stale-while-revalidate).
+- Older, or not cached: fetched now. A cached entry's ETag/Last-Modified are
+  sent as If-None-Match/If-Modified-Since, so an unchanged result comes back
+  as a bodiless 304 that just renews the entry.
+- If the request fails, any cached copy is served instead, however old.
+
+The cache is capped in size; the least recently used entries go first.
+
+A monitor run over several claims fetches all of their searches at once
+(fetch_many): an asyncio loop drives requests over a small pool of kept-alive
+http.client connections, paced by a token bucket, each with its own
+deadline. Results are merged back in the order the URLs were given, whatever
+order they finish in.
+
+Environment:
+  COURTLISTENER_API_TOKEN     API token (online mode is off without it)
+  FTC_COURTLISTENER_URL       API base URL (default: CourtListener REST v4)
+  FTC_COURTLISTENER_TTL       Seconds a response stays fresh (default: 86400)
+
+Usage:
+  from ftc_engine.courtlistener import search_opinions
+  data = search_opinions("1983_fourth_excessive_force", token)
+  by_url = fetch_many([search_url(k) for k in claim_keys], token)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_BASE_URL = "https://www.courtlistener.com/api/rest/v4"
+CACHE_DIR = Path.home() / ".ftc" / "cache" / "courtlistener"
+DEFAULT_TTL = 24 * 3600            # fresh for a day
+DEFAULT_STALE = 7 * 24 * 3600      # then served stale (and revalidated) for a week
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+REQUEST_TIMEOUT = 10
+MAX_CONNECTIONS = 4
+REQUESTS_PER_SECOND = 4.0          # CourtListener allows 5,000 requests/hour
+
+# What a claim's search covers: recent SCOTUS / 11th Cir. opinions, newest first
+SEARCH_COURTS = ("scotus", "ca11")
+FILED_AFTER = "2023-01-01"
+RESULTS_PER_CLAIM = 3
+
+# Claim key -> search terms (other claims search their key's words)
+SEARCH_TERMS = {
+    "bivens_fourth_search_seizure": "Bivens fourth amendment",
+    "bivens_fifth_due_process": "Bivens fifth amendment due process",
+    "bivens_eighth_deliberate_indifference": "Bivens eighth amendment",
+    "1983_fourth_excessive_force": "section 1983 excessive force qualified immunity",
+    "1983_monell_municipal_liability": "Monell municipal liability",
+    "title_vii_disparate_treatment": "Title VII disparate treatment",
+    "apa_arbitrary_capricious": "APA arbitrary capricious chevron",
+}
+
+
+def base_url() -> str:
+    return os.environ.get("FTC_COURTLISTENER_URL", DEFAULT_BASE_URL).rstrip("/")
+
+
+def search_terms(claim_key: str) -> str:
+    return SEARCH_TERMS.get(claim_key, claim_key.replace("_", " "))
+
+
+def search_url(claim_key: str, base: str | None = None) -> str:
+    """The opinion search URL for a claim (recent SCOTUS / 11th Cir. decisions)."""
+    from urllib.parse import urlencode
+    params = {
+        "q": search_terms(claim_key), "type": "o", "court": ",".join(SEARCH_COURTS),
+        "filed_after": FILED_AFTER, "order_by": "dateFiled desc", "page_size": RESULTS_PER_CLAIM,
+    }
+    return f"{base or base_url()}/search/?{urlencode(params)}"
+
+
+# ── Disk cache ──────────────────────────────────────────────────────────────
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: dict
+    fetched_at: float
+    etag: str = ""
+    last_modified: str = ""
+
+    def age(self, now: float | None = None) -> float:
+        return (now if now is not None else time.time()) - self.fetched_at
+
+
+class ResponseCache:
+    """CourtListener responses on disk, keyed by URL, evicted LRU by size."""
+
+    def __init__(self, directory: Path | None = None, ttl: float | None = None,
+                 stale: float = DEFAULT_STALE, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory else CACHE_DIR
+        if ttl is None:
+            ttl = float(os.environ.get("FTC_COURTLISTENER_TTL", DEFAULT_TTL))
+        self.ttl = ttl
+        self.stale = stale
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        path = self._path(url)
+        try:
+            entry = CachedResponse(**json.loads(path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        if entry.url != url:
+            return None
+        try:
+            os.utime(path)  # mtime tracks last use for eviction
+        except OSError:
+            pass
+        return entry
+
+    def put(self, entry: CachedResponse) -> None:
+        """Store an entry (atomically), then evict down to max_bytes."""
+        path = self._path(entry.url)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(asdict(entry)))
+            tmp.replace(path)
+        except OSError:
+            return  # caching is best-effort
+        self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits; returns the count."""
+        with self._lock:
+            try:
+                files = [(p.stat(), p) for p in self.directory.glob("*.json")]
+            except OSError:
+                return 0
+            total = sum(st.st_size for st, _ in files)
+            removed = 0
+            for st, p in sorted(files, key=lambda f: f[0].st_mtime):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                total -= st.st_size
+                removed += 1
+            return removed
+
+    def clear(self) -> None:
+        for p in self.directory.glob("*.json"):
+            p.unlink(missing_ok=True)
+
+
+# ── Fetching ────────────────────────────────────────────────────────────────
+
+class CourtListenerError(Exception):
+    """A search failed and no cached copy was available."""
+
+
+_revalidations: list[threading.Thread] = []
+
+
+def conditional_headers(token: str, entry: Optional[CachedResponse]) -> dict[str, str]:
+    """Request headers: auth, plus validators from a cached entry."""
+    headers = {"Authorization": f"Token {token}", "Accept": "application/json"}
+    if entry and entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry and entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def store_response(cache: ResponseCache, url: str, status: int, headers, body: bytes,
+                   entry: Optional[CachedResponse]) -> CachedResponse:
+    """Turn a 200 or 304 response into a (stored) cache entry.
+
+    Raises:
+        CourtListenerError: Any other status, a 304 with nothing cached, or a bad body
+    """
+    if status == 304 and entry is not None:
+        fresh = CachedResponse(url, entry.body, time.time(),
+                               headers.get("ETag") or entry.etag,
+                               headers.get("Last-Modified") or entry.last_modified)
+    elif status == 200:
+        try:
+            data = json.loads(body.decode("utf-8"))
+        except ValueError as e:
+            raise CourtListenerError(f"Invalid JSON from CourtListener: {e}")
+        fresh = CachedResponse(url, data, time.time(),
+                               headers.get("ETag") or "", headers.get("Last-Modified") or "")
+    else:
+        raise CourtListenerError(f"CourtListener returned HTTP {status}")
+    cache.put(fresh)
+    return fresh
+
+
+def _request(url: str, token: str, cache: ResponseCache, entry: Optional[CachedResponse],
+             timeout: float) -> CachedResponse:
+    import urllib.error
+    import urllib.request
+
+    req = urllib.request.Request(url, headers=conditional_headers(token, entry))
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return store_response(cache, url, resp.status, resp.headers, resp.read(), entry)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return store_response(cache, url, 304, e.headers, b"", entry)
+        raise CourtListenerError(f"CourtListener returned HTTP {e.code}")
+    except OSError as e:
+        raise CourtListenerError(f"CourtListener request failed: {e}")
+
+
+def _revalidate(url: str, token: str, cache: ResponseCache, entry: CachedResponse,
+                timeout: float) -> None:
+    try:
+        _request(url, token, cache, entry, timeout)
+    except CourtListenerError:
+        pass  # the stale copy stays until the next attempt
+
+
+def _cached_body(url: str, token: str, cache: ResponseCache, entry: Optional[CachedResponse],
+                 timeout: float) -> Optional[dict]:
+    """The body to serve without waiting for a request, if the entry allows it.
+
+    Fresh entries are served as they are; stale ones are served while a
+    background thread revalidates them.
+    """
+    if entry is None:
+        return None
+    age = entry.age()
+    if age < cache.ttl:
+        return entry.body
+    if age < cache.ttl + cache.stale:
+        t = threading.Thread(target=_revalidate, args=(url, token, cache, entry, timeout),
+                             name="courtlistener-revalidate")
+        t.start()
+        _revalidations[:] = [r for r in _revalidations if r.is_alive()]  # drop finished ones
+        _revalidations.append(t)
+        return entry.body
+    return None
+
+
+def fetch_json(url: str, token: str, cache: ResponseCache | None = None,
+               timeout: float = REQUEST_TIMEOUT) -> dict:
+    """GET a CourtListener API URL through the disk cache.
+
+    Raises:
+        CourtListenerError: The request failed and nothing is cached
+    """
+    cache = cache or ResponseCache()
+    entry = cache.get(url)
+    body = _cached_body(url, token, cache, entry, timeout)
+    if body is not None:
+        return body
+    try:
+        return _request(url, token, cache, entry, timeout).body
+    except CourtListenerError:
+        if entry is not None:
+            return entry.body  # stale-if-error
+        raise
+
+
+def wait_for_revalidation(timeout: float | None = None) -> None:
+    """Wait for background revalidations started by fetch_json()."""
+    while _revalidations:
+        _revalidations.pop().join(timeout)
+
+
+def search_opinions(claim_key: str, token: str, cache: ResponseCache | None = None) -> dict:
+    """Recent opinions relevant to a claim (the raw search response)."""
+    return fetch_json(search_url(claim_key), token, cache)
+
+
+# ── Concurrent fetching ─────────────────────────────────────────────────────
+
+class TokenBucket:
+    """Async rate limiter: `rate` tokens per second, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float | None = None, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        import asyncio
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ConnectionPool:
+    """Kept-alive http.client connections to one host, shared by worker threads."""
+
+    def __init__(self, url: str, size: int = MAX_CONNECTIONS):
+        from urllib.parse import urlsplit
+        parts = urlsplit(url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname or ""
+        self.port = parts.port
+        self.size = size
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+    def _connect(self, timeout: float):
+        import http.client
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=timeout)
+
+    def request(self, target: str, headers: dict[str, str], timeout: float) -> tuple[int, dict, bytes]:
+        """GET `target` (path + query) on a pooled connection.
+
+        Raises:
+            CourtListenerError: Connection or protocol failure
+        """
+        import http.client
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._connect(timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise CourtListenerError(f"CourtListener request failed: {e}")
+        if resp.will_close:
+            conn.close()
+        else:
+            with self._lock:
+                if len(self._idle) < self.size:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+        return resp.status, resp.headers, body
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+async def _fetch_all(urls: list[str], token: str, cache: ResponseCache,
+                     entries: dict[str, Optional[CachedResponse]], connections: int,
+                     rate: float, timeout: float) -> dict[str, Optional[dict]]:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from urllib.parse import urlsplit
+
+    results: dict[str, Optional[dict]] = {}
+    if not urls:
+        return results
+    pool = ConnectionPool(urls[0], connections)
+    bucket = TokenBucket(rate)
+    slots = asyncio.Semaphore(connections)
+    loop = asyncio.get_running_loop()
+
+    async def fetch(url: str) -> None:
+        entry = entries[url]
+        parts = urlsplit(url)
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path or "/"
+        async with slots:
+            await bucket.acquire()
+            try:
+                status, headers, body = await asyncio.wait_for(
+                    loop.run_in_executor(executor, pool.request, target,
+                                         conditional_headers(token, entry), timeout),
+                    timeout)
+                results[url] = store_response(cache, url, status, headers, body, entry).body
+            except (CourtListenerError, asyncio.TimeoutError):
+                results[url] = entry.body if entry is not None else None  # stale-if-error
+
+    with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="courtlistener") as executor:
+        try:
+            await asyncio.gather(*(fetch(url) for url in urls))
+        finally:
+            pool.close()
+    return results
+
+
+def fetch_many(urls: list[str], token: str, cache: ResponseCache | None = None,
+               connections: int = MAX_CONNECTIONS, rate: float = REQUESTS_PER_SECOND,
+               timeout: float = REQUEST_TIMEOUT) -> dict[str, Optional[dict]]:
+    """GET several CourtListener URLs (one host) concurrently through the disk cache.
+
+    Cached entries are served as fetch_json() would; the rest are requested
+    at once over at most `connections` connections, at most `rate` requests
+    per second, each abandoned after `timeout` seconds.
+
+    Returns:
+        {url: body}, in the order the URLs were given; None where the request
+        failed and nothing was cached
+    """
+    import asyncio
+
+    cache = cache or ResponseCache()
+    merged: dict[str, Optional[dict]] = {}
+    entries: dict[str, Optional[CachedResponse]] = {}
+    for url in dict.fromkeys(urls):
+        entry = cache.get(url)
+        merged[url] = _cached_body(url, token, cache, entry, timeout)
+        if merged[url] is None:
+            entries[url] = entry
+    if entries:
+        fetched = asyncio.run(_fetch_all(list(entries), token, cache, entries,
+                                         max(1, connections), rate, timeout))
+        merged.update(fetched)
+    return merged
+
+
+def search_many(claim_keys: list[str], token: str, cache: ResponseCache | None = None,
+                **kwargs) -> dict[str, Optional[dict]]:
+    """search_opinions() for several claims at once; {claim_key: response or None}."""
+    urls = {ck: search_url(ck) for ck in claim_keys}
+    by_url = fetch_many(list(urls.values()), token, cache, **kwargs)
+    return {ck: by_url[url] for ck, url in urls.items()}
@@ -0,0 +1,262 @@
+"""
+CLI Daemon — Serves ftc commands from a warm process over a Unix socket.
+
+Every `ftc` invocation otherwise pays for a fresh interpreter: argparse, the
+engine modules, and the claim, district, element and viability tables. The
+daemon loads all of that once and then answers JSON-RPC 2.0 requests, one
+JSON object per line. The method is an ftc command name, and params carry
+the remaining arguments, the client's working directory and its FTC_* and
+COURTLISTENER_* environment variables:
+
+  {"jsonrpc": "2.0", "id": 1, "method": "suggest",
+   "params": {"args": ["-i", "case.json"], "cwd": "/home/me/smith",
+              "env": {"FTC_VIABILITY_SOURCE": "local"}, "version": "1.0.0"}}
+  -> {"jsonrpc": "2.0", "id": 1, "result": {"stdout": "...", "stderr": "", "exit_code": 0}}
+
+"ping" and "shutdown" are also accepted. Requests are handled one at a time,
+because each runs in the client's directory and environment with its
+output captured.
+
+While a daemon is running, `ftc <command>` sends the command to it and prints
+the reply (see daemon_client.py). Interactive commands always run locally, as
+does everything when FTC_NO_DAEMON is set or the daemon is missing or on
+another engine version.
+
+Usage:
+  ftc serve                  # run in the foreground (e.g. `ftc serve &`)
+  ftc serve --idle-timeout 3600
+  ftc serve --status
+  ftc serve --stop
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from .daemon_client import (  # noqa: F401 (re-exported)
+    FORWARDED_ENV_PREFIXES, INVALID_PARAMS, INVALID_REQUEST, LOCAL_ONLY_COMMANDS,
+    METHOD_NOT_FOUND, PARSE_ERROR, SOCKET_PATH, VERSION_MISMATCH, DaemonError, call, socket_path, try_remote,
+)
+
+
+# ── Server ──────────────────────────────────────────────────────────────────
+
+def warm_caches() -> None:
+    """Import the engine and build the tables commands read."""
+    from .claims import CLAIM_LIBRARY
+    from .deposition import CLAIM_ELEMENTS
+    from .districts import DISTRICTS, get_active_district
+    from .rule11_monitor import VIABILITY_KNOWLEDGE
+    from . import suggest, risk, sol, drafter, filing_calendar, pacer_meta, exhibits, questions  # noqa: F401
+
+    len(CLAIM_LIBRARY), len(CLAIM_ELEMENTS), len(VIABILITY_KNOWLEDGE), len(DISTRICTS)
+    get_active_district()
+
+
+@contextmanager
+def _client_environment(env: dict[str, str] | None):
+    """Replace this process's FTC_*/COURTLISTENER_* variables with the client's."""
+    if env is None:
+        yield
+        return
+    saved = {k: v for k, v in os.environ.items() if k.startswith(FORWARDED_ENV_PREFIXES)}
+    try:
+        for k in saved:
+            del os.environ[k]
+        os.environ.update({k: v for k, v in env.items() if k.startswith(FORWARDED_ENV_PREFIXES)})
+        yield
+    finally:
+        for k in [k for k in os.environ if k.startswith(FORWARDED_ENV_PREFIXES)]:
+            del os.environ[k]
+        os.environ.update(saved)
+
+
+def run_command(command: str, args: list[str], cwd: str | None = None,
+                env: dict[str, str] | None = None) -> dict:
+    """Run one ftc command in this process, capturing its output.
+
+    Args:
+        env: The client's FTC_*/COURTLISTENER_* variables, in effect for this
+            command only (None keeps the daemon's own)
+
+    District data files edited since the last command are reloaded first.
+
+    Returns {"stdout", "stderr", "exit_code"}.
+    """
+    from .cli import run
+    from .districts import refresh_districts
+
+    out, err = io.StringIO(), io.StringIO()
+    exit_code = 0
+    previous_cwd = os.getcwd()
+    try:
+        if cwd:
+            os.chdir(cwd)
+        with _client_environment(env), redirect_stdout(out), redirect_stderr(err):
+            try:
+                refresh_districts()
+                run([command, *args])
+            except SystemExit as e:
+                if isinstance(e.code, str):
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+                else:
+                    exit_code = e.code or 0
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        os.chdir(previous_cwd)
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "exit_code": exit_code}
+
+
+def _error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if self.server.stopping:
+                break
+        self.server.last_request = time.monotonic()
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Sequential JSON-RPC server for ftc commands."""
+
+    def __init__(self, path: Path, idle_timeout: float | None = None):
+        from . import __version__
+        from .cli import COMMANDS
+
+        self.version = __version__
+        self.commands = set(COMMANDS) - LOCAL_ONLY_COMMANDS
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.last_request = time.monotonic()
+        self.requests = 0
+        self.stopping = False
+        super().__init__(str(path), _Handler)
+        os.chmod(path, 0o600)
+
+    def dispatch(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return _error(request_id, INVALID_PARAMS, "params must be an object")
+        self.requests += 1
+
+        if method == "ping":
+            result = {"version": self.version, "pid": os.getpid(),
+                      "uptime": round(time.time() - self.started, 1), "requests": self.requests}
+        elif method == "shutdown":
+            self.stop()
+            result = {"stopped": True}
+        elif method in self.commands:
+            if params.get("version", self.version) != self.version:
+                return _error(request_id, VERSION_MISMATCH,
+                              f"Daemon runs engine {self.version}, client is {params['version']}")
+            args = params.get("args", [])
+            if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+                return _error(request_id, INVALID_PARAMS, "args must be a list of strings")
+            env = params.get("env")
+            if env is not None and not (isinstance(env, dict)
+                                        and all(isinstance(v, str) for v in env.values())):
+                return _error(request_id, INVALID_PARAMS, "env must be an object of strings")
+            result = run_command(method, args, params.get("cwd"), env)
+        else:
+            return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def stop(self) -> None:
+        """Leave serve_forever() once the current request is answered."""
+        if not self.stopping:
+            self.stopping = True
+            # shutdown() waits for the serve loop, so it can't run on the loop's thread
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def service_actions(self) -> None:
+        if self.idle_timeout and time.monotonic() - self.last_request > self.idle_timeout:
+            self.stop()
+
+
+def _daemon_running(path: Path) -> bool:
+    try:
+        call("ping", path=path)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def _private_socket_dir(directory: Path) -> None:
+    """Create the socket directory owner-only, or check that an existing one is private.
+
+    Raises:
+        RuntimeError: The directory belongs to another user or others can write to it
+    """
+    try:
+        directory.mkdir(mode=0o700, parents=True)
+        os.chmod(directory, 0o700)  # mkdir's mode is masked by the umask
+        return
+    except FileExistsError:
+        pass
+    st = directory.stat()
+    if st.st_uid != os.getuid():
+        raise RuntimeError(f"Socket directory {directory} belongs to another user")
+    if st.st_mode & 0o022:
+        raise RuntimeError(f"Socket directory {directory} is writable by other users; "
+                           f"put the socket in a private directory")
+
+
+def serve(path: Path | None = None, idle_timeout: float | None = None, ready=None) -> None:
+    """Run the daemon until a shutdown request arrives.
+
+    Args:
+        path: Socket path (default: socket_path())
+        idle_timeout: Exit after this many seconds without a request
+        ready: Optional threading.Event set once the socket is listening
+
+    Raises:
+        RuntimeError: Another daemon is already listening on the socket, or the
+            socket directory isn't private
+    """
+    path = path or socket_path()
+    _private_socket_dir(path.parent)
+    if path.exists():
+        if _daemon_running(path):
+            raise RuntimeError(f"ftc daemon already running on {path}")
+        path.unlink()  # stale socket from a daemon that died
+
+    warm_caches()
+    server = DaemonServer(path, idle_timeout)
+    try:
+        if ready is not None:
+            ready.set()
+        server.serve_forever(poll_interval=0.2)
+    finally:
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
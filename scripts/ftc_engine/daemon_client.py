@@ -0,0 +1,124 @@
+"""
+Daemon Client — Sends ftc commands to a running `ftc serve` daemon.
+
+Imported by every `ftc` invocation, so it stays small: when no daemon socket
+exists, try_remote() returns after one stat() call and the command runs
+locally. The server side lives in daemon.py.
+
+Usage:
+  exit_code = try_remote(sys.argv[1:])
+  if exit_code is None:
+      ...  # run locally
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+
+SOCKET_PATH = Path.home() / ".ftc" / "run" / "ftc.sock"
+
+# Commands that prompt for input or manage the daemon itself never go remote
+LOCAL_ONLY_COMMANDS = {"new", "open", "setup", "serve"}
+
+# Environment variables the engine reads at run time; the client's values are
+# sent with each request and replace the daemon's own for that command
+FORWARDED_ENV_PREFIXES = ("FTC_", "COURTLISTENER_")
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+VERSION_MISMATCH = -32000
+
+_CONNECT_TIMEOUT = 0.5
+
+
+def socket_path() -> Path:
+    """The daemon socket: $FTC_SOCKET, else $XDG_RUNTIME_DIR/ftc/ftc.sock, else ~/.ftc/run/ftc.sock."""
+    if os.environ.get("FTC_SOCKET"):
+        return Path(os.environ["FTC_SOCKET"])
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "ftc" / "ftc.sock"
+    return SOCKET_PATH
+
+
+class DaemonError(Exception):
+    """The daemon answered with a JSON-RPC error."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def call(method: str, params: dict | None = None, path: Path | None = None) -> dict:
+    """Send one request to the daemon and return its result.
+
+    Raises:
+        OSError: No daemon is listening
+        DaemonError: The daemon rejected the request
+    """
+    import socket
+
+    path = path or socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        sock.connect(str(path))
+        sock.settimeout(None)  # commands such as batch export can run for a while
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("ftc daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise DaemonError(response["error"]["code"], response["error"]["message"])
+    return response["result"]
+
+
+def _output_format(argv: list[str]) -> str | None:
+    """The --format value in argv, as argparse reads it (--format X, --format=X, --form X)."""
+    fmt = None
+    for i, arg in enumerate(argv):
+        option, eq, value = arg.partition("=")
+        if len(option) > 3 and "--format".startswith(option):
+            fmt = value if eq else (argv[i + 1] if i + 1 < len(argv) else None)
+    return fmt
+
+
+def try_remote(argv: list[str]) -> int | None:
+    """Run a command on the daemon if one is available.
+
+    Prints the command's output and returns its exit code, or returns None
+    if the command must run locally (no daemon, another engine version,
+    interactive command, --batch, a '-' stdin/stdout argument, or FTC_NO_DAEMON
+    set).
+    """
+    if not argv or argv[0] in LOCAL_ONLY_COMMANDS or argv[0].startswith("-"):
+        return None
+    if "-" in argv:  # streams stdin/stdout, which the daemon can't see
+        return None
+    if any(a == "--batch" or a.startswith("--batch=") for a in argv):
+        return None  # long-running and spawns its own worker pool
+    if _output_format(argv) == "msgpack":  # binary stdout; the daemon relays text only
+        return None
+    if os.environ.get("FTC_NO_DAEMON"):
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+
+    from . import __version__
+    try:
+        env = {k: v for k, v in os.environ.items() if k.startswith(FORWARDED_ENV_PREFIXES)}
+        result = call(argv[0], {"args": argv[1:], "cwd": os.getcwd(), "env": env,
+                                "version": __version__}, path)
+    except (OSError, ValueError, DaemonError):
+        return None
+    sys.stdout.write(result.get("stdout", ""))
+    sys.stderr.write(result.get("stderr", ""))
+    return int(result.get("exit_code", 0))
@@ -19,6 +19,8 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
+from .lazy import lazy_attributes
+
 
 @dataclass
 class DepositionQuestion:
@@ -46,122 +48,129 @@ class DepositionOutline:
 
 # ── Claim Elements Knowledge Base ────────────────────────────────────────────
 
-CLAIM_ELEMENTS: dict[str, list[dict]] = {
-    "1983_fourth_excessive_force": [
-        {"element": "State action / color of law",
-         "direct": ["Describe the officer's role and duties on the date of the incident."],
-         "cross": ["You were acting in your official capacity as a law enforcement officer, correct?",
-                    "You were on duty at the time, isn't that right?"]},
-        {"element": "Seizure occurred",
-         "direct": ["Describe what happened when you encountered the officer.",
-                     "Were you free to leave at any point during this encounter?"],
-         "cross": ["You physically restrained the plaintiff, correct?",
-                    "The plaintiff was not free to leave, isn't that true?"]},
-        {"element": "Force was objectively unreasonable (Graham v. Connor factors)",
-         "direct": ["Describe the level of force used against you.",
-                     "What were you doing immediately before force was applied?",
-                     "Did you pose any threat to anyone at that moment?"],
-         "cross": ["What crime did you suspect the plaintiff of committing?",
-                    "On a scale from 1 to 10, how would you rate the severity of that crime?",
-                    "Did the plaintiff have any weapons?",
-                    "Was the plaintiff actively resisting arrest?",
-                    "Isn't it true that less force could have achieved the same result?"]},
-        {"element": "Injury resulted from the force",
-         "direct": ["Describe the injuries you sustained.",
-                     "What medical treatment did you receive?"],
-         "cross": ["You observed injuries on the plaintiff after the use of force, correct?",
-                    "An ambulance was called to the scene, isn't that right?"]},
-    ],
-    "1983_fourth_false_arrest": [
-        {"element": "Arrest occurred without probable cause",
-         "direct": ["Describe the circumstances of your arrest.",
-                     "What were you told was the reason for your arrest?"],
-         "cross": ["What specific facts supported probable cause for this arrest?",
-                    "Did you obtain an arrest warrant before arresting the plaintiff?",
-                    "Isn't it true that the only basis for arrest was a verbal complaint?"]},
-        {"element": "State actor made the arrest",
-         "direct": ["Identify the person who placed you under arrest."],
-         "cross": ["You identified yourself as a police officer before making the arrest, correct?"]},
-        {"element": "Resulting deprivation of liberty",
-         "direct": ["How long were you detained?", "Where were you taken?"],
-         "cross": ["The plaintiff was held in custody for more than 24 hours, correct?"]},
-    ],
-    "1983_monell_municipal_liability": [
-        {"element": "Official policy, custom, or practice",
-         "direct": ["Are you aware of the department's use-of-force policy?"],
-         "cross": ["The department has a written use-of-force policy, correct?",
-                    "How many excessive force complaints were filed against this department in the past three years?",
-                    "Were all officers trained on the current use-of-force policy?"]},
-        {"element": "Policy was the moving force behind the violation",
-         "direct": ["In your experience, how does the department handle similar situations?"],
-         "cross": ["Isn't it true that this officer had prior complaints for excessive force?",
-                    "Were any prior complaints sustained?",
-                    "What disciplinary action was taken, if any?"]},
-    ],
-    "title_vii_disparate_treatment": [
-        {"element": "Membership in protected class",
-         "direct": ["What is your race/gender/national origin?"],
-         "cross": ["You are aware that the plaintiff is a member of a protected class, correct?"]},
-        {"element": "Adverse employment action",
-         "direct": ["Describe the employment action taken against you.",
-                     "When did this occur?"],
-         "cross": ["You terminated the plaintiff's employment, correct?",
-                    "What was the stated reason for the termination?"]},
-        {"element": "Similarly situated comparators treated differently",
-         "direct": ["Were there other employees in similar positions who were not terminated?",
-                     "What was their protected class status?"],
-         "cross": ["Other employees with similar performance records were retained, correct?",
-                    "Those employees were outside the plaintiff's protected class, isn't that true?"]},
-        {"element": "Pretext — stated reason is not the real reason",
-         "direct": ["Were you given any indication that the real reason differed from what was stated?"],
-         "cross": ["The stated reason for termination was documented in writing, correct?",
-                    "When was that documentation created — before or after the termination decision?",
-                    "Isn't it true that the plaintiff's supervisor made comments about [protected class]?"]},
-    ],
-    "title_vii_hostile_work_environment": [
-        {"element": "Unwelcome conduct based on protected characteristic",
-         "direct": ["Describe the conduct you experienced at work.",
-                     "How did this conduct relate to your [protected class]?"],
-         "cross": ["You were aware of complaints about this conduct, correct?"]},
-        {"element": "Severe or pervasive",
-         "direct": ["How frequently did this conduct occur?",
-                     "How did it affect your ability to perform your job?"],
-         "cross": ["You received multiple complaints from the plaintiff about this conduct, correct?",
-                    "This conduct occurred over a period of months, isn't that right?"]},
-        {"element": "Employer knew or should have known and failed to act",
-         "direct": ["Did you report this conduct to your supervisor or HR?", "What happened after you reported?"],
-         "cross": ["The plaintiff reported this conduct to HR, correct?",
-                    "What investigation was conducted?",
-                    "What corrective action was taken?"]},
-    ],
-    "ftca_negligence": [
-        {"element": "Duty of care owed by federal employee",
-         "direct": ["Describe the federal employee's role and responsibilities."],
-         "cross": ["The federal employee had a duty to follow established protocols, correct?"]},
-        {"element": "Breach of duty",
-         "direct": ["Describe how the standard of care was violated."],
-         "cross": ["The established protocol was not followed, isn't that true?"]},
-        {"element": "Causation",
-         "direct": ["How did the federal employee's actions cause your injury?"],
-         "cross": ["The plaintiff's injuries occurred as a direct result of the employee's actions, correct?"]},
-        {"element": "Damages",
-         "direct": ["Describe the harm you suffered.", "What treatment have you received?"],
-         "cross": ["Medical records document the plaintiff's injuries, correct?"]},
-    ],
-    "ada_title_i_employment_disability": [
-        {"element": "Qualified individual with a disability",
-         "direct": ["Describe your disability.", "Were you able to perform the essential functions of your job?"],
-         "cross": ["You were aware the plaintiff had a disability, correct?",
-                    "The plaintiff was performing their job duties satisfactorily, isn't that true?"]},
-        {"element": "Failure to provide reasonable accommodation",
-         "direct": ["What accommodation did you request?", "What was the employer's response?"],
-         "cross": ["The plaintiff requested an accommodation, correct?",
-                    "What interactive process did you engage in to determine a reasonable accommodation?"]},
-        {"element": "Adverse action because of disability",
-         "direct": ["Do you believe your disability played a role in the adverse action?"],
-         "cross": ["The timing of the adverse action coincided with the accommodation request, correct?"]},
-    ],
-}
+CLAIM_ELEMENTS: dict[str, list[dict]]  # built on first access
+
+
+def _build_claim_elements() -> dict[str, list[dict]]:
+    return {
+        "1983_fourth_excessive_force": [
+            {"element": "State action / color of law",
+             "direct": ["Describe the officer's role and duties on the date of the incident."],
+             "cross": ["You were acting in your official capacity as a law enforcement officer, correct?",
+                        "You were on duty at the time, isn't that right?"]},
+            {"element": "Seizure occurred",
+             "direct": ["Describe what happened when you encountered the officer.",
+                         "Were you free to leave at any point during this encounter?"],
+             "cross": ["You physically restrained the plaintiff, correct?",
+                        "The plaintiff was not free to leave, isn't that true?"]},
+            {"element": "Force was objectively unreasonable (Graham v. Connor factors)",
+             "direct": ["Describe the level of force used against you.",
+                         "What were you doing immediately before force was applied?",
+                         "Did you pose any threat to anyone at that moment?"],
+             "cross": ["What crime did you suspect the plaintiff of committing?",
+                        "On a scale from 1 to 10, how would you rate the severity of that crime?",
+                        "Did the plaintiff have any weapons?",
+                        "Was the plaintiff actively resisting arrest?",
+                        "Isn't it true that less force could have achieved the same result?"]},
+            {"element": "Injury resulted from the force",
+             "direct": ["Describe the injuries you sustained.",
+                         "What medical treatment did you receive?"],
+             "cross": ["You observed injuries on the plaintiff after the use of force, correct?",
+                        "An ambulance was called to the scene, isn't that right?"]},
+        ],
+        "1983_fourth_false_arrest": [
+            {"element": "Arrest occurred without probable cause",
+             "direct": ["Describe the circumstances of your arrest.",
+                         "What were you told was the reason for your arrest?"],
+             "cross": ["What specific facts supported probable cause for this arrest?",
+                        "Did you obtain an arrest warrant before arresting the plaintiff?",
+                        "Isn't it true that the only basis for arrest was a verbal complaint?"]},
+            {"element": "State actor made the arrest",
+             "direct": ["Identify the person who placed you under arrest."],
+             "cross": ["You identified yourself as a police officer before making the arrest, correct?"]},
+            {"element": "Resulting deprivation of liberty",
+             "direct": ["How long were you detained?", "Where were you taken?"],
+             "cross": ["The plaintiff was held in custody for more than 24 hours, correct?"]},
+        ],
+        "1983_monell_municipal_liability": [
+            {"element": "Official policy, custom, or practice",
+             "direct": ["Are you aware of the department's use-of-force policy?"],
+             "cross": ["The department has a written use-of-force policy, correct?",
+                        "How many excessive force complaints were filed against this department in the past three years?",
+                        "Were all officers trained on the current use-of-force policy?"]},
+            {"element": "Policy was the moving force behind the violation",
+             "direct": ["In your experience, how does the department handle similar situations?"],
+             "cross": ["Isn't it true that this officer had prior complaints for excessive force?",
+                        "Were any prior complaints sustained?",
+                        "What disciplinary action was taken, if any?"]},
+        ],
+        "title_vii_disparate_treatment": [
+            {"element": "Membership in protected class",
+             "direct": ["What is your race/gender/national origin?"],
+             "cross": ["You are aware that the plaintiff is a member of a protected class, correct?"]},
+            {"element": "Adverse employment action",
+             "direct": ["Describe the employment action taken against you.",
+                         "When did this occur?"],
+             "cross": ["You terminated the plaintiff's employment, correct?",
+                        "What was the stated reason for the termination?"]},
+            {"element": "Similarly situated comparators treated differently",
+             "direct": ["Were there other employees in similar positions who were not terminated?",
+                         "What was their protected class status?"],
+             "cross": ["Other employees with similar performance records were retained, correct?",
+                        "Those employees were outside the plaintiff's protected class, isn't that true?"]},
+            {"element": "Pretext — stated reason is not the real reason",
+             "direct": ["Were you given any indication that the real reason differed from what was stated?"],
+             "cross": ["The stated reason for termination was documented in writing, correct?",
+                        "When was that documentation created — before or after the termination decision?",
+                        "Isn't it true that the plaintiff's supervisor made comments about [protected class]?"]},
+        ],
+        "title_vii_hostile_work_environment": [
+            {"element": "Unwelcome conduct based on protected characteristic",
+             "direct": ["Describe the conduct you experienced at work.",
+                         "How did this conduct relate to your [protected class]?"],
+             "cross": ["You were aware of complaints about this conduct, correct?"]},
+            {"element": "Severe or pervasive",
+             "direct": ["How frequently did this conduct occur?",
+                         "How did it affect your ability to perform your job?"],
+             "cross": ["You received multiple complaints from the plaintiff about this conduct, correct?",
+                        "This conduct occurred over a period of months, isn't that right?"]},
+            {"element": "Employer knew or should have known and failed to act",
+             "direct": ["Did you report this conduct to your supervisor or HR?", "What happened after you reported?"],
+             "cross": ["The plaintiff reported this conduct to HR, correct?",
+                        "What investigation was conducted?",
+                        "What corrective action was taken?"]},
+        ],
+        "ftca_negligence": [
+            {"element": "Duty of care owed by federal employee",
+             "direct": ["Describe the federal employee's role and responsibilities."],
+             "cross": ["The federal employee had a duty to follow established protocols, correct?"]},
+            {"element": "Breach of duty",
+             "direct": ["Describe how the standard of care was violated."],
+             "cross": ["The established protocol was not followed, isn't that true?"]},
+            {"element": "Causation",
+             "direct": ["How did the federal employee's actions cause your injury?"],
+             "cross": ["The plaintiff's injuries occurred as a direct result of the employee's actions, correct?"]},
+            {"element": "Damages",
+             "direct": ["Describe the harm you suffered.", "What treatment have you received?"],
+             "cross": ["Medical records document the plaintiff's injuries, correct?"]},
+        ],
+        "ada_title_i_employment_disability": [
+            {"element": "Qualified individual with a disability",
+             "direct": ["Describe your disability.", "Were you able to perform the essential functions of your job?"],
+             "cross": ["You were aware the plaintiff had a disability, correct?",
+                        "The plaintiff was performing their job duties satisfactorily, isn't that true?"]},
+            {"element": "Failure to provide reasonable accommodation",
+             "direct": ["What accommodation did you request?", "What was the employer's response?"],
+             "cross": ["The plaintiff requested an accommodation, correct?",
+                        "What interactive process did you engage in to determine a reasonable accommodation?"]},
+            {"element": "Adverse action because of disability",
+             "direct": ["Do you believe your disability played a role in the adverse action?"],
+             "cross": ["The timing of the adverse action coincided with the accommodation request, correct?"]},
+        ],
+    }
+
+
+__getattr__ = lazy_attributes(globals(), CLAIM_ELEMENTS=_build_claim_elements)
 
 # Generic elements for claims not in CLAIM_ELEMENTS
 _GENERIC_ELEMENTS: list[dict] = [
@@ -277,7 +286,7 @@ def _generate_claim_element_questions(
     case_data: dict, claim_key: str, witness_name: str, exam_type: str
 ) -> list[DepositionQuestion]:
     """Generate questions mapped to specific claim elements."""
-    elements = CLAIM_ELEMENTS.get(claim_key, _GENERIC_ELEMENTS)
+    elements = __getattr__("CLAIM_ELEMENTS").get(claim_key, _GENERIC_ELEMENTS)
     qs = []
 
     for elem in elements:
@@ -3,19 +3,23 @@ District Portability Layer — Configuration system to swap Local Rules and
 standard orders for any Federal District.
 
 Replaces hardcoded M.D. Fla. references throughout the engine with a
-configurable district context. Supports 7 built-in districts with extensible
-data structures for additional districts.
+configurable district context. Ships 7 built-in districts in
+data/districts.json; more districts and judges can be added, or built-in
+fields overridden, with JSON files in ~/.ftc/districts/.
 
 Usage:
   ftc district list                  # List all available districts
   ftc district set sdfl              # Switch to S.D. Florida
   ftc district info ndcal            # Show N.D. California details
   ftc district current               # Show active district
+  ftc district compile               # Rebuild the district snapshot
 """
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import marshal
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
@@ -91,223 +95,197 @@ class DistrictContext:
     active_judge: Optional[JudgeInfo] = None
 
 
-# ── Built-in District Database ───────────────────────────────────────────────
-
-DISTRICTS: dict[str, DistrictConfig] = {
-    "mdfl": DistrictConfig(
-        code="mdfl",
-        name="Middle District of Florida",
-        circuit="11th Circuit",
-        circuit_number=11,
-        state="Florida",
-        divisions=["Tampa", "Orlando", "Jacksonville", "Fort Myers", "Ocala"],
-        motion_page_limit=25,
-        response_page_limit=25,
-        reply_page_limit=10,
-        response_days=21,
-        reply_days=7,
-        interrogatory_limit=25,
-        deposition_limit=10,
-        meet_and_confer_required=True,
-        meet_and_confer_method="phone_or_in_person",
-        mediation_required=True,
-        sol_state="Florida",
-        sol_personal_injury_years=4.0,
-        court_address="401 W. Central Blvd., Suite 1100, Orlando, FL 32801",
-        clerk_phone="(407) 835-4200",
-        local_rule_prefix="Local Rule",
-        special_rules=[
-            "Local Rule 3.01(g): meet-and-confer must be in person or by phone, NOT email",
-            "Local Rule 9.01: mediation required for all cases",
-            "Local Rule 6.01: magistrate consent required for dispositive matters",
-            "Pro se handbook available at flmd.uscourts.gov",
-        ],
-    ),
-
-    "sdfl": DistrictConfig(
-        code="sdfl",
-        name="Southern District of Florida",
-        circuit="11th Circuit",
-        circuit_number=11,
-        state="Florida",
-        divisions=["Miami", "Fort Lauderdale", "West Palm Beach", "Key West"],
-        motion_page_limit=20,
-        response_page_limit=20,
-        reply_page_limit=10,
-        response_days=14,
-        reply_days=7,
-        interrogatory_limit=25,
-        deposition_limit=10,
-        meet_and_confer_required=True,
-        meet_and_confer_method="phone_or_in_person",
-        mediation_required=True,
-        sol_state="Florida",
-        sol_personal_injury_years=4.0,
-        court_address="400 N. Miami Ave., Miami, FL 33128",
-        clerk_phone="(305) 523-5100",
-        local_rule_prefix="Local Rule",
-        special_rules=[
-            "Local Rule 7.1(a)(3): motions limited to 20 pages",
-            "Local Rule 16.1: mediation required within 150 days of answer",
-            "Local Rule 7.1: separate statement of undisputed facts for summary judgment",
-            "Local Rule 88.9: assigned duty judges handle emergency motions",
-        ],
-    ),
-
-    "ndcal": DistrictConfig(
-        code="ndcal",
-        name="Northern District of California",
-        circuit="9th Circuit",
-        circuit_number=9,
-        state="California",
-        divisions=["San Francisco", "San Jose", "Oakland", "Eureka"],
-        motion_page_limit=25,
-        response_page_limit=25,
-        reply_page_limit=15,
-        response_days=14,
-        reply_days=7,
-        interrogatory_limit=25,
-        deposition_limit=10,
-        meet_and_confer_required=True,
-        meet_and_confer_method="any",
-        mediation_required=False,
-        sol_state="California",
-        sol_personal_injury_years=2.0,
-        court_address="450 Golden Gate Ave., San Francisco, CA 94102",
-        clerk_phone="(415) 522-2000",
-        local_rule_prefix="Civil L.R.",
-        special_rules=[
-            "Civil L.R. 7-2: no hearing on motion unless ordered by judge",
-            "Civil L.R. 7-4: tentative rulings issued before hearings",
-            "Civil L.R. 36-1: early neutral evaluation (ENE) program",
-            "ADR required under Civil L.R. 16-8",
-            "Patent Local Rules for IP cases",
-        ],
-    ),
-
-    "sdny": DistrictConfig(
-        code="sdny",
-        name="Southern District of New York",
-        circuit="2nd Circuit",
-        circuit_number=2,
-        state="New York",
-        divisions=["Manhattan", "White Plains"],
-        motion_page_limit=25,
-        response_page_limit=25,
-        reply_page_limit=10,
-        response_days=14,
-        reply_days=7,
-        interrogatory_limit=25,
-        deposition_limit=10,
-        meet_and_confer_required=True,
-        meet_and_confer_method="any",
-        mediation_required=False,
-        sol_state="New York",
-        sol_personal_injury_years=3.0,
-        court_address="500 Pearl St., New York, NY 10007",
-        clerk_phone="(212) 805-0136",
-        local_rule_prefix="Local Civil Rule",
-        special_rules=[
-            "Local Civil Rule 6.1: letter motions for non-dispositive issues",
-            "Local Civil Rule 33.3: Uniform Interrogatories adopted by individual judges",
-            "Local Civil Rule 56.1: Rule 56.1 Statement required for summary judgment",
-            "Individual judge practices vary significantly — check judge's webpage",
-            "Most judges require pre-motion conference before filing MTD or SJ",
-        ],
-    ),
-
-    "edva": DistrictConfig(
-        code="edva",
-        name="Eastern District of Virginia",
-        circuit="4th Circuit",
-        circuit_number=4,
-        state="Virginia",
-        divisions=["Alexandria", "Norfolk", "Newport News", "Richmond"],
-        motion_page_limit=30,
-        response_page_limit=30,
-        reply_page_limit=15,
-        response_days=11,
-        reply_days=3,
-        interrogatory_limit=25,
-        deposition_limit=10,
-        meet_and_confer_required=True,
-        meet_and_confer_method="any",
-        mediation_required=False,
-        sol_state="Virginia",
-        sol_personal_injury_years=2.0,
-        court_address="401 Courthouse Sq., Alexandria, VA 22314",
-        clerk_phone="(703) 299-2100",
-        local_rule_prefix="Local Rule",
-        special_rules=[
-            "Known as the 'Rocket Docket' — fastest federal court in the U.S.",
-            "Local Rule 7(F): 11-day response period, 3-day reply period",
-            "Discovery typically completed within 5 months",
-            "Trial dates set early and rarely continued",
-            "Cases move from complaint to trial in 8-12 months",
-        ],
-    ),
-
-    "ndill": DistrictConfig(
-        code="ndill",
-        name="Northern District of Illinois",
-        circuit="7th Circuit",
-        circuit_number=7,
-        state="Illinois",
-        divisions=["Chicago", "Rockford"],
-        motion_page_limit=15,
-        response_page_limit=15,
-        reply_page_limit=10,
-        response_days=21,
-        reply_days=14,
-        interrogatory_limit=25,
-        deposition_limit=10,
-        meet_and_confer_required=True,
-        meet_and_confer_method="any",
-        mediation_required=False,
-        sol_state="Illinois",
-        sol_personal_injury_years=2.0,
-        court_address="219 S. Dearborn St., Chicago, IL 60604",
-        clerk_phone="(312) 435-5670",
-        local_rule_prefix="LR",
-        special_rules=[
-            "LR 7.1: motions limited to 15 pages (strictly enforced)",
-            "LR 56.1: Local Rule 56.1 statements required for summary judgment",
-            "LR 83.11: initial status report required within 14 days of answer",
-            "Seventh Circuit limits briefing to 30 pages on appeal",
-        ],
-    ),
-
-    "ddc": DistrictConfig(
-        code="ddc",
-        name="District of Columbia",
-        circuit="D.C. Circuit",
-        circuit_number=0,  # D.C. has no numbered circuit
-        state="District of Columbia",
-        divisions=["Washington"],
-        motion_page_limit=45,
-        response_page_limit=45,
-        reply_page_limit=25,
-        response_days=14,
-        reply_days=7,
-        interrogatory_limit=25,
-        deposition_limit=10,
-        meet_and_confer_required=True,
-        meet_and_confer_method="any",
-        mediation_required=False,
-        sol_state="District of Columbia",
-        sol_personal_injury_years=3.0,
-        court_address="333 Constitution Ave., NW, Washington, DC 20001",
-        clerk_phone="(202) 354-3000",
-        local_rule_prefix="LCvR",
-        special_rules=[
-            "LCvR 7(a): generous 45-page limit for motions",
-            "LCvR 7(d): meet-and-confer required before filing any motion",
-            "Primary venue for APA/federal agency challenges",
-            "Heavy administrative law docket — specialized APA expertise on bench",
-            "D.C. Circuit highly influential for federal regulatory law",
-        ],
-    ),
-}
+# ── District Database ───────────────────────────────────────────────────────
+#
+# District data lives in data/districts.json (built-in) plus any *.json files
+# in ~/.ftc/districts/, which may add new districts or override fields of
+# existing ones by code. The merged set is compiled into a marshal snapshot at
+# ~/.ftc/cache/districts.snapshot holding one pre-serialized record per
+# district; the snapshot is rebuilt whenever a source file changes. Each
+# DistrictConfig is materialized only when first looked up, so a single
+# `ftc district info` or SOL lookup does not build every district.
+
+_DATA_FILE = Path(__file__).parent / "data" / "districts.json"
+_USER_DISTRICTS_DIR = Path.home() / ".ftc" / "districts"
+_SNAPSHOT_FILE = Path.home() / ".ftc" / "cache" / "districts.snapshot"
+_SNAPSHOT_VERSION = 1
+
+_REQUIRED_FIELDS = ("code", "name", "circuit", "circuit_number", "state")
+_DISTRICT_FIELDS = {f.name for f in fields(DistrictConfig)}
+_JUDGE_FIELDS = {f.name for f in fields(JudgeInfo)}
+
+
+def _district_sources() -> list[Path]:
+    """Built-in data file followed by user extension files (sorted by name)."""
+    sources = [_DATA_FILE]
+    if _USER_DISTRICTS_DIR.is_dir():
+        sources.extend(sorted(_USER_DISTRICTS_DIR.glob("*.json")))
+    return sources
+
+
+def _source_stamps(sources: list[Path]) -> list[tuple[str, int, int]]:
+    stamps = []
+    for path in sources:
+        st = path.stat()
+        stamps.append((str(path), st.st_mtime_ns, st.st_size))
+    return stamps
+
+
+def _read_district_records(path: Path) -> list[dict]:
+    """Read district records from one data file ({"districts": [...]} or a list)."""
+    try:
+        data = json.loads(path.read_text())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid district data in {path}: {e}") from e
+    records = data.get("districts", []) if isinstance(data, dict) else data
+    for rec in records:
+        unknown = set(rec) - _DISTRICT_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown district field(s) in {path}: {', '.join(sorted(unknown))}")
+        if "code" not in rec:
+            raise ValueError(f"District record without 'code' in {path}")
+        for judge in rec.get("judges", []):
+            unknown = set(judge) - _JUDGE_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown judge field(s) in {path}: {', '.join(sorted(unknown))}")
+    return records
+
+
+def compile_district_snapshot(sources: list[Path] | None = None) -> dict:
+    """Merge district data files and compile them into a snapshot dict.
+
+    Later sources override earlier ones field by field, keyed by district code.
+    Returns {"version", "sources", "records": {code: bytes}, "names": {name: code}}.
+    """
+    sources = sources if sources is not None else _district_sources()
+    merged: dict[str, dict] = {}
+    for path in sources:
+        for rec in _read_district_records(path):
+            code = rec["code"].lower()
+            merged[code] = {**merged.get(code, {}), **rec, "code": code}
+
+    records: dict[str, bytes] = {}
+    names: dict[str, str] = {}
+    for code, rec in merged.items():
+        missing = [f for f in _REQUIRED_FIELDS if f not in rec]
+        if missing:
+            raise ValueError(f"District '{code}' is missing required field(s): {', '.join(missing)}")
+        records[code] = marshal.dumps(rec)
+        names[rec["name"].lower()] = code
+
+    return {
+        "version": _SNAPSHOT_VERSION,
+        "sources": _source_stamps(sources),
+        "records": records,
+        "names": names,
+    }
+
+
+def _load_snapshot() -> dict:
+    """Load the compiled snapshot, rebuilding it if any source file changed."""
+    sources = _district_sources()
+    stamps = _source_stamps(sources)
+    try:
+        snapshot = marshal.loads(_SNAPSHOT_FILE.read_bytes())
+        if snapshot.get("version") == _SNAPSHOT_VERSION and snapshot.get("sources") == stamps:
+            return snapshot
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+
+    snapshot = compile_district_snapshot(sources)
+    try:
+        _SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _SNAPSHOT_FILE.with_suffix(".tmp")
+        tmp.write_bytes(marshal.dumps(snapshot))
+        tmp.replace(_SNAPSHOT_FILE)
+    except OSError:
+        pass  # Read-only home: keep the compiled snapshot in memory only
+    return snapshot
+
+
+def _materialize(record: bytes) -> DistrictConfig:
+    data = marshal.loads(record)
+    data["judges"] = [JudgeInfo(**j) for j in data.get("judges", [])]
+    return DistrictConfig(**data)
+
+
+class _DistrictTable(Mapping):
+    """Read-only mapping of code -> DistrictConfig backed by the snapshot.
+
+    The snapshot is loaded on first use and each DistrictConfig is built on
+    first access, then reused.
+    """
+
+    def __init__(self):
+        self._snapshot: dict | None = None
+        self._configs: dict[str, DistrictConfig] = {}
+
+    def _records(self) -> dict[str, bytes]:
+        if self._snapshot is None:
+            self._snapshot = _load_snapshot()
+        return self._snapshot["records"]
+
+    def __getitem__(self, code: str) -> DistrictConfig:
+        config = self._configs.get(code)
+        if config is None:
+            config = _materialize(self._records()[code])
+            self._configs[code] = config
+        return config
+
+    def __iter__(self):
+        return iter(self._records())
+
+    def __len__(self) -> int:
+        return len(self._records())
+
+    def __contains__(self, code) -> bool:
+        return code in self._records()
+
+    def code_for_name(self, name: str) -> str | None:
+        self._records()
+        return self._snapshot["names"].get(name.lower())
+
+    def stale(self) -> bool:
+        """True if a district data file changed since the snapshot was loaded."""
+        if self._snapshot is None:
+            return False
+        try:
+            return self._snapshot["sources"] != _source_stamps(_district_sources())
+        except OSError:
+            return True
+
+    def reload(self) -> None:
+        self._snapshot = None
+        self._configs.clear()
+
+
+DISTRICTS: Mapping[str, DistrictConfig] = _DistrictTable()
+
+
+def reload_districts() -> int:
+    """Re-read district data files (recompiling the snapshot if needed).
+
+    Returns:
+        Number of districts available
+    """
+    DISTRICTS.reload()
+    clear_config_cache()
+    return len(DISTRICTS)
+
+
+def refresh_districts() -> bool:
+    """Reload the districts if a data file changed since they were loaded.
+
+    Long-lived processes (the daemon) call this before each command; a
+    one-shot CLI run already checks the stamps on first load.
+
+    Returns:
+        True if the districts were reloaded
+    """
+    if not DISTRICTS.stale():
+        return False
+    reload_districts()
+    return True
 
 
 # ── State SOL lookup ─────────────────────────────────────────────────────────
@@ -358,27 +336,75 @@ _CONFIG_DIR = Path.home() / ".ftc"
 _CONFIG_FILE = _CONFIG_DIR / "config.json"
 
 
+# In-process cache of the parsed config file. Entries are keyed by path and
+# validated against the file's (mtime_ns, size) stamp, so edits made by other
+# processes are picked up while repeated lookups skip the read and parse.
+_config_cache: dict = {"path": None, "stamp": None, "data": {}, "context": None}
+
+
+def _config_stamp(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for the config file, or None if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_config(path: Path, stamp: tuple[int, int] | None, data: dict) -> None:
+    _config_cache.update(path=path, stamp=stamp, data=data, context=None)
+
+
 def _load_config() -> dict:
-    """Load persistent configuration."""
-    if _CONFIG_FILE.exists():
+    """Load persistent configuration (cached until the file changes)."""
+    path = _CONFIG_FILE
+    stamp = _config_stamp(path)
+    if _config_cache["path"] == path and _config_cache["stamp"] == stamp:
+        return dict(_config_cache["data"])
+
+    data: dict = {}
+    if stamp is not None:
         try:
-            return json.loads(_CONFIG_FILE.read_text())
+            data = json.loads(path.read_text())
         except (json.JSONDecodeError, OSError):
-            return {}
-    return {}
+            data = {}
+    _cache_config(path, stamp, data)
+    return dict(data)
 
 
 def _save_config(config: dict):
-    """Save persistent configuration."""
+    """Save persistent configuration and refresh the in-process cache."""
     _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     _CONFIG_FILE.write_text(json.dumps(config, indent=2))
+    _cache_config(_CONFIG_FILE, _config_stamp(_CONFIG_FILE), dict(config))
+
+
+def clear_config_cache() -> None:
+    """Drop the cached config so the next lookup re-reads the file."""
+    _cache_config(None, None, {})
 
 
 # ── Public API ───────────────────────────────────────────────────────────────
 
 def get_district(code: str) -> DistrictConfig | None:
     """Look up a district by its short code (case-insensitive)."""
-    return DISTRICTS.get(code.lower())
+    code = code.lower()
+    return DISTRICTS[code] if code in DISTRICTS else None
+
+
+def find_district(value: str) -> DistrictConfig | None:
+    """Look up a district by short code or full name (case-insensitive).
+
+    Case files store the court as a name ("Middle District of Florida");
+    this resolves either form.
+    """
+    if not value:
+        return None
+    district = get_district(value.strip())
+    if district:
+        return district
+    code = DISTRICTS.code_for_name(value.strip())
+    return DISTRICTS[code] if code else None
 
 
 def list_districts() -> list[DistrictConfig]:
@@ -387,8 +413,16 @@ def list_districts() -> list[DistrictConfig]:
 
 
 def get_active_district() -> DistrictContext:
-    """Return the currently active district. Default: mdfl/Orlando."""
+    """Return the currently active district. Default: mdfl/Orlando.
+
+    The resolved context is cached alongside the config file contents and
+    rebuilt only when the file changes or set_active_district() is called.
+    """
     config = _load_config()
+    cached = _config_cache["context"]
+    if cached is not None:
+        return cached
+
     code = config.get("active_district", "mdfl")
     division = config.get("active_division", "")
 
@@ -396,7 +430,9 @@ def get_active_district() -> DistrictContext:
     if not division and district.divisions:
         division = district.divisions[0]
 
-    return DistrictContext(config=district, division=division)
+    ctx = DistrictContext(config=district, division=division)
+    _config_cache["context"] = ctx
+    return ctx
 
 
 def set_active_district(code: str, division: str | None = None) -> DistrictContext:
@@ -431,7 +467,9 @@ def set_active_district(code: str, division: str | None = None) -> DistrictConte
     config["active_division"] = division or ""
     _save_config(config)
 
-    return DistrictContext(config=district, division=division or "")
+    ctx = DistrictContext(config=district, division=division or "")
+    _config_cache["context"] = ctx
+    return ctx
 
 
 def get_sol_days_for_district(claim_key: str, district_code: str | None = None) -> int:
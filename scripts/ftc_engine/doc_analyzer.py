@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
@@ -587,22 +587,60 @@ _WORKFLOW_LABELS: dict[str, str] = {
 }
 
 
+def _parse_extracted_date(value: str) -> date | None:
+    """Parse a date entity in any of the formats extract_dates recognizes."""
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%B %d, %Y", "%B %d %Y"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _trigger_date(analyses: list[DocumentAnalysis], category: str) -> date | None:
+    """Latest non-future date found in documents of a category, if any."""
+    today = date.today()
+    found = [
+        d for a in analyses if a.document_category == category and not a.errors
+        for d in (_parse_extracted_date(e.value) for e in a.dates)
+        if d is not None and d <= today
+    ]
+    return max(found) if found else None
+
+
+def _due_note(analyses: list[DocumentAnalysis], category: str, days: int, event: str) -> str:
+    """Concrete FRCP 6(a) due date when the document carries a usable date."""
+    from .court_days import compute_deadline
+
+    trigger = _trigger_date(analyses, category)
+    if trigger is None:
+        return ""
+    return f" (if {event} {trigger}: due {compute_deadline(trigger, days)})"
+
+
 def generate_recommendations(analyses: list[DocumentAnalysis]) -> list[str]:
-    """Generate actionable recommendations based on the analysis."""
+    """Generate actionable recommendations based on the analysis.
+
+    Response periods are turned into concrete due dates, counted under
+    FRCP 6(a), from the latest date found in the triggering document.
+    """
     recs: list[str] = []
     categories = [a.document_category for a in analyses if not a.errors]
 
     if "complaint" in categories:
-        recs.append("Complaint detected — Answer or MTD due within 21 days of service")
+        recs.append("Complaint detected — Answer or MTD due within 21 days of service"
+                    + _due_note(analyses, "complaint", 21, "served"))
 
     if "motion_dismiss" in categories:
-        recs.append("Motion to Dismiss detected — Response due within 21 days")
+        recs.append("Motion to Dismiss detected — Response due within 21 days"
+                    + _due_note(analyses, "motion_dismiss", 21, "served"))
 
     if "motion_summary_judgment" in categories:
         recs.append("Summary Judgment motion detected — Response due per local rule")
 
     if "discovery_request" in categories:
-        recs.append("Discovery requests detected — Responses due within 30 days")
+        recs.append("Discovery requests detected — Responses due within 30 days"
+                    + _due_note(analyses, "discovery_request", 30, "served"))
 
     if "court_order" in categories:
         recs.append("Court order detected — Check compliance deadlines immediately")
@@ -0,0 +1,147 @@
+"""
+Streaming DOCX writer — Writes word/document.xml paragraph by paragraph.
+
+python-docx builds the whole document tree in memory before saving, which is
+slow and memory-hungry for 300-page appendices and deposition digests. This
+backend copies every other part (styles, settings, section properties) from
+the exporter's pre-styled base document and streams the body straight into
+the zip archive, so paragraphs reference the same named styles and the
+output is formatted identically.
+
+Used by the exporter when `stream=True` (`ftc export --stream`).
+
+Usage:
+  with StreamingDocument(base_docx_bytes, "appendix.docx") as doc:
+      doc.paragraph("1. The plaintiff alleges ...", "FTCBody")
+      doc.blank()
+"""
+from __future__ import annotations
+
+import io
+import os
+import re
+
+
+DOCUMENT_PART = "word/document.xml"
+
+# Characters python-docx turns into elements inside a run
+_RUN_SPECIAL = re.compile(r"(\r\n|\n|\r|\t)")
+# Characters not allowed in XML 1.0 documents
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_FLUSH_BYTES = 64 * 1024
+
+
+def _escape(text: str) -> str:
+    """Escape &, < and > (as xml.sax.saxutils.escape, which imports urllib)."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _run_xml(text: str, bold: bool) -> str:
+    parts = ["<w:r>"]
+    if bold:
+        parts.append("<w:rPr><w:b/></w:rPr>")
+    for piece in _RUN_SPECIAL.split(_XML_INVALID.sub("", text)):
+        if not piece:
+            continue
+        if piece == "\t":
+            parts.append("<w:tab/>")
+        elif piece in ("\n", "\r", "\r\n"):
+            parts.append("<w:br/>")
+        elif piece[0].isspace() or piece[-1].isspace():
+            parts.append(f'<w:t xml:space="preserve">{_escape(piece)}</w:t>')
+        else:
+            parts.append(f"<w:t>{_escape(piece)}</w:t>")
+    parts.append("</w:r>")
+    return "".join(parts)
+
+
+class StreamingDocument:
+    """A .docx being written to disk one paragraph at a time.
+
+    The archive is built in a temporary file next to output_path and moved
+    into place only by a clean close(); leaving the `with` block on an
+    exception discards it, so a failed render never leaves a truncated .docx.
+
+    Args:
+        base_docx: Serialized base document supplying every part except the
+                   body, and the body's section properties
+        output_path: Where to write the .docx
+    """
+
+    def __init__(self, base_docx: bytes, output_path: str):
+        import zipfile
+
+        base = zipfile.ZipFile(io.BytesIO(base_docx))
+        document_xml = base.read(DOCUMENT_PART).decode("utf-8")
+        body_start = document_xml.index("<w:body>") + len("<w:body>")
+        sect_start = document_xml.rfind("<w:sectPr", body_start)
+        if sect_start < 0:
+            sect_start = document_xml.rindex("</w:body>")
+        self._head = document_xml[:body_start]
+        self._tail = document_xml[sect_start:]
+
+        self._output_path = output_path
+        self._tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        self._zip = zipfile.ZipFile(self._tmp_path, "w", zipfile.ZIP_DEFLATED)
+        for info in base.infolist():
+            if info.filename != DOCUMENT_PART:
+                self._zip.writestr(info, base.read(info.filename))
+        self._part = self._zip.open(DOCUMENT_PART, "w")
+        self._pending: list[str] = [self._head]
+        self._pending_size = len(self._head)
+        self.paragraph_count = 0
+
+    def _write(self, xml: str) -> None:
+        self._pending.append(xml)
+        self._pending_size += len(xml)
+        if self._pending_size >= _FLUSH_BYTES:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._part.write("".join(self._pending).encode("utf-8"))
+            self._pending = []
+            self._pending_size = 0
+
+    def paragraph(self, text: str, style_id: str, bold: bool = False) -> None:
+        """Append a paragraph in a named style with a single run of text."""
+        self._write(f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>{_run_xml(text, bold)}</w:p>')
+        self.paragraph_count += 1
+
+    def blank(self) -> None:
+        """Append an empty paragraph."""
+        self._write("<w:p/>")
+        self.paragraph_count += 1
+
+    def close(self) -> None:
+        """Finish the body and the archive, and move it to output_path."""
+        if self._part is None:
+            return
+        self._write(self._tail)
+        self._flush()
+        self._part.close()
+        self._part = None
+        self._zip.close()
+        os.replace(self._tmp_path, self._output_path)
+
+    def abort(self) -> None:
+        """Discard the partly written archive; output_path is left untouched."""
+        if self._part is None:
+            return
+        self._part.close()
+        self._part = None
+        self._zip.close()
+        try:
+            os.unlink(self._tmp_path)
+        except OSError:
+            pass
+
+    def __enter__(self) -> "StreamingDocument":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
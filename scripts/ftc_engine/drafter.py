@@ -42,8 +42,12 @@ class ComplaintSection:
     certificate_of_service: str
 
 
-def analyze_jurisdiction(case_data: dict) -> JurisdictionAnalysis:
-    """Analyze subject-matter jurisdiction, venue, and standing."""
+def analyze_jurisdiction(case_data: dict, suggestions: list | None = None) -> JurisdictionAnalysis:
+    """Analyze subject-matter jurisdiction, venue, and standing.
+
+    suggestions: Precomputed suggest_claims() results, used instead of
+                 re-suggesting when the case asks for auto-suggested claims.
+    """
     claims = case_data.get("claims_requested", [])
     parties = case_data.get("parties", {})
     facts = case_data.get("facts", [])
@@ -52,8 +56,10 @@ def analyze_jurisdiction(case_data: dict) -> JurisdictionAnalysis:
 
     # If auto_suggest, resolve actual claims first
     if not claims or claims == ["auto_suggest"]:
-        from .suggest import suggest_claims
-        claims = [s.claim_key for s in suggest_claims(case_data, 5) if not s.showstoppers]
+        if suggestions is None:
+            from .suggest import suggest_claims
+            suggestions = suggest_claims(case_data, 5)
+        claims = [s.claim_key for s in suggestions[:5] if not s.showstoppers]
 
     # Check federal question
     has_federal = False
@@ -227,12 +233,20 @@ def generate_prayer(case_data: dict) -> str:
     return "PRAYER FOR RELIEF\n\n     WHEREFORE, Plaintiff respectfully requests judgment as follows:\n\n" + "\n".join(f"     {i}" for i in items)
 
 
-def generate_complaint(case_data: dict) -> str:
-    """Generate complete complaint skeleton."""
+def generate_complaint(case_data: dict, suggestions: list | None = None,
+                       jurisdiction: JurisdictionAnalysis | None = None) -> str:
+    """Generate complete complaint skeleton.
+
+    suggestions and jurisdiction take precomputed suggest_claims() and
+    analyze_jurisdiction() results, so a caller that already has them
+    doesn't pay for them twice.
+    """
     claims = case_data.get("claims_requested", [])
     if not claims or claims == ["auto_suggest"]:
-        from .suggest import suggest_claims
-        suggestions = suggest_claims(case_data, 3)
+        if suggestions is None:
+            from .suggest import suggest_claims
+            suggestions = suggest_claims(case_data, 3)
+        suggestions = suggestions[:3]
         claims = [s.claim_key for s in suggestions if not s.showstoppers]
         if not claims and suggestions:
             claims = [suggestions[0].claim_key]
@@ -244,7 +258,7 @@ def generate_complaint(case_data: dict) -> str:
         generate_parties_section(case_data),
     ]
 
-    jx = analyze_jurisdiction(case_data)
+    jx = jurisdiction or analyze_jurisdiction(case_data, suggestions)
     sections.append(f"\nJURISDICTION\n\n     This Court has jurisdiction pursuant to {', '.join(jx.citations) or '[CITE]'} because {jx.analysis}")
     sections.append(f"\nVENUE\n\n     Venue is proper pursuant to 28 U.S.C. 1391(b) because a substantial part of events occurred in this District.")
     sections.append("\n" + "\n".join(generate_factual_allegations(case_data)))
@@ -2,6 +2,11 @@
 Exhibit Metadata Extractor — Generates standard Exhibit Indexes by scanning
 document metadata, case facts, and filenames.
 
+Directory scans walk the whole tree. Files are hashed (SHA-256) and PDF page
+counts read from the page tree on a thread pool; identical files become one
+exhibit, and Bates ranges are assigned from the real page counts — from the
+case's persistent Bates ledger with --case, so numbers survive re-scans.
+
 Produces:
 - Numbered exhibit index with authentication methods
 - FRE 901/902 authentication checklist
@@ -11,6 +16,8 @@ Produces:
 Usage:
   ftc exhibits -i case.json --format table
   ftc exhibits -i case.json --scan ./documents/ --numbering bates --prefix SMITH
+  ftc exhibits -i case.json --scan ./production/ --format detailed --workers 16
+  ftc exhibits -i case.json --scan ./production/ --numbering bates --prefix SMITH --case 6:24-cv-01234
 """
 from __future__ import annotations
 
@@ -20,6 +27,8 @@ from datetime import date
 from pathlib import Path
 from typing import Optional
 
+from .bates_ledger import BatesLedger, bates_label
+
 
 @dataclass
 class ExhibitEntry:
@@ -35,6 +44,8 @@ class ExhibitEntry:
     pages: int = 0
     objections_anticipated: list[str] = field(default_factory=list)
     status: str = "needs_authentication"  # authenticated | needs_authentication | self_authenticating
+    source_file: str = ""           # Directory scan: path under the scanned folder
+    sha256: str = ""                # Directory scan: content hash
 
 
 @dataclass
@@ -44,6 +55,8 @@ class ExhibitIndex:
     entries: list[ExhibitEntry] = field(default_factory=list)
     authentication_checklist: list[dict] = field(default_factory=list)
     missing_authentication: list[str] = field(default_factory=list)
+    duplicates: dict[str, str] = field(default_factory=dict)  # skipped file -> exhibit it duplicates
+    held_back: dict[str, str] = field(default_factory=dict)  # scanned file left unnumbered -> why
     generated_at: str = ""
 
 
@@ -155,7 +168,7 @@ def _number_exhibit(index: int, numbering: str, prefix: str = "") -> str:
     elif numbering == "numeric":
         return str(index + 1)
     elif numbering == "bates":
-        return f"{prefix}-{index + 1:06d}" if prefix else f"EX-{index + 1:06d}"
+        return bates_label(index + 1, prefix)
     return str(index + 1)
 
 
@@ -263,37 +276,240 @@ def _extract_from_manifest(manifest: list[dict], numbering: str, prefix: str) ->
     return entries
 
 
-def _scan_directory(directory: str, numbering: str, prefix: str) -> list[ExhibitEntry]:
-    """Scan a directory for documents and extract metadata from filenames."""
-    entries = []
+# ── Directory Scanning ───────────────────────────────────────────────────────
+
+SCAN_EXTENSIONS = {".pdf", ".doc", ".docx", ".txt", ".jpg", ".jpeg", ".png",
+                   ".tiff", ".mp4", ".mov", ".xlsx", ".csv"}
+
+_READ_CHUNK = 1 << 20
+
+# PDF page tree: the document's page count is the /Count of the /Pages node
+# the catalog points to (trailer /Root -> catalog /Pages). Each object is read
+# from its last definition in the file, so incremental updates are honoured,
+# including objects in compressed object streams (PDF 1.5+). Only those two
+# dictionaries are read, never page content. PDFs where this fails (e.g.
+# encrypted object streams) fall back to PyPDF2.
+_PDF_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_PDF_PAGES_REF_RE = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+_PDF_COUNT_RE = re.compile(rb"/Count\s+(\d+)(?!\s+\d+\s+R)")
+_PDF_OBJSTM_RE = re.compile(rb"/Type\s*/ObjStm\b")
+_PDF_NESTED_DICT_RE = re.compile(rb"<<(?:(?!<<|>>).)*>>", re.S)
+
+
+@dataclass
+class ScannedFile:
+    path: Path
+    relative: str       # path under the scanned directory, "/"-separated
+    sha256: str = ""
+    pages: int = 0      # 0 if unknown
+    error: str = ""
+
+
+def _pdf_object_streams(data, after: int = -1):
+    """(offset, inflated contents, /N, /First) of each compressed object stream past `after`."""
+    import zlib
+    for m in _PDF_OBJSTM_RE.finditer(data):
+        if m.start() <= after:
+            continue
+        start = data.find(b"stream", m.end())
+        if start < 0:
+            break
+        header = data[data.rfind(b"obj", 0, m.start()):start]
+        n, first = re.search(rb"/N\s+(\d+)", header), re.search(rb"/First\s+(\d+)", header)
+        start += len(b"stream")
+        start += 2 if data[start:start + 2] == b"\r\n" else 1
+        end = data.find(b"endstream", start)
+        if not (n and first):
+            continue
+        try:
+            inflated = zlib.decompressobj().decompress(data[start:end if end > 0 else len(data)])
+        except zlib.error:
+            continue
+        yield m.start(), inflated, int(n.group(1)), int(first.group(1))
+
+
+def _pdf_object(data, number: int) -> bytes | None:
+    """The body of the last definition of object `number` in a PDF."""
+    found = None
+    for found in re.finditer(rb"(?<![0-9])%d\s+\d+\s+obj\b" % number, data):
+        pass
+    body, position = None, -1
+    if found is not None:
+        end = data.find(b"endobj", found.end())
+        body, position = data[found.end():end if end > 0 else len(data)], found.start()
+    # An object stream written later (an incremental update) supersedes it
+    for _, inflated, n, first in _pdf_object_streams(data, position):
+        pairs = [int(v) for v in inflated[:first].split()[:2 * n]]
+        offsets = pairs[1::2] + [len(inflated) - first]
+        for i, obj in enumerate(pairs[0::2]):
+            if obj == number:
+                body = inflated[first + offsets[i]:first + offsets[i + 1]]
+    return body
+
+
+def _pdf_top_level(body: bytes) -> bytes:
+    """A dictionary's own entries, with nested dictionaries removed."""
+    inner = body[body.find(b"<<") + 2:]
+    while b"<<" in inner:
+        inner, count = _PDF_NESTED_DICT_RE.subn(b" ", inner)
+        if not count:
+            break
+    return inner
+
+
+def pdf_page_count(data) -> int:
+    """Page count of a PDF from its page tree, without extracting text.
+
+    Args:
+        data: The PDF's bytes (or an mmap of the file)
+
+    Returns:
+        Page count, or 0 if the page tree couldn't be resolved
+    """
+    root = None
+    for root in _PDF_ROOT_RE.finditer(data):
+        pass  # the last trailer is the current one
+    if root is None:
+        return 0
+    catalog = _pdf_object(data, int(root.group(1)))
+    pages_ref = catalog and _PDF_PAGES_REF_RE.search(_pdf_top_level(catalog))
+    if not pages_ref:
+        return 0
+    pages = _pdf_object(data, int(pages_ref.group(1)))
+    count = pages and _PDF_COUNT_RE.search(_pdf_top_level(pages))
+    return int(count.group(1)) if count else 0
+
+
+def _pypdf_page_count(path: Path) -> int:
+    try:
+        from PyPDF2 import PdfReader
+        return len(PdfReader(str(path), strict=False).pages)
+    except Exception:
+        return 0
+
+
+def _scan_file(item: ScannedFile) -> ScannedFile:
+    """Hash a file and, for PDFs, read its page count."""
+    import hashlib
+    digest = hashlib.sha256()
+    try:
+        with open(item.path, "rb") as f:
+            if item.path.suffix.lower() == ".pdf" and item.path.stat().st_size:
+                import mmap
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    digest.update(data)
+                    item.pages = pdf_page_count(data) or _pypdf_page_count(item.path)
+            else:
+                while chunk := f.read(_READ_CHUNK):
+                    digest.update(chunk)
+    except OSError as e:
+        item.error = str(e)
+        return item
+    item.sha256 = digest.hexdigest()
+    return item
+
+
+def _walk_documents(dir_path: Path) -> list[ScannedFile]:
+    """Every document under a directory, skipping hidden files and folders, sorted by path."""
+    import os
+    found = []
+    for root, dirs, files in os.walk(dir_path):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        rel_root = Path(root).relative_to(dir_path)
+        for name in files:
+            if not name.startswith(".") and Path(name).suffix.lower() in SCAN_EXTENSIONS:
+                found.append(ScannedFile(Path(root) / name, (rel_root / name).as_posix()))
+    found.sort(key=lambda f: Path(f.relative).parts)
+    return found
+
+
+def scan_documents(directory: str | Path, workers: int | None = None) -> list[ScannedFile]:
+    """Walk a directory tree and hash every document (and count PDF pages) in parallel.
+
+    Args:
+        directory: Root of the exhibit tree
+        workers: Threads for hashing and page counting (default: the
+            ThreadPoolExecutor default)
+
+    Returns:
+        One ScannedFile per document, sorted by relative path
+    """
     dir_path = Path(directory)
-    if not dir_path.exists():
-        return entries
+    if not dir_path.is_dir():
+        return []
+    files = _walk_documents(dir_path)
+    if len(files) > 1 and workers != 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_scan_file, files))
+    return [_scan_file(f) for f in files]
+
+
+def _scan_directory(directory: str, numbering: str, prefix: str, workers: int | None = None,
+                    ledger: BatesLedger | None = None
+                    ) -> tuple[list[ExhibitEntry], dict[str, str], dict[str, str]]:
+    """Scan a directory tree for documents, one exhibit per distinct file.
+
+    Files with identical contents become one exhibit. Each gets a contiguous
+    Bates range sized by its page count (one page for non-PDF files such as
+    photos), taken from the case's ledger so numbers stay stable across
+    scans; without a ledger, ranges run from 1 in path order. With "bates"
+    numbering each exhibit is numbered by the first page of its range.
+    Files that can't be read are held back, as they have no hash to key a
+    range by. So is a PDF whose page count can't be read, rather than
+    giving it a range that may be too short, since a range can never be
+    resized once allocated.
 
-    extensions = {".pdf", ".doc", ".docx", ".txt", ".jpg", ".jpeg", ".png",
-                  ".tiff", ".mp4", ".mov", ".xlsx", ".csv"}
+    Returns:
+        (entries, duplicates, held_back), where duplicates maps each skipped
+        file's relative path to the exhibit number it duplicates, and
+        held_back maps each held-back file's relative path to the reason
+    """
+    ledger = ledger if ledger is not None else BatesLedger()
+    entries: list[ExhibitEntry] = []
+    duplicates: dict[str, str] = {}
+    held_back: dict[str, str] = {}
+    kept: dict[str, str] = {}  # sha256 -> exhibit number
+
+    for item in scan_documents(directory, workers):
+        if not item.sha256:
+            held_back[item.relative] = f"unreadable ({item.error}); no Bates range allocated"
+            continue
+        if item.sha256 in kept:
+            duplicates[item.relative] = kept[item.sha256]
+            continue
+        if (not item.pages and item.path.suffix.lower() == ".pdf"
+                and ledger.get(item.sha256, prefix) is None):
+            held_back[item.relative] = "page count unreadable; no Bates range allocated"
+            continue
+
+        desc = item.path.stem.replace("_", " ").replace("-", " ").title()
+        # Folder names help classify ("Medical Records/er_visit.pdf")
+        context = " ".join(Path(item.relative).parent.parts + (desc,)).replace("_", " ")
+        doc_type = _classify_document_type(context)
+        rule, method, witness = _suggest_authentication(doc_type)
 
-    idx = 0
-    for f in sorted(dir_path.iterdir()):
-        if f.suffix.lower() in extensions and not f.name.startswith("."):
-            desc = f.stem.replace("_", " ").replace("-", " ").title()
-            doc_type = _classify_document_type(desc)
-            rule, method, witness = _suggest_authentication(doc_type)
-            doc_date = _extract_date_from_text(f.name)
+        bates = ledger.allocate(item.sha256, item.pages, prefix, item.relative)
+        number = (bates_label(bates.start, prefix) if numbering == "bates"
+                  else _number_exhibit(len(entries), numbering, prefix))
+        kept[item.sha256] = number
 
-            entries.append(ExhibitEntry(
-                exhibit_number=_number_exhibit(idx, numbering, prefix),
-                description=desc,
-                document_type=doc_type,
-                date=doc_date,
-                authentication_method=f"{rule} - {method}",
-                authentication_witness=witness,
-                objections_anticipated=_anticipate_objections(doc_type),
-                status="needs_authentication",
-            ))
-            idx += 1
+        entries.append(ExhibitEntry(
+            exhibit_number=number,
+            description=desc,
+            document_type=doc_type,
+            date=_extract_date_from_text(item.path.name),
+            bates_range=bates.bates_range,
+            authentication_method=f"{rule} - {method}",
+            authentication_witness=witness,
+            pages=item.pages,
+            objections_anticipated=_anticipate_objections(doc_type),
+            status="needs_authentication",
+            source_file=item.relative,
+            sha256=item.sha256,
+        ))
 
-    return entries
+    return entries, duplicates, held_back
 
 
 # ── Main API ─────────────────────────────────────────────────────────────────
@@ -304,6 +520,8 @@ def generate_exhibit_index(
     scan_directory: str | None = None,
     numbering: str = "alpha",
     prefix: str = "",
+    workers: int | None = None,
+    ledger: BatesLedger | None = None,
 ) -> ExhibitIndex:
     """Generate a comprehensive exhibit index.
 
@@ -313,17 +531,22 @@ def generate_exhibit_index(
         scan_directory: Optional directory path to scan
         numbering: "alpha" (A, B, C), "numeric" (1, 2, 3), or "bates"
         prefix: Bates prefix (e.g., "SMITH")
+        workers: Threads for hashing scanned files
+        ledger: The case's Bates ledger for scanned files (see
+            bates_ledger.py); updated in memory, the caller saves it
 
     Returns:
         ExhibitIndex with entries and authentication checklist
     """
     entries = []
+    duplicates: dict[str, str] = {}
+    held_back: dict[str, str] = {}
 
     # Priority: manifest > directory scan > case facts
     if document_manifest:
         entries = _extract_from_manifest(document_manifest, numbering, prefix)
     elif scan_directory:
-        entries = _scan_directory(scan_directory, numbering, prefix)
+        entries, duplicates, held_back = _scan_directory(scan_directory, numbering, prefix, workers, ledger)
     else:
         entries = _extract_from_case_facts(case_data, numbering, prefix)
 
@@ -355,6 +578,8 @@ def generate_exhibit_index(
         entries=entries,
         authentication_checklist=checklist,
         missing_authentication=missing,
+        duplicates=duplicates,
+        held_back=held_back,
         generated_at=str(date.today()),
     )
 
@@ -375,6 +600,10 @@ def format_exhibit_index(index: ExhibitIndex, fmt: str = "table") -> str:
     lines.append(f"  Case:     {index.case_name}")
     lines.append(f"  Exhibits: {index.total_exhibits}")
     lines.append(f"  Pending:  {len(index.missing_authentication)} need authentication")
+    if index.duplicates:
+        lines.append(f"  Skipped:  {len(index.duplicates)} duplicate file(s)")
+    if index.held_back:
+        lines.append(f"  Held:     {len(index.held_back)} file(s) held back")
     lines.append("")
 
     if fmt == "table":
@@ -394,6 +623,10 @@ def format_exhibit_index(index: ExhibitIndex, fmt: str = "table") -> str:
                 lines.append(f"    Source:         {e.author_source}")
             if e.bates_range:
                 lines.append(f"    Bates:          {e.bates_range}")
+            if e.pages:
+                lines.append(f"    Pages:          {e.pages}")
+            if e.source_file:
+                lines.append(f"    File:           {e.source_file}")
             lines.append(f"    Authentication: {e.authentication_method}")
             lines.append(f"    Witness:        {e.authentication_witness}")
             lines.append(f"    Status:         {e.status}")
@@ -408,6 +641,12 @@ def format_exhibit_index(index: ExhibitIndex, fmt: str = "table") -> str:
         lines.append("")
         lines.append(f"  AUTHENTICATION NEEDED: Exhibits {', '.join(index.missing_authentication)}")
 
+    if index.held_back:
+        lines.append("")
+        lines.append("  HELD BACK (not numbered):")
+        for path, reason in index.held_back.items():
+            lines.append(f"    {path}: {reason}")
+
     lines.append("")
     lines.append("=" * 70)
     lines.append(f"  Generated: {index.generated_at}")
@@ -16,28 +16,55 @@ Usage:
   ftc export --draft --case case.json --out complaint.docx
   ftc export --template motions/motion_to_dismiss --case case.json --out motion.docx
   ftc export --text input.md --out output.docx
+  ftc export --text appendix.md --out appendix.docx --stream
 """
 from __future__ import annotations
 
+import hashlib
+import io
+import marshal
 import re
 from pathlib import Path
 from dataclasses import dataclass, field
 
-from docx import Document
-from docx.shared import Inches, Pt, Emu
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.section import WD_ORIENT
+from .docx_stream import StreamingDocument
+from .layout import PageLayout, ParagraphFormat
+from .lazy import lazy_attributes
+
+# python-docx (and lxml under it) is imported where documents are built, not
+# here: most commands that import the exporter never create a document.
 
 
 # ── Court formatting constants ───────────────────────────────────────────────
 
 FONT_NAME = "Times New Roman"
-FONT_SIZE_BODY = Pt(12)
-FONT_SIZE_HEADING = Pt(12)
-FONT_SIZE_CAPTION = Pt(12)
+FONT_SIZE_PT = 12.0
 LINE_SPACING = 2.0  # Double-spaced
-MARGIN = Inches(1)
-FIRST_LINE_INDENT = Inches(0.5)
+MARGIN_INCHES = 1.0
+FIRST_LINE_INDENT_INCHES = 0.5
+
+
+def _length(unit: str, value: float):
+    """Builder for a python-docx Length constant (Pt or Inches)."""
+    def build():
+        from docx import shared
+        return getattr(shared, unit)(value)
+    return build
+
+
+# The python-docx Length versions of the constants above
+__getattr__ = lazy_attributes(
+    globals(),
+    FONT_SIZE_BODY=_length("Pt", FONT_SIZE_PT),
+    FONT_SIZE_HEADING=_length("Pt", FONT_SIZE_PT),
+    FONT_SIZE_CAPTION=_length("Pt", FONT_SIZE_PT),
+    MARGIN=_length("Inches", MARGIN_INCHES),
+    FIRST_LINE_INDENT=_length("Inches", FIRST_LINE_INDENT_INCHES),
+)
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "assets" / "templates"
+_TEMPLATE_CACHE_DIR = Path.home() / ".ftc" / "cache" / "templates"
+_TEMPLATE_CACHE_VERSION = 1
 
 # Patterns for parsing legal document structure
 RE_HEADING = re.compile(r"^\s{5,}([A-Z][A-Z .,'&§()/:;0-9—–-]{3,})\s*$")
@@ -47,8 +74,27 @@ RE_LETTERED = re.compile(r"^\s{6,}(\[?\s*[a-z]\s*\]?)\s*[.)]\s*(.+)")
 RE_CHECKBOX = re.compile(r"^\s{3,}\[\s*\]\s+(\d+)\.\s+(.+)")
 RE_SIGNATURE = re.compile(r"^\s{20,}(Respectfully submitted|/s/|Copies to:|DONE AND ORDERED|I HEREBY CERTIFY)")
 RE_DASHES = re.compile(r"^_{5,}|^-{5,}")
+RE_ROMAN = re.compile(r"^[IVX]+\.\s+")
 RE_CAPTION_PARTY = re.compile(r"^\s*(.*?),\s*$")
 
+# Line token flags. Every line is classified once by _tokenize; the renderer
+# and its continuation loops test these bits instead of re-running patterns.
+T_BLANK = 1 << 0
+T_CAPTION = 1 << 1      # contains "UNITED STATES DISTRICT COURT"
+T_HEADING = 1 << 2      # RE_HEADING
+T_SIGNATURE = 1 << 3    # RE_SIGNATURE
+T_CHECKBOX = 1 << 4     # RE_CHECKBOX
+T_NUMBERED = 1 << 5     # RE_NUMBERED
+T_LETTERED = 1 << 6     # RE_LETTERED
+T_DASHES = 1 << 7       # RE_DASHES (on the stripped line)
+T_ROMAN = 1 << 8        # RE_ROMAN (on the stripped line)
+
+# Lines that end a paragraph's continuation, per paragraph type
+_STOP_CHECKBOX = T_BLANK | T_CHECKBOX | T_NUMBERED | T_HEADING
+_STOP_NUMBERED = T_BLANK | T_NUMBERED | T_HEADING | T_CHECKBOX | T_LETTERED | T_SIGNATURE
+_STOP_LETTERED = T_BLANK | T_LETTERED | T_NUMBERED | T_HEADING
+_STOP_BODY = T_BLANK | T_NUMBERED | T_HEADING | T_CHECKBOX | T_SIGNATURE | T_LETTERED
+
 
 @dataclass
 class ExportResult:
@@ -56,45 +102,114 @@ class ExportResult:
     format: str  # "docx"
     pages_estimate: int
     sections: int
+    lines_estimate: int = 0
+    unknown_placeholders: list[str] = field(default_factory=list)
 
 
-def _setup_document(district_code: str | None = None) -> Document:
-    """Create a new document with court-standard formatting.
-
-    Args:
-        district_code: Optional district code for district-specific formatting.
-                       Falls back to module-level constants if None.
+@dataclass
+class LineToken:
+    flags: int
+    text: str                   # the stripped line
+    groups: tuple[str, str] = ("", "")  # (number/letter, content) of a checkbox, numbered or lettered line
+
+
+# Paragraph styles carried by every base document. The _add_* helpers apply
+# these by name instead of formatting each paragraph and run directly.
+STYLE_CENTERED = "FTC Centered"
+STYLE_HEADING = "FTC Heading"          # centered, bold
+STYLE_RIGHT = "FTC Right"              # right-aligned, single-spaced
+STYLE_BODY = "FTC Body"                # justified, first-line indent
+STYLE_BODY_FLUSH = "FTC Body Flush"    # justified, no indent
+STYLE_LETTERED = "FTC Lettered"        # justified, 1" left indent
+
+# Geometry of each style, for the page estimate; keep in step with _build_base_document
+_STYLE_FORMATS = {
+    STYLE_CENTERED: ParagraphFormat(),
+    STYLE_HEADING: ParagraphFormat(bold=True),
+    STYLE_RIGHT: ParagraphFormat(line_spacing=1.0),
+    STYLE_BODY: ParagraphFormat(first_line_indent_in=FIRST_LINE_INDENT_INCHES),
+    STYLE_BODY_FLUSH: ParagraphFormat(),
+    STYLE_LETTERED: ParagraphFormat(left_indent_in=1.0),
+}
+
+_base_documents: dict[tuple, bytes] = {}
+_style_ids: dict[str, str] = {}  # style name -> styleId, identical in every base document
+
+
+def _formatting_profile(district_code: str | None = None) -> tuple[str, float, float, float]:
+    """(font_name, font_size_pt, line_spacing, margin_inches) for a district.
+
+    Falls back to the module-level constants if no district is given or its
+    config can't be read.
     """
-    doc = Document()
-
-    # Get formatting config from district if available
-    font_name = FONT_NAME
-    font_size = FONT_SIZE_BODY
-    line_spacing = LINE_SPACING
-    margin = MARGIN
-
+    profile = (FONT_NAME, FONT_SIZE_PT, LINE_SPACING, MARGIN_INCHES)
     if district_code:
         try:
             from .districts import get_formatting_config
             fmt = get_formatting_config(district_code)
-            font_name = fmt.get("font_name", FONT_NAME)
-            font_size = Pt(fmt.get("font_size_pt", 12))
-            line_spacing = fmt.get("line_spacing", LINE_SPACING)
-            margin = Inches(fmt.get("margin_inches", 1.0))
+            profile = (
+                fmt.get("font_name", FONT_NAME),
+                float(fmt.get("font_size_pt", 12)),
+                fmt.get("line_spacing", LINE_SPACING),
+                float(fmt.get("margin_inches", 1.0)),
+            )
         except Exception:
             pass  # Fall back to defaults
+    return profile
+
+
+def describe_formatting(district_code: str | None = None) -> str:
+    """The applied formatting profile in words, e.g. 'Times New Roman 12pt, double-spaced, 1" margins'."""
+    font_name, font_size_pt, line_spacing, margin_inches = _formatting_profile(district_code)
+    spacing = {1.0: "single-spaced", 1.5: "1.5-spaced", 2.0: "double-spaced"}.get(
+        float(line_spacing), f"{float(line_spacing):g}x line spacing")
+    return f'{font_name} {float(font_size_pt):g}pt, {spacing}, {float(margin_inches):g}" margins'
+
+
+def _build_base_document(profile: tuple[str, float, float, float]) -> bytes:
+    """Create and serialize a court-formatted empty document for a profile."""
+    from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches, Pt
+
+    font_name, font_size_pt, line_spacing, margin_inches = profile
+    doc = Document()
+    margin = Inches(margin_inches)
 
     # Set default font
-    style = doc.styles["Normal"]
-    font = style.font
-    font.name = font_name
-    font.size = font_size
+    styles = doc.styles
+    normal = styles["Normal"]
+    normal.font.name = font_name
+    normal.font.size = Pt(font_size_pt)
 
-    pf = style.paragraph_format
+    pf = normal.paragraph_format
     pf.line_spacing = line_spacing
     pf.space_after = Pt(0)
     pf.space_before = Pt(0)
 
+    def add_style(name: str, alignment, bold: bool = False, spacing: float | None = None,
+                  first_line_indent=None, left_indent=None):
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = normal
+        style.font.bold = bold or None
+        style.paragraph_format.alignment = alignment
+        if spacing is not None:
+            style.paragraph_format.line_spacing = spacing
+        if first_line_indent is not None:
+            style.paragraph_format.first_line_indent = first_line_indent
+        if left_indent is not None:
+            style.paragraph_format.left_indent = left_indent
+
+    add_style(STYLE_CENTERED, WD_ALIGN_PARAGRAPH.CENTER)
+    add_style(STYLE_HEADING, WD_ALIGN_PARAGRAPH.CENTER, bold=True)
+    add_style(STYLE_RIGHT, WD_ALIGN_PARAGRAPH.RIGHT, spacing=1.0)  # Single-spaced signature blocks
+    add_style(STYLE_BODY, WD_ALIGN_PARAGRAPH.JUSTIFY, first_line_indent=Inches(FIRST_LINE_INDENT_INCHES))
+    add_style(STYLE_BODY_FLUSH, WD_ALIGN_PARAGRAPH.JUSTIFY)
+    add_style(STYLE_LETTERED, WD_ALIGN_PARAGRAPH.JUSTIFY, left_indent=Inches(1.0))
+    for name in (STYLE_CENTERED, STYLE_HEADING, STYLE_RIGHT, STYLE_BODY, STYLE_BODY_FLUSH, STYLE_LETTERED):
+        _style_ids[name] = styles[name].style_id
+
     # Set margins
     for section in doc.sections:
         section.top_margin = margin
@@ -102,61 +217,86 @@ def _setup_document(district_code: str | None = None) -> Document:
         section.left_margin = margin
         section.right_margin = margin
 
-    return doc
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def _base_document_bytes(district_code: str | None = None) -> bytes:
+    """The serialized base document for a district's profile, built once."""
+    profile = _formatting_profile(district_code)
+    data = _base_documents.get(profile)
+    if data is None:
+        data = _base_documents[profile] = _build_base_document(profile)
+    return data
+
+
+def _setup_document(district_code: str | None = None) -> Document:
+    """Create a new document with court-standard formatting.
+
+    The document is cloned from a cached, pre-styled base for the district's
+    formatting profile.
+
+    Args:
+        district_code: Optional district code for district-specific formatting.
+                       Falls back to module-level constants if None.
+    """
+    from docx import Document
+
+    return Document(io.BytesIO(_base_document_bytes(district_code)))
+
+
+class _MeasuredDocument:
+    """Render target that passes paragraphs to a document and a PageLayout."""
 
+    def __init__(self, doc, layout: PageLayout):
+        self.doc = doc
+        self.layout = layout
 
-def _add_centered(doc: Document, text: str, bold: bool = False, size=None, caps: bool = False):
-    """Add centered paragraph."""
+
+def _add_paragraph(doc: Document, text: str, style: str, bold: bool = False):
+    if isinstance(doc, _MeasuredDocument):
+        doc.layout.paragraph(text, _STYLE_FORMATS[style], bold)
+        doc = doc.doc
+    if isinstance(doc, StreamingDocument):
+        return doc.paragraph(text, _style_ids[style], bold)
     p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p.paragraph_format.line_spacing = LINE_SPACING
-    p.paragraph_format.space_after = Pt(0)
-    p.paragraph_format.space_before = Pt(0)
-    run = p.add_run(text.upper() if caps else text)
-    run.font.name = FONT_NAME
-    run.font.size = size or FONT_SIZE_BODY
-    run.bold = bold
+    # Set the styleId directly: python-docx's name lookup scans every style per call
+    p._p.style = _style_ids[style]
+    run = p.add_run(text)
+    if bold:
+        run.bold = True
     return p
 
 
+def _add_centered(doc: Document, text: str, bold: bool = False, caps: bool = False):
+    """Add centered paragraph (bold uses the heading style)."""
+    return _add_paragraph(doc, text.upper() if caps else text, STYLE_HEADING if bold else STYLE_CENTERED)
+
+
 def _add_right_aligned(doc: Document, text: str, bold: bool = False):
     """Add right-aligned paragraph (for signatures)."""
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    p.paragraph_format.line_spacing = 1.0  # Single-spaced signature blocks
-    p.paragraph_format.space_after = Pt(0)
-    p.paragraph_format.space_before = Pt(0)
-    run = p.add_run(text)
-    run.font.name = FONT_NAME
-    run.font.size = FONT_SIZE_BODY
-    run.bold = bold
-    return p
+    return _add_paragraph(doc, text, STYLE_RIGHT, bold)
 
 
 def _add_body(doc: Document, text: str, indent: bool = True, bold: bool = False):
     """Add body paragraph with optional first-line indent."""
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    p.paragraph_format.line_spacing = LINE_SPACING
-    p.paragraph_format.space_after = Pt(0)
-    p.paragraph_format.space_before = Pt(0)
-    if indent:
-        p.paragraph_format.first_line_indent = FIRST_LINE_INDENT
-    run = p.add_run(text)
-    run.font.name = FONT_NAME
-    run.font.size = FONT_SIZE_BODY
-    run.bold = bold
-    return p
+    return _add_paragraph(doc, text, STYLE_BODY if indent else STYLE_BODY_FLUSH, bold)
+
+
+def _add_lettered(doc: Document, text: str):
+    """Add lettered sub-paragraph, indented one inch."""
+    return _add_paragraph(doc, text, STYLE_LETTERED)
 
 
 def _add_blank_line(doc: Document):
     """Add empty paragraph for spacing."""
-    p = doc.add_paragraph()
-    p.paragraph_format.space_after = Pt(0)
-    p.paragraph_format.space_before = Pt(0)
-    run = p.add_run("")
-    run.font.size = FONT_SIZE_BODY
-    return p
+    if isinstance(doc, _MeasuredDocument):
+        doc.layout.blank()
+        doc = doc.doc
+    if isinstance(doc, StreamingDocument):
+        return doc.blank()
+    return doc.add_paragraph()
 
 
 def _is_caption_area(lines: list[str], i: int) -> bool:
@@ -166,30 +306,78 @@ def _is_caption_area(lines: list[str], i: int) -> bool:
     return any("UNITED STATES DISTRICT COURT" in l for l in window)
 
 
+def _classify_line(line: str) -> LineToken:
+    """Classify one line against every structural pattern."""
+    stripped = line.strip()
+    if not stripped:
+        return LineToken(T_BLANK, "")
+
+    flags = 0
+    groups = ("", "")
+    if "UNITED STATES DISTRICT COURT" in stripped:
+        flags |= T_CAPTION
+    if RE_HEADING.match(line):
+        flags |= T_HEADING
+    if RE_SIGNATURE.match(line):
+        flags |= T_SIGNATURE
+    # Checkbox, numbered, lettered: the renderer tries them in this order,
+    # so the first match supplies the groups.
+    m = RE_CHECKBOX.match(line)
+    if m:
+        flags |= T_CHECKBOX
+        groups = (m.group(1), m.group(2))
+    m = RE_NUMBERED.match(line)
+    if m:
+        flags |= T_NUMBERED
+        if not flags & T_CHECKBOX:
+            groups = (m.group(1), m.group(2))
+    m = RE_LETTERED.match(line)
+    if m:
+        flags |= T_LETTERED
+        if not flags & (T_CHECKBOX | T_NUMBERED):
+            groups = (m.group(1), m.group(2))
+    if RE_DASHES.match(stripped):
+        flags |= T_DASHES
+    if RE_ROMAN.match(stripped):
+        flags |= T_ROMAN
+    return LineToken(flags, stripped, groups)
+
+
+def _tokenize(text: str) -> list[LineToken]:
+    """Classify every line of a legal document exactly once."""
+    return [_classify_line(line) for line in text.split("\n")]
+
+
 def _parse_and_render(doc: Document, text: str):
     """Parse legal document text and render to Word document."""
-    lines = text.split("\n")
+    return _render_tokens(doc, _tokenize(text))
+
+
+def _render_tokens(doc: Document, tokens: list[LineToken]) -> int:
+    """Render a token stream to a Word document. Returns the heading count."""
+    n = len(tokens)
     i = 0
     in_signature_block = False
     caption_done = False
     section_count = 0
 
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+    while i < n:
+        tok = tokens[i]
+        flags = tok.flags
+        stripped = tok.text
 
         # Skip empty lines (we control spacing ourselves)
-        if not stripped:
+        if flags & T_BLANK:
             i += 1
             continue
 
         # ── Caption block (UNITED STATES DISTRICT COURT) ──
-        if "UNITED STATES DISTRICT COURT" in stripped and not caption_done:
+        if flags & T_CAPTION and not caption_done:
             _add_centered(doc, "UNITED STATES DISTRICT COURT", bold=True)
             i += 1
             # Read next few lines as caption
-            while i < len(lines):
-                cl = lines[i].strip()
+            while i < n:
+                cl = tokens[i].text
                 if not cl:
                     i += 1
                     continue
@@ -229,12 +417,12 @@ def _parse_and_render(doc: Document, text: str):
             continue
 
         # ── Document title (after caption, centered, all caps) ──
-        if caption_done and RE_HEADING.match(line) and not in_signature_block:
+        if caption_done and flags & T_HEADING and not in_signature_block:
             heading_text = stripped
             # Check for multi-line headings
-            while i + 1 < len(lines) and lines[i + 1].strip() and RE_HEADING.match(lines[i + 1]):
+            while i + 1 < n and tokens[i + 1].flags & T_HEADING:
                 i += 1
-                heading_text += "\n" + lines[i].strip()
+                heading_text += "\n" + tokens[i].text
             _add_blank_line(doc)
             _add_centered(doc, heading_text, bold=True)
             _add_blank_line(doc)
@@ -243,7 +431,7 @@ def _parse_and_render(doc: Document, text: str):
             continue
 
         # ── Signature / right-aligned blocks ──
-        if RE_SIGNATURE.match(line):
+        if flags & T_SIGNATURE:
             in_signature_block = True
 
         if in_signature_block:
@@ -269,48 +457,44 @@ def _parse_and_render(doc: Document, text: str):
             continue
 
         # ── Checkbox paragraphs [ ] ──
-        m = RE_CHECKBOX.match(line)
-        if m:
-            num, content = m.group(1), m.group(2)
+        if flags & T_CHECKBOX:
+            num, content = tok.groups
             # Collect continuation lines
-            while i + 1 < len(lines) and lines[i + 1].strip() and not RE_CHECKBOX.match(lines[i + 1]) and not RE_NUMBERED.match(lines[i + 1]) and not RE_HEADING.match(lines[i + 1]):
+            while i + 1 < n and not tokens[i + 1].flags & _STOP_CHECKBOX:
                 i += 1
-                content += " " + lines[i].strip()
+                content += " " + tokens[i].text
             _add_body(doc, f"[ ] {num}. {content}", indent=True)
             i += 1
             continue
 
         # ── Numbered paragraphs ──
-        m = RE_NUMBERED.match(line)
-        if m:
-            num, content = m.group(1), m.group(2)
+        if flags & T_NUMBERED:
+            num, content = tok.groups
             # Collect continuation lines
-            while i + 1 < len(lines) and lines[i + 1].strip() and not RE_NUMBERED.match(lines[i + 1]) and not RE_HEADING.match(lines[i + 1]) and not RE_CHECKBOX.match(lines[i + 1]) and not RE_LETTERED.match(lines[i + 1]) and not RE_SIGNATURE.match(lines[i + 1]):
+            while i + 1 < n and not tokens[i + 1].flags & _STOP_NUMBERED:
                 i += 1
-                content += " " + lines[i].strip()
+                content += " " + tokens[i].text
             _add_body(doc, f"{num}. {content}", indent=True)
             i += 1
             continue
 
         # ── Lettered sub-paragraphs ──
-        m = RE_LETTERED.match(line)
-        if m:
-            letter, content = m.group(1), m.group(2)
-            while i + 1 < len(lines) and lines[i + 1].strip() and not RE_LETTERED.match(lines[i + 1]) and not RE_NUMBERED.match(lines[i + 1]) and not RE_HEADING.match(lines[i + 1]):
+        if flags & T_LETTERED:
+            letter, content = tok.groups
+            while i + 1 < n and not tokens[i + 1].flags & _STOP_LETTERED:
                 i += 1
-                content += " " + lines[i].strip()
-            p = _add_body(doc, f"{letter.strip()}. {content}", indent=False)
-            p.paragraph_format.left_indent = Inches(1.0)
+                content += " " + tokens[i].text
+            _add_lettered(doc, f"{letter.strip()}. {content}")
             i += 1
             continue
 
         # ── Divider lines ──
-        if RE_DASHES.match(stripped):
+        if flags & T_DASHES:
             i += 1
             continue
 
         # ── Roman numeral subheadings (I. II. III. etc) ──
-        if re.match(r"^[IVX]+\.\s+", stripped):
+        if flags & T_ROMAN:
             _add_blank_line(doc)
             _add_centered(doc, stripped, bold=True)
             i += 1
@@ -319,14 +503,9 @@ def _parse_and_render(doc: Document, text: str):
         # ── Regular body text ──
         content = stripped
         # Collect continuation
-        while i + 1 < len(lines) and lines[i + 1].strip() and not RE_NUMBERED.match(lines[i + 1]) and not RE_HEADING.match(lines[i + 1]) and not RE_CHECKBOX.match(lines[i + 1]) and not RE_SIGNATURE.match(lines[i + 1]):
-            next_stripped = lines[i + 1].strip()
-            if not next_stripped:
-                break
-            if RE_LETTERED.match(lines[i + 1]):
-                break
-            content += " " + next_stripped
+        while i + 1 < n and not tokens[i + 1].flags & _STOP_BODY:
             i += 1
+            content += " " + tokens[i].text
 
         _add_body(doc, content, indent=True)
         i += 1
@@ -345,109 +524,257 @@ def _extract_legal_text(template_content: str) -> str:
 
 def _fill_placeholders(text: str, case_data: dict) -> str:
     """Replace {{PLACEHOLDER}} tokens with case data values."""
-    parties = case_data.get("parties", {})
-    court = case_data.get("court", {})
-    plaintiffs = parties.get("plaintiffs", [])
-    defendants = parties.get("defendants", [])
-
-    replacements = {
-        "PLAINTIFF_NAME": plaintiffs[0]["name"].upper() if plaintiffs else "[PLAINTIFF]",
-        "DEFENDANT_NAME": defendants[0]["name"].upper() if defendants else "[DEFENDANT]",
-        "CASE_NO": case_data.get("case_number", "________"),
-        "ATTORNEY_NAME": case_data.get("attorney", {}).get("name", "[ATTORNEY NAME]"),
-        "BAR_NO": case_data.get("attorney", {}).get("bar_number", "[BAR NO.]"),
-        "FIRM_NAME": case_data.get("attorney", {}).get("firm", "[FIRM NAME]"),
-        "ADDRESS": case_data.get("attorney", {}).get("address", "[ADDRESS]"),
-        "CITY": case_data.get("attorney", {}).get("city", "[CITY]"),
-        "STATE": case_data.get("attorney", {}).get("state", "[STATE]"),
-        "ZIP": case_data.get("attorney", {}).get("zip", "[ZIP]"),
-        "PHONE": case_data.get("attorney", {}).get("phone", "[PHONE]"),
-        "EMAIL": case_data.get("attorney", {}).get("email", "[EMAIL]"),
-        "DATE": case_data.get("filing_date", "____________"),
+    from .placeholders import fill_placeholders
+    return fill_placeholders(text, case_data)[0]
+
+
+# ── Compiled templates ───────────────────────────────────────────────────────
+
+@dataclass
+class CompiledTemplate:
+    """A template's legal text, tokenized once with its placeholders unfilled.
+
+    Only the lines listed in `slots` contain placeholders; filling a case
+    substitutes and re-classifies those lines and reuses every other token.
+    """
+    path: str
+    stamp: tuple[int, int]          # (mtime_ns, size) of the template file
+    lines: list[str]
+    tokens: list[LineToken]
+    slots: list[int]
+
+    def fill(self, case_data: dict, context=None) -> list[LineToken]:
+        """Token stream for this template filled with a case's data.
+
+        Pass a PlaceholderContext to collect unknown placeholders.
+        """
+        if not self.slots:
+            return list(self.tokens)
+        from .placeholders import PlaceholderContext
+        ctx = context or PlaceholderContext(case_data)
+        tokens: list[LineToken] = []
+        prev = 0
+        for i in self.slots:
+            tokens.extend(self.tokens[prev:i])
+            # A value containing newlines splits the line, as in the plain text
+            tokens.extend(_tokenize(ctx.substitute(self.lines[i])))
+            prev = i + 1
+        tokens.extend(self.tokens[prev:])
+        return tokens
+
+
+_compiled_templates: dict[str, CompiledTemplate] = {}
+
+
+def _find_template(template_name: str) -> Path:
+    """Locate a template by "category/name" or bare name."""
+    template_path = TEMPLATES_DIR / f"{template_name}.md"
+
+    if not template_path.exists():
+        # Try without subfolder
+        for subdir in TEMPLATES_DIR.iterdir():
+            if subdir.is_dir():
+                candidate = subdir / f"{template_name}.md"
+                if candidate.exists():
+                    template_path = candidate
+                    break
+        if not template_path.exists():
+            raise FileNotFoundError(f"Template not found: {template_name}")
+    return template_path
+
+
+def compile_template(raw: str, path: str = "", stamp: tuple[int, int] = (0, 0)) -> CompiledTemplate:
+    """Extract, tokenize and index the placeholder lines of a template."""
+    lines = _extract_legal_text(raw).split("\n")
+    return CompiledTemplate(
+        path=path,
+        stamp=stamp,
+        lines=lines,
+        tokens=[_classify_line(line) for line in lines],
+        slots=[i for i, line in enumerate(lines) if "{{" in line],
+    )
+
+
+def _template_cache_file(path: Path) -> Path:
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return _TEMPLATE_CACHE_DIR / f"{path.stem}-{digest}.tmpl"
+
+
+def _read_cached_template(path: Path, stamp: tuple[int, int]) -> CompiledTemplate | None:
+    try:
+        data = marshal.loads(_template_cache_file(path).read_bytes())
+        if (data.get("version") != _TEMPLATE_CACHE_VERSION or data.get("path") != str(path)
+                or tuple(data.get("stamp", ())) != stamp):
+            return None
+        return CompiledTemplate(
+            path=str(path),
+            stamp=stamp,
+            lines=data["lines"],
+            tokens=[LineToken(flags, text, groups) for flags, text, groups in data["tokens"]],
+            slots=data["slots"],
+        )
+    except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+def _write_cached_template(compiled: CompiledTemplate) -> None:
+    data = {
+        "version": _TEMPLATE_CACHE_VERSION,
+        "path": compiled.path,
+        "stamp": compiled.stamp,
+        "lines": compiled.lines,
+        "tokens": [(t.flags, t.text, t.groups) for t in compiled.tokens],
+        "slots": compiled.slots,
     }
+    cache_file = _template_cache_file(Path(compiled.path))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_bytes(marshal.dumps(data))
+        tmp.replace(cache_file)
+    except OSError:
+        pass  # Read-only home: keep the compiled template in memory only
+
+
+def load_compiled_template(template_path: Path) -> CompiledTemplate:
+    """Compiled form of a template file, from memory, disk cache, or parsed fresh.
+
+    Entries are keyed by path and invalidated when the file's mtime or size
+    changes.
+    """
+    st = template_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(template_path)
+
+    compiled = _compiled_templates.get(key)
+    if compiled is not None and compiled.stamp == stamp:
+        return compiled
+
+    compiled = _read_cached_template(template_path, stamp)
+    if compiled is None:
+        compiled = compile_template(template_path.read_text(), key, stamp)
+        _write_cached_template(compiled)
+    _compiled_templates[key] = compiled
+    return compiled
+
+
+def clear_template_cache() -> None:
+    """Drop compiled templates held in memory (the disk cache is revalidated on use)."""
+    _compiled_templates.clear()
 
-    for key, value in replacements.items():
-        text = text.replace(f"{{{{{key}}}}}", str(value))
 
-    return text
+def _render_to_file(tokens: list[LineToken], output_path: str, stream: bool = False,
+                    district_code: str | None = None) -> tuple[int, PageLayout]:
+    """Render tokens to a .docx with python-docx or the streaming writer.
 
+    Every paragraph is also laid out on a PageLayout for the same formatting
+    profile, so the page estimate costs no second pass.
 
-def export_draft(case_data: dict, output_path: str) -> ExportResult:
+    Returns (heading count, layout).
+    """
+    layout = PageLayout(*_formatting_profile(district_code))
+    if stream:
+        with StreamingDocument(_base_document_bytes(district_code), output_path) as doc:
+            return _render_tokens(_MeasuredDocument(doc, layout), tokens), layout
+    doc = _setup_document(district_code)
+    sections = _render_tokens(_MeasuredDocument(doc, layout), tokens)
+    doc.save(output_path)
+    return sections, layout
+
+
+def export_draft(case_data: dict, output_path: str, stream: bool = False,
+                 district_code: str | None = None) -> ExportResult:
     """Export a generated complaint draft as .docx."""
     from .drafter import generate_complaint
 
     complaint_md = generate_complaint(case_data)
-    doc = _setup_document()
-    sections = _parse_and_render(doc, complaint_md)
-    doc.save(output_path)
+    sections, layout = _render_to_file(_tokenize(complaint_md), output_path, stream, district_code)
 
     return ExportResult(
         output_path=output_path,
         format="docx",
-        pages_estimate=max(1, sections),
+        pages_estimate=layout.pages,
         sections=sections,
+        lines_estimate=layout.lines,
     )
 
 
-def export_template(template_name: str, case_data: dict, output_path: str) -> ExportResult:
+def export_template(template_name: str, case_data: dict, output_path: str,
+                    stream: bool = False, district_code: str | None = None) -> ExportResult:
     """Export a filled template as .docx.
 
     template_name: e.g. "motions/motion_to_dismiss" or "orders/proposed_order_mtd"
     """
-    # Find template file
-    templates_dir = Path(__file__).parent.parent.parent / "assets" / "templates"
-    template_path = templates_dir / f"{template_name}.md"
-
-    if not template_path.exists():
-        # Try without subfolder
-        for subdir in templates_dir.iterdir():
-            if subdir.is_dir():
-                candidate = subdir / f"{template_name}.md"
-                if candidate.exists():
-                    template_path = candidate
-                    break
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_name}")
-
-    raw = template_path.read_text()
-    legal_text = _extract_legal_text(raw)
-    filled = _fill_placeholders(legal_text, case_data)
+    from .placeholders import PlaceholderContext
 
-    doc = _setup_document()
-    sections = _parse_and_render(doc, filled)
-    doc.save(output_path)
+    compiled = load_compiled_template(_find_template(template_name))
+    ctx = PlaceholderContext(case_data)
+    sections, layout = _render_to_file(compiled.fill(case_data, ctx), output_path, stream, district_code)
 
     return ExportResult(
         output_path=output_path,
         format="docx",
-        pages_estimate=max(1, sections),
+        pages_estimate=layout.pages,
         sections=sections,
+        lines_estimate=layout.lines,
+        unknown_placeholders=ctx.unknown,
     )
 
 
-def export_text(text: str, output_path: str) -> ExportResult:
-    """Export raw text/markdown as court-formatted .docx."""
+def export_text(text: str, output_path: str, stream: bool = False,
+                district_code: str | None = None) -> ExportResult:
+    """Export raw text/markdown as court-formatted .docx.
+
+    stream=True writes the document body directly into the archive instead
+    of building it in memory; use it for very large documents.
+    """
     # Check if it contains code blocks (template format)
     legal_text = _extract_legal_text(text)
-
-    doc = _setup_document()
-    sections = _parse_and_render(doc, legal_text)
-    doc.save(output_path)
+    sections, layout = _render_to_file(_tokenize(legal_text), output_path, stream, district_code)
 
     return ExportResult(
         output_path=output_path,
         format="docx",
-        pages_estimate=max(1, sections),
+        pages_estimate=layout.pages,
         sections=sections,
+        lines_estimate=layout.lines,
     )
 
 
+def page_limit_kind(template_name: str) -> str | None:
+    """Which local-rule page limit a template falls under, if any.
+
+    Returns "motion", "response" or "reply" for templates in motions/,
+    None for everything else (pleadings, orders, discovery, ...).
+    """
+    category, _, name = template_name.partition("/")
+    if category != "motions":
+        return None
+    if "reply" in name:
+        return "reply"
+    if "response" in name or "opposition" in name:
+        return "response"
+    return "motion"
+
+
+def page_limit_warning(template_name: str, pages: int, district_code: str | None = None) -> str:
+    """Warning if a template's estimated length is over its district page limit, else ""."""
+    from .districts import get_page_limits
+
+    kind = page_limit_kind(template_name)
+    if kind is None:
+        return ""
+    limit = get_page_limits(district_code).get(kind)
+    if not limit or pages <= limit:
+        return ""
+    return f"estimated {pages} pages exceeds the {limit}-page {kind} limit"
+
+
 def list_templates() -> list[dict]:
     """List all available templates."""
-    templates_dir = Path(__file__).parent.parent.parent / "assets" / "templates"
     result = []
-    if templates_dir.exists():
-        for subdir in sorted(templates_dir.iterdir()):
+    if TEMPLATES_DIR.exists():
+        for subdir in sorted(TEMPLATES_DIR.iterdir()):
             if subdir.is_dir():
                 for f in sorted(subdir.glob("*.md")):
                     result.append({
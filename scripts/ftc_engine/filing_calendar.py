@@ -11,6 +11,8 @@ Produces a chronological document map showing:
 - Trial-related deadlines
 
 Integrates with districts (for response days), claims, and sol modules.
+Deadlines are computed under FRCP 6(a) via court_days, so a period ending on
+a weekend or federal holiday runs to the next court day.
 
 Usage:
   ftc calendar -i case.json
@@ -23,6 +25,8 @@ from dataclasses import dataclass, field
 from datetime import date, timedelta, datetime
 from typing import Optional
 
+from .court_days import compute_deadline
+
 
 @dataclass
 class CalendarEntry:
@@ -123,7 +127,7 @@ def _build_service_entries(filing_date: date, case_data: dict) -> list[CalendarE
     entries = []
     defendants = case_data.get("parties", {}).get("defendants", [])
 
-    service_deadline = filing_date + timedelta(days=90)
+    service_deadline = compute_deadline(filing_date, 90)
 
     for d in defendants:
         d_name = d.get("name", "Defendant")
@@ -134,7 +138,7 @@ def _build_service_entries(filing_date: date, case_data: dict) -> list[CalendarE
                 document=f"Service on {d_name} (Federal)",
                 category="service",
                 deadline=service_deadline,
-                relative_days=90,
+                relative_days=(service_deadline - filing_date).days,
                 description="Serve U.S. Attorney + agency + Attorney General per FRCP 4(i)",
                 rule_authority="FRCP 4(i)",
                 priority="critical",
@@ -146,7 +150,7 @@ def _build_service_entries(filing_date: date, case_data: dict) -> list[CalendarE
                 document=f"Service on {d_name}",
                 category="service",
                 deadline=service_deadline,
-                relative_days=90,
+                relative_days=(service_deadline - filing_date).days,
                 description=f"Complete service of process on {d_name}",
                 rule_authority="FRCP 4(c)-(e), 4(m)",
                 priority="critical",
@@ -172,7 +176,7 @@ def _build_response_entries(
 
         # Assume service on day 30 (reasonable estimate)
         est_service = filing_date + timedelta(days=30)
-        answer_deadline = est_service + timedelta(days=actual_days)
+        answer_deadline = compute_deadline(est_service, actual_days)
 
         entries.append(CalendarEntry(
             document=f"Answer/MTD from {d_name}",
@@ -219,12 +223,12 @@ def _build_discovery_entries(filing_date: date, timings: dict) -> list[CalendarE
     entries = []
 
     # Rule 26(f) conference — typically 21 days before scheduling conference
-    r26f_date = filing_date + timedelta(days=90)
+    r26f_date = compute_deadline(filing_date, 90)
     entries.append(CalendarEntry(
         document="Rule 26(f) Conference",
         category="discovery",
         deadline=r26f_date,
-        relative_days=90,
+        relative_days=(r26f_date - filing_date).days,
         description="Parties' planning meeting — discuss discovery, ESI, scheduling",
         rule_authority="FRCP 26(f)",
         priority="high",
@@ -232,7 +236,7 @@ def _build_discovery_entries(filing_date: date, timings: dict) -> list[CalendarE
     ))
 
     # Initial disclosures — 14 days after Rule 26(f)
-    init_disc = r26f_date + timedelta(days=14)
+    init_disc = compute_deadline(r26f_date, 14)
     entries.append(CalendarEntry(
         document="Initial Disclosures (Rule 26(a)(1))",
         category="discovery",
@@ -245,12 +249,12 @@ def _build_discovery_entries(filing_date: date, timings: dict) -> list[CalendarE
     ))
 
     # Fact discovery cutoff (estimate: 6 months from filing)
-    fact_disc = filing_date + timedelta(days=180)
+    fact_disc = compute_deadline(filing_date, 180)
     entries.append(CalendarEntry(
         document="Fact Discovery Cutoff",
         category="discovery",
         deadline=fact_disc,
-        relative_days=180,
+        relative_days=(fact_disc - filing_date).days,
         description="All fact discovery (depositions, interrogatories, RFPs, RFAs) must be completed",
         rule_authority="FRCP 16(b); Scheduling Order",
         priority="critical",
@@ -258,12 +262,12 @@ def _build_discovery_entries(filing_date: date, timings: dict) -> list[CalendarE
     ))
 
     # Expert disclosures (estimate: 7 months)
-    expert_disc = filing_date + timedelta(days=210)
+    expert_disc = compute_deadline(filing_date, 210)
     entries.append(CalendarEntry(
         document="Expert Disclosures (Rule 26(a)(2))",
         category="discovery",
         deadline=expert_disc,
-        relative_days=210,
+        relative_days=(expert_disc - filing_date).days,
         description="Disclose expert witnesses with written reports",
         rule_authority="FRCP 26(a)(2)",
         priority="high",
@@ -271,7 +275,7 @@ def _build_discovery_entries(filing_date: date, timings: dict) -> list[CalendarE
     ))
 
     # Rebuttal expert disclosures
-    rebuttal = expert_disc + timedelta(days=30)
+    rebuttal = compute_deadline(expert_disc, 30)
     entries.append(CalendarEntry(
         document="Rebuttal Expert Disclosures",
         category="discovery",
@@ -285,12 +289,12 @@ def _build_discovery_entries(filing_date: date, timings: dict) -> list[CalendarE
 
     # Mediation (if required)
     if timings.get("mediation_required"):
-        med_date = filing_date + timedelta(days=150)
+        med_date = compute_deadline(filing_date, 150)
         entries.append(CalendarEntry(
             document="Court-Ordered Mediation",
             category="discovery",
             deadline=med_date,
-            relative_days=150,
+            relative_days=(med_date - filing_date).days,
             description="Mediation conference per local rule requirement",
             rule_authority="Local Rule",
             priority="high",
@@ -305,12 +309,12 @@ def _build_dispositive_entries(filing_date: date) -> list[CalendarEntry]:
     entries = []
 
     # Dispositive motions (estimate: 8-9 months)
-    disp_date = filing_date + timedelta(days=270)
+    disp_date = compute_deadline(filing_date, 270)
     entries.append(CalendarEntry(
         document="Dispositive Motions Deadline",
         category="dispositive",
         deadline=disp_date,
-        relative_days=270,
+        relative_days=(disp_date - filing_date).days,
         description="Last day to file summary judgment (FRCP 56) and Daubert motions",
         rule_authority="FRCP 56; Scheduling Order",
         priority="critical",
@@ -326,12 +330,12 @@ def _build_trial_entries(filing_date: date) -> list[CalendarEntry]:
     entries = []
 
     # Pretrial conference (estimate: 11 months)
-    pretrial = filing_date + timedelta(days=330)
+    pretrial = compute_deadline(filing_date, 330)
     entries.append(CalendarEntry(
         document="Final Pretrial Conference",
         category="trial",
         deadline=pretrial,
-        relative_days=330,
+        relative_days=(pretrial - filing_date).days,
         description="File joint pretrial statement; exchange exhibit/witness lists",
         rule_authority="FRCP 16(e)",
         priority="critical",
@@ -339,12 +343,12 @@ def _build_trial_entries(filing_date: date) -> list[CalendarEntry]:
     ))
 
     # Motions in limine (typically 14-21 days before trial)
-    mil_date = filing_date + timedelta(days=345)
+    mil_date = compute_deadline(filing_date, 345)
     entries.append(CalendarEntry(
         document="Motions in Limine",
         category="trial",
         deadline=mil_date,
-        relative_days=345,
+        relative_days=(mil_date - filing_date).days,
         description="File motions to exclude/admit evidence",
         rule_authority="FRE 104; Local Rule",
         priority="high",
@@ -352,12 +356,12 @@ def _build_trial_entries(filing_date: date) -> list[CalendarEntry]:
     ))
 
     # Trial (estimate: 12 months)
-    trial = filing_date + timedelta(days=365)
+    trial = compute_deadline(filing_date, 365)
     entries.append(CalendarEntry(
         document="TRIAL",
         category="trial",
         deadline=trial,
-        relative_days=365,
+        relative_days=(trial - filing_date).days,
         description="Trial date (estimate — set by scheduling order)",
         rule_authority="FRCP 16(b)",
         priority="critical",
@@ -370,13 +374,15 @@ def _build_trial_entries(filing_date: date) -> list[CalendarEntry]:
 def _build_post_trial_entries(filing_date: date) -> list[CalendarEntry]:
     """Post-trial deadlines."""
     entries = []
-    trial_date = filing_date + timedelta(days=365)
+    trial_date = compute_deadline(filing_date, 365)
+    jmol_date = compute_deadline(trial_date, 28)
+    appeal_date = compute_deadline(trial_date, 30)
 
     entries.append(CalendarEntry(
         document="Post-Trial Motions (JMOL/New Trial)",
         category="post_trial",
-        deadline=trial_date + timedelta(days=28),
-        relative_days=393,
+        deadline=jmol_date,
+        relative_days=(jmol_date - filing_date).days,
         description="Renewed JMOL (FRCP 50(b)) or New Trial (FRCP 59) motions",
         rule_authority="FRCP 50(b), FRCP 59(b)",
         priority="critical",
@@ -387,8 +393,8 @@ def _build_post_trial_entries(filing_date: date) -> list[CalendarEntry]:
     entries.append(CalendarEntry(
         document="Notice of Appeal",
         category="post_trial",
-        deadline=trial_date + timedelta(days=30),
-        relative_days=395,
+        deadline=appeal_date,
+        relative_days=(appeal_date - filing_date).days,
         description="File notice of appeal to the Circuit Court",
         rule_authority="FRAP 4(a)(1)(A)",
         priority="critical",
@@ -462,7 +468,7 @@ def generate_filing_calendar(
         entries=entries,
         total_documents=len(entries),
         critical_deadlines=critical_count,
-        estimated_trial_date=str(filing_date + timedelta(days=365)),
+        estimated_trial_date=str(compute_deadline(filing_date, 365)),
         generated_at=str(date.today()),
     )
 
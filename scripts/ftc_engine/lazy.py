@@ -0,0 +1,48 @@
+"""
+Lazy Module Attributes — Builds heavy module-level values on first access.
+
+Large literal tables (claims, deposition elements, viability knowledge) and
+objects from optional libraries (python-docx lengths) used to be created when
+their module was imported, so every command paid for them, including ones
+like `ftc claims` that never read most of them. A module now defines a
+builder function per value and installs a PEP 562 `__getattr__`. The value
+is built the first time anything reads it, then stored as an ordinary module
+global, so later reads are plain attribute lookups.
+
+Code inside the module can't rely on a bare global name before the first
+build, so it goes through `__getattr__` (usually via a small helper).
+
+Usage:
+  def _build_claim_library() -> dict[str, ClaimMetadata]:
+      return {...}
+
+  __getattr__ = lazy_attributes(globals(), CLAIM_LIBRARY=_build_claim_library)
+
+  from ftc_engine.claims import CLAIM_LIBRARY   # built here, once
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+def lazy_attributes(namespace: dict[str, Any], **builders: Callable[[], Any]) -> Callable[[str], Any]:
+    """Return a module `__getattr__` that builds each named value on first access.
+
+    Args:
+        namespace: The module's globals()
+        **builders: Attribute name -> zero-argument function that builds it
+
+    Concurrent first reads may both run the builder; only the first result is
+    stored, so every caller sees the same object.
+    """
+    module = namespace.get("__name__", "module")
+
+    def __getattr__(name: str) -> Any:
+        if name in namespace:
+            return namespace[name]
+        builder = builders.get(name)
+        if builder is None:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+        return namespace.setdefault(name, builder())
+
+    return __getattr__
@@ -0,0 +1,301 @@
+"""
+Monitor Sweep — Portfolio-wide Rule 11 viability monitoring across all
+saved cases.
+
+Runs the Rule 11 monitor over every case in the case index and writes one
+docket-level report, with findings ordered by severity. Two things keep a
+sweep cheap enough to run routinely:
+
+- Claims are grouped. Built-in knowledge lookups and online CourtListener
+  searches run once per distinct claim key across the docket rather than
+  once per case (see rule11_monitor.claim_lookups).
+- Results are kept in ~/.ftc/cases/.monitor_sweep.json. A case is re-checked
+  only if its case.json changed since the last sweep, the sweep mode or
+  case-law source changed, the engine was upgraded, or the result is from an
+  earlier day (SOL findings count days from today). Online results also
+  expire with the CourtListener cache TTL, or, for the local mirror, when
+  the mirror is re-imported. Otherwise its stored report is reused.
+
+Usage:
+  ftc monitor --all-cases
+  ftc monitor --all-cases --mode online -v -o docket_monitor.txt
+  ftc monitor --all-cases --recheck-all
+"""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
+from . import case_manager
+from .rule11_monitor import (
+    MonitorReport, ViabilityCheck, ViabilityIssue,
+    claim_lookups, default_source, generate_monitor_report, monitored_claims,
+)
+
+
+SWEEP_FILENAME = ".monitor_sweep.json"
+
+SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+STATUS_RANK = {"non_viable": 0, "questionable": 1, "warning": 2, "viable": 3}
+COMPLIANCE_RANK = {"non_compliant": 0, "review_needed": 1, "compliant": 2}
+
+
+@dataclass
+class DocketFinding:
+    severity: str
+    case_number: str
+    case_name: str
+    claim_key: str
+    status: str  # the claim's viability status
+    description: str
+    citation: str = ""
+    recommendation: str = ""
+
+
+@dataclass
+class CaseSweep:
+    case_number: str
+    report: MonitorReport
+    rechecked: bool  # False: reused from the last sweep
+
+
+@dataclass
+class DocketMonitorReport:
+    mode: str
+    source: str = ""  # online mode: case-law source
+    cases: list[CaseSweep] = field(default_factory=list)
+    findings: list[DocketFinding] = field(default_factory=list)
+    claims_looked_up: int = 0  # distinct claims looked up for the re-checked cases
+    generated_at: str = ""
+
+    @property
+    def rechecked(self) -> int:
+        return sum(1 for c in self.cases if c.rechecked)
+
+
+# ── Persistence ─────────────────────────────────────────────────────────────
+
+def _sweep_path() -> Path:
+    return case_manager.CASES_DIR / SWEEP_FILENAME
+
+
+def _load_sweep() -> dict:
+    from . import __version__
+    path = _sweep_path()
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == 1 and data.get("engine_version") == __version__:
+                return data
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {"version": 1, "engine_version": __version__, "cases": {}}
+
+
+def _save_sweep(sweep: dict) -> None:
+    path = _sweep_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(sweep) + "\n")
+
+
+def _report_from_data(data: dict) -> MonitorReport:
+    checks = [
+        ViabilityCheck(**{**c, "issues": [ViabilityIssue(**i) for i in c["issues"]]})
+        for c in data["checks"]
+    ]
+    return MonitorReport(**{**data, "checks": checks})
+
+
+def _source_generation(source: str) -> str:
+    """A stamp that changes when the case-law source's data does ("" if untracked)."""
+    if source == "local":
+        from .caselaw_mirror import mirror_generation
+        return mirror_generation()
+    return ""
+
+
+def _is_current(known: dict | None, entry: dict, mode: str, source: str,
+                generation: str = "", max_age: float | None = None) -> bool:
+    """Whether the last sweep's result for a case still holds.
+
+    Args:
+        generation: The source's _source_generation()
+        max_age: Seconds an online result stays current (None: no limit)
+    """
+    if not known or known.get("mtime_ns") != entry.get("mtime_ns"):
+        return False
+    if known.get("mode") != mode or known.get("source", "") != source:
+        return False
+    if known.get("source_generation", "") != generation:
+        return False
+    if known.get("swept") != str(date.today()):
+        return False  # SOL findings are relative to the day of the sweep
+    return max_age is None or time.time() - known.get("checked_at", 0) < max_age
+
+
+def _stored_report(known: dict) -> MonitorReport | None:
+    try:
+        return _report_from_data(known["report"])
+    except (KeyError, TypeError):
+        return None
+
+
+# ── Sweep ───────────────────────────────────────────────────────────────────
+
+def docket_findings(cases: list[CaseSweep]) -> list[DocketFinding]:
+    """Every issue across the docket, most severe first.
+
+    Ties are broken by the claim's status (non-viable first), then case
+    number and claim key, so the order is stable from sweep to sweep.
+    """
+    findings = [
+        DocketFinding(
+            severity=issue.severity,
+            case_number=c.case_number,
+            case_name=c.report.case_name,
+            claim_key=check.claim_key,
+            status=check.status,
+            description=issue.description,
+            citation=issue.citation,
+            recommendation=issue.recommendation,
+        )
+        for c in cases
+        for check in c.report.checks
+        for issue in check.issues
+    ]
+    findings.sort(key=lambda f: (SEVERITY_RANK.get(f.severity, len(SEVERITY_RANK)),
+                                 STATUS_RANK.get(f.status, len(STATUS_RANK)),
+                                 f.case_number, f.claim_key))
+    return findings
+
+
+def sweep_cases(mode: str = "offline", recheck_all: bool = False,
+                source: str | None = None) -> DocketMonitorReport:
+    """Monitor every saved case and build the docket report.
+
+    Args:
+        mode: "offline" or "online" (as for a single case)
+        recheck_all: Ignore stored results and re-check every case
+        source: Online mode: case-law source name (default: default_source())
+
+    Raises:
+        ValueError: Unknown case-law source
+    """
+    source = (source or default_source()) if mode == "online" else ""
+    generation = _source_generation(source)
+    max_age = None
+    if mode == "online" and source != "local":  # the mirror's generation tracks its data
+        from .courtlistener import ResponseCache
+        max_age = ResponseCache().ttl
+    index = case_manager.load_case_index()
+    sweep = {} if recheck_all else _load_sweep()
+    known_cases = sweep.get("cases", {})
+
+    reused: dict[str, MonitorReport | None] = {}
+    pending: dict[str, tuple[dict, list[str]]] = {}
+    for key, entry in index.items():
+        if not entry.get("mtime_ns"):
+            continue  # no case.json yet
+        known = known_cases.get(key)
+        if _is_current(known, entry, mode, source, generation, max_age):
+            if known.get("report") is None:
+                reused[key] = None  # nothing to monitor last time either
+                continue
+            report = _stored_report(known)
+            if report is not None:
+                reused[key] = report
+                continue
+        case_data = case_manager.load_case_data(entry["case_number"])
+        pending[key] = (case_data, monitored_claims(case_data))
+
+    # One lookup per distinct claim across every case being re-checked
+    lookups = claim_lookups([ck for _, claims in pending.values() for ck in claims], mode, source or None)
+
+    from . import __version__
+    from .output import to_data
+    stored = {"version": 1, "engine_version": __version__, "cases": {}}
+    cases: list[CaseSweep] = []
+    now = time.time()
+    for key, entry in index.items():
+        if key in reused:
+            report, rechecked = reused[key], False
+            checked_at = known_cases[key].get("checked_at", now)
+        elif key in pending:
+            case_data, claims = pending[key]
+            report = generate_monitor_report(case_data, claims, mode, lookups, source or None) if claims else None
+            rechecked, checked_at = True, now
+        else:
+            continue
+        stored["cases"][key] = {"mtime_ns": entry["mtime_ns"], "mode": mode, "source": source,
+                                "source_generation": generation,
+                                "swept": str(date.today()), "checked_at": checked_at,
+                                "report": to_data(report) if report else None}
+        if report is not None:  # cases without claims have nothing to report
+            cases.append(CaseSweep(entry["case_number"], report, rechecked))
+
+    if pending or stored["cases"].keys() != known_cases.keys():
+        _save_sweep(stored)
+
+    cases.sort(key=lambda c: (COMPLIANCE_RANK.get(c.report.overall_compliance, len(COMPLIANCE_RANK)),
+                              c.case_number))
+    return DocketMonitorReport(
+        mode=mode,
+        source=source,
+        cases=cases,
+        findings=docket_findings(cases),
+        claims_looked_up=len(lookups),
+        generated_at=str(date.today()),
+    )
+
+
+def format_docket_monitor(report: DocketMonitorReport, verbose: bool = False) -> str:
+    """Format the docket-level monitor report for CLI output."""
+    lines = []
+    lines.append("")
+    lines.append("=" * 70)
+    lines.append("         RULE 11 DUTY MONITOR — DOCKET SWEEP")
+    lines.append("=" * 70)
+    lines.append(f"  Cases:      {len(report.cases)} ({report.rechecked} re-checked, "
+                 f"{len(report.cases) - report.rechecked} unchanged)")
+    lines.append(f"  Lookups:    {report.claims_looked_up} distinct claim(s)")
+    lines.append(f"  Mode:       {report.mode}{f' ({report.source})' if report.source else ''}")
+
+    if not report.cases:
+        lines.append("")
+        lines.append("  No saved cases with case data. Create one with: ftc new")
+        return "\n".join(lines)
+
+    lines.append("")
+    lines.append(f"  {'Compliance':<15} {'Case':<24} {'Claims':>6}  Name")
+    lines.append("  " + "-" * 66)
+    for c in report.cases:
+        compliance = c.report.overall_compliance.upper().replace("_", " ")
+        lines.append(f"  {compliance:<15} {c.case_number[:24]:<24} {c.report.claims_checked:>6}  "
+                     f"{c.report.case_name}")
+
+    sev_icon = {"critical": "!!", "high": ">>", "medium": "..", "low": "  "}
+    shown = report.findings if verbose else [
+        f for f in report.findings if f.severity in ("critical", "high")
+    ]
+    lines.append("")
+    lines.append(f"  FINDINGS ({len(shown)} of {len(report.findings)}"
+                 f"{'' if verbose else ', critical and high; -v for all'}):")
+    for f in shown:
+        lines.append(f"    [{sev_icon.get(f.severity, '  ')}] {f.case_number[:24]:<24} {f.claim_key}")
+        lines.append(f"         {f.description[:100]}")
+        if verbose:
+            if f.citation:
+                lines.append(f"         Citation: {f.citation}")
+            if f.recommendation:
+                lines.append(f"         Action:   {f.recommendation}")
+    if not shown:
+        lines.append("    None")
+
+    lines.append("")
+    lines.append("=" * 70)
+    lines.append(f"  Generated: {report.generated_at}")
+    lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,119 @@
+"""
+Structured Output — Serializes command results as versioned JSON or msgpack.
+
+`--format json` and `--format msgpack` make a command emit the engine's
+dataclasses (MTDRiskResult, SOLResult, FilingCalendar, ExhibitIndex,
+DepositionOutline, MonitorReport, PacerFilingPackage, QuestionSet, ...)
+instead of the formatted text. Every payload sits in the same envelope:
+
+  {
+    "schema": "ftc.risk",
+    "schema_version": 1,
+    "engine_version": "1.0.0",
+    "generated_at": "2026-03-01T14:22:05Z",
+    "data": {...}
+  }
+
+schema_version changes only when an existing field is renamed, removed or
+changes meaning; new fields may appear in any release. Dataclasses become
+objects keyed by field name, dates become ISO strings, sets become sorted
+lists. msgpack output needs the optional `msgpack` package.
+
+Usage:
+  ftc risk -i case.json --format json | jq '.data["1983_fourth_excessive_force"].overall_score'
+  ftc calendar -i case.json --format msgpack -o calendar.msgpack
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, BinaryIO
+
+
+SCHEMA_VERSION = 1
+STRUCTURED_FORMATS = ("json", "msgpack")
+
+_field_names: dict[type, tuple[str, ...]] = {}
+
+
+def to_data(obj: Any) -> Any:
+    """Convert a result (dataclasses, dates, containers) to JSON-compatible data.
+
+    Unlike dataclasses.asdict() this doesn't deep-copy field values, and
+    field names are looked up once per class.
+
+    Raises:
+        TypeError: A value of a type with no JSON form
+    """
+    if obj is None or isinstance(obj, (str, bool, int, float)):
+        return obj
+    cls = type(obj)
+    names = _field_names.get(cls)
+    if names is None and is_dataclass(obj) and not isinstance(obj, type):
+        names = _field_names[cls] = tuple(f.name for f in fields(obj))
+    if names is not None:
+        return {name: to_data(getattr(obj, name)) for name in names}
+    if isinstance(obj, dict):
+        return {str(k): to_data(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_data(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted(to_data(v) for v in obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return to_data(obj.value)
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Cannot serialize {cls.__name__}")
+
+
+def envelope(command: str, result: Any) -> dict:
+    """Wrap a command result in the versioned envelope."""
+    from . import __version__
+    return {
+        "schema": f"ftc.{command}",
+        "schema_version": SCHEMA_VERSION,
+        "engine_version": __version__,
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "data": to_data(result),
+    }
+
+
+def encode(payload: dict, fmt: str) -> bytes:
+    """Encode an envelope as JSON (UTF-8, one line) or msgpack.
+
+    Raises:
+        RuntimeError: msgpack requested but not installed
+        ValueError: Unknown format
+    """
+    if fmt == "json":
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+    if fmt == "msgpack":
+        try:
+            import msgpack
+        except ImportError:
+            raise RuntimeError("--format msgpack needs the msgpack package (pip install msgpack)")
+        return msgpack.packb(payload, use_bin_type=True)
+    raise ValueError(f"Unknown structured format: {fmt}")
+
+
+def decode(data: bytes, fmt: str) -> dict:
+    """Decode an envelope produced by encode()."""
+    if fmt == "json":
+        return json.loads(data)
+    if fmt == "msgpack":
+        import msgpack
+        return msgpack.unpackb(data, raw=False)
+    raise ValueError(f"Unknown structured format: {fmt}")
+
+
+def write_structured(command: str, result: Any, fmt: str, out: BinaryIO) -> int:
+    """Encode a command result and write it to a binary stream; returns bytes written."""
+    data = encode(envelope(command, result), fmt)
+    out.write(data)
+    out.flush()
+    return len(data)
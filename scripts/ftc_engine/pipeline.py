@@ -0,0 +1,143 @@
+"""
+Stage Pipeline — Runs a dependency graph of named stages on a thread pool.
+
+A stage runs as soon as every stage it depends on has finished, and receives
+their results. Each result is computed once however many stages consume it,
+and stages with no path between them run concurrently. A failed stage fails
+everything downstream of it; the rest of the graph carries on.
+
+Used by the case wizard's document generation step.
+
+Usage:
+  results = run_stages([
+      Stage("suggestions", lambda deps: suggest_claims(case_data)),
+      Stage("doc:monitor", lambda deps: build_report(deps["suggestions"]), ("suggestions",)),
+  ])
+  results["doc:monitor"].value, results["doc:monitor"].seconds
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[dict[str, Any]], Any]    # called with {dependency name: result}
+    deps: tuple[str, ...] = ()
+
+
+@dataclass
+class StageResult:
+    name: str
+    value: Any = None
+    error: str = ""
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+def _check_graph(stages: list[Stage]) -> None:
+    """Raise ValueError on duplicate names, unknown dependencies or cycles."""
+    names = [s.name for s in stages]
+    known = set(names)
+    if len(known) != len(names):
+        dupes = sorted({n for n in names if names.count(n) > 1})
+        raise ValueError(f"Duplicate stage names: {', '.join(dupes)}")
+    for s in stages:
+        missing = [d for d in s.deps if d not in known]
+        if missing:
+            raise ValueError(f"Stage '{s.name}' depends on unknown stage(s): {', '.join(missing)}")
+
+    remaining = {s.name: len(s.deps) for s in stages}
+    dependents: dict[str, list[str]] = {s.name: [] for s in stages}
+    for s in stages:
+        for d in s.deps:
+            dependents[d].append(s.name)
+    ready = [n for n, count in remaining.items() if count == 0]
+    visited = 0
+    while ready:
+        name = ready.pop()
+        visited += 1
+        for child in dependents[name]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+    if visited != len(stages):
+        cyclic = sorted(n for n, count in remaining.items() if count)
+        raise ValueError(f"Stage dependencies form a cycle: {', '.join(cyclic)}")
+
+
+def _run_stage(stage: Stage, inputs: dict[str, Any]) -> StageResult:
+    start = time.perf_counter()
+    try:
+        value = stage.run(inputs)
+    except Exception as e:
+        return StageResult(stage.name, error=f"{type(e).__name__}: {e}",
+                           seconds=time.perf_counter() - start)
+    return StageResult(stage.name, value, seconds=time.perf_counter() - start)
+
+
+def run_stages(
+    stages: list[Stage],
+    workers: int | None = None,
+    on_done: Callable[[StageResult], None] | None = None,
+) -> dict[str, StageResult]:
+    """Run every stage once, in dependency order, on a thread pool.
+
+    Args:
+        stages: The graph; each stage names the stages it depends on
+        workers: Pool size (default: the executor's default)
+        on_done: Called in the calling thread as each stage finishes, in
+                 completion order (progress output goes here)
+
+    Returns:
+        Results by stage name, in the order the stages were given
+
+    Raises:
+        ValueError: Duplicate names, unknown dependencies or a cycle
+    """
+    _check_graph(stages)
+    by_name = {s.name: s for s in stages}
+    remaining = {s.name: len(s.deps) for s in stages}
+    dependents: dict[str, list[str]] = {s.name: [] for s in stages}
+    for s in stages:
+        for d in s.deps:
+            dependents[d].append(s.name)
+
+    results: dict[str, StageResult] = {}
+    ready = deque(s.name for s in stages if not s.deps)
+
+    def complete(result: StageResult) -> None:
+        results[result.name] = result
+        if on_done:
+            on_done(result)
+        for child in dependents[result.name]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: dict[Future, str] = {}
+        while ready or pending:
+            while ready:
+                stage = by_name[ready.popleft()]
+                failed = next((d for d in stage.deps if not results[d].ok), None)
+                if failed is not None:
+                    complete(StageResult(stage.name, error=f"upstream stage '{failed}' failed"))
+                    continue
+                inputs = {d: results[d].value for d in stage.deps}
+                pending[pool.submit(_run_stage, stage, inputs)] = stage.name
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    complete(future.result())
+
+    return {s.name: results[s.name] for s in stages}
@@ -0,0 +1,193 @@
+"""
+Placeholder Engine — Fills {{KEY}} variables in templates from case data.
+
+Every placeholder in a text is substituted in a single regex pass. Variables
+are resolved lazily through a registry of resolver functions: a resolver
+only runs when its placeholder actually appears, and at most once per case,
+so expensive values (claim suggestions for the count summary, district
+lookups) cost nothing for templates that don't use them.
+
+Placeholders with no registered resolver are left in the text and reported,
+so a template typo is visible instead of silently shipping "{{DEFENDENT}}".
+
+Usage:
+  from ftc_engine.placeholders import fill_placeholders
+  text, unknown = fill_placeholders(template_text, case_data)
+
+  @placeholder("JUDGE_NAME")
+  def _judge(case_data): ...
+"""
+from __future__ import annotations
+
+import re
+from typing import Callable
+
+
+PLACEHOLDER_RE = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
+
+Resolver = Callable[[dict], str]
+
+_RESOLVERS: dict[str, Resolver] = {}
+
+
+def register_placeholder(key: str, resolver: Resolver) -> None:
+    """Register (or replace) the resolver for {{KEY}}."""
+    _RESOLVERS[key] = resolver
+
+
+def placeholder(key: str) -> Callable[[Resolver], Resolver]:
+    """Decorator form of register_placeholder."""
+    def decorate(fn: Resolver) -> Resolver:
+        register_placeholder(key, fn)
+        return fn
+    return decorate
+
+
+def list_placeholders() -> list[str]:
+    """All registered placeholder keys, sorted."""
+    return sorted(_RESOLVERS)
+
+
+class PlaceholderContext:
+    """Placeholder values for one case, each resolved on first use.
+
+    A context can substitute many texts (e.g. every placeholder line of a
+    compiled template); `unknown` collects unregistered keys in first-seen
+    order across all of them.
+    """
+
+    def __init__(self, case_data: dict):
+        self.case_data = case_data
+        self.unknown: list[str] = []
+        self._values: dict[str, str] = {}
+
+    def resolve(self, key: str) -> str | None:
+        """Value for a key, or None if no resolver is registered."""
+        value = self._values.get(key)
+        if value is None:
+            resolver = _RESOLVERS.get(key)
+            if resolver is None:
+                return None
+            value = self._values[key] = str(resolver(self.case_data))
+        return value
+
+    def _replace(self, m: re.Match) -> str:
+        value = self.resolve(m.group(1))
+        if value is None:
+            if m.group(1) not in self.unknown:
+                self.unknown.append(m.group(1))
+            return m.group(0)
+        return value
+
+    def substitute(self, text: str) -> str:
+        """Replace every known {{KEY}} in one pass."""
+        if "{{" not in text:
+            return text
+        return PLACEHOLDER_RE.sub(self._replace, text)
+
+
+def fill_placeholders(text: str, case_data: dict) -> tuple[str, list[str]]:
+    """Fill a text's placeholders. Returns (filled_text, unknown_keys)."""
+    ctx = PlaceholderContext(case_data)
+    return ctx.substitute(text), ctx.unknown
+
+
+# ── Built-in variables ──────────────────────────────────────────────────────
+
+def _parties(case_data: dict, side: str) -> list[dict]:
+    return case_data.get("parties", {}).get(side, [])
+
+
+def _attorney(field_name: str, default: str) -> Resolver:
+    return lambda case_data: case_data.get("attorney", {}).get(field_name, default)
+
+
+def _join_names(names: list[str]) -> str:
+    if len(names) <= 2:
+        return " and ".join(names)
+    return ", ".join(names[:-1]) + ", and " + names[-1]
+
+
+@placeholder("PLAINTIFF_NAME")
+def _plaintiff_name(case_data: dict) -> str:
+    plaintiffs = _parties(case_data, "plaintiffs")
+    return plaintiffs[0]["name"].upper() if plaintiffs else "[PLAINTIFF]"
+
+
+@placeholder("DEFENDANT_NAME")
+def _defendant_name(case_data: dict) -> str:
+    defendants = _parties(case_data, "defendants")
+    return defendants[0]["name"].upper() if defendants else "[DEFENDANT]"
+
+
+@placeholder("PLAINTIFFS")
+def _plaintiffs(case_data: dict) -> str:
+    names = [p["name"].upper() for p in _parties(case_data, "plaintiffs") if p.get("name")]
+    return _join_names(names) if names else "[PLAINTIFFS]"
+
+
+@placeholder("DEFENDANTS")
+def _defendants(case_data: dict) -> str:
+    names = [d["name"].upper() for d in _parties(case_data, "defendants") if d.get("name")]
+    return _join_names(names) if names else "[DEFENDANTS]"
+
+
+@placeholder("DEFENDANT_LIST")
+def _defendant_list(case_data: dict) -> str:
+    """One defendant per line, with role when recorded."""
+    lines = []
+    for d in _parties(case_data, "defendants"):
+        role = d.get("role") or d.get("type", "")
+        lines.append(f"{d.get('name', '[DEFENDANT]')}" + (f" ({role})" if role else ""))
+    return "\n".join(lines) if lines else "[DEFENDANTS]"
+
+
+@placeholder("COUNT_SUMMARY")
+def _count_summary(case_data: dict) -> str:
+    """Counts in the order the drafter pleads them."""
+    from .claims import get_claim
+
+    claims = case_data.get("claims_requested", [])
+    if not claims or claims == ["auto_suggest"]:
+        from .suggest import suggest_claims
+        suggestions = suggest_claims(case_data, 3)
+        claims = [s.claim_key for s in suggestions if not s.showstoppers]
+        if not claims and suggestions:
+            claims = [suggestions[0].claim_key]
+    if not claims:
+        return "[COUNTS]"
+    parts = []
+    for i, key in enumerate(claims, 1):
+        meta = get_claim(key)
+        parts.append(f"Count {i}: {meta.name if meta else key}")
+    return "; ".join(parts)
+
+
+@placeholder("DISTRICT_NAME")
+def _district_name(case_data: dict) -> str:
+    from .districts import find_district
+
+    recorded = case_data.get("court", {}).get("district", "")
+    district = find_district(recorded) if recorded else None
+    if district:
+        return district.name.upper()
+    return recorded.upper() if recorded else "[DISTRICT]"
+
+
+@placeholder("DIVISION")
+def _division(case_data: dict) -> str:
+    division = case_data.get("court", {}).get("division", "")
+    return f"{division.upper()} DIVISION" if division else "[DIVISION]"
+
+
+register_placeholder("CASE_NO", lambda case_data: case_data.get("case_number", "________"))
+register_placeholder("ATTORNEY_NAME", _attorney("name", "[ATTORNEY NAME]"))
+register_placeholder("BAR_NO", _attorney("bar_number", "[BAR NO.]"))
+register_placeholder("FIRM_NAME", _attorney("firm", "[FIRM NAME]"))
+register_placeholder("ADDRESS", _attorney("address", "[ADDRESS]"))
+register_placeholder("CITY", _attorney("city", "[CITY]"))
+register_placeholder("STATE", _attorney("state", "[STATE]"))
+register_placeholder("ZIP", _attorney("zip", "[ZIP]"))
+register_placeholder("PHONE", _attorney("phone", "[PHONE]"))
+register_placeholder("EMAIL", _attorney("email", "[EMAIL]"))
+register_placeholder("DATE", lambda case_data: case_data.get("filing_date", "____________"))
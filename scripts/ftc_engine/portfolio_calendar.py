@@ -0,0 +1,304 @@
+"""
+Portfolio Calendar — Merged deadline calendar across every saved case.
+
+Each case's filing calendar is already sorted by deadline, so the portfolio
+view is a k-way heap merge of the per-case streams: entries come out in date
+order one at a time and can be written straight to ICS or CSV without the
+whole docket being held in memory.
+
+For range and conflict queries the merged entries are indexed in an interval
+tree. Every entry occupies its working window — the `lead_days` before the
+deadline through the deadline itself — and two entries from different cases
+conflict when their windows overlap (for example, two reply briefs due the
+same week).
+
+Cases are taken from the case index; a case needs a filing_date in its
+case.json to have a calendar (the wizard's court step records it).
+
+Usage:
+  ftc calendar --all-cases
+  ftc calendar --all-cases --from 2026-04-01 --to 2026-06-30
+  ftc calendar --all-cases --conflicts --window 7
+  ftc calendar --all-cases --format ics -o docket.ics
+"""
+from __future__ import annotations
+
+import csv
+import heapq
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, TextIO
+
+from .filing_calendar import CalendarEntry, FilingCalendar
+
+
+@dataclass
+class PortfolioEntry:
+    case_number: str
+    case_name: str
+    entry: CalendarEntry
+
+    @property
+    def deadline(self) -> date:
+        return self.entry.deadline
+
+
+@dataclass
+class DeadlineConflict:
+    first: PortfolioEntry
+    second: PortfolioEntry
+    overlap_start: date
+    overlap_end: date
+
+
+# ── Merging ─────────────────────────────────────────────────────────────────
+
+def iter_case_calendars(priorities: set[str] | None = None) -> Iterator[tuple[str, FilingCalendar]]:
+    """Yield (case_number, calendar) for every indexed case with a filing date."""
+    from .case_manager import load_case_index, load_case_data
+    from .districts import find_district
+    from .filing_calendar import generate_filing_calendar
+
+    for entry in load_case_index().values():
+        if not entry.get("filing_date"):
+            continue
+        district = find_district(entry.get("district", ""))
+        calendar = generate_filing_calendar(
+            load_case_data(entry["case_number"]),
+            filing_date_str=entry["filing_date"],
+            district_code=district.code if district else None,
+        )
+        if priorities:
+            calendar.entries = [e for e in calendar.entries if e.priority in priorities]
+        yield entry["case_number"], calendar
+
+
+def _case_stream(case_number: str, calendar: FilingCalendar) -> Iterator[PortfolioEntry]:
+    for e in calendar.entries:
+        yield PortfolioEntry(case_number, calendar.case_name, e)
+
+
+def merge_calendars(calendars: Iterable[tuple[str, FilingCalendar]]) -> Iterator[PortfolioEntry]:
+    """K-way merge of per-case calendars into one date-ordered stream.
+
+    Ties on the same day are ordered by case number, then by each case's own
+    entry order.
+    """
+    streams = [_case_stream(case_number, cal) for case_number, cal in calendars]
+    return heapq.merge(*streams, key=lambda p: (p.deadline, p.case_number))
+
+
+def iter_portfolio_entries(priorities: set[str] | None = None) -> Iterator[PortfolioEntry]:
+    """Date-ordered deadlines across every saved case."""
+    return merge_calendars(iter_case_calendars(priorities))
+
+
+# ── Interval tree ───────────────────────────────────────────────────────────
+
+class DeadlineIntervalTree:
+    """Static interval tree over entry working windows.
+
+    Intervals are kept sorted by start date; the implicit balanced tree over
+    that array stores the latest end date of each subtree, so a query prunes
+    every subtree that finishes before the range begins. Queries run in
+    O(log n + k) and return entries in window-start order.
+    """
+
+    def __init__(self, entries: Iterable[PortfolioEntry], lead_days: int = 7):
+        self.lead_days = lead_days
+        items = [(p.deadline - timedelta(days=lead_days), p.deadline, p) for p in entries]
+        items.sort(key=lambda t: (t[0], t[1], t[2].case_number))
+        self._starts = [t[0] for t in items]
+        self._ends = [t[1] for t in items]
+        self._entries = [t[2] for t in items]
+        self._max_end: list[date | None] = [None] * len(items)
+        if items:
+            self._build(0, len(items) - 1)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _build(self, lo: int, hi: int) -> date:
+        mid = (lo + hi) // 2
+        latest = self._ends[mid]
+        if lo < mid:
+            latest = max(latest, self._build(lo, mid - 1))
+        if mid < hi:
+            latest = max(latest, self._build(mid + 1, hi))
+        self._max_end[mid] = latest
+        return latest
+
+    def _query(self, lo: int, hi: int, start: date, end: date, out: list[int]) -> None:
+        if lo > hi:
+            return
+        mid = (lo + hi) // 2
+        if self._max_end[mid] < start:
+            return
+        self._query(lo, mid - 1, start, end, out)
+        if self._starts[mid] > end:
+            return
+        if self._ends[mid] >= start:
+            out.append(mid)
+        self._query(mid + 1, hi, start, end, out)
+
+    def _overlapping(self, start: date, end: date) -> list[int]:
+        out: list[int] = []
+        self._query(0, len(self._entries) - 1, start, end, out)
+        return out
+
+    def window(self, start: date, end: date) -> list[PortfolioEntry]:
+        """Entries whose deadline falls within [start, end], in date order."""
+        hits = [self._entries[i] for i in self._overlapping(start, end)
+                if start <= self._entries[i].deadline <= end]
+        hits.sort(key=lambda p: (p.deadline, p.case_number))
+        return hits
+
+    def overlapping(self, start: date, end: date) -> list[PortfolioEntry]:
+        """Entries whose working window overlaps [start, end]."""
+        return [self._entries[i] for i in self._overlapping(start, end)]
+
+    def conflicts(self, same_case: bool = False) -> list[DeadlineConflict]:
+        """Pairs of entries whose working windows overlap.
+
+        Args:
+            same_case: Also report overlaps within a single case
+        """
+        found: list[DeadlineConflict] = []
+        for i, p in enumerate(self._entries):
+            for j in self._overlapping(self._starts[i], self._ends[i]):
+                if j <= i:
+                    continue
+                q = self._entries[j]
+                if not same_case and q.case_number == p.case_number:
+                    continue
+                found.append(DeadlineConflict(
+                    first=p,
+                    second=q,
+                    overlap_start=max(self._starts[i], self._starts[j]),
+                    overlap_end=min(self._ends[i], self._ends[j]),
+                ))
+        found.sort(key=lambda c: (c.overlap_start, c.first.case_number, c.second.case_number))
+        return found
+
+
+# ── Streaming writers ───────────────────────────────────────────────────────
+
+CSV_FIELDS = [
+    "deadline", "case_number", "case_name", "document", "category",
+    "priority", "rule_authority", "description", "depends_on", "status",
+]
+
+
+def write_csv(entries: Iterable[PortfolioEntry], out: TextIO) -> int:
+    """Write entries as CSV rows as they arrive. Returns the row count."""
+    writer = csv.writer(out)
+    writer.writerow(CSV_FIELDS)
+    count = 0
+    for p in entries:
+        e = p.entry
+        writer.writerow([
+            e.deadline.isoformat(), p.case_number, p.case_name, e.document, e.category,
+            e.priority, e.rule_authority, e.description, e.depends_on, e.status,
+        ])
+        count += 1
+    return count
+
+
+def _ics_escape(text: str) -> str:
+    return (text.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _ics_fold(line: str) -> str:
+    """Fold a content line at 75 octets (RFC 5545 §3.1)."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line
+    parts: list[str] = []
+    limit = 75
+    while data:
+        cut = min(limit, len(data))
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1  # don't split a multi-byte character
+        parts.append(data[:cut].decode("utf-8"))
+        data = data[cut:]
+        limit = 74  # continuation lines start with a space
+    return "\r\n ".join(parts)
+
+
+def _ics_uid(p: PortfolioEntry) -> str:
+    slug = "".join(c if c.isalnum() else "-" for c in p.entry.document.lower()).strip("-")
+    case = "".join(c if c.isalnum() else "-" for c in p.case_number)
+    return f"{case}-{slug}-{p.deadline:%Y%m%d}@ftc"
+
+
+def write_ics(entries: Iterable[PortfolioEntry], out: TextIO) -> int:
+    """Write entries as an iCalendar feed of all-day events, one at a time.
+
+    Returns the event count.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    def emit(line: str) -> None:
+        out.write(_ics_fold(line) + "\r\n")
+
+    emit("BEGIN:VCALENDAR")
+    emit("VERSION:2.0")
+    emit("PRODID:-//Federal Trial Counsel//Filing Calendar//EN")
+    emit("CALSCALE:GREGORIAN")
+    count = 0
+    for p in entries:
+        e = p.entry
+        description = e.description
+        if e.rule_authority:
+            description += f"\n{e.rule_authority}"
+        for note in e.notes:
+            description += f"\n{note}"
+        emit("BEGIN:VEVENT")
+        emit(f"UID:{_ics_uid(p)}")
+        emit(f"DTSTAMP:{stamp}")
+        emit(f"DTSTART;VALUE=DATE:{e.deadline:%Y%m%d}")
+        emit(f"DTEND;VALUE=DATE:{e.deadline + timedelta(days=1):%Y%m%d}")
+        emit(f"SUMMARY:{_ics_escape(f'[{p.case_number}] {e.document}')}")
+        emit(f"DESCRIPTION:{_ics_escape(description)}")
+        emit(f"CATEGORIES:{_ics_escape(e.category)}")
+        emit("END:VEVENT")
+        count += 1
+    emit("END:VCALENDAR")
+    return count
+
+
+# ── Formatting ──────────────────────────────────────────────────────────────
+
+def format_portfolio_calendar(entries: Iterable[PortfolioEntry]) -> str:
+    """Format merged portfolio entries for CLI output."""
+    lines = []
+    lines.append(f"  {'Date':<12} {'Pri':>3}  {'Case':<22} {'Document':<35} {'Rule'}")
+    lines.append("  " + "-" * 96)
+    count = 0
+    for p in entries:
+        e = p.entry
+        pri_icon = {"critical": "!!", "high": ">>", "medium": "..", "low": "  "}.get(e.priority, "  ")
+        status_mark = " [OVERDUE]" if e.status == "overdue" else ""
+        lines.append(
+            f"  {e.deadline!s:<12} [{pri_icon}] {p.case_number[:22]:<22} "
+            f"{e.document[:35]:<35} {e.rule_authority[:20]}{status_mark}"
+        )
+        count += 1
+    if not count:
+        lines.append("  No deadlines found. Cases need a filing_date to appear on the calendar.")
+    return "\n".join(lines)
+
+
+def format_conflicts(conflicts: list[DeadlineConflict], lead_days: int) -> str:
+    """Format deadline conflicts for CLI output."""
+    lines = []
+    lines.append(f"  DEADLINE CONFLICTS ({len(conflicts)}) — working windows of {lead_days} days")
+    lines.append("  " + "-" * 76)
+    for c in conflicts:
+        lines.append(f"  {c.overlap_start} to {c.overlap_end}")
+        for p in (c.first, c.second):
+            lines.append(f"    {p.deadline}  {p.case_number[:22]:<22} {p.entry.document}")
+    if not conflicts:
+        lines.append("  No overlapping deadlines across cases.")
+    return "\n".join(lines)
@@ -7,7 +7,7 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from typing import Optional
-from .claims import get_claim, CLAIM_LIBRARY
+from .claims import get_claim
 
 
 @dataclass
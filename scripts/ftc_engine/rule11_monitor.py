@@ -4,8 +4,13 @@ Rule 11 Duty Monitor — Monitors claim viability against current case law.
 Works in dual mode:
 - OFFLINE (default): Uses built-in VIABILITY_KNOWLEDGE dict covering major
   Supreme Court and Circuit decisions. Zero external calls. Self-sufficient.
-- ONLINE (opt-in): When COURTLISTENER_API_TOKEN env var is set and --mode online
-  is used, queries CourtListener API v4 via urllib.request (stdlib).
+- ONLINE (opt-in): With --mode online, also searches recent case law through
+  a pluggable source (--source, or FTC_VIABILITY_SOURCE):
+    courtlistener (default) — CourtListener API v4 via urllib.request
+      (stdlib), through a disk cache with TTL and conditional requests
+      (courtlistener.py). Needs COURTLISTENER_API_TOKEN.
+    local — a SQLite FTS5 mirror of opinions loaded from bulk exports
+      (caselaw_mirror.py). No network.
   Graceful fallback to offline on failure.
 
 Produces:
@@ -20,9 +25,12 @@ Usage:
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
+
+from .lazy import lazy_attributes
 
 
 @dataclass
@@ -42,7 +50,15 @@ class ViabilityCheck:
     status: str  # viable | warning | questionable | non_viable
     confidence: float = 0.0  # 0.0-1.0
     issues: list[ViabilityIssue] = field(default_factory=list)
-    data_source: str = "built_in"  # built_in | courtlistener
+    data_source: str = "built_in"  # built_in | the case-law source name (courtlistener, local)
+
+
+@dataclass
+class ClaimLookup:
+    """The case-independent part of a claim's check, shareable across cases."""
+    built_in: list[ViabilityIssue] = field(default_factory=list)
+    online: list[ViabilityIssue] = field(default_factory=list)
+    source: str = ""  # case-law source the online issues came from
 
 
 @dataclass
@@ -58,347 +74,474 @@ class MonitorReport:
 
 # ── Built-in Viability Knowledge ────────────────────────────────────────────
 
-VIABILITY_KNOWLEDGE: dict[str, list[ViabilityIssue]] = {
-    # Bivens claims — post-Egbert severe restrictions
-    "bivens_fourth_search_seizure": [
-        ViabilityIssue(
+VIABILITY_KNOWLEDGE: dict[str, list[ViabilityIssue]]  # built on first access
+
+
+def _build_viability_knowledge() -> dict[str, list[ViabilityIssue]]:
+    return {
+        # Bivens claims — post-Egbert severe restrictions
+        "bivens_fourth_search_seizure": [
+            ViabilityIssue(
+                severity="critical",
+                category="scotus_decision",
+                description="Bivens extension effectively frozen after Egbert v. Boule. New contexts almost certainly barred.",
+                citation="Egbert v. Boule, 596 U.S. 482 (2022)",
+                date="2022-06-08",
+                recommendation="Verify this is a recognized Bivens context (Bivens itself, Davis, Carlson). If new context, consider § 1983 or FTCA alternative.",
+            ),
+            ViabilityIssue(
+                severity="high",
+                category="scotus_decision",
+                description="Even in recognized Fourth Amendment Bivens context, courts increasingly find 'special factors' counsel hesitation.",
+                citation="Ziglar v. Abbasi, 582 U.S. 120 (2017)",
+                date="2017-06-19",
+                recommendation="Plead within the exact factual contours of Bivens v. Six Unknown Named Agents, 403 U.S. 388 (1971).",
+            ),
+        ],
+        "bivens_fifth_due_process": [
+            ViabilityIssue(
+                severity="critical",
+                category="scotus_decision",
+                description="Fifth Amendment Bivens claims face near-certain dismissal in new contexts post-Egbert.",
+                citation="Egbert v. Boule, 596 U.S. 482 (2022)",
+                date="2022-06-08",
+                recommendation="Only viable in exact Davis v. Passman context (employment discrimination by congressional staffer). Consider FTCA or APA alternatives.",
+            ),
+        ],
+        "bivens_eighth_deliberate_indifference": [
+            ViabilityIssue(
+                severity="critical",
+                category="scotus_decision",
+                description="Eighth Amendment Bivens for prisoner conditions may be limited to Carlson v. Green facts.",
+                citation="Egbert v. Boule, 596 U.S. 482 (2022)",
+                date="2022-06-08",
+                recommendation="Plead within Carlson v. Green, 446 U.S. 14 (1980) contours (failure to provide medical treatment). Consider FTCA.",
+            ),
+        ],
+
+        # Section 1983 — qualified immunity strictness
+        "1983_fourth_excessive_force": [
+            ViabilityIssue(
+                severity="medium",
+                category="circuit_decision",
+                description="11th Circuit applies strict 'clearly established' standard; factually identical precedent often required.",
+                citation="Mercado v. City of Orlando, 407 F.3d 1152 (11th Cir. 2005)",
+                date="2005-05-16",
+                recommendation="Cite factually analogous 11th Circuit or Supreme Court decisions when opposing qualified immunity.",
+            ),
+        ],
+        "1983_fourth_false_arrest": [
+            ViabilityIssue(
+                severity="medium",
+                category="circuit_decision",
+                description="Qualified immunity grants common for false arrest; courts broadly interpret 'arguable probable cause'.",
+                citation="Grider v. City of Auburn, 618 F.3d 1240 (11th Cir. 2010)",
+                date="2010-08-20",
+                recommendation="Show officer lacked even arguable probable cause and cite analogous precedent.",
+            ),
+        ],
+        "1983_monell_municipal_liability": [
+            ViabilityIssue(
+                severity="medium",
+                category="circuit_decision",
+                description="Monell pleading standards require specific policy/custom allegations; cannot rely solely on respondeat superior.",
+                citation="McDowell v. Brown, 392 F.3d 1283 (11th Cir. 2004)",
+                date="2004-12-15",
+                recommendation="Plead specific policy, widespread custom, or deliberate indifference to training. Obtain FOIA records of prior complaints.",
+            ),
+        ],
+
+        # Employment — procedural traps
+        "title_vii_disparate_treatment": [
+            ViabilityIssue(
+                severity="high",
+                category="exhaustion_change",
+                description="Failure to file EEOC charge within 180/300 days bars claim. Right-to-sue letter required before filing.",
+                citation="Fort Bend County v. Davis, 587 U.S. 541 (2019)",
+                date="2019-06-03",
+                recommendation="Verify EEOC charge was timely filed and right-to-sue letter received. 90-day filing window from receipt is jurisdictional-like.",
+            ),
+        ],
+        "title_vii_hostile_work_environment": [
+            ViabilityIssue(
+                severity="medium",
+                category="circuit_decision",
+                description="Continuing violation doctrine may save late-filed claims, but discrete acts still require timely EEOC charge.",
+                citation="Nat'l R.R. Passenger Corp. v. Morgan, 536 U.S. 101 (2002)",
+                date="2002-06-10",
+                recommendation="Distinguish between discrete acts (timely charge required) and hostile environment pattern (continuing violation doctrine applies).",
+            ),
+        ],
+        "adea_age_discrimination": [
+            ViabilityIssue(
+                severity="medium",
+                category="exhaustion_change",
+                description="ADEA exhaustion parallels Title VII but mixed motive framework is more limited per Gross v. FBL.",
+                citation="Gross v. FBL Financial Services, 557 U.S. 167 (2009)",
+                date="2009-06-18",
+                recommendation="Plead 'but-for' causation, not merely motivating factor. ADEA requires stronger causal link than Title VII.",
+            ),
+        ],
+
+        # FTCA
+        "ftca_negligence": [
+            ViabilityIssue(
+                severity="high",
+                category="exhaustion_change",
+                description="SF-95 administrative claim must be filed within 2 years. Failure is jurisdictional — cannot be waived.",
+                citation="McNeil v. United States, 508 U.S. 106 (1993)",
+                date="1993-05-17",
+                recommendation="Verify SF-95 filed within 2 years of accrual. After denial, file suit within 6 months.",
+            ),
+            ViabilityIssue(
+                severity="medium",
+                category="immunity_expansion",
+                description="Discretionary function exception (28 U.S.C. 2680(a)) bars many government negligence claims.",
+                citation="Berkovitz v. United States, 486 U.S. 531 (1988)",
+                date="1988-06-13",
+                recommendation="Show government employee violated a mandatory duty (not discretionary judgment).",
+            ),
+        ],
+        "ftca_medical_malpractice": [
+            ViabilityIssue(
+                severity="high",
+                category="exhaustion_change",
+                description="SF-95 administrative claim required. State law governs standard of care under FTCA.",
+                citation="28 U.S.C. 2674",
+                recommendation="File SF-95 within 2 years. Apply forum state's medical malpractice standard (not federal).",
+            ),
+        ],
+
+        # APA
+        "apa_arbitrary_capricious": [
+            ViabilityIssue(
+                severity="medium",
+                category="scotus_decision",
+                description="Post-Loper Bright, Chevron deference overruled. Courts now exercise independent judgment on statutory interpretation.",
+                citation="Loper Bright Enterprises v. Raimondo, 603 U.S. ___ (2024)",
+                date="2024-06-28",
+                recommendation="APA challenges may be more viable post-Loper Bright. Argue statutory text independently — Chevron deference no longer applies.",
+            ),
+        ],
+
+        # PLRA — prisoner claims
+        "1983_eighth_deliberate_indifference": [
+            ViabilityIssue(
+                severity="high",
+                category="exhaustion_change",
+                description="PLRA requires exhaustion of all available administrative remedies before filing. No exceptions.",
+                citation="Ross v. Blake, 578 U.S. 632 (2016)",
+                date="2016-06-06",
+                recommendation="Exhaust all available prison grievance procedures. If unavailable, document why (Ross v. Blake three exceptions).",
+            ),
+        ],
+    }
+
+
+# ── Viability Checkers ──────────────────────────────────────────────────────
+
+def _check_built_in_viability(claim_key: str) -> list[ViabilityIssue]:
+    """Check claim against built-in knowledge base."""
+    return __getattr__("VIABILITY_KNOWLEDGE").get(claim_key, [])
+
+
+# ── Viability Rules ─────────────────────────────────────────────────────────
+# Case-specific checks as one declarative table. Each rule is keyed by the
+# claim attribute that triggers it: an exhaustion-type tag (matched within
+# ClaimMetadata.exhaustion_type), an SOL status, or an immunity name. A
+# claim's rules are compiled once; a case's facts are derived once per
+# report, so checking N claims is one pass over the claims.
+
+@dataclass
+class CaseFacts:
+    """The case attributes the viability rules read."""
+    exhaustion: dict = field(default_factory=dict)
+    injury_date: Optional[date] = None  # None if missing, invalid or in the future
+    defendant_types: frozenset[str] = frozenset()
+    individual_defendants: bool = False  # officers or individual-capacity defendants
+    _deadlines: dict[int, tuple[date, int]] = field(default_factory=dict, repr=False, compare=False)
+
+    def sol_deadline(self, sol_days: int) -> tuple[date, int]:
+        """(deadline, days remaining) for an SOL period, computed once per period."""
+        if sol_days not in self._deadlines:
+            from .court_days import compute_deadline
+            deadline = compute_deadline(self.injury_date, sol_days)
+            self._deadlines[sol_days] = (deadline, (deadline - date.today()).days)
+        return self._deadlines[sol_days]
+
+
+@dataclass(frozen=True)
+class ViabilityRule:
+    attribute: str  # "exhaustion", "sol" or "immunity"
+    value: str  # exhaustion-type tag, SOL status or immunity name
+    issue: ViabilityIssue  # "sol" descriptions are formatted with {deadline} and {days}
+    when: Callable[[CaseFacts], bool] = lambda facts: True
+
+
+VIABILITY_RULES: list[ViabilityRule]  # built on first access
+
+
+def _build_viability_rules() -> list[ViabilityRule]:
+    return [
+        # Exhaustion
+        ViabilityRule("exhaustion", "eeoc", ViabilityIssue(
             severity="critical",
-            category="scotus_decision",
-            description="Bivens extension effectively frozen after Egbert v. Boule. New contexts almost certainly barred.",
-            citation="Egbert v. Boule, 596 U.S. 482 (2022)",
-            date="2022-06-08",
-            recommendation="Verify this is a recognized Bivens context (Bivens itself, Davis, Carlson). If new context, consider § 1983 or FTCA alternative.",
-        ),
-        ViabilityIssue(
+            category="exhaustion_change",
+            description="EEOC charge NOT filed. Title VII / ADEA / ADA claims require administrative exhaustion.",
+            recommendation="File EEOC charge immediately. If 180/300-day deadline passed, analyze tolling options.",
+        ), when=lambda f: f.exhaustion.get("eeoc_charge_filed") is False),
+        ViabilityRule("exhaustion", "eeoc", ViabilityIssue(
             severity="high",
-            category="scotus_decision",
-            description="Even in recognized Fourth Amendment Bivens context, courts increasingly find 'special factors' counsel hesitation.",
-            citation="Ziglar v. Abbasi, 582 U.S. 120 (2017)",
-            date="2017-06-19",
-            recommendation="Plead within the exact factual contours of Bivens v. Six Unknown Named Agents, 403 U.S. 388 (1971).",
-        ),
-    ],
-    "bivens_fifth_due_process": [
-        ViabilityIssue(
+            category="exhaustion_change",
+            description="EEOC filing status unknown. Must verify before proceeding.",
+            recommendation="Confirm EEOC charge was filed and right-to-sue letter was received.",
+        ), when=lambda f: f.exhaustion.get("eeoc_charge_filed") is None),
+        ViabilityRule("exhaustion", "ftca", ViabilityIssue(
             severity="critical",
-            category="scotus_decision",
-            description="Fifth Amendment Bivens claims face near-certain dismissal in new contexts post-Egbert.",
-            citation="Egbert v. Boule, 596 U.S. 482 (2022)",
-            date="2022-06-08",
-            recommendation="Only viable in exact Davis v. Passman context (employment discrimination by congressional staffer). Consider FTCA or APA alternatives.",
-        ),
-    ],
-    "bivens_eighth_deliberate_indifference": [
-        ViabilityIssue(
+            category="exhaustion_change",
+            description="SF-95 administrative claim NOT filed. FTCA requires exhaustion — jurisdictional bar.",
+            citation="28 U.S.C. 2675(a)",
+            recommendation="File SF-95 immediately. This is a jurisdictional prerequisite.",
+        ), when=lambda f: f.exhaustion.get("ftca_admin_claim_filed") is False),
+        ViabilityRule("exhaustion", "plra", ViabilityIssue(
             severity="critical",
-            category="scotus_decision",
-            description="Eighth Amendment Bivens for prisoner conditions may be limited to Carlson v. Green facts.",
-            citation="Egbert v. Boule, 596 U.S. 482 (2022)",
-            date="2022-06-08",
-            recommendation="Plead within Carlson v. Green, 446 U.S. 14 (1980) contours (failure to provide medical treatment). Consider FTCA.",
-        ),
-    ],
-
-    # Section 1983 — qualified immunity strictness
-    "1983_fourth_excessive_force": [
-        ViabilityIssue(
-            severity="medium",
-            category="circuit_decision",
-            description="11th Circuit applies strict 'clearly established' standard; factually identical precedent often required.",
-            citation="Mercado v. City of Orlando, 407 F.3d 1152 (11th Cir. 2005)",
-            date="2005-05-16",
-            recommendation="Cite factually analogous 11th Circuit or Supreme Court decisions when opposing qualified immunity.",
-        ),
-    ],
-    "1983_fourth_false_arrest": [
-        ViabilityIssue(
-            severity="medium",
-            category="circuit_decision",
-            description="Qualified immunity grants common for false arrest; courts broadly interpret 'arguable probable cause'.",
-            citation="Grider v. City of Auburn, 618 F.3d 1240 (11th Cir. 2010)",
-            date="2010-08-20",
-            recommendation="Show officer lacked even arguable probable cause and cite analogous precedent.",
-        ),
-    ],
-    "1983_monell_municipal_liability": [
-        ViabilityIssue(
-            severity="medium",
-            category="circuit_decision",
-            description="Monell pleading standards require specific policy/custom allegations; cannot rely solely on respondeat superior.",
-            citation="McDowell v. Brown, 392 F.3d 1283 (11th Cir. 2004)",
-            date="2004-12-15",
-            recommendation="Plead specific policy, widespread custom, or deliberate indifference to training. Obtain FOIA records of prior complaints.",
-        ),
-    ],
-
-    # Employment — procedural traps
-    "title_vii_disparate_treatment": [
-        ViabilityIssue(
-            severity="high",
             category="exhaustion_change",
-            description="Failure to file EEOC charge within 180/300 days bars claim. Right-to-sue letter required before filing.",
-            citation="Fort Bend County v. Davis, 587 U.S. 541 (2019)",
-            date="2019-06-03",
-            recommendation="Verify EEOC charge was timely filed and right-to-sue letter received. 90-day filing window from receipt is jurisdictional-like.",
-        ),
-    ],
-    "title_vii_hostile_work_environment": [
-        ViabilityIssue(
-            severity="medium",
-            category="circuit_decision",
-            description="Continuing violation doctrine may save late-filed claims, but discrete acts still require timely EEOC charge.",
-            citation="Nat'l R.R. Passenger Corp. v. Morgan, 536 U.S. 101 (2002)",
-            date="2002-06-10",
-            recommendation="Distinguish between discrete acts (timely charge required) and hostile environment pattern (continuing violation doctrine applies).",
-        ),
-    ],
-    "adea_age_discrimination": [
-        ViabilityIssue(
-            severity="medium",
+            description="PLRA exhaustion NOT completed. All available administrative remedies must be exhausted.",
+            citation="42 U.S.C. 1997e(a); Ross v. Blake, 578 U.S. 632 (2016)",
+            recommendation="Complete prison grievance process. Document if unavailable.",
+        ), when=lambda f: f.exhaustion.get("plra_exhaustion_done") is False),
+
+        # Statute of limitations
+        ViabilityRule("sol", "expired", ViabilityIssue(
+            severity="critical",
             category="exhaustion_change",
-            description="ADEA exhaustion parallels Title VII but mixed motive framework is more limited per Gross v. FBL.",
-            citation="Gross v. FBL Financial Services, 557 U.S. 167 (2009)",
-            date="2009-06-18",
-            recommendation="Plead 'but-for' causation, not merely motivating factor. ADEA requires stronger causal link than Title VII.",
-        ),
-    ],
-
-    # FTCA
-    "ftca_negligence": [
-        ViabilityIssue(
+            description="Statute of limitations EXPIRED. Deadline was {deadline}, {days} days ago.",
+            recommendation="Analyze tolling doctrines: discovery rule, equitable tolling, fraudulent concealment. If no tolling, drop claim.",
+        )),
+        ViabilityRule("sol", "urgent", ViabilityIssue(
             severity="high",
             category="exhaustion_change",
-            description="SF-95 administrative claim must be filed within 2 years. Failure is jurisdictional — cannot be waived.",
-            citation="McNeil v. United States, 508 U.S. 106 (1993)",
-            date="1993-05-17",
-            recommendation="Verify SF-95 filed within 2 years of accrual. After denial, file suit within 6 months.",
-        ),
-        ViabilityIssue(
+            description="SOL expires in {days} days (deadline: {deadline}).",
+            recommendation="File immediately. Consider filing with leave to amend if investigation is incomplete.",
+        )),
+
+        # Immunity
+        ViabilityRule("immunity", "qualified", ViabilityIssue(
             severity="medium",
             category="immunity_expansion",
-            description="Discretionary function exception (28 U.S.C. 2680(a)) bars many government negligence claims.",
-            citation="Berkovitz v. United States, 486 U.S. 531 (1988)",
-            date="1988-06-13",
-            recommendation="Show government employee violated a mandatory duty (not discretionary judgment).",
-        ),
-    ],
-    "ftca_medical_malpractice": [
-        ViabilityIssue(
+            description="Qualified immunity defense expected. Must identify clearly established law at time of conduct.",
+            recommendation="Research factually analogous circuit precedent. Officers are immune unless clearly established law was violated.",
+        ), when=lambda f: f.individual_defendants),
+        ViabilityRule("immunity", "sovereign", ViabilityIssue(
             severity="high",
-            category="exhaustion_change",
-            description="SF-95 administrative claim required. State law governs standard of care under FTCA.",
-            citation="28 U.S.C. 2674",
-            recommendation="File SF-95 within 2 years. Apply forum state's medical malpractice standard (not federal).",
-        ),
-    ],
-
-    # APA
-    "apa_arbitrary_capricious": [
-        ViabilityIssue(
-            severity="medium",
-            category="scotus_decision",
-            description="Post-Loper Bright, Chevron deference overruled. Courts now exercise independent judgment on statutory interpretation.",
-            citation="Loper Bright Enterprises v. Raimondo, 603 U.S. ___ (2024)",
-            date="2024-06-28",
-            recommendation="APA challenges may be more viable post-Loper Bright. Argue statutory text independently — Chevron deference no longer applies.",
-        ),
-    ],
-
-    # PLRA — prisoner claims
-    "1983_eighth_deliberate_indifference": [
-        ViabilityIssue(
+            category="immunity_expansion",
+            description="Sovereign immunity applies to federal defendants unless waived by statute (e.g., FTCA, Tucker Act).",
+            recommendation="Identify specific statutory waiver of sovereign immunity.",
+        ), when=lambda f: "federal" in f.defendant_types),
+        ViabilityRule("immunity", "eleventh_amendment", ViabilityIssue(
             severity="high",
-            category="exhaustion_change",
-            description="PLRA requires exhaustion of all available administrative remedies before filing. No exceptions.",
-            citation="Ross v. Blake, 578 U.S. 632 (2016)",
-            date="2016-06-06",
-            recommendation="Exhaust all available prison grievance procedures. If unavailable, document why (Ross v. Blake three exceptions).",
-        ),
-    ],
-}
+            category="immunity_expansion",
+            description="Eleventh Amendment bars damages claims against states. Ex parte Young exception limited to injunctive relief against officials.",
+            citation="Ex parte Young, 209 U.S. 123 (1908)",
+            recommendation="Sue state officials in individual capacity or seek only injunctive/declaratory relief.",
+        ), when=lambda f: "state" in f.defendant_types),
+    ]
 
 
-# ── Viability Checkers ──────────────────────────────────────────────────────
+__getattr__ = lazy_attributes(
+    globals(),
+    VIABILITY_KNOWLEDGE=_build_viability_knowledge,
+    VIABILITY_RULES=_build_viability_rules,
+)
 
-def _check_built_in_viability(claim_key: str) -> list[ViabilityIssue]:
-    """Check claim against built-in knowledge base."""
-    return VIABILITY_KNOWLEDGE.get(claim_key, [])
 
+def case_facts(case_data: dict) -> CaseFacts:
+    """Derive the facts the viability rules read from a case, once."""
+    from datetime import datetime
+    injury = None
+    injury_date_str = case_data.get("limitations", {}).get("key_dates", {}).get("injury_date")
+    if injury_date_str:
+        try:
+            injury = datetime.strptime(injury_date_str, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            pass
+        if injury and injury > date.today():
+            injury = None  # not a limitations question yet
 
-def _check_exhaustion_compliance(case_data: dict, claim_key: str) -> list[ViabilityIssue]:
-    """Check exhaustion requirements are met."""
-    from .claims import get_claim
-    meta = get_claim(claim_key)
-    if not meta or not meta.exhaustion_required:
-        return []
+    defendants = case_data.get("parties", {}).get("defendants", [])
+    return CaseFacts(
+        exhaustion=case_data.get("exhaustion", {}),
+        injury_date=injury,
+        defendant_types=frozenset(d.get("type") for d in defendants if d.get("type")),
+        individual_defendants=any(
+            d.get("type") == "officer" or d.get("capacity") == "individual" for d in defendants),
+    )
 
-    issues = []
-    exhaustion = case_data.get("exhaustion", {})
-    etype = meta.exhaustion_type or ""
 
-    # Check EEOC exhaustion
-    if "eeoc" in etype:
-        if exhaustion.get("eeoc_charge_filed") is False:
-            issues.append(ViabilityIssue(
-                severity="critical",
-                category="exhaustion_change",
-                description="EEOC charge NOT filed. Title VII / ADEA / ADA claims require administrative exhaustion.",
-                recommendation="File EEOC charge immediately. If 180/300-day deadline passed, analyze tolling options.",
-            ))
-        elif exhaustion.get("eeoc_charge_filed") is None:
-            issues.append(ViabilityIssue(
-                severity="high",
-                category="exhaustion_change",
-                description="EEOC filing status unknown. Must verify before proceeding.",
-                recommendation="Confirm EEOC charge was filed and right-to-sue letter was received.",
-            ))
-
-    # Check FTCA exhaustion
-    if "ftca" in etype:
-        if exhaustion.get("ftca_admin_claim_filed") is False:
-            issues.append(ViabilityIssue(
-                severity="critical",
-                category="exhaustion_change",
-                description="SF-95 administrative claim NOT filed. FTCA requires exhaustion — jurisdictional bar.",
-                citation="28 U.S.C. 2675(a)",
-                recommendation="File SF-95 immediately. This is a jurisdictional prerequisite.",
-            ))
-
-    # Check PLRA exhaustion
-    if "plra" in etype:
-        if exhaustion.get("plra_exhaustion_done") is False:
-            issues.append(ViabilityIssue(
-                severity="critical",
-                category="exhaustion_change",
-                description="PLRA exhaustion NOT completed. All available administrative remedies must be exhausted.",
-                citation="42 U.S.C. 1997e(a); Ross v. Blake, 578 U.S. 632 (2016)",
-                recommendation="Complete prison grievance process. Document if unavailable.",
-            ))
+@lru_cache(maxsize=None)
+def _rule_index() -> dict[tuple[str, str], tuple[ViabilityRule, ...]]:
+    index: dict[tuple[str, str], list[ViabilityRule]] = {}
+    for rule in __getattr__("VIABILITY_RULES"):
+        index.setdefault((rule.attribute, rule.value), []).append(rule)
+    return {key: tuple(rules) for key, rules in index.items()}
+
 
+@lru_cache(maxsize=None)
+def _claim_rules(claim_key: str) -> tuple[dict[str, tuple[ViabilityRule, ...]], int | None]:
+    """A claim's exhaustion and immunity rules, in table order, and its SOL period.
+
+    Unknown claims have no rules and no SOL period.
+    """
+    from .claims import get_claim
+    from .sol import SOL_DAYS
+    meta = get_claim(claim_key)
+    if not meta:
+        return {}, None
+    etype = (meta.exhaustion_type or "") if meta.exhaustion_required else None
+    rules: dict[str, list[ViabilityRule]] = {"exhaustion": [], "immunity": []}
+    for (attribute, value), matched in _rule_index().items():
+        if (attribute == "exhaustion" and etype is not None and value in etype) or (
+                attribute == "immunity" and value in meta.immunities):
+            rules[attribute].extend(matched)
+    return {a: tuple(r) for a, r in rules.items()}, SOL_DAYS.get(claim_key, 1461)
+
+
+def rule_issues(facts: CaseFacts, claim_key: str,
+                attributes: tuple[str, ...] = ("exhaustion", "sol", "immunity")) -> list[ViabilityIssue]:
+    """Issues the rule table raises for one claim on a case."""
+    rules, sol_days = _claim_rules(claim_key)
+    issues: list[ViabilityIssue] = []
+    for attribute in attributes:
+        if attribute != "sol":
+            issues.extend(rule.issue for rule in rules.get(attribute, ()) if rule.when(facts))
+        elif sol_days is not None and facts.injury_date is not None:
+            from .sol import sol_status
+            deadline, remaining = facts.sol_deadline(sol_days)
+            for rule in _rule_index().get(("sol", sol_status(remaining)), ()):
+                issues.append(replace(rule.issue, description=rule.issue.description.format(
+                    deadline=deadline, days=abs(remaining))))
     return issues
 
 
-def _check_sol_compliance(case_data: dict, claim_key: str) -> list[ViabilityIssue]:
-    """Cross-check SOL status."""
-    injury_date_str = case_data.get("limitations", {}).get("key_dates", {}).get("injury_date")
-    if not injury_date_str:
-        return []
+def _check_exhaustion_compliance(case_data: dict, claim_key: str) -> list[ViabilityIssue]:
+    """Check exhaustion requirements are met."""
+    return rule_issues(case_facts(case_data), claim_key, ("exhaustion",))
 
-    try:
-        from .sol import calculate_sol
-        sol = calculate_sol(claim_key, injury_date_str)
-        if sol.status == "expired":
-            return [ViabilityIssue(
-                severity="critical",
-                category="exhaustion_change",
-                description=f"Statute of limitations EXPIRED. Deadline was {sol.deadline}, {abs(sol.days_remaining)} days ago.",
-                recommendation="Analyze tolling doctrines: discovery rule, equitable tolling, fraudulent concealment. If no tolling, drop claim.",
-            )]
-        if sol.status == "urgent":
-            return [ViabilityIssue(
-                severity="high",
-                category="exhaustion_change",
-                description=f"SOL expires in {sol.days_remaining} days (deadline: {sol.deadline}).",
-                recommendation="File immediately. Consider filing with leave to amend if investigation is incomplete.",
-            )]
-    except Exception:
-        pass
 
-    return []
+def _check_sol_compliance(case_data: dict, claim_key: str) -> list[ViabilityIssue]:
+    """Cross-check SOL status."""
+    return rule_issues(case_facts(case_data), claim_key, ("sol",))
 
 
 def _check_immunity_exposure(case_data: dict, claim_key: str) -> list[ViabilityIssue]:
     """Check immunity risks."""
-    from .claims import get_claim
-    meta = get_claim(claim_key)
-    if not meta:
-        return []
+    return rule_issues(case_facts(case_data), claim_key, ("immunity",))
 
-    issues = []
-    defendants = case_data.get("parties", {}).get("defendants", [])
 
-    if "qualified" in meta.immunities:
-        officers = [d for d in defendants if d.get("type") == "officer" or d.get("capacity") == "individual"]
-        if officers:
-            issues.append(ViabilityIssue(
-                severity="medium",
-                category="immunity_expansion",
-                description="Qualified immunity defense expected. Must identify clearly established law at time of conduct.",
-                recommendation="Research factually analogous circuit precedent. Officers are immune unless clearly established law was violated.",
-            ))
-
-    if "sovereign" in meta.immunities:
-        fed_defs = [d for d in defendants if d.get("type") == "federal"]
-        if fed_defs:
-            issues.append(ViabilityIssue(
-                severity="high",
-                category="immunity_expansion",
-                description="Sovereign immunity applies to federal defendants unless waived by statute (e.g., FTCA, Tucker Act).",
-                recommendation="Identify specific statutory waiver of sovereign immunity.",
-            ))
-
-    if "eleventh_amendment" in meta.immunities:
-        state_defs = [d for d in defendants if d.get("type") == "state"]
-        if state_defs:
-            issues.append(ViabilityIssue(
-                severity="high",
-                category="immunity_expansion",
-                description="Eleventh Amendment bars damages claims against states. Ex parte Young exception limited to injunctive relief against officials.",
-                citation="Ex parte Young, 209 U.S. 123 (1908)",
-                recommendation="Sue state officials in individual capacity or seek only injunctive/declaratory relief.",
-            ))
+# ── Case-law sources ────────────────────────────────────────────────────────
 
-    return issues
+# A source runs the recent-case-law search for several claims at once and
+# returns {claim_key: response} in the CourtListener search-response shape
+# ({"results": [{"caseName", "dateFiled", "snippet", ...}]}). Claims it has
+# nothing for may be left out.
+CaseLawSource = Callable[[list[str]], dict[str, dict]]
+
+DEFAULT_SOURCE = "courtlistener"
+
+_SOURCES: dict[str, CaseLawSource] = {}
+
+
+def register_source(name: str, source: CaseLawSource) -> None:
+    """Register (or replace) a case-law source for online mode."""
+    _SOURCES[name] = source
+
+
+def list_sources() -> list[str]:
+    """All registered case-law source names, sorted."""
+    return sorted(_SOURCES)
+
+
+def default_source() -> str:
+    return os.environ.get("FTC_VIABILITY_SOURCE") or DEFAULT_SOURCE
 
 
-def _check_courtlistener(claim_key: str) -> list[ViabilityIssue]:
-    """Query CourtListener for recent decisions affecting claim viability (online mode only)."""
+def claim_lookups(claim_keys: list[str], mode: str = "offline",
+                  source: str | None = None) -> dict[str, ClaimLookup]:
+    """Run the case-independent lookups once per distinct claim.
+
+    Built-in knowledge is read once per claim; in online mode the case-law
+    source is searched once per claim, all claims in one call.
+
+    Raises:
+        ValueError: Unknown source
+    """
+    unique = list(dict.fromkeys(claim_keys))
+    online: dict[str, dict] = {}
+    if mode == "online":
+        source = source or default_source()
+        if source not in _SOURCES:
+            raise ValueError(f"Unknown case-law source '{source}' (choose from {', '.join(list_sources())})")
+        online = _SOURCES[source](unique) if unique else {}
+    return {
+        ck: ClaimLookup(
+            built_in=_check_built_in_viability(ck),
+            online=_case_law_issues(online[ck]) if ck in online else [],
+            source=source or "",
+        )
+        for ck in unique
+    }
+
+
+def _prefetch_courtlistener(claim_keys: list[str]) -> dict[str, dict]:
+    """Fetch the CourtListener searches for several claims concurrently.
+
+    Responses come from the on-disk cache when it has them (see
+    courtlistener.py). Returns {claim_key: response}, with {} for a failed
+    search; empty without an API token.
+    """
     token = os.environ.get("COURTLISTENER_API_TOKEN")
-    if not token:
-        return []
+    if not token or not claim_keys:
+        return {}
+
+    from .courtlistener import search_many
+    return {ck: data or {} for ck, data in search_many(claim_keys, token).items()}
+
 
+def _search_local_mirror(claim_keys: list[str]) -> dict[str, dict]:
+    """Search the local case-law mirror; empty if none has been imported."""
+    import sqlite3
+    from .caselaw_mirror import search_claims
     try:
-        import urllib.request
-        import json
-
-        # Map claim to search terms
-        search_terms = {
-            "bivens_fourth_search_seizure": "Bivens fourth amendment",
-            "bivens_fifth_due_process": "Bivens fifth amendment due process",
-            "bivens_eighth_deliberate_indifference": "Bivens eighth amendment",
-            "1983_fourth_excessive_force": "section 1983 excessive force qualified immunity",
-            "1983_monell_municipal_liability": "Monell municipal liability",
-            "title_vii_disparate_treatment": "Title VII disparate treatment",
-            "apa_arbitrary_capricious": "APA arbitrary capricious chevron",
-        }
-
-        query = search_terms.get(claim_key, claim_key.replace("_", " "))
-        url = f"https://www.courtlistener.com/api/rest/v4/search/?q={urllib.parse.quote(query)}&type=o&court=scotus,ca11&filed_after=2023-01-01&order_by=dateFiled desc&page_size=3"
-
-        req = urllib.request.Request(url, headers={"Authorization": f"Token {token}"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
-
-        issues = []
-        for result in data.get("results", [])[:3]:
-            case_name = result.get("caseName", "Unknown case")
-            filed = result.get("dateFiled", "")
-            snippet = result.get("snippet", "")[:200]
-
-            issues.append(ViabilityIssue(
-                severity="medium",
-                category="circuit_decision",
-                description=f"Recent decision: {case_name} ({filed}) — {snippet}",
-                citation=case_name,
-                date=filed,
-                recommendation="Review this decision for impact on current claim viability.",
-            ))
+        return search_claims(claim_keys)
+    except sqlite3.Error:
+        return {}
 
-        return issues
 
-    except Exception:
-        # Graceful fallback — online mode is best-effort
+register_source("courtlistener", _prefetch_courtlistener)
+register_source("local", _search_local_mirror)
+
+
+def _case_law_issues(data: dict) -> list[ViabilityIssue]:
+    """Issues for the top results of a search response (CourtListener shape)."""
+    if not isinstance(data, dict):
         return []
+    issues = []
+    for result in (data.get("results") or [])[:3]:
+        if not isinstance(result, dict):
+            continue
+        case_name = result.get("caseName", "Unknown case")
+        filed = result.get("dateFiled", "")
+        snippet = (result.get("snippet") or "")[:200]
+
+        issues.append(ViabilityIssue(
+            severity="medium",
+            category="circuit_decision",
+            description=f"Recent decision: {case_name} ({filed}) — {snippet}",
+            citation=case_name,
+            date=filed,
+            recommendation="Review this decision for impact on current claim viability.",
+        ))
+    return issues
 
 
 # ── Main API ────────────────────────────────────────────────────────────────
@@ -407,13 +550,20 @@ def check_claim_viability(
     case_data: dict,
     claim_key: str,
     mode: str = "offline",
+    lookup: ClaimLookup | None = None,
+    source: str | None = None,
+    facts: CaseFacts | None = None,
 ) -> ViabilityCheck:
     """Check viability of a single claim.
 
     Args:
         case_data: The case JSON data
         claim_key: The claim key to check
-        mode: "offline" (built-in only) or "online" (+ CourtListener)
+        mode: "offline" (built-in only) or "online" (+ case-law source)
+        lookup: Precomputed built-in/online issues for the claim (see
+            claim_lookups) instead of looking them up now
+        source: Online mode: case-law source name (default: default_source())
+        facts: Precomputed case facts (see case_facts)
 
     Returns:
         ViabilityCheck with status, confidence, and issues
@@ -422,27 +572,22 @@ def check_claim_viability(
     meta = get_claim(claim_key)
     claim_name = meta.name if meta else claim_key
 
+    if lookup is None:
+        lookup = claim_lookups([claim_key], mode, source)[claim_key]
+
     issues: list[ViabilityIssue] = []
 
     # Built-in knowledge
-    issues.extend(_check_built_in_viability(claim_key))
-
-    # Exhaustion compliance
-    issues.extend(_check_exhaustion_compliance(case_data, claim_key))
-
-    # SOL compliance
-    issues.extend(_check_sol_compliance(case_data, claim_key))
+    issues.extend(lookup.built_in)
 
-    # Immunity exposure
-    issues.extend(_check_immunity_exposure(case_data, claim_key))
+    # Exhaustion, SOL and immunity rules
+    issues.extend(rule_issues(facts or case_facts(case_data), claim_key))
 
     # Online mode
     data_source = "built_in"
-    if mode == "online":
-        online_issues = _check_courtlistener(claim_key)
-        if online_issues:
-            issues.extend(online_issues)
-            data_source = "courtlistener"
+    if mode == "online" and lookup.online:
+        issues.extend(lookup.online)
+        data_source = lookup.source
 
     # Determine status
     critical_count = sum(1 for i in issues if i.severity == "critical")
@@ -474,10 +619,24 @@ def check_claim_viability(
     )
 
 
+def monitored_claims(case_data: dict, claim_keys: list[str] | None = None) -> list[str]:
+    """The claims a report covers: those given, else requested, else suggested."""
+    if claim_keys:
+        return claim_keys
+    claim_keys = case_data.get("claims_requested", [])
+    if not claim_keys or claim_keys == ["auto_suggest"]:
+        from .suggest import suggest_claims
+        suggestions = suggest_claims(case_data, max_results=5)
+        claim_keys = [s.claim_key for s in suggestions if not s.showstoppers]
+    return claim_keys
+
+
 def generate_monitor_report(
     case_data: dict,
     claim_keys: list[str] | None = None,
     mode: str = "offline",
+    lookups: dict[str, ClaimLookup] | None = None,
+    source: str | None = None,
 ) -> MonitorReport:
     """Generate a comprehensive viability monitor report.
 
@@ -485,20 +644,20 @@ def generate_monitor_report(
         case_data: The case JSON data
         claim_keys: Claims to check (auto-detects if None)
         mode: "offline" or "online"
+        lookups: Shared claim lookups (see claim_lookups); computed for
+            this case's claims if None
+        source: Online mode: case-law source name (default: default_source())
 
     Returns:
         MonitorReport with all checks and overall compliance
     """
-    # Determine claims
-    if not claim_keys:
-        claim_keys = case_data.get("claims_requested", [])
-        if not claim_keys or claim_keys == ["auto_suggest"]:
-            from .suggest import suggest_claims
-            suggestions = suggest_claims(case_data, max_results=5)
-            claim_keys = [s.claim_key for s in suggestions if not s.showstoppers]
-
-    # Run checks
-    checks = [check_claim_viability(case_data, ck, mode) for ck in claim_keys]
+    claim_keys = monitored_claims(case_data, claim_keys)
+
+    # Run checks (online: every claim's case-law search runs in one batch first)
+    if lookups is None:
+        lookups = claim_lookups(claim_keys, mode, source)
+    facts = case_facts(case_data)
+    checks = [check_claim_viability(case_data, ck, mode, lookups.get(ck), source, facts) for ck in claim_keys]
 
     # Overall compliance
     non_viable = [c for c in checks if c.status == "non_viable"]
@@ -4,9 +4,10 @@ Keys aligned with TypeScript engine (claim_library.ts).
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from datetime import date, timedelta, datetime
+from datetime import date, datetime
 from typing import Optional
-from .claims import get_claim, CLAIM_LIBRARY
+from .claims import get_claim
+from .court_days import compute_deadline
 
 
 @dataclass
@@ -100,15 +101,11 @@ def calculate_sol(claim_key: str, injury_date_str: str, district_code: str | Non
         except Exception:
             pass  # Fall back to default
 
-    deadline = injury + timedelta(days=sol_days)
+    # FRCP 6(a)(1)(C): a period ending on a weekend or holiday runs to the next court day
+    deadline = compute_deadline(injury, sol_days)
     remaining = (deadline - date.today()).days
 
-    if remaining < 0:
-        status = "expired"
-    elif remaining < 90:
-        status = "urgent"
-    else:
-        status = "safe"
+    status = sol_status(remaining)
 
     tolling = _get_tolling_notes(claim_key, meta)
 
@@ -124,6 +121,15 @@ def calculate_sol(claim_key: str, injury_date_str: str, district_code: str | Non
     )
 
 
+def sol_status(days_remaining: int) -> str:
+    """Classify days remaining as "expired", "urgent" (< 90 days) or "safe"."""
+    if days_remaining < 0:
+        return "expired"
+    if days_remaining < 90:
+        return "urgent"
+    return "safe"
+
+
 def calculate_all_sol(claim_keys: list[str], injury_date_str: str) -> list[SOLResult]:
     """Calculate SOL for multiple claims."""
     return [calculate_sol(ck, injury_date_str) for ck in claim_keys]
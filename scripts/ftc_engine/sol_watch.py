@@ -0,0 +1,214 @@
+"""
+SOL Watchlist — Portfolio-wide statute of limitations tracking across all
+saved cases.
+
+Keeps a heap-ordered list of (deadline, case, claim) items on disk at
+~/.ftc/cases/.sol_watchlist.json. Saving a case through case_manager updates
+only that case's items, so the most urgent deadlines across the docket can be
+read back without recomputing anything. Deadlines use the district-aware SOL
+for the court recorded on each case.
+
+Usage:
+  ftc sol --watch
+  ftc sol --watch --limit 10
+"""
+from __future__ import annotations
+
+import heapq
+import json
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from . import case_manager
+
+
+WATCHLIST_FILENAME = ".sol_watchlist.json"
+
+
+@dataclass
+class WatchItem:
+    deadline: date
+    case_number: str
+    claim_key: str
+    claim_name: str
+    injury_date: str
+    district_code: str
+    days_remaining: int
+    status: str  # "safe", "urgent", "expired"
+
+
+# ── Persistence ─────────────────────────────────────────────────────────────
+
+def _watchlist_path() -> Path:
+    return case_manager.CASES_DIR / WATCHLIST_FILENAME
+
+
+def _load_watchlist() -> dict:
+    path = _watchlist_path()
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == 1:
+                return data
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {"version": 1, "heap": [], "cases": {}}
+
+
+def _save_watchlist(watchlist: dict) -> None:
+    path = _watchlist_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(watchlist) + "\n")
+
+
+# ── Deadline computation ────────────────────────────────────────────────────
+
+def compute_case_deadlines(entry: dict) -> list[list]:
+    """Compute heap items for every requested claim of one indexed case.
+
+    Each item is [deadline_iso, case_number, claim_key, claim_name,
+    injury_date, district_code]; ISO dates sort chronologically, so the list
+    can be heap-ordered as-is. Claims without a computable SOL (unknown key,
+    missing or future injury date) are skipped.
+    """
+    from .sol import calculate_sol
+    from .districts import find_district
+
+    injury_date = entry.get("injury_date", "")
+    if not injury_date:
+        return []
+
+    district = find_district(entry.get("district", ""))
+    district_code = district.code if district else ""
+
+    items: list[list] = []
+    for claim_key in entry.get("claims", []):
+        if claim_key == "auto_suggest":
+            continue
+        try:
+            result = calculate_sol(claim_key, injury_date, district_code or None)
+        except ValueError:
+            continue
+        items.append([
+            result.deadline.isoformat(),
+            entry["case_number"],
+            claim_key,
+            result.claim_name,
+            injury_date,
+            district_code,
+        ])
+    return items
+
+
+def _replace_case_items(watchlist: dict, key: str, items: list[list]) -> None:
+    """Drop a case's old items and push its new ones, keeping heap order."""
+    heap = watchlist["heap"]
+    old_case_number = watchlist["cases"].get(key, {}).get("case_number")
+    if old_case_number is not None:
+        heap = [item for item in heap if item[1] != old_case_number]
+        heapq.heapify(heap)
+    for item in items:
+        heapq.heappush(heap, item)
+    watchlist["heap"] = heap
+
+
+# ── Public API ──────────────────────────────────────────────────────────────
+
+def update_watchlist_for_case(entry: dict) -> None:
+    """Incrementally refresh one case's watchlist items from its index entry."""
+    key = case_manager._sanitize_case_number(entry["case_number"])
+    watchlist = _load_watchlist()
+    _replace_case_items(watchlist, key, compute_case_deadlines(entry))
+    watchlist["cases"][key] = {
+        "case_number": entry["case_number"],
+        "mtime_ns": entry.get("mtime_ns", 0),
+    }
+    _save_watchlist(watchlist)
+
+
+def remove_case_from_watchlist(case_number: str) -> None:
+    """Remove every watchlist item belonging to a case."""
+    key = case_manager._sanitize_case_number(case_number)
+    watchlist = _load_watchlist()
+    if key not in watchlist["cases"]:
+        return
+    _replace_case_items(watchlist, key, [])
+    del watchlist["cases"][key]
+    _save_watchlist(watchlist)
+
+
+def refresh_watchlist() -> dict:
+    """Bring the watchlist in line with the case index.
+
+    Only cases whose case.json changed since they were last indexed (for
+    example, edited by hand) are recomputed; deleted cases are dropped.
+    """
+    index = case_manager.load_case_index()
+    watchlist = _load_watchlist()
+    changed = False
+
+    for key, entry in index.items():
+        known = watchlist["cases"].get(key)
+        if known is None or known.get("mtime_ns") != entry.get("mtime_ns"):
+            _replace_case_items(watchlist, key, compute_case_deadlines(entry))
+            watchlist["cases"][key] = {
+                "case_number": entry["case_number"],
+                "mtime_ns": entry.get("mtime_ns", 0),
+            }
+            changed = True
+
+    for key in [k for k in watchlist["cases"] if k not in index]:
+        _replace_case_items(watchlist, key, [])
+        del watchlist["cases"][key]
+        changed = True
+
+    if changed:
+        _save_watchlist(watchlist)
+    return watchlist
+
+
+def get_watchlist(limit: int | None = None) -> list[WatchItem]:
+    """Return watchlist items, most urgent first.
+
+    Args:
+        limit: Maximum number of items (all items if None)
+    """
+    from .sol import sol_status
+
+    heap = refresh_watchlist()["heap"]
+    ordered = heapq.nsmallest(limit, heap) if limit else sorted(heap)
+
+    today = date.today()
+    items: list[WatchItem] = []
+    for deadline_iso, case_number, claim_key, claim_name, injury_date, district_code in ordered:
+        deadline = date.fromisoformat(deadline_iso)
+        remaining = (deadline - today).days
+        items.append(WatchItem(
+            deadline=deadline,
+            case_number=case_number,
+            claim_key=claim_key,
+            claim_name=claim_name,
+            injury_date=injury_date,
+            district_code=district_code,
+            days_remaining=remaining,
+            status=sol_status(remaining),
+        ))
+    return items
+
+
+def format_watchlist(items: list[WatchItem]) -> str:
+    """Format watchlist items for CLI output."""
+    lines = []
+    lines.append(f"{'Status':<8} {'Deadline':<12} {'Remaining':>10}  {'Case':<24} {'Claim'}")
+    lines.append("-" * 100)
+    for item in items:
+        icon = {"safe": "OK", "urgent": "URGENT", "expired": "EXPIRED"}.get(item.status, "UNKNOWN")
+        district = f" [{item.district_code}]" if item.district_code else ""
+        lines.append(
+            f"{icon:<8} {item.deadline!s:<12} {item.days_remaining:>9}d  "
+            f"{item.case_number[:24]:<24} {item.claim_key}{district}"
+        )
+    if not items:
+        lines.append("  No SOL deadlines found. Cases need an injury date and requested claims.")
+    return "\n".join(lines)
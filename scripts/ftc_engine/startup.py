@@ -0,0 +1,118 @@
+"""
+Startup Profiler — Measures the cold-start cost of ftc commands.
+
+Runs a command in a fresh interpreter under `python -X importtime` (with the
+daemon bypassed) and parses the per-module timings it writes to stderr. The
+report checks lightweight commands against two budgets — import time alone,
+and the whole run including table building and output — and lists the
+slowest imports and any heavy library (python-docx, lxml, urllib) that a
+lightweight command should never have loaded.
+
+Usage:
+  ftc doctor --startup
+"""
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+# Budgets for the commands in LIGHT_COMMANDS: import time alone (interpreter
+# start included), and the whole subprocess wall time, which also covers
+# building the tables the command reads and writing its output
+IMPORT_BUDGET_MS = 100.0
+RUN_BUDGET_MS = 300.0
+
+LIGHT_COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("claims",),
+    ("info", "1983_fourth_excessive_force"),
+)
+
+# Libraries only document generation or network checks need
+HEAVY_MODULES = ("docx", "lxml", "urllib.request", "http.client", "socketserver", "zipfile")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 0 = imported directly by the command or interpreter start
+
+
+@dataclass
+class StartupProfile:
+    command: list[str]
+    wall_ms: float = 0.0
+    exit_code: int = 0
+    imports: list[ImportTiming] = field(default_factory=list)
+
+    @property
+    def import_ms(self) -> float:
+        """Total import time (top-level imports include their children)."""
+        return sum(t.cumulative_us for t in self.imports if t.depth == 0) / 1000
+
+    @property
+    def engine_ms(self) -> float:
+        """Time spent executing ftc_engine modules themselves."""
+        return sum(t.self_us for t in self.imports if t.module.split(".")[0] == "ftc_engine") / 1000
+
+    def slowest(self, n: int = 8) -> list[ImportTiming]:
+        """The n imports with the largest cumulative time."""
+        return sorted(self.imports, key=lambda t: -t.cumulative_us)[:n]
+
+    def heavy_modules(self) -> list[str]:
+        """HEAVY_MODULES (or their submodules) that the command imported."""
+        names = {t.module for t in self.imports}
+        return [h for h in HEAVY_MODULES if any(n == h or n.startswith(h + ".") for n in names)]
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse `-X importtime` output; other stderr lines are ignored."""
+    timings = []
+    for line in stderr.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if m:
+            depth = (len(m.group(3)) - 1) // 2
+            timings.append(ImportTiming(m.group(4), int(m.group(1)), int(m.group(2)), depth))
+    return timings
+
+
+def profile_command(args: list[str] | tuple[str, ...], timeout: float = 60) -> StartupProfile:
+    """Run `ftc <args>` in a fresh interpreter under -X importtime."""
+    env = dict(os.environ, FTC_NO_DAEMON="1")
+    package_root = Path(__file__).resolve().parent.parent
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(package_root), env.get("PYTHONPATH")]))
+    cmd = [sys.executable, "-X", "importtime", "-m", "ftc_engine", *args]
+
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True, timeout=timeout)
+    wall_ms = (time.perf_counter() - start) * 1000
+    return StartupProfile(list(args), wall_ms, proc.returncode, parse_importtime(proc.stderr))
+
+
+def format_startup_report(profiles: list[StartupProfile], import_budget_ms: float = IMPORT_BUDGET_MS,
+                          run_budget_ms: float = RUN_BUDGET_MS, top: int = 5) -> str:
+    """Format startup profiles as a doctor-style report."""
+    lines = [f"  Startup (budgets: {import_budget_ms:.0f} ms imports, {run_budget_ms:.0f} ms wall):"]
+    for p in profiles:
+        over = p.import_ms > import_budget_ms or p.wall_ms > run_budget_ms
+        heavy = p.heavy_modules()
+        icon = "!!" if over or heavy or p.exit_code else "OK"
+        lines.append(f"  [{icon}] ftc {' '.join(p.command)}: {p.import_ms:.1f} ms imports, "
+                     f"{p.engine_ms:.1f} ms in ftc_engine, {p.wall_ms:.0f} ms wall")
+        if p.exit_code:
+            lines.append(f"        exited with status {p.exit_code}")
+        if heavy:
+            lines.append(f"        loaded heavy modules: {', '.join(heavy)}")
+        for t in p.slowest(top):
+            lines.append(f"        {t.cumulative_us / 1000:7.1f} ms  {t.module}")
+    return "\n".join(lines)
@@ -4,7 +4,7 @@ Keys aligned with TypeScript engine (claim_library.ts).
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
-from .claims import CLAIM_LIBRARY, get_claim
+from .claims import get_claim
 
 
 @dataclass
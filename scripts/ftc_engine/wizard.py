@@ -18,6 +18,10 @@ from typing import Optional
 
 from .case_manager import (
     CaseState,
+    output_fingerprint,
+    output_is_current,
+    load_output_fingerprints,
+    record_outputs,
     WORKFLOW_STEPS,
     STEP_KEYS,
     create_case,
@@ -111,8 +115,11 @@ def _prompt_yes_no(label: str, *, default: bool = False) -> bool:
     return raw.startswith("y")
 
 
-def _prompt_date(label: str, *, required: bool = False) -> str:
-    """Prompt for a date in YYYY-MM-DD format."""
+def _prompt_date(label: str, *, required: bool = False, strict: bool = False) -> str:
+    """Prompt for a date in YYYY-MM-DD format.
+
+    With strict, the date must also exist on the calendar (e.g. not 2024-13-45).
+    """
     while True:
         raw = input(f"  {label} (YYYY-MM-DD): ").strip()
         if not raw and not required:
@@ -123,7 +130,14 @@ def _prompt_date(label: str, *, required: bool = False) -> str:
         # Basic validation
         parts = raw.split("-")
         if len(parts) == 3 and all(p.isdigit() for p in parts):
-            return raw
+            if not strict:
+                return raw
+            from datetime import date
+            try:
+                return date.fromisoformat(raw).isoformat()
+            except ValueError:
+                print("    → Not a valid calendar date")
+                continue
         print("    → Format: YYYY-MM-DD")
 
 
@@ -174,12 +188,15 @@ def collect_court(state: CaseState, case_data: dict) -> dict:
         state_name = d.state
 
     division = _prompt("Division", description="e.g. Tampa, Orlando")
+    filing_date = _prompt_date("Filing date, blank if not yet filed", strict=True)
 
     case_data["court"] = {
         "district": district,
         "division": division,
         "state": state_name,
     }
+    if filing_date:
+        case_data["filing_date"] = filing_date  # drives `ftc calendar --all-cases`
     save_case_data(state.case_number, case_data)
     advance_step(state, "court")
     return case_data
@@ -515,6 +532,54 @@ AVAILABLE_DOCUMENTS = [
 ]
 
 
+# Top-level case fields each document reads. An output is regenerated only
+# when one of these (or the engine version) changes; None means the whole case.
+DOCUMENT_INPUTS: dict[str, tuple[str, ...] | None] = {
+    "complaint": ("court", "parties", "facts", "claims_requested", "relief_requested", "exhaustion"),
+    "analysis": ("court", "parties", "facts", "claims_requested", "relief_requested",
+                 "exhaustion", "limitations"),
+    "js44": ("court", "parties", "facts", "claims_requested", "relief_requested",
+             "attorney", "case_number"),
+    "summons": ("court", "parties", "attorney", "case_number"),
+    "disclosure": ("court", "parties", "attorney", "case_number"),
+    "calendar": ("court", "parties", "filing_date"),
+    "monitor": ("parties", "facts", "claims_requested", "exhaustion", "limitations"),
+    "risk": ("parties", "facts", "claims_requested", "relief_requested", "exhaustion", "limitations"),
+    "sol": ("claims_requested", "limitations"),
+    "exhibits": ("parties", "facts", "claims_requested", "exhibits"),
+    "deposition": ("parties", "facts", "claims_requested", "exhaustion"),
+    "questions": None,
+}
+
+# Documents that count days from today (SOL remaining, overdue deadlines)
+_DATED_DOCUMENTS = {"analysis", "calendar", "monitor", "sol"}
+
+# Documents that read the active district (timing rules, court address, citations)
+_DISTRICT_DOCUMENTS = {"calendar", "questions", "summons"}
+
+
+def _active_district_key() -> str:
+    """Active district code, division and a hash of its configuration."""
+    import hashlib
+    import json
+    from dataclasses import asdict
+    from .districts import get_active_district
+    ctx = get_active_district()
+    config = json.dumps(asdict(ctx.config), sort_keys=True, default=str)
+    return f"{ctx.config.code}/{ctx.division}/{hashlib.sha256(config.encode('utf-8')).hexdigest()[:16]}"
+
+
+def document_fingerprint(key: str, case_data: dict) -> str:
+    """Fingerprint of everything a generated document depends on."""
+    from datetime import date
+    extra = []
+    if key in _DATED_DOCUMENTS:
+        extra.append(str(date.today()))
+    if key in _DISTRICT_DOCUMENTS:
+        extra.append(_active_district_key())
+    return output_fingerprint(case_data, DOCUMENT_INPUTS.get(key), " ".join(extra))
+
+
 def _filter_available_docs(case_data: dict) -> list[dict]:
     """Filter documents to only those possible given the case data."""
     docs = list(AVAILABLE_DOCUMENTS)
@@ -593,59 +658,240 @@ def collect_document_selection(state: CaseState, case_data: dict) -> dict:
 
 
 # ── Pipeline executor ───────────────────────────────────────────────────────
+#
+# Generation runs as a dependency graph: the shared upstream results (claim
+# suggestions, MTD risk, SOL, jurisdiction) are stages computed once, and
+# each selected document is a stage that depends only on what it uses, so
+# independent documents are generated concurrently.
+
+def _requested_claims(case_data: dict) -> list[str]:
+    return [c for c in case_data.get("claims_requested", []) if c != "auto_suggest"]
+
+
+def _auto_suggest(case_data: dict) -> bool:
+    claims = case_data.get("claims_requested", [])
+    return not claims or claims == ["auto_suggest"]
+
+
+def _stage_suggestions(case_data: dict, upstream: dict | None = None):
+    from .suggest import suggest_claims
+    return suggest_claims(case_data)
+
+
+def _stage_risk(case_data: dict, upstream: dict | None = None) -> dict:
+    from .risk import calculate_mtd_risk
+    return {c: calculate_mtd_risk(case_data, c) for c in _requested_claims(case_data)}
+
+
+def _stage_sol(case_data: dict, upstream: dict | None = None) -> dict:
+    """SOL result per requested claim; a claim that can't be computed maps to its error."""
+    from .sol import calculate_sol
+    injury = case_data.get("limitations", {}).get("key_dates", {}).get("injury_date")
+    if not injury:
+        return {}
+    results: dict = {}
+    for c in _requested_claims(case_data):
+        try:
+            results[c] = calculate_sol(c, injury)
+        except ValueError as e:
+            results[c] = e
+    return results
+
+
+def _stage_jurisdiction(case_data: dict, upstream: dict | None = None):
+    from .drafter import analyze_jurisdiction
+    suggestions = _upstream("suggestions", case_data, upstream) if _auto_suggest(case_data) else None
+    return analyze_jurisdiction(case_data, suggestions)
+
+
+UPSTREAM_STAGES = {
+    "suggestions": _stage_suggestions,
+    "risk": _stage_risk,
+    "sol": _stage_sol,
+    "jurisdiction": _stage_jurisdiction,
+}
 
-def execute_pipeline(state: CaseState, case_data: dict) -> list[str]:
-    """Generate selected documents, save to case folder, display progress."""
+
+def _upstream_deps(name: str, case_data: dict) -> tuple[str, ...]:
+    """Upstream stages another upstream stage uses."""
+    if name == "jurisdiction" and _auto_suggest(case_data):
+        return ("suggestions",)
+    return ()
+
+
+def _document_deps(key: str, case_data: dict) -> tuple[str, ...]:
+    """Upstream stages a document uses."""
+    if key == "complaint":
+        return ("suggestions", "jurisdiction") if _auto_suggest(case_data) else ("jurisdiction",)
+    if key == "analysis":
+        return ("jurisdiction", "suggestions", "risk", "sol")
+    if key in ("monitor", "deposition"):
+        return ("suggestions",) if _auto_suggest(case_data) else ()
+    if key == "risk":
+        return ("risk",)
+    if key == "sol":
+        return ("sol",)
+    if key == "questions":
+        return ("suggestions", "risk", "sol")
+    return ()
+
+
+def _upstream(name: str, case_data: dict, upstream: dict | None):
+    if upstream is not None and name in upstream:
+        return upstream[name]
+    return UPSTREAM_STAGES[name](case_data, upstream)
+
+
+def _suggested_keys(case_data: dict, upstream: dict | None, limit: int) -> list[str] | None:
+    """Claims to cover when none were requested: the top viable suggestions."""
+    if not _auto_suggest(case_data):
+        return None
+    suggestions = _upstream("suggestions", case_data, upstream)[:limit]
+    return [s.claim_key for s in suggestions if not s.showstoppers]
+
+
+def _sol_line(claim: str, result) -> str:
+    if isinstance(result, Exception):
+        raise result
+    return f"{claim}: {result.days_remaining}d remaining ({result.status})"
+
+
+def _save_outputs(key: str, text: str, state: CaseState) -> list[str]:
+    """Write a generated document in the selected output format(s)."""
+    fmt = state.output_format
+    saved: list[str] = []
+    if fmt in ("markdown", "both"):
+        out_md = get_output_path(state.case_number, key).with_suffix(".md")
+        out_md.write_text(text)
+        saved.append(str(out_md))
+
+    if fmt in ("docx", "both"):
+        try:
+            from .exporter import export_text
+            out_docx = str(get_output_path(state.case_number, key).with_suffix(".docx"))
+            export_text(text, out_docx)
+            saved.append(out_docx)
+        except Exception:
+            pass  # docx export is optional
+    return saved
+
+
+def _output_names(state: CaseState, key: str) -> list[str]:
+    """File names a document is saved under in the selected output format."""
+    suffixes = {"markdown": [".md"], "docx": [".docx"], "both": [".md", ".docx"]}.get(state.output_format, [])
+    base = get_output_path(state.case_number, key)
+    return [base.with_suffix(suffix).name for suffix in suffixes]
+
+
+def _pipeline_stages(state: CaseState, case_data: dict, keys: list[str]) -> list:
+    """The generation graph for the given documents."""
+    from .pipeline import Stage
+
+    doc_stages = []
+    needed: set[str] = set()
+    for key in keys:
+        deps = _document_deps(key, case_data)
+        needed.update(deps)
+
+        def run(inputs: dict, key: str = key) -> tuple[str, list[str]]:
+            text = _generate_document(key, case_data, state, inputs)
+            return text, (_save_outputs(key, text, state) if text else [])
+
+        doc_stages.append(Stage(f"doc:{key}", run, deps))
+
+    for name in list(needed):
+        needed.update(_upstream_deps(name, case_data))
+    upstream = [
+        Stage(name, lambda inputs, fn=fn: fn(case_data, inputs), _upstream_deps(name, case_data))
+        for name, fn in UPSTREAM_STAGES.items() if name in needed
+    ]
+    return upstream + doc_stages
+
+
+def _stage_label(name: str) -> str:
+    if name.startswith("doc:"):
+        key = name[4:]
+        return next((d["name"] for d in AVAILABLE_DOCUMENTS if d["key"] == key), key)
+    return name
+
+
+def execute_pipeline(state: CaseState, case_data: dict, workers: int | None = None,
+                     force: bool = False) -> list[str]:
+    """Generate selected documents, save to case folder, display progress.
+
+    Saved outputs whose fingerprint (the case fields they read and the engine
+    version) is unchanged since they were last generated are kept as they
+    are; force=True regenerates everything.
+    """
     import shutil
+    import time
+    from .pipeline import run_stages
 
     _print_header("STEP 12: GENERATING DOCUMENTS")
     selected = state.documents_selected
-    fmt = state.output_format
-    generated: list[str] = []
     total = len(selected)
+    finished = 0
+
+    # Incremental regeneration only applies to saved outputs
+    fingerprints = {key: document_fingerprint(key, case_data) for key in selected}
+    current: list[str] = []
+    if state.output_format != "terminal" and not force:
+        recorded = load_output_fingerprints(state.case_number)
+        current = [key for key in selected
+                   if output_is_current(state.case_number, key, fingerprints[key],
+                                        _output_names(state, key), recorded)]
+    for key in current:
+        finished += 1
+        print(f"\n  [{finished}/{total}] {_stage_label('doc:' + key)}... up to date")
+    to_generate = [key for key in selected if key not in current]
+
+    def report(result) -> None:
+        nonlocal finished
+        if not result.name.startswith("doc:"):
+            if not result.ok:
+                print(f"\n  [--] {result.name} failed: {result.error}")
+            return
+        finished += 1
+        print(f"\n  [{finished}/{total}] {_stage_label(result.name)}... ", end="")
+        if not result.ok:
+            print(f"ERROR: {result.error}")
+            return
+        text, _ = result.value
+        if not text:
+            print("skipped (no output)")
+            return
+        print(f"done ({result.seconds:.2f}s)")
+        if state.output_format == "terminal":
+            print(text)
+
+    start = time.perf_counter()
+    results = run_stages(_pipeline_stages(state, case_data, to_generate), workers=workers, on_done=report)
+    wall = time.perf_counter() - start
 
-    for i, key in enumerate(selected, 1):
-        label = next((d["name"] for d in AVAILABLE_DOCUMENTS if d["key"] == key), key)
-        print(f"\n  [{i}/{total}] {label}...", end=" ", flush=True)
-
-        try:
-            text = _generate_document(key, case_data, state)
-            if text:
-                # Save to disk if not terminal-only
-                if fmt in ("markdown", "both"):
-                    out = get_output_path(state.case_number, key)
-                    out_md = out.with_suffix(".md")
-                    out_md.write_text(text)
-                    generated.append(str(out_md))
-
-                if fmt in ("docx", "both"):
-                    try:
-                        from .exporter import export_text
-                        out = get_output_path(state.case_number, key)
-                        out_docx = str(out.with_suffix(".docx"))
-                        export_text(text, out_docx)
-                        generated.append(out_docx)
-                    except Exception:
-                        pass  # docx export is optional
-
-                if fmt == "terminal":
-                    print("done")
-                    print(text)
-                else:
-                    print("done")
-            else:
-                print("skipped (no output)")
-        except Exception as e:
-            print(f"ERROR: {e}")
+    generated: list[str] = []
+    kept: list[str] = []
+    fresh: dict[str, tuple[str, list[str]]] = {}
+    for key in selected:
+        if key in current:
+            base = get_output_path(state.case_number, key)
+            kept.extend(str(base.with_name(name)) for name in _output_names(state, key))
+            continue
+        result = results[f"doc:{key}"]
+        if result.ok:
+            paths = result.value[1]
+            generated.extend(paths)
+            if paths:
+                fresh[key] = (fingerprints[key], [Path(p).name for p in paths])
+    record_outputs(state.case_number, fresh)
 
     advance_step(state, "generate")
 
     # Copy files to user's chosen location if set
     copied: list[str] = []
-    if state.output_location and generated:
+    if state.output_location and (generated or kept):
         dest = Path(state.output_location)
         dest.mkdir(parents=True, exist_ok=True)
-        for src_path in generated:
+        for src_path in generated + kept:
             src = Path(src_path)
             dst = dest / src.name
             shutil.copy2(src, dst)
@@ -657,58 +903,101 @@ def execute_pipeline(state: CaseState, case_data: dict) -> list[str]:
     for g in generated:
         print(f"    → {g}")
 
+    if kept:
+        print(f"\n  Up to date, not regenerated ({len(kept)}):")
+        for k in kept:
+            print(f"    = {k}")
+
     if copied:
         print(f"\n  Also saved to: {state.output_location}")
         for c in copied:
             print(f"    → {c}")
 
+    print("\n  Stage timings:")
+    for result in results.values():
+        status = "" if result.ok else "  (failed)"
+        print(f"    {_stage_label(result.name):<36} {result.seconds:>7.3f}s{status}")
+    print(f"    {'Total (wall clock)':<36} {wall:>7.3f}s")
+
     print(f"\n  Case folder: {state.case_path}")
     print()
 
-    return generated
-
-
-def _generate_document(key: str, case_data: dict, state: CaseState) -> str:
-    """Generate a single document by key. Returns formatted text."""
+    return generated + kept
+
+
+def output_status(state: CaseState, case_data: dict) -> list[tuple[str, str]]:
+    """(doc key, status) for every previously generated output.
+
+    status is "current", "stale" (its inputs changed since it was generated)
+    or "missing" (a recorded file was deleted).
+    """
+    recorded = load_output_fingerprints(state.case_number)
+    out_dir = Path(state.case_path) / "output"
+    order = {d["key"]: i for i, d in enumerate(AVAILABLE_DOCUMENTS)}
+    rows: list[tuple[str, str]] = []
+    for key in sorted(recorded, key=lambda k: order.get(k, len(order))):
+        entry = recorded[key]
+        if not all((out_dir / name).exists() for name in entry.get("files", [])):
+            status = "missing"
+        elif entry.get("fingerprint") != document_fingerprint(key, case_data):
+            status = "stale"
+        else:
+            status = "current"
+        rows.append((key, status))
+    return rows
+
+
+def format_output_status(state: CaseState, rows: list[tuple[str, str]]) -> str:
+    """Format output freshness for CLI display."""
+    lines = ["", "  Generated outputs:"]
+    for key, status in rows:
+        lines.append(f"    [{status.upper():<7}] {_stage_label('doc:' + key)}")
+    outdated = sum(1 for _, status in rows if status != "current")
+    if outdated:
+        lines.append(f"\n  {outdated} output(s) out of date — run 'ftc open {state.case_number} "
+                     f"--step generate' to regenerate them")
+    return "\n".join(lines)
+
+
+def _generate_document(key: str, case_data: dict, state: CaseState,
+                       upstream: dict | None = None) -> str:
+    """Generate a single document by key. Returns formatted text.
+
+    upstream: Results of the pipeline's upstream stages ("suggestions",
+              "risk", "sol", "jurisdiction"); any that are missing are
+              computed here.
+    """
     if key == "complaint":
         from .drafter import generate_complaint
-        return generate_complaint(case_data)
+        suggestions = _upstream("suggestions", case_data, upstream) if _auto_suggest(case_data) else None
+        return generate_complaint(case_data, suggestions, _upstream("jurisdiction", case_data, upstream))
 
     elif key == "analysis":
-        from .suggest import suggest_claims
-        from .risk import calculate_mtd_risk
-        from .sol import calculate_sol
-        from .drafter import analyze_jurisdiction
-
         lines: list[str] = []
         lines.append("=" * 70)
         lines.append("  FULL CASE ANALYSIS REPORT")
         lines.append("=" * 70)
 
-        jx = analyze_jurisdiction(case_data)
+        jx = _upstream("jurisdiction", case_data, upstream)
         lines.append(f"\n  Jurisdiction: {jx.basis}")
-        lines.append(f"  Venue: {jx.venue}")
+        lines.append(f"  Venue: {jx.venue_analysis}")
 
-        suggestions = suggest_claims(case_data)
+        suggestions = _upstream("suggestions", case_data, upstream)
         lines.append(f"\n  Suggested Claims ({len(suggestions)}):")
         for s in suggestions:
-            lines.append(f"    [{s.score:.0f}] {s.claim_key}")
+            lines.append(f"    [{s.match_score:.0f}] {s.claim_key}")
 
-        claims = case_data.get("claims_requested", [])
-        if claims and claims != ["auto_suggest"]:
+        risk = _upstream("risk", case_data, upstream)
+        if risk:
             lines.append("\n  MTD Risk Scores:")
-            for c in claims:
-                r = calculate_mtd_risk(case_data, c)
+            for c, r in risk.items():
                 lines.append(f"    {c}: {r.overall_score}/100")
 
-        injury = case_data.get("limitations", {}).get("key_dates", {}).get("injury_date")
-        if injury and claims:
+        sol = _upstream("sol", case_data, upstream)
+        if sol:
             lines.append("\n  SOL Check:")
-            for c in claims:
-                if c == "auto_suggest":
-                    continue
-                sol = calculate_sol(c, injury)
-                lines.append(f"    {c}: {sol.days_remaining}d remaining ({sol.status})")
+            for c, result in sol.items():
+                lines.append(f"    {_sol_line(c, result)}")
 
         return "\n".join(lines)
 
@@ -748,33 +1037,21 @@ def _generate_document(key: str, case_data: dict, state: CaseState) -> str:
 
     elif key == "monitor":
         from .rule11_monitor import generate_monitor_report, format_monitor_report
-        report = generate_monitor_report(case_data)
+        report = generate_monitor_report(case_data, _suggested_keys(case_data, upstream, 5))
         return format_monitor_report(report, verbose=True)
 
     elif key == "risk":
-        from .risk import calculate_mtd_risk
-        claims = case_data.get("claims_requested", [])
+        risk = _upstream("risk", case_data, upstream)
         lines = ["  MTD RISK SCORES", "  " + "-" * 40]
-        for c in claims:
-            if c == "auto_suggest":
-                continue
-            r = calculate_mtd_risk(case_data, c)
+        for c, r in risk.items():
             lines.append(f"    {c}: {r.overall_score}/100")
         return "\n".join(lines) if len(lines) > 2 else ""
 
     elif key == "sol":
-        from .sol import calculate_sol
-        injury = case_data.get("limitations", {}).get("key_dates", {}).get("injury_date")
-        claims = case_data.get("claims_requested", [])
-        if not injury or not claims:
-            return ""
+        sol = _upstream("sol", case_data, upstream)
         lines = ["  STATUTE OF LIMITATIONS REPORT", "  " + "-" * 40]
-        for c in claims:
-            if c == "auto_suggest":
-                continue
-            result = calculate_sol(c, injury)
-            lines.append(f"    {c}: {result.days_remaining}d remaining "
-                         f"({result.status}) — deadline {result.deadline}")
+        for c, result in sol.items():
+            lines.append(f"    {_sol_line(c, result)} — deadline {result.deadline}")
         return "\n".join(lines) if len(lines) > 2 else ""
 
     elif key == "exhibits":
@@ -785,16 +1062,27 @@ def _generate_document(key: str, case_data: dict, state: CaseState) -> str:
     elif key == "deposition":
         from .deposition import generate_deposition_outline, format_deposition_outline
         defs = case_data.get("parties", {}).get("defendants", [])
+        claim_keys = _suggested_keys(case_data, upstream, 3)
         parts = []
         for d in defs:
             outline = generate_deposition_outline(
-                case_data, witness_name=d["name"], dep_type="cross")
+                case_data, witness_name=d["name"], exam_type="cross", claim_keys=claim_keys)
             parts.append(format_deposition_outline(outline, verbose=True))
         return "\n\n".join(parts)
 
     elif key == "questions":
         from .questions import generate_questions, format_questions
-        qs = generate_questions(case_data)
+        suggestions = _upstream("suggestions", case_data, upstream)
+        risk = _upstream("risk", case_data, upstream)
+        sol = _upstream("sol", case_data, upstream)
+        qs = generate_questions(
+            case_data,
+            suggestions=[{"key": s.claim_key, "score": s.match_score, "showstoppers": s.showstoppers}
+                         for s in suggestions],
+            risk_scores={c: {"score": r.overall_score, "level": r.risk_level} for c, r in risk.items()},
+            sol_results=[{"claim_key": c, "status": r.status, "days_remaining": r.days_remaining}
+                         for c, r in sol.items() if not isinstance(r, Exception)] or None,
+        )
         return format_questions(qs, verbose=True)
 
     return ""
@@ -4,6 +4,47 @@ import pytest
 from pathlib import Path
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_district_snapshot(tmp_path_factory):
+    """Keep the compiled district snapshot and user district files out of ~/.ftc."""
+    import ftc_engine.districts as districts
+    root = tmp_path_factory.mktemp("ftc_districts")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(districts, "_SNAPSHOT_FILE", root / "cache" / "districts.snapshot")
+        mp.setattr(districts, "_USER_DISTRICTS_DIR", root / "districts")
+        districts.reload_districts()
+        yield
+    districts.DISTRICTS.reload()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_template_cache(tmp_path_factory):
+    """Keep compiled export templates out of ~/.ftc."""
+    import ftc_engine.exporter as exporter
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(exporter, "_TEMPLATE_CACHE_DIR", tmp_path_factory.mktemp("ftc_templates"))
+        yield
+    exporter.clear_template_cache()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_courtlistener_cache(tmp_path_factory):
+    """Keep cached CourtListener responses out of ~/.ftc."""
+    import ftc_engine.courtlistener as courtlistener
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(courtlistener, "CACHE_DIR", tmp_path_factory.mktemp("ftc_courtlistener"))
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_caselaw_mirror(tmp_path_factory):
+    """Keep the local case-law mirror out of ~/.ftc."""
+    import ftc_engine.caselaw_mirror as mirror
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(mirror, "DB_PATH", tmp_path_factory.mktemp("ftc_caselaw") / "opinions.db")
+        yield
+
+
 @pytest.fixture
 def sample_case() -> dict:
     """Load the standard sample case (excessive force / Tampa PD)."""
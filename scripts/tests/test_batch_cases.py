@@ -0,0 +1,186 @@
+"""Tests for JSONL batch case processing."""
+import io
+import json
+import multiprocessing
+import os
+import pytest
+import ftc_engine.batch_cases as batch_cases
+from ftc_engine.batch_cases import (
+    BATCH_COMMANDS,
+    _ordered_map,
+    format_batch_summary,
+    iter_case_lines,
+    process_line,
+    run_batch,
+)
+from ftc_engine.cli import run
+
+
+@pytest.fixture
+def intake(sample_case, minimal_case) -> str:
+    """Three cases, a blank line, and a malformed line."""
+    second = dict(minimal_case, case_number="2:25-cv-00002")
+    return "\n".join([
+        json.dumps(sample_case),
+        json.dumps(second),
+        "",
+        "{not json",
+        json.dumps(dict(sample_case, case_number="3:25-cv-00003")),
+    ]) + "\n"
+
+
+def _results(text: str) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestProcessLine:
+    """Test one case line through each command."""
+
+    @pytest.mark.parametrize("command", BATCH_COMMANDS)
+    def test_every_command_returns_json(self, command, sample_case):
+        ok, line = process_line(command, {}, 7, json.dumps(sample_case))
+        record = json.loads(line)
+        assert ok and record["ok"]
+        assert record["line"] == 7
+        assert record["command"] == command
+        assert record["result"]
+
+    def test_risk_matches_engine(self, sample_case):
+        from ftc_engine.risk import calculate_mtd_risk
+        ok, line = process_line("risk", {"claims": "1983_fourth_excessive_force"}, 1, json.dumps(sample_case))
+        scores = json.loads(line)["result"]
+        expected = calculate_mtd_risk(sample_case, "1983_fourth_excessive_force").overall_score
+        assert scores["1983_fourth_excessive_force"]["overall_score"] == expected
+
+    def test_suggest_respects_max(self, sample_case):
+        _, line = process_line("suggest", {"max": 2}, 1, json.dumps(sample_case))
+        assert len(json.loads(line)["result"]) == 2
+
+    def test_bad_input_recorded(self):
+        ok, line = process_line("risk", {}, 3, "{nope")
+        assert not ok
+        assert json.loads(line)["error"].startswith("Invalid JSON")
+        ok, line = process_line("risk", {}, 4, "[1, 2]")
+        assert not ok
+        assert "object" in json.loads(line)["error"]
+
+
+class TestRunBatch:
+    """Test streaming, ordering and bounded concurrency."""
+
+    def test_blank_lines_skipped(self):
+        assert [n for n, _ in iter_case_lines(["{}\n", "\n", "  \n", "{}\n"])] == [1, 4]
+
+    def test_results_in_input_order(self, intake):
+        out = io.StringIO()
+        summary = run_batch("suggest", io.StringIO(intake), out, workers=1)
+        records = _results(out.getvalue())
+        assert [r["line"] for r in records] == [1, 2, 4, 5]
+        assert [r["ok"] for r in records] == [True, True, False, True]
+        assert records[1]["case"] == "2:25-cv-00002"
+        assert summary.processed == 4 and summary.failed == 1
+
+    def test_process_pool_matches_serial(self, intake):
+        serial, parallel = io.StringIO(), io.StringIO()
+        run_batch("risk", io.StringIO(intake), serial, workers=1)
+        summary = run_batch("risk", io.StringIO(intake), parallel, workers=2)
+        assert parallel.getvalue() == serial.getvalue()
+        assert summary.workers == 2
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="patched handler must be inherited by the workers")
+    def test_worker_death_recorded(self, sample_case, monkeypatch):
+        def crash(case_data, options):
+            if case_data.get("case_number") == "crash":
+                os._exit(1)
+            return {"ok": True}
+
+        monkeypatch.setitem(batch_cases._HANDLERS, "risk", crash)
+        cases = [dict(sample_case, case_number=str(i)) for i in range(20)]
+        cases[3]["case_number"] = "crash"
+        out = io.StringIO()
+        summary = run_batch("risk", io.StringIO("\n".join(json.dumps(c) for c in cases)), out, workers=2)
+        results = _results(out.getvalue())
+        assert [r["line"] for r in results] == list(range(1, 21))
+        crashed = results[3]
+        assert crashed["case"] == "crash" and "Worker process died" in crashed["error"]
+        assert results[-1]["ok"]  # a fresh pool carried on after the crash
+        assert summary.processed == 20 and 1 <= summary.failed < 20
+
+    def test_window_bounds_in_flight_items(self):
+        in_flight, peak = [], []
+
+        class Done:
+            def __init__(self, value):
+                self.value = value
+
+            def result(self):
+                in_flight.remove(self.value)
+                return self.value
+
+        def submit(value):
+            in_flight.append(value)
+            peak.append(len(in_flight))
+            return Done(value)
+
+        results = list(_ordered_map(submit, ((i,) for i in range(100)), window=4))
+        assert results == list(range(100))
+        assert max(peak) == 4
+
+    def test_input_read_lazily(self):
+        consumed = []
+
+        def source():
+            for i in range(50):
+                consumed.append(i)
+                yield json.dumps({"case_number": str(i)}) + "\n"
+
+        class Out(io.StringIO):
+            consumed_at_first_write = None
+
+            def write(self, text):
+                if self.consumed_at_first_write is None:
+                    self.consumed_at_first_write = len(consumed)
+                return super().write(text)
+
+        out = Out()
+        run_batch("pacer", source(), out, workers=1)
+        assert out.consumed_at_first_write == 1
+        assert len(_results(out.getvalue())) == 50
+
+    def test_unknown_command(self):
+        with pytest.raises(ValueError, match="supports"):
+            run_batch("draft", io.StringIO(""), io.StringIO())
+
+    def test_summary(self, intake):
+        summary = run_batch("pacer", io.StringIO(intake), io.StringIO(), workers=1)
+        text = format_batch_summary(summary, "out.jsonl")
+        assert "4 case(s) processed" in text
+        assert "1 case(s) failed" in text
+
+
+class TestBatchCli:
+    """Test --batch/--jsonl-out on the CLI."""
+
+    def test_jsonl_out_file(self, intake, tmp_path, capsys):
+        src = tmp_path / "intake.jsonl"
+        src.write_text(intake)
+        dest = tmp_path / "monitor.jsonl"
+        with pytest.raises(SystemExit) as e:  # one malformed line
+            run(["monitor", "--batch", str(src), "--jsonl-out", str(dest), "--workers", "1"])
+        assert e.value.code == 1
+        assert len(_results(dest.read_text())) == 4
+        assert str(dest) in capsys.readouterr().out
+
+    def test_stdout_stays_pure_jsonl(self, sample_case, tmp_path, capsys):
+        src = tmp_path / "intake.jsonl"
+        src.write_text(json.dumps(sample_case) + "\n")
+        run(["calendar", "--batch", str(src), "--workers", "1"])
+        captured = capsys.readouterr()
+        assert [r["ok"] for r in _results(captured.out)] == [True]
+        assert "1 case(s) processed" in captured.err
+
+    def test_input_still_required_without_batch(self, capsys):
+        with pytest.raises(SystemExit):
+            run(["risk"])
+        assert "--batch" in capsys.readouterr().err
@@ -0,0 +1,107 @@
+"""Tests for parallel batch export."""
+import json
+import pytest
+from pathlib import Path
+from ftc_engine.batch_export import (
+    ExportJob,
+    BatchReport,
+    load_manifest,
+    parse_job,
+    export_batch,
+    run_job,
+    format_batch_report,
+)
+
+
+@pytest.fixture
+def batch_dir(tmp_path, sample_case):
+    """A manifest directory with a case file and two text sources."""
+    (tmp_path / "case.json").write_text(json.dumps(sample_case))
+    (tmp_path / "a.md").write_text("   1. First paragraph\n   2. Second paragraph")
+    (tmp_path / "b.md").write_text("Plain body text")
+    return tmp_path
+
+
+class TestManifest:
+    """Test manifest parsing."""
+
+    def test_paths_relative_to_manifest(self, batch_dir):
+        manifest = batch_dir / "manifest.json"
+        manifest.write_text(json.dumps({"jobs": [
+            {"text": "a.md", "output": "out/a.docx", "stream": True},
+            {"draft": True, "case": "case.json", "output": "out/c.docx"},
+        ]}))
+        jobs = load_manifest(str(manifest))
+        assert jobs[0] == ExportJob("text", str(batch_dir / "out/a.docx"), str(batch_dir / "a.md"), "", True)
+        assert jobs[1].kind == "draft"
+        assert jobs[1].case == str(batch_dir / "case.json")
+
+    def test_bare_list_accepted(self, batch_dir):
+        manifest = batch_dir / "manifest.json"
+        manifest.write_text(json.dumps([{"template": "motions/mtd", "output": "x.docx"}]))
+        assert load_manifest(str(manifest))[0].source == "motions/mtd"
+
+    def test_invalid_jobs_rejected(self, batch_dir):
+        with pytest.raises(ValueError):
+            parse_job({"text": "a.md"}, batch_dir)
+        with pytest.raises(ValueError):
+            parse_job({"output": "x.docx"}, batch_dir)
+        with pytest.raises(ValueError):
+            parse_job({"draft": True, "output": "x.docx"}, batch_dir)
+
+    def test_non_object_job_rejected(self, batch_dir, capsys):
+        from ftc_engine.cli import run
+        manifest = batch_dir / "manifest.json"
+        manifest.write_text(json.dumps([{"text": "a.md", "output": "a.docx"}, "b.md"]))
+        with pytest.raises(ValueError, match="Job 2 .* must be an object"):
+            load_manifest(str(manifest))
+        with pytest.raises(SystemExit):
+            run(["export", "--batch", str(manifest)])
+        assert "Job 2" in capsys.readouterr().err
+
+
+class TestExportBatch:
+    """Test job execution and error capture."""
+
+    def _jobs(self, d: Path) -> list[ExportJob]:
+        return [
+            ExportJob("text", str(d / "out" / "a.docx"), str(d / "a.md")),
+            ExportJob("text", str(d / "out" / "b.docx"), str(d / "b.md"), stream=True),
+            ExportJob("text", str(d / "out" / "missing.docx"), str(d / "missing.md")),
+            ExportJob("draft", str(d / "out" / "c.docx"), case=str(d / "case.json")),
+        ]
+
+    def test_inline_batch(self, batch_dir):
+        report = export_batch(self._jobs(batch_dir), workers=1)
+        assert [r.ok for r in report.results] == [True, True, False, True]
+        assert "FileNotFoundError" in report.results[2].error
+        assert (batch_dir / "out" / "c.docx").exists()
+
+    def test_process_pool_batch(self, batch_dir):
+        report = export_batch(self._jobs(batch_dir), workers=2)
+        assert report.workers == 2
+        assert [r.index for r in report.results] == [0, 1, 2, 3]
+        assert report.succeeded == 3
+        assert report.failed == 1
+        assert (batch_dir / "out" / "a.docx").exists()
+
+    def test_run_job_inline_case(self, batch_dir, sample_case):
+        result = run_job(0, ExportJob("draft", str(batch_dir / "d.docx"), case=sample_case))
+        assert result.ok
+        assert result.sections > 0
+
+    def test_empty_batch(self):
+        report = export_batch([])
+        assert report.results == []
+        assert report.docs_per_second == 0.0
+
+
+class TestFormatReport:
+    """Test batch report formatting."""
+
+    def test_reports_throughput_and_errors(self, batch_dir):
+        jobs = [ExportJob("text", str(batch_dir / "x.docx"), str(batch_dir / "nope.md"))]
+        output = format_batch_report(export_batch(jobs, workers=1))
+        assert "0/1 exported" in output
+        assert "docs/s" in output
+        assert "FileNotFoundError" in output
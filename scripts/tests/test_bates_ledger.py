@@ -0,0 +1,208 @@
+"""Tests for the persistent per-case Bates ledger."""
+import json
+
+import pytest
+from ftc_engine.bates_ledger import (
+    BatesLedger,
+    bates_label,
+    format_lookup,
+    ledger_path,
+    parse_bates_label,
+)
+from ftc_engine.case_manager import create_case
+from ftc_engine.cli import run
+from ftc_engine.exhibits import format_exhibit_index, generate_exhibit_index
+import ftc_engine.case_manager as cm
+
+
+@pytest.fixture
+def isolated_cases(tmp_path, monkeypatch):
+    """Redirect CASES_DIR to a temp folder for isolation."""
+    test_dir = tmp_path / "cases"
+    test_dir.mkdir()
+    monkeypatch.setattr(cm, "CASES_DIR", test_dir)
+    return test_dir
+
+
+@pytest.fixture
+def ledger():
+    ledger = BatesLedger()
+    ledger.allocate("a" * 64, 45, "SMITH", "medical.pdf", "vol1")
+    ledger.allocate("b" * 64, 0, "SMITH", "photo.jpg", "vol1")
+    ledger.allocate("c" * 64, 10, "SMITH", "report.pdf", "vol1")
+    return ledger
+
+
+class TestAllocation:
+    """Test contiguous, hash-keyed allocation."""
+
+    def test_contiguous_ranges(self, ledger):
+        assert [(a.start, a.end) for a in ledger] == [(1, 45), (46, 46), (47, 56)]
+        assert ledger.next_number("SMITH") == 57
+        assert ledger.get("a" * 64, "SMITH").bates_range == "SMITH-000001 to SMITH-000045"
+
+    def test_same_hash_keeps_range(self, ledger):
+        again = ledger.allocate("c" * 64, 10, "SMITH", "renamed.pdf")
+        assert (again.start, again.source_file) == (47, "report.pdf")
+        assert len(ledger) == 3
+
+    def test_prefixes_are_separate_series(self, ledger):
+        other = ledger.allocate("a" * 64, 45, "JONES")
+        assert other.start == 1 and ledger.next_number("SMITH") == 57
+        assert ledger.allocate("d" * 64, 2).bates_range == "EX-000001 to EX-000002"
+
+
+class TestLookup:
+    """Test Bates number -> document lookup."""
+
+    @pytest.mark.parametrize("label,source", [
+        ("SMITH-000001", "medical.pdf"), ("SMITH-000045", "medical.pdf"),
+        ("SMITH-000046", "photo.jpg"), ("SMITH-000050", "report.pdf"), ("SMITH-000056", "report.pdf"),
+    ])
+    def test_found(self, ledger, label, source):
+        assert ledger.lookup(label).source_file == source
+
+    @pytest.mark.parametrize("label", ["SMITH-000000", "SMITH-000057", "JONES-000001"])
+    def test_not_allocated(self, ledger, label):
+        assert ledger.lookup(label) is None
+
+    def test_labels(self):
+        assert parse_bates_label(" SMITH-CO-004213 ") == ("SMITH-CO", 4213)
+        assert bates_label(4213, "SMITH") == "SMITH-004213"
+        with pytest.raises(ValueError):
+            parse_bates_label("004213")
+
+    def test_format(self, ledger):
+        text = format_lookup("SMITH-000050", ledger.lookup("SMITH-000050"))
+        assert "page 4 of report.pdf" in text and "SMITH-000047 to SMITH-000056" in text
+        assert "not allocated" in format_lookup("SMITH-000099", None)
+
+
+class TestPersistence:
+    """Test the on-disk ledger."""
+
+    def test_round_trip(self, ledger, tmp_path):
+        ledger.path = tmp_path / "ledger.json"
+        ledger.save()
+        loaded = BatesLedger.load(ledger.path)
+        assert list(loaded) == list(ledger)
+        assert loaded.lookup("SMITH-000046").sha256 == "b" * 64
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert len(BatesLedger.load(tmp_path / "none.json")) == 0
+
+    def test_corrupt_file_raises(self, tmp_path):
+        path = tmp_path / "ledger.json"
+        path.write_text("{oops")
+        with pytest.raises(ValueError, match="unreadable"):
+            BatesLedger.load(path)
+
+    def test_overlap_rejected(self, tmp_path):
+        path = tmp_path / "ledger.json"
+        rows = [{"prefix": "S", "start": 1, "end": 5, "sha256": "a"},
+                {"prefix": "S", "start": 5, "end": 6, "sha256": "b"}]
+        path.write_text(json.dumps({"version": 1, "allocations": rows}))
+        with pytest.raises(ValueError, match="Overlapping"):
+            BatesLedger.load(path)
+
+
+class TestExhibitScan:
+    """Test stable numbering across scans and the CLI."""
+
+    def test_stable_across_scans(self, tmp_path, sample_case):
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "b_letter.txt").write_text("letter")
+        (docs / "c_memo.txt").write_text("memo")
+        ledger = BatesLedger()
+        first = generate_exhibit_index(sample_case, scan_directory=str(docs), numbering="bates",
+                                       prefix="SMITH", ledger=ledger)
+        assert [e.exhibit_number for e in first.entries] == ["SMITH-000001", "SMITH-000002"]
+
+        (docs / "a_email.txt").write_text("new document, sorts first")
+        second = generate_exhibit_index(sample_case, scan_directory=str(docs), numbering="bates",
+                                        prefix="SMITH", ledger=ledger)
+        assert {e.source_file: e.exhibit_number for e in second.entries} == {
+            "a_email.txt": "SMITH-000003", "b_letter.txt": "SMITH-000001", "c_memo.txt": "SMITH-000002",
+        }
+
+    def test_unreadable_pdf_held_back(self, tmp_path, sample_case):
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "damaged.pdf").write_bytes(b"%PDF-1.4 truncated")
+        (docs / "photo.jpg").write_bytes(b"\xff\xd8jpeg")
+        ledger = BatesLedger()
+        index = generate_exhibit_index(sample_case, scan_directory=str(docs), prefix="SMITH", ledger=ledger)
+        assert [e.source_file for e in index.entries] == ["photo.jpg"]
+        assert "page count unreadable" in index.held_back["damaged.pdf"]
+        assert [a.source_file for a in ledger] == ["photo.jpg"]
+        assert "HELD BACK" in format_exhibit_index(index)
+
+    def test_unreadable_file_held_back(self, tmp_path, sample_case, monkeypatch):
+        """A file that can't be read takes no label that could collide with a ledger range."""
+        import ftc_engine.exhibits as exhibits
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a_letter.txt").write_text("first")
+        ledger = BatesLedger()
+        ledger.allocate("f" * 64, 3, "SMITH", "earlier.pdf")  # SMITH-000001..000003
+        real_scan = exhibits.scan_documents
+
+        def scan_with_locked_file(directory, workers=None):
+            locked = exhibits.ScannedFile(docs / "locked.txt", "locked.txt", error="Permission denied")
+            return real_scan(directory, workers) + [locked]
+
+        monkeypatch.setattr(exhibits, "scan_documents", scan_with_locked_file)
+        index = generate_exhibit_index(sample_case, scan_directory=str(docs), numbering="bates",
+                                       prefix="SMITH", ledger=ledger)
+        assert [e.exhibit_number for e in index.entries] == ["SMITH-000004"]
+        assert "Permission denied" in index.held_back["locked.txt"]
+
+    def test_cli_saves_only_new_allocations(self, isolated_cases, tmp_path, sample_case, monkeypatch):
+        saves = []
+        original = BatesLedger.save
+        monkeypatch.setattr(BatesLedger, "save", lambda self: saves.append(1) or original(self))
+        create_case("6:24-cv-00002")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "damaged.pdf").write_bytes(b"%PDF-1.4 truncated")
+        case_file = tmp_path / "case.json"
+        case_file.write_text(json.dumps(sample_case))
+        args = ["exhibits", "-i", str(case_file), "--scan", str(docs), "--case", "6:24-cv-00002"]
+        run(args)
+        assert not ledger_path("6:24-cv-00002").exists() and saves == []
+
+        (docs / "memo.txt").write_text("memo")
+        run(args)
+        run(args)
+        assert ledger_path("6:24-cv-00002").exists() and saves == [1]
+
+    def test_cli(self, isolated_cases, tmp_path, sample_case, capsys):
+        create_case("6:24-cv-00001")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "letter.txt").write_text("letter")
+        (docs / "memo.txt").write_text("memo")
+        case_file = tmp_path / "case.json"
+        case_file.write_text(json.dumps(sample_case))
+
+        run(["exhibits", "-i", str(case_file), "--scan", str(docs), "--prefix", "SMITH",
+             "--case", "6:24-cv-00001"])
+        assert ledger_path("6:24-cv-00001").exists()
+        capsys.readouterr()
+
+        run(["exhibits", "--case", "6:24-cv-00001", "--bates-lookup", "SMITH-000002"])
+        assert "page 1 of memo.txt" in capsys.readouterr().out
+        run(["exhibits", "--case", "6:24-cv-00001", "--bates-lookup", "SMITH-000002", "--format", "json"])
+        assert json.loads(capsys.readouterr().out)["data"]["source_file"] == "memo.txt"
+
+    def test_cli_errors(self, isolated_cases, capsys):
+        with pytest.raises(SystemExit):
+            run(["exhibits", "--bates-lookup", "SMITH-000001"])
+        assert "needs --case" in capsys.readouterr().err
+        with pytest.raises(SystemExit):
+            run(["exhibits", "--case", "missing", "--bates-lookup", "SMITH-000001"])
+        assert "Case not found" in capsys.readouterr().err
+        with pytest.raises(SystemExit):
+            run(["exhibits"])
+        assert "--input is required" in capsys.readouterr().err
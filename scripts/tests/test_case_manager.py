@@ -16,6 +16,10 @@ from ftc_engine.case_manager import (
     list_intake_docs,
     get_output_path,
     list_outputs,
+    output_fingerprint,
+    output_is_current,
+    record_outputs,
+    load_output_fingerprints,
     CaseState,
     CaseInfo,
     WORKFLOW_STEPS,
@@ -261,3 +265,36 @@ class TestOutputManagement:
         p.with_suffix(".md").write_text("# Calendar")
         outputs = list_outputs("out-004")
         assert len(outputs) == 1
+
+
+class TestOutputFingerprints:
+    """Test per-output input fingerprints."""
+
+    def test_fingerprint_covers_only_listed_fields(self):
+        base = {"parties": {"plaintiffs": [{"name": "A"}]}, "relief_requested": ["damages"]}
+        changed = dict(base, relief_requested=["injunction"])
+        assert output_fingerprint(base, ("parties",)) == output_fingerprint(changed, ("parties",))
+        assert output_fingerprint(base) != output_fingerprint(changed)
+
+    def test_fingerprint_includes_engine_version(self, monkeypatch):
+        import ftc_engine
+        before = output_fingerprint({"a": 1})
+        monkeypatch.setattr(ftc_engine, "__version__", "99.0.0")
+        assert output_fingerprint({"a": 1}) != before
+
+    def test_record_and_check(self, isolated_cases):
+        create_case("fp-001")
+        p = get_output_path("fp-001", "js44").with_suffix(".md")
+        p.write_text("JS-44")
+        record_outputs("fp-001", {"js44": ("abc", [p.name])})
+        assert load_output_fingerprints("fp-001")["js44"]["files"] == ["js44.md"]
+        assert output_is_current("fp-001", "js44", "abc", ["js44.md"])
+        assert not output_is_current("fp-001", "js44", "def", ["js44.md"])
+        assert not output_is_current("fp-001", "js44", "abc", ["js44.md", "js44.docx"])
+        p.unlink()
+        assert not output_is_current("fp-001", "js44", "abc", ["js44.md"])
+
+    def test_manifest_not_listed_as_output(self, isolated_cases):
+        create_case("fp-002")
+        record_outputs("fp-002", {"js44": ("abc", [])})
+        assert list_outputs("fp-002") == []
@@ -0,0 +1,211 @@
+"""Tests for the local case-law mirror and pluggable monitor sources."""
+import csv
+import gzip
+import json
+
+import pytest
+from ftc_engine.caselaw_mirror import (
+    connect,
+    fts_query,
+    import_files,
+    mirror_stats,
+    search,
+    search_claims,
+)
+from ftc_engine.cli import run
+import ftc_engine.rule11_monitor as monitor
+
+OPINIONS = [
+    {"id": 1, "case_name": "Smith v. City of Miami", "court": "ca11", "date_filed": "2024-03-01",
+     "plain_text": "Section 1983 excessive force claim; qualified immunity denied."},
+    {"id": 2, "case_name": "Doe v. Sheriff", "court": "ca11", "date_filed": "2022-06-01",
+     "plain_text": "Section 1983 excessive force; qualified immunity granted."},
+    {"id": 3, "case_name": "Roe v. Officer", "court": "ca9", "date_filed": "2025-01-01",
+     "plain_text": "Section 1983 excessive force and qualified immunity."},
+    {"id": 4, "case_name": "Barnes v. Felix", "court": "scotus", "date_filed": "2025-05-15",
+     "plain_text": "<p>Excessive force under section 1983; qualified immunity analysis.</p>"},
+]
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    """A mirror loaded from a JSONL export, used as the default database."""
+    db = tmp_path / "opinions.db"
+    monkeypatch.setenv("FTC_CASELAW_DB", str(db))
+    export = tmp_path / "opinions.jsonl"
+    export.write_text("\n".join(json.dumps(o) for o in OPINIONS) + "\n")
+    import_files([export])
+    return db
+
+
+class TestImport:
+    """Test loading bulk exports."""
+
+    def test_jsonl(self, mirror):
+        stats = mirror_stats()
+        assert stats.opinions == 4
+        assert stats.courts == {"ca11": 2, "ca9": 1, "scotus": 1}
+        assert (stats.earliest, stats.latest) == ("2022-06-01", "2025-05-15")
+
+    def test_reimport_updates_in_place(self, mirror, tmp_path):
+        export = tmp_path / "update.jsonl"
+        export.write_text(json.dumps(dict(OPINIONS[0], case_name="Smith v. Miami")) + "\n")
+        assert import_files([export]) == 1
+        assert mirror_stats().opinions == 4
+        assert search("Smith Miami")[0]["caseName"] == "Smith v. Miami"
+        assert search("City") == []  # old name dropped from the index
+
+    def test_gzipped_csv(self, tmp_path):
+        db = tmp_path / "m.db"
+        export = tmp_path / "clusters.csv.gz"
+        with gzip.open(export, "wt", newline="") as f:
+            writer = csv.DictWriter(f, ["cluster_id", "caseName", "court_id", "dateFiled", "snippet"])
+            writer.writeheader()
+            writer.writerow({"cluster_id": "9", "caseName": "A v. B", "court_id": "CA11",
+                             "dateFiled": "2024-01-01T00:00:00", "snippet": "Monell policy"})
+        assert import_files([export], db) == 1
+        conn = connect(db)
+        result = search("monell", ["ca11"], conn=conn)
+        conn.close()
+        assert result[0]["dateFiled"] == "2024-01-01"
+
+    def test_opinion_and_cluster_ids_kept_apart(self, tmp_path):
+        db = tmp_path / "m.db"
+        opinions = tmp_path / "opinions.jsonl"
+        opinions.write_text(json.dumps(dict(OPINIONS[0], id=9)) + "\n")
+        clusters = tmp_path / "clusters.csv"
+        with open(clusters, "w", newline="") as f:
+            writer = csv.DictWriter(f, ["cluster_id", "caseName", "court_id", "dateFiled", "snippet"])
+            writer.writeheader()
+            writer.writerow({"cluster_id": "9", "caseName": "A v. B", "court_id": "ca11",
+                             "dateFiled": "2024-01-01", "snippet": "Monell policy"})
+        assert import_files([opinions, clusters], db) == 2
+        assert mirror_stats(db).opinions == 2
+        conn = connect(db)
+        keys = sorted(r[0] for r in conn.execute("SELECT source_id FROM opinions"))
+        conn.close()
+        assert keys == ["cluster:9", "opinion:9"]
+
+    def test_saved_search_response(self, tmp_path):
+        export = tmp_path / "search.json"
+        export.write_text(json.dumps({"results": [
+            {"caseName": "No Id v. Case", "court_id": "scotus", "dateFiled": "2024-01-01",
+             "snippet": "Bivens"},
+            {"court_id": "scotus"},  # no case name: skipped
+        ]}))
+        db = tmp_path / "m.db"
+        assert import_files([export, export], db) == 2
+        assert mirror_stats(db).opinions == 1  # same derived id both times
+
+    def test_bad_json(self, tmp_path):
+        bad = tmp_path / "bad.jsonl"
+        bad.write_text("{nope\n")
+        with pytest.raises(ValueError):
+            import_files([bad], tmp_path / "m.db")
+
+
+class TestSearch:
+    """Test full-text search with court and date filters."""
+
+    def test_filters_and_order(self, mirror):
+        results = search("excessive force qualified immunity", ["scotus", "ca11"], "2023-01-01")
+        assert [r["caseName"] for r in results] == ["Barnes v. Felix", "Smith v. City of Miami"]
+        assert "<p>" not in results[0]["snippet"]
+
+    def test_limit(self, mirror):
+        assert len(search("excessive force", limit=2)) == 2
+
+    def test_query_operators_are_literal(self, mirror):
+        assert fts_query('force" OR (NEAR') == '"force" "OR" "NEAR"'
+        assert search('excessive" OR *') == []
+        assert search("()") == []
+
+    def test_claim_searches(self, mirror):
+        found = search_claims(["1983_fourth_excessive_force", "apa_arbitrary_capricious"])
+        assert [r["caseName"] for r in found["1983_fourth_excessive_force"]["results"]] == [
+            "Barnes v. Felix", "Smith v. City of Miami"]
+        assert found["apa_arbitrary_capricious"] == {"results": []}
+
+    def test_no_mirror(self, tmp_path):
+        assert search_claims(["1983_fourth_excessive_force"], tmp_path / "none.db") == {}
+        assert not (tmp_path / "none.db").exists()
+
+
+class TestMonitorSource:
+    """Test the monitor's online mode against the local mirror."""
+
+    def test_local_source(self, mirror, sample_case):
+        check = monitor.check_claim_viability(
+            sample_case, "1983_fourth_excessive_force", mode="online", source="local")
+        assert check.data_source == "local"
+        online = [i for i in check.issues if i.description.startswith("Recent decision")]
+        assert [i.citation for i in online] == ["Barnes v. Felix", "Smith v. City of Miami"]
+        assert online[0].date == "2025-05-15"
+
+    def test_env_selects_source(self, mirror, monkeypatch, sample_case):
+        monkeypatch.setenv("FTC_VIABILITY_SOURCE", "local")
+        report = monitor.generate_monitor_report(
+            sample_case, claim_keys=["1983_fourth_excessive_force"], mode="online")
+        assert report.checks[0].data_source == "local"
+
+    def test_empty_mirror_falls_back(self, tmp_path, monkeypatch, sample_case):
+        monkeypatch.setenv("FTC_CASELAW_DB", str(tmp_path / "none.db"))
+        check = monitor.check_claim_viability(
+            sample_case, "1983_fourth_excessive_force", mode="online", source="local")
+        assert check.data_source == "built_in"
+
+    def test_unknown_source(self, sample_case):
+        with pytest.raises(ValueError, match="courtlistener, local"):
+            monitor.claim_lookups(["1983_fourth_excessive_force"], "online", "westlaw")
+
+    def test_registered_source(self, monkeypatch, sample_case):
+        monkeypatch.setitem(monitor._SOURCES, "fixture", lambda keys: {
+            k: {"results": [{"caseName": "Fixture v. Case", "dateFiled": "2025-01-01"}]} for k in keys})
+        check = monitor.check_claim_viability(
+            sample_case, "1983_fourth_excessive_force", mode="online", source="fixture")
+        assert check.data_source == "fixture"
+        assert "fixture" in monitor.list_sources()
+
+    def test_null_results(self, monkeypatch, sample_case):
+        monkeypatch.setitem(monitor._SOURCES, "fixture", lambda keys: {k: {"results": None} for k in keys})
+        check = monitor.check_claim_viability(
+            sample_case, "1983_fourth_excessive_force", mode="online", source="fixture")
+        assert not [i for i in check.issues if i.description.startswith("Recent decision")]
+
+
+class TestCli:
+    """Test `ftc caselaw` and `ftc monitor --source`."""
+
+    def test_import_search_stats(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("FTC_CASELAW_DB", str(tmp_path / "m.db"))
+        export = tmp_path / "o.jsonl"
+        export.write_text("\n".join(json.dumps(o) for o in OPINIONS))
+        run(["caselaw", "import", str(export)])
+        assert "Imported 4 opinion(s)" in capsys.readouterr().out
+        run(["caselaw", "search", "excessive", "force", "--court", "ca11,scotus", "--after", "2023-01-01"])
+        out = capsys.readouterr().out
+        assert "Barnes v. Felix" in out and "Roe v. Officer" not in out
+        run(["caselaw", "stats", "--format", "json"])
+        assert json.loads(capsys.readouterr().out)["data"]["opinions"] == 4
+
+    def test_import_missing_file(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("FTC_CASELAW_DB", str(tmp_path / "m.db"))
+        with pytest.raises(SystemExit):
+            run(["caselaw", "import", str(tmp_path / "missing.jsonl")])
+        assert "Error" in capsys.readouterr().err
+
+    def test_no_mirror_imported(self, tmp_path, monkeypatch, capsys):
+        db = tmp_path / "m.db"
+        monkeypatch.setenv("FTC_CASELAW_DB", str(db))
+        for args in (["search", "excessive", "force"], ["stats"]):
+            with pytest.raises(SystemExit):
+                run(["caselaw", *args])
+            assert "No case-law mirror imported" in capsys.readouterr().err
+        assert not db.exists()
+
+    def test_monitor_unknown_source(self, tmp_path, sample_case, capsys):
+        case_file = tmp_path / "case.json"
+        case_file.write_text(json.dumps(sample_case))
+        with pytest.raises(SystemExit):
+            run(["monitor", "-i", str(case_file), "--mode", "online", "--source", "westlaw"])
+        assert "Unknown case-law source" in capsys.readouterr().err
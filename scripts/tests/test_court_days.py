@@ -0,0 +1,110 @@
+"""Tests for FRCP 6(a) court-day arithmetic."""
+from datetime import date, timedelta
+from ftc_engine.court_days import (
+    federal_holidays,
+    holiday_name,
+    is_court_day,
+    roll_forward,
+    roll_backward,
+    compute_deadline,
+    court_days_between,
+    add_court_days,
+)
+
+
+class TestFederalHolidays:
+    """Test the federal legal holiday table."""
+
+    def test_2026_holidays(self):
+        holidays = federal_holidays(2026)
+        assert date(2026, 1, 19) in holidays     # MLK Day, 3rd Monday
+        assert date(2026, 5, 25) in holidays     # Memorial Day, last Monday
+        assert date(2026, 6, 19) in holidays     # Juneteenth
+        assert date(2026, 7, 3) in holidays      # July 4 is a Saturday
+        assert date(2026, 11, 26) in holidays    # Thanksgiving
+        assert len(holidays) == 11
+
+    def test_sunday_holiday_observed_monday(self):
+        assert holiday_name(date(2027, 7, 5)) == "Independence Day"
+
+    def test_saturday_new_year_observed_prior_december(self):
+        assert holiday_name(date(2021, 12, 31)) == "New Year's Day"
+        assert date(2022, 1, 1) not in federal_holidays(2022)
+
+    def test_no_juneteenth_before_2021(self):
+        assert date(2020, 6, 19) not in federal_holidays(2020)
+
+
+class TestRolling:
+    """Test weekend/holiday roll-forward and roll-backward."""
+
+    def test_court_day_unchanged(self):
+        assert is_court_day(date(2026, 3, 2))
+        assert roll_forward(date(2026, 3, 2)) == date(2026, 3, 2)
+        assert roll_backward(date(2026, 3, 2)) == date(2026, 3, 2)
+
+    def test_weekend_rolls(self):
+        assert roll_forward(date(2026, 5, 30)) == date(2026, 6, 1)
+        assert roll_backward(date(2026, 5, 30)) == date(2026, 5, 29)
+
+    def test_weekend_into_holiday(self):
+        # Sat 2026-05-23 -> Sun -> Memorial Day -> Tue
+        assert roll_forward(date(2026, 5, 23)) == date(2026, 5, 26)
+
+    def test_crosses_year_boundary(self):
+        # Sat 2022-01-01 (observed Fri 12/31) -> Mon 2022-01-03
+        assert roll_forward(date(2021, 12, 31)) == date(2022, 1, 3)
+        assert roll_backward(date(2022, 1, 2)) == date(2021, 12, 30)
+
+
+class TestComputeDeadline:
+    """Test FRCP 6(a)(1) period computation."""
+
+    def test_plain_period(self):
+        assert compute_deadline(date(2026, 1, 6), 90) == date(2026, 4, 6)
+
+    def test_period_ending_on_weekend(self):
+        assert compute_deadline(date(2026, 3, 1), 90) == date(2026, 6, 1)
+
+    def test_backward_period_rolls_backward(self):
+        # 14 days before Mon 2026-06-15 is Mon 6/1; 15 days is Sun 5/31 -> Fri 5/29
+        assert compute_deadline(date(2026, 6, 15), -14) == date(2026, 6, 1)
+        assert compute_deadline(date(2026, 6, 15), -15) == date(2026, 5, 29)
+
+    def test_matches_naive_scan(self):
+        start = date(2025, 12, 1)
+        for days in range(0, 800, 7):
+            naive = start + timedelta(days=days)
+            while naive.weekday() >= 5 or holiday_name(naive):
+                naive += timedelta(days=1)
+            assert compute_deadline(start, days) == naive
+
+
+class TestCourtDayCounting:
+    """Test O(1) court-day counting and offsets."""
+
+    def test_count_within_week(self):
+        # Fri -> next Fri: Mon..Fri = 5
+        assert court_days_between(date(2026, 3, 6), date(2026, 3, 13)) == 5
+
+    def test_count_across_years(self):
+        start, end = date(2025, 11, 1), date(2027, 2, 1)
+        naive = sum(
+            1 for i in range(1, (end - start).days + 1)
+            if is_court_day(start + timedelta(days=i))
+        )
+        assert court_days_between(start, end) == naive
+        assert court_days_between(end, start) == -naive
+
+    def test_add_court_days_skips_holiday(self):
+        # Fri 2026-05-22 + 1 court day skips the weekend and Memorial Day
+        assert add_court_days(date(2026, 5, 22), 1) == date(2026, 5, 26)
+        assert add_court_days(date(2026, 5, 26), -1) == date(2026, 5, 22)
+
+    def test_add_court_days_round_trip(self):
+        start = date(2026, 12, 20)
+        for n in (1, 5, 30, 300):
+            end = add_court_days(start, n)
+            assert is_court_day(end)
+            assert court_days_between(start, end) == n
+            assert add_court_days(end, -n) <= start
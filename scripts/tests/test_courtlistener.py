@@ -0,0 +1,304 @@
+"""Tests for the cached CourtListener client, against a local stub server."""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from ftc_engine.courtlistener import (
+    CachedResponse,
+    CourtListenerError,
+    ResponseCache,
+    TokenBucket,
+    fetch_json,
+    fetch_many,
+    search_url,
+    wait_for_revalidation,
+)
+
+SEARCH_BODY = {"results": [{"caseName": "Smith v. Jones", "dateFiled": "2025-01-02",
+                            "snippet": "qualified immunity"}]}
+
+
+class StubCourtListener(BaseHTTPRequestHandler):
+    """Answers every GET with SEARCH_BODY and ETag "v1" (304 when it matches)."""
+
+    requests: list = []
+    status = 200
+
+    def do_GET(self):
+        type(self).requests.append(dict(self.headers))
+        if self.status != 200:
+            self.send_response(self.status)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        body = json.dumps(SEARCH_BODY).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.send_header("Last-Modified", "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    StubCourtListener.requests = []
+    StubCourtListener.status = 200
+    server = _serve(StubCourtListener)
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/rest/v4"
+    server.shutdown()
+    server.server_close()
+
+
+class SlowCourtListener(BaseHTTPRequestHandler):
+    """Keep-alive stub; `?q=<name>` answers {"results": [{"caseName": name}]}
+    after DELAYS[name] seconds, and records which connection served it."""
+
+    protocol_version = "HTTP/1.1"
+    DELAYS: dict = {}
+    served: list = []
+
+    def do_GET(self):
+        from urllib.parse import parse_qs, urlsplit
+        name = parse_qs(urlsplit(self.path).query)["q"][0]
+        time.sleep(self.DELAYS.get(name, 0))
+        type(self).served.append((name, self.client_address[1], time.monotonic()))
+        body = json.dumps({"results": [{"caseName": name}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def slow_stub():
+    SlowCourtListener.DELAYS = {}
+    SlowCourtListener.served = []
+    server = _serve(SlowCourtListener)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResponseCache:
+    return ResponseCache(tmp_path / "cl", ttl=60, stale=600)
+
+
+def _age(cache: ResponseCache, url: str, seconds: float) -> None:
+    entry = cache.get(url)
+    entry.fetched_at -= seconds
+    cache.put(entry)
+
+
+class TestFetchJson:
+    """Test TTL, conditional requests and stale-while-revalidate."""
+
+    def test_fresh_entry_served_from_disk(self, stub, cache):
+        url = search_url("1983_fourth_excessive_force", stub)
+        assert fetch_json(url, "tok", cache) == SEARCH_BODY
+        assert fetch_json(url, "tok", cache) == SEARCH_BODY
+        assert len(StubCourtListener.requests) == 1
+        assert StubCourtListener.requests[0]["Authorization"] == "Token tok"
+
+    def test_expired_entry_revalidated_with_304(self, stub, cache):
+        url = search_url("title_vii_disparate_treatment", stub)
+        fetch_json(url, "tok", cache)
+        _age(cache, url, 60 + 600 + 1)
+        assert fetch_json(url, "tok", cache) == SEARCH_BODY
+        second = StubCourtListener.requests[1]
+        assert second["If-None-Match"] == '"v1"'
+        assert second["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert cache.get(url).age() < 5  # renewed
+
+    def test_stale_served_then_revalidated(self, stub, cache):
+        url = search_url("bivens_fifth_due_process", stub)
+        fetch_json(url, "tok", cache)
+        _age(cache, url, 120)
+        assert fetch_json(url, "tok", cache) == SEARCH_BODY
+        wait_for_revalidation(5)
+        assert len(StubCourtListener.requests) == 2
+        assert cache.get(url).age() < 5
+
+    def test_finished_revalidations_pruned(self, stub, cache):
+        from ftc_engine import courtlistener
+        url = search_url("bivens_fourth_search", stub)
+        fetch_json(url, "tok", cache)
+        for _ in range(20):
+            _age(cache, url, 120)
+            fetch_json(url, "tok", cache)
+            courtlistener._revalidations[-1].join(5)
+        assert len(courtlistener._revalidations) == 1
+        wait_for_revalidation(5)
+
+    def test_stale_if_error(self, stub, cache):
+        url = search_url("apa_arbitrary_capricious", stub)
+        fetch_json(url, "tok", cache)
+        _age(cache, url, 10_000)
+        StubCourtListener.status = 503
+        assert fetch_json(url, "tok", cache) == SEARCH_BODY
+
+    def test_error_without_cache(self, stub, cache):
+        StubCourtListener.status = 500
+        with pytest.raises(CourtListenerError, match="500"):
+            fetch_json(search_url("x", stub), "tok", cache)
+
+    def test_unreachable(self, cache):
+        with pytest.raises(CourtListenerError):
+            fetch_json("http://127.0.0.1:9/search/", "tok", cache, timeout=1)
+
+
+class TestResponseCache:
+    """Test on-disk storage and size-based eviction."""
+
+    def test_round_trip(self, cache):
+        cache.put(CachedResponse("u", {"a": 1}, 5.0, '"e"'))
+        assert cache.get("u") == CachedResponse("u", {"a": 1}, 5.0, '"e"')
+        assert cache.get("other") is None
+
+    def test_corrupt_entry_ignored(self, cache):
+        cache.put(CachedResponse("u", {}, 1.0))
+        next(cache.directory.glob("*.json")).write_text("{broken")
+        assert cache.get("u") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=60, max_bytes=10**9)
+        for i in range(3):
+            cache.put(CachedResponse(f"u{i}", {"pad": "x" * 500}, 1.0))
+            os.utime(cache._path(f"u{i}"), (i + 1, i + 1))
+        cache.get("u0")  # most recently used now
+        cache.max_bytes = 2 * cache._path("u0").stat().st_size
+        assert cache.evict() == 1
+        assert cache.get("u1") is None
+        assert cache.get("u0") and cache.get("u2")
+
+
+class TestMonitorOnline:
+    """Test online monitor mode through the cache."""
+
+    def test_issues_from_stub(self, stub, monkeypatch, sample_case):
+        from ftc_engine.rule11_monitor import check_claim_viability
+        monkeypatch.setenv("COURTLISTENER_API_TOKEN", "tok")
+        monkeypatch.setenv("FTC_COURTLISTENER_URL", stub)
+        for _ in range(3):
+            check = check_claim_viability(sample_case, "1983_fourth_excessive_force", mode="online")
+        assert check.data_source == "courtlistener"
+        assert any("Smith v. Jones" in i.description for i in check.issues)
+        assert len(StubCourtListener.requests) == 1
+
+    def test_report_fetches_claims_concurrently(self, slow_stub, monkeypatch, sample_case):
+        from ftc_engine.courtlistener import SEARCH_TERMS
+        from ftc_engine.rule11_monitor import generate_monitor_report
+        monkeypatch.setenv("COURTLISTENER_API_TOKEN", "tok")
+        monkeypatch.setenv("FTC_COURTLISTENER_URL", slow_stub)
+        claims = ["1983_fourth_excessive_force", "1983_monell_municipal_liability",
+                  "title_vii_disparate_treatment"]
+        SlowCourtListener.DELAYS = {SEARCH_TERMS[c]: 0.3 for c in claims}
+        start = time.monotonic()
+        report = generate_monitor_report(sample_case, claim_keys=claims, mode="online")
+        assert time.monotonic() - start < 0.8  # serially: 0.9s
+        assert [c.claim_key for c in report.checks] == claims
+        for check in report.checks:
+            assert check.data_source == "courtlistener"
+            assert any(SEARCH_TERMS[check.claim_key] in i.citation for i in check.issues)
+
+    def test_failure_falls_back_offline(self, stub, monkeypatch, sample_case):
+        from ftc_engine.rule11_monitor import check_claim_viability
+        monkeypatch.setenv("COURTLISTENER_API_TOKEN", "tok")
+        monkeypatch.setenv("FTC_COURTLISTENER_URL", stub)
+        StubCourtListener.status = 502
+        check = check_claim_viability(sample_case, "1983_monell_municipal_liability", mode="online")
+        assert check.data_source == "built_in"
+
+
+def _urls(base: str, names) -> list[str]:
+    return [f"{base}/search/?q={n}" for n in names]
+
+
+class TestFetchMany:
+    """Test concurrent fetching: pooling, pacing, deadlines, ordering."""
+
+    def test_concurrent_and_in_input_order(self, slow_stub, cache):
+        names = ["a", "b", "c", "d"]
+        SlowCourtListener.DELAYS = {"a": 0.4, "b": 0.3, "c": 0.2, "d": 0.1}
+        start = time.monotonic()
+        results = fetch_many(_urls(slow_stub, names), "tok", cache, connections=4, rate=100)
+        elapsed = time.monotonic() - start
+        assert elapsed < 0.9  # serially: 1.0s
+        assert [r["results"][0]["caseName"] for r in results.values()] == names
+        assert list(results) == _urls(slow_stub, names)
+        assert [n for n, _, _ in SlowCourtListener.served] != names  # finished out of order
+
+    def test_connections_reused(self, slow_stub, cache):
+        names = [f"q{i}" for i in range(8)]
+        fetch_many(_urls(slow_stub, names), "tok", cache, connections=2, rate=100)
+        assert len({port for _, port, _ in SlowCourtListener.served}) <= 2
+
+    def test_cached_urls_not_requested(self, slow_stub, cache):
+        urls = _urls(slow_stub, ["a", "b"])
+        fetch_many(urls[:1], "tok", cache, rate=100)
+        results = fetch_many(urls, "tok", cache, rate=100)
+        assert [n for n, _, _ in SlowCourtListener.served] == ["a", "b"]
+        assert results[urls[0]]["results"][0]["caseName"] == "a"
+
+    def test_deadline(self, slow_stub, cache):
+        SlowCourtListener.DELAYS = {"slow": 1.0}
+        urls = _urls(slow_stub, ["slow", "fast"])
+        start = time.monotonic()
+        results = fetch_many(urls, "tok", cache, rate=100, timeout=0.3)
+        assert results[urls[0]] is None
+        assert results[urls[1]]["results"][0]["caseName"] == "fast"
+        assert time.monotonic() - start < 0.9
+
+    def test_rate_limited(self, slow_stub, cache):
+        fetch_many(_urls(slow_stub, [f"q{i}" for i in range(13)]), "tok", cache, rate=10)
+        times = sorted(t for _, _, t in SlowCourtListener.served)
+        assert times[-1] - times[0] >= 0.25  # a burst of 10, then 3 more 0.1s apart
+
+    def test_duplicate_urls_fetched_once(self, slow_stub, cache):
+        url = _urls(slow_stub, ["a"])[0]
+        assert list(fetch_many([url, url], "tok", cache, rate=100)) == [url]
+        assert len(SlowCourtListener.served) == 1
+
+
+class TestTokenBucket:
+    """Test the rate limiter with a fake clock."""
+
+    def test_burst_then_paced(self):
+        import asyncio
+        now = [0.0]
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+
+        async def sleep(seconds):
+            now[0] += seconds
+
+        async def run():
+            for _ in range(4):
+                await bucket.acquire()
+            return now[0]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(asyncio, "sleep", sleep)
+            assert asyncio.run(run()) == pytest.approx(1.0)  # 2 free, then 0.5s each
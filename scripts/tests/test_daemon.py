@@ -0,0 +1,203 @@
+"""Tests for the ftc daemon and its thin client."""
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from ftc_engine import __version__
+from ftc_engine import daemon
+from ftc_engine.cli import run
+
+
+@pytest.fixture
+def socket_dir():
+    # Unix socket paths are limited to ~100 bytes, so stay out of pytest's tmp_path
+    path = Path(tempfile.mkdtemp(prefix="ftc"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_dir, monkeypatch):
+    """A daemon serving on a private socket, stopped after the test."""
+    path = socket_dir / "ftc.sock"
+    monkeypatch.setenv("FTC_SOCKET", str(path))
+    monkeypatch.delenv("FTC_NO_DAEMON", raising=False)
+    ready = threading.Event()
+    thread = threading.Thread(target=daemon.serve, kwargs={"path": path, "ready": ready}, daemon=True)
+    thread.start()
+    assert ready.wait(30)
+    yield path
+    try:
+        daemon.call("shutdown", path=path)
+    except OSError:
+        pass
+    thread.join(10)
+
+
+def _raw(path, payload: bytes) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(payload + b"\n")
+        with sock.makefile("rb") as reader:
+            return json.loads(reader.readline())
+
+
+class TestDaemonProtocol:
+    """Test JSON-RPC handling."""
+
+    def test_ping(self, running_daemon):
+        info = daemon.call("ping", path=running_daemon)
+        assert info["version"] == __version__
+        assert info["requests"] >= 1
+
+    def test_command_matches_local_run(self, running_daemon, capsys):
+        run(["claims"])
+        local = capsys.readouterr().out
+        result = daemon.call("claims", {"args": [], "version": __version__}, running_daemon)
+        assert result["exit_code"] == 0
+        assert result["stdout"] == local
+
+    def test_runs_in_client_cwd(self, running_daemon, sample_case, tmp_path):
+        (tmp_path / "case.json").write_text(json.dumps(sample_case))
+        result = daemon.call("suggest", {"args": ["-i", "case.json"], "cwd": str(tmp_path)}, running_daemon)
+        assert result["exit_code"] == 0
+        assert "1983" in result["stdout"]
+
+    def test_runs_with_client_environment(self, running_daemon, sample_case, tmp_path, monkeypatch):
+        monkeypatch.delenv("FTC_VIABILITY_SOURCE", raising=False)
+        (tmp_path / "case.json").write_text(json.dumps(sample_case))
+        args = ["-i", "case.json", "--mode", "online"]
+        result = daemon.call("monitor", {"args": args, "cwd": str(tmp_path),
+                                         "env": {"FTC_VIABILITY_SOURCE": "westlaw", "PATH": ""}},
+                             running_daemon)
+        assert result["exit_code"] == 1
+        assert "Unknown case-law source" in result["stderr"]
+        assert "FTC_VIABILITY_SOURCE" not in os.environ and os.environ["PATH"]
+        with pytest.raises(daemon.DaemonError) as e:
+            daemon.call("claims", {"env": {"FTC_CASELAW_DB": 1}}, running_daemon)
+        assert e.value.code == daemon.INVALID_PARAMS
+
+    def test_binary_output_refused_cleanly(self, monkeypatch):
+        monkeypatch.setattr("ftc_engine.output.encode", lambda payload, fmt: b"\x80")
+        result = daemon.run_command("claims", ["--format=msgpack"])
+        assert result["exit_code"] == 1
+        assert "binary stdout" in result["stderr"] and "Traceback" not in result["stderr"]
+
+    def test_district_files_edited_between_commands(self, tmp_path, monkeypatch):
+        import ftc_engine.districts as districts
+        user_dir = tmp_path / "districts"
+        user_dir.mkdir()
+        monkeypatch.setattr(districts, "_USER_DISTRICTS_DIR", user_dir)
+        monkeypatch.setattr(districts, "_SNAPSHOT_FILE", tmp_path / "cache" / "districts.snapshot")
+        districts.reload_districts()
+        try:
+            assert "Western District of Texas" not in daemon.run_command("district", ["list"])["stdout"]
+            (user_dir / "texas.json").write_text(json.dumps({"districts": [{
+                "code": "wdtx", "name": "Western District of Texas", "circuit": "5th Circuit",
+                "circuit_number": 5, "state": "Texas",
+            }]}))
+            assert "Western District of Texas" in daemon.run_command("district", ["list"])["stdout"]
+        finally:
+            monkeypatch.undo()
+            districts.reload_districts()
+
+    def test_exit_code_and_stderr_returned(self, running_daemon):
+        result = daemon.call("info", {"args": ["no_such_claim"]}, running_daemon)
+        assert result["exit_code"] != 0
+        result = daemon.call("deposition", {"args": []}, running_daemon)
+        assert result["exit_code"] == 2
+        assert "required" in result["stderr"]
+
+    def test_errors(self, running_daemon):
+        assert _raw(running_daemon, b"{not json")["error"]["code"] == daemon.PARSE_ERROR
+        assert _raw(running_daemon, b"[1, 2]")["error"]["code"] == daemon.INVALID_REQUEST
+        with pytest.raises(daemon.DaemonError) as e:
+            daemon.call("rm", path=running_daemon)
+        assert e.value.code == daemon.METHOD_NOT_FOUND
+        with pytest.raises(daemon.DaemonError) as e:
+            daemon.call("new", path=running_daemon)
+        assert e.value.code == daemon.METHOD_NOT_FOUND
+        with pytest.raises(daemon.DaemonError) as e:
+            daemon.call("claims", {"args": "claims"}, running_daemon)
+        assert e.value.code == daemon.INVALID_PARAMS
+        with pytest.raises(daemon.DaemonError) as e:
+            daemon.call("claims", {"version": "0.0.1"}, running_daemon)
+        assert e.value.code == daemon.VERSION_MISMATCH
+
+    def test_second_daemon_refused(self, running_daemon):
+        with pytest.raises(RuntimeError, match="already running"):
+            daemon.serve(running_daemon)
+
+    def test_shutdown_removes_socket(self, running_daemon):
+        assert daemon.call("shutdown", path=running_daemon) == {"stopped": True}
+        for _ in range(100):
+            if not running_daemon.exists():
+                break
+            threading.Event().wait(0.05)
+        assert not running_daemon.exists()
+
+    def test_idle_timeout(self, socket_dir):
+        path = socket_dir / "idle.sock"
+        thread = threading.Thread(target=daemon.serve, kwargs={"path": path, "idle_timeout": 0.3}, daemon=True)
+        thread.start()
+        thread.join(30)
+        assert not thread.is_alive()
+        assert not path.exists()
+
+    def test_socket_directory_created_private(self, socket_dir):
+        path = socket_dir / "run" / "idle.sock"
+        daemon.serve(path, idle_timeout=0.3)
+        assert (path.parent.stat().st_mode & 0o777) == 0o700
+
+    def test_shared_socket_directory_refused(self, socket_dir):
+        socket_dir.chmod(0o1777)
+        with pytest.raises(RuntimeError, match="writable by other users"):
+            daemon.serve(socket_dir / "ftc.sock")
+        assert (socket_dir.stat().st_mode & 0o7777) == 0o1777
+
+    def test_runtime_dir_default(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("FTC_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert daemon.socket_path() == tmp_path / "ftc" / "ftc.sock"
+
+
+class TestClient:
+    """Test transparent use of the daemon by ordinary commands."""
+
+    def test_remote_output_printed(self, running_daemon, capsys):
+        run(["claims"])
+        local = capsys.readouterr().out
+        assert daemon.try_remote(["claims"]) == 0
+        assert capsys.readouterr().out == local
+        assert daemon.try_remote(["info", "no_such_claim"]) == 1
+        assert "Unknown claim" in capsys.readouterr().out
+
+    def test_falls_back_without_daemon(self, socket_dir, monkeypatch):
+        monkeypatch.setenv("FTC_SOCKET", str(socket_dir / "ftc.sock"))
+        monkeypatch.delenv("FTC_NO_DAEMON", raising=False)
+        assert daemon.try_remote(["claims"]) is None
+
+    def test_falls_back_on_stale_socket(self, socket_dir, monkeypatch):
+        path = socket_dir / "ftc.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()  # file left behind, nobody listening
+        monkeypatch.setenv("FTC_SOCKET", str(path))
+        monkeypatch.delenv("FTC_NO_DAEMON", raising=False)
+        assert daemon.try_remote(["claims"]) is None
+
+    def test_local_only_commands(self, running_daemon, monkeypatch):
+        assert daemon.try_remote(["new"]) is None
+        assert daemon.try_remote(["--help"]) is None
+        assert daemon.try_remote(["risk", "--batch", "-"]) is None
+        assert daemon.try_remote(["risk", "--batch", "intake.jsonl"]) is None
+        assert daemon.try_remote(["risk", "--batch=intake.jsonl"]) is None
+        for args in (["--format", "msgpack"], ["--format=msgpack"], ["--form", "msgpack"]):
+            assert daemon.try_remote(["claims", *args]) is None
+        monkeypatch.setenv("FTC_NO_DAEMON", "1")
+        assert daemon.try_remote(["claims"]) is None
@@ -11,6 +11,7 @@ from ftc_engine.districts import (
     get_page_limits,
     get_formatting_config,
     get_district_name,
+    find_district,
     format_district_info,
     format_district_list,
     DistrictConfig,
@@ -189,3 +190,130 @@ class TestFormattingConfig:
     def test_district_name_helper(self):
         assert get_district_name("sdfl") == "Southern District of Florida"
         assert get_district_name("zzzzz") == "Middle District of Florida"  # fallback
+
+
+class TestConfigCache:
+    """Test the mtime-validated in-process config cache."""
+
+    def _isolate(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("ftc_engine.districts._CONFIG_FILE", tmp_path / "config.json")
+        monkeypatch.setattr("ftc_engine.districts._CONFIG_DIR", tmp_path)
+        return tmp_path / "config.json"
+
+    def test_repeated_lookups_read_file_once(self, tmp_path, monkeypatch):
+        cfg = self._isolate(tmp_path, monkeypatch)
+        cfg.write_text(json.dumps({"active_district": "sdny"}))
+        reads = []
+        original = Path.read_text
+
+        def counting_read(self, *args, **kwargs):
+            if self == cfg:
+                reads.append(1)
+            return original(self, *args, **kwargs)
+        monkeypatch.setattr(Path, "read_text", counting_read)
+
+        for _ in range(20):
+            get_active_district()
+            get_district_name()
+            get_page_limits()
+            get_formatting_config()
+            get_sol_days_for_district("1983_fourth_excessive_force")
+        assert len(reads) == 1
+
+    def test_external_edit_invalidates(self, tmp_path, monkeypatch):
+        import os
+        cfg = self._isolate(tmp_path, monkeypatch)
+        cfg.write_text(json.dumps({"active_district": "sdny"}))
+        assert get_active_district().config.code == "sdny"
+        cfg.write_text(json.dumps({"active_district": "ndcal"}))
+        st = cfg.stat()
+        os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert get_active_district().config.code == "ndcal"
+
+    def test_set_updates_cache(self, tmp_path, monkeypatch):
+        self._isolate(tmp_path, monkeypatch)
+        assert get_active_district().config.code == "mdfl"
+        set_active_district("edva")
+        assert get_active_district().config.code == "edva"
+        assert get_district_name() == "Eastern District of Virginia"
+
+    def test_loaded_config_is_a_copy(self, tmp_path, monkeypatch):
+        self._isolate(tmp_path, monkeypatch)
+        _save_config({"active_district": "ddc"})
+        _load_config()["active_district"] = "sdfl"
+        assert _load_config()["active_district"] == "ddc"
+
+
+class TestDistrictDatabase:
+    """Test the externalized, snapshot-backed district data."""
+
+    @pytest.fixture
+    def district_files(self, tmp_path, monkeypatch):
+        import ftc_engine.districts as districts
+        user_dir = tmp_path / "districts"
+        user_dir.mkdir()
+        monkeypatch.setattr(districts, "_USER_DISTRICTS_DIR", user_dir)
+        monkeypatch.setattr(districts, "_SNAPSHOT_FILE", tmp_path / "cache" / "districts.snapshot")
+        districts.reload_districts()
+        yield user_dir
+        monkeypatch.undo()
+        districts.DISTRICTS.reload()
+
+    def test_snapshot_written(self, district_files, tmp_path):
+        assert len(DISTRICTS) == 7
+        assert (tmp_path / "cache" / "districts.snapshot").exists()
+
+    def test_lookup_materializes_single_district(self, district_files):
+        get_district("sdny")
+        assert set(DISTRICTS._configs) == {"sdny"}
+
+    def test_user_file_adds_district_with_judges(self, district_files):
+        import ftc_engine.districts as districts
+        (district_files / "more.json").write_text(json.dumps({"districts": [{
+            "code": "wdtx", "name": "Western District of Texas", "circuit": "5th Circuit",
+            "circuit_number": 5, "state": "Texas", "divisions": ["Austin"],
+            "judges": [{"name": "Jane Roe", "title": "District Judge", "division": "Austin"}],
+        }]}))
+        districts.reload_districts()
+        d = get_district("wdtx")
+        assert d.judges[0].name == "Jane Roe"
+        assert d.motion_page_limit == 25  # dataclass default
+        assert get_sol_days_for_district("1983_fourth_excessive_force", "wdtx") == 730
+        assert find_district("Western District of Texas").code == "wdtx"
+
+    def test_user_file_overrides_fields(self, district_files):
+        import ftc_engine.districts as districts
+        (district_files / "override.json").write_text(json.dumps([
+            {"code": "mdfl", "motion_page_limit": 30},
+        ]))
+        districts.reload_districts()
+        d = get_district("mdfl")
+        assert d.motion_page_limit == 30
+        assert d.name == "Middle District of Florida"
+
+    def test_unknown_field_rejected(self, district_files):
+        import ftc_engine.districts as districts
+        (district_files / "bad.json").write_text(json.dumps([{"code": "mdfl", "bogus": 1}]))
+        with pytest.raises(ValueError, match="Unknown district field"):
+            districts.reload_districts()
+        (district_files / "bad.json").unlink()
+
+    def test_stale_snapshot_rebuilt(self, district_files):
+        import marshal
+        import ftc_engine.districts as districts
+        assert get_district("wdtx") is None
+        before = marshal.loads(districts._SNAPSHOT_FILE.read_bytes())["sources"]
+        extra = district_files / "late.json"
+        extra.write_text(json.dumps([{"code": "wdtx", "name": "Western District of Texas",
+                                      "circuit": "5th Circuit", "circuit_number": 5, "state": "Texas"}]))
+        assert "wdtx" in districts._DistrictTable()  # a fresh table loads through _load_snapshot
+        after = marshal.loads(districts._SNAPSHOT_FILE.read_bytes())["sources"]
+        assert after != before
+        assert after[-1][0] == str(extra)
+
+    def test_compile_requires_core_fields(self, tmp_path):
+        from ftc_engine.districts import compile_district_snapshot
+        src = tmp_path / "partial.json"
+        src.write_text(json.dumps([{"code": "xx", "name": "Nowhere"}]))
+        with pytest.raises(ValueError, match="missing required"):
+            compile_district_snapshot([src])
@@ -405,6 +405,14 @@ class TestGenerateRecommendations:
         recs = generate_recommendations([self._make_analysis("complaint")])
         assert any("Answer or MTD" in r for r in recs)
 
+    def test_complaint_due_date_from_document(self):
+        from ftc_engine.doc_analyzer import ExtractedEntity
+        a = self._make_analysis("complaint")
+        a.dates = [ExtractedEntity("date", "March 1, 2026", 0.9, "context")]
+        recs = generate_recommendations([a])
+        # Day 21 is Sunday 2026-03-22; FRCP 6(a)(1)(C) runs it to Monday
+        assert any("due 2026-03-23" in r for r in recs)
+
     def test_discovery_recommendation(self):
         recs = generate_recommendations([self._make_analysis("discovery_request")])
         assert any("30 days" in r for r in recs)
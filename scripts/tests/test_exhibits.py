@@ -14,9 +14,39 @@ from ftc_engine.exhibits import (
     _extract_date_from_text,
     _number_exhibit,
     _map_to_claims,
+    pdf_page_count,
+    scan_documents,
 )
 
 
+def _pdf(pages: int) -> bytes:
+    import io
+    from PyPDF2 import PdfWriter
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(612, 792)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+@pytest.fixture
+def production(tmp_path):
+    """A nested exhibit tree with a duplicate, hidden files and an unsupported type."""
+    root = tmp_path / "production"
+    (root / "Medical Records").mkdir(parents=True)
+    (root / "police" / "reports").mkdir(parents=True)
+    (root / ".git").mkdir()
+    (root / "Medical Records" / "er_visit_2025-06-15.pdf").write_bytes(_pdf(3))
+    (root / "police" / "reports" / "arrest_report.pdf").write_bytes(_pdf(5))
+    (root / "police" / "arrest_report_copy.pdf").write_bytes(_pdf(5))
+    (root / "scene_photo.jpg").write_bytes(b"\xff\xd8jpeg")
+    (root / ".git" / "index.txt").write_text("x")
+    (root / ".hidden.pdf").write_bytes(_pdf(1))
+    (root / "notes.md").write_text("skip")
+    return root
+
+
 @pytest.fixture
 def exhibit_case(sample_case):
     """Sample case with rich document references."""
@@ -211,6 +241,82 @@ class TestIndexGeneration:
         assert descs.count("Medical records from Tampa General Hospital") == 1
 
 
+class TestDirectoryScan:
+    """Test the recursive scanner: hashing, page counts, dedup, Bates ranges."""
+
+    def test_walks_tree(self, production):
+        files = scan_documents(production)
+        assert [f.relative for f in files] == [
+            "Medical Records/er_visit_2025-06-15.pdf", "police/arrest_report_copy.pdf",
+            "police/reports/arrest_report.pdf", "scene_photo.jpg",
+        ]
+        assert [f.pages for f in files] == [3, 5, 5, 0]
+        assert files[1].sha256 == files[2].sha256 != files[0].sha256
+
+    def test_serial_matches_parallel(self, production):
+        assert scan_documents(production, workers=1) == scan_documents(production, workers=4)
+
+    def test_missing_directory(self, tmp_path):
+        assert scan_documents(tmp_path / "nope") == []
+
+    def test_duplicates_and_bates_ranges(self, sample_case, production):
+        index = generate_exhibit_index(sample_case, scan_directory=str(production), prefix="SMITH")
+        assert [e.exhibit_number for e in index.entries] == ["A", "B", "C"]
+        assert [e.bates_range for e in index.entries] == [
+            "SMITH-000001 to SMITH-000003",
+            "SMITH-000004 to SMITH-000008",
+            "SMITH-000009 to SMITH-000009",  # unknown page count: one page
+        ]
+        assert index.duplicates == {"police/reports/arrest_report.pdf": "B"}
+        assert index.entries[0].document_type == "medical_records"
+        assert index.entries[0].date == "2025-06-15"
+        assert "Skipped:  1 duplicate" in format_exhibit_index(index)
+
+    def test_bates_numbering_uses_range_start(self, sample_case, production):
+        index = generate_exhibit_index(sample_case, scan_directory=str(production),
+                                       numbering="bates", prefix="SMITH")
+        assert [e.exhibit_number for e in index.entries] == ["SMITH-000001", "SMITH-000004", "SMITH-000009"]
+
+    def test_page_count_from_object_stream(self):
+        import zlib
+        objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b"<< /Type /Pages /Kids [3 0 R] /Count 12 >>"]
+        header = b"1 0 2 %d " % (len(objects[0]) + 1)
+        body = zlib.compress(header + b" ".join(objects))
+        pdf = (b"%PDF-1.5\n4 0 obj << /Type /ObjStm /N 2 /First " + str(len(header)).encode()
+               + b" /Filter /FlateDecode >>\nstream\r\n" + body + b"\r\nendstream\nendobj\n"
+               + b"5 0 obj << /Type /XRef /Root 1 0 R >>\nendobj\n%%EOF")
+        assert pdf_page_count(pdf) == 12
+        assert pdf_page_count(b"%PDF-1.4\n%%EOF") == 0
+
+    def test_page_count_with_nested_dictionaries(self):
+        pdf = (b"%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+               b"2 0 obj << /Type /Pages /Resources << /Font << /F1 9 0 R >> >> "
+               b"/Kids [3 0 R 4 0 R] /Count 6 >> endobj\n"
+               b"3 0 obj << /Type /Pages /Parent 2 0 R /Kids [] /Count 3 >> endobj\n"
+               b"4 0 obj << /Type /Pages /Parent 2 0 R /Kids [] /Count 3 >> endobj\n"
+               b"trailer << /Root 1 0 R >>\n%%EOF")
+        assert pdf_page_count(pdf) == 6
+
+    def test_page_count_after_incremental_update(self):
+        original = (b"%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+                    b"2 0 obj << /Type /Pages /Kids [] /Count 10 >> endobj\n"
+                    b"trailer << /Root 1 0 R >>\n%%EOF\n")
+        update = b"2 0 obj << /Type /Pages /Kids [] /Count 4 >> endobj\ntrailer << /Root 1 0 R >>\n%%EOF"
+        assert pdf_page_count(original) == 10
+        assert pdf_page_count(original + update) == 4
+
+    def test_cli_json(self, sample_case, production, tmp_path, capsys):
+        import json
+        from ftc_engine.cli import run
+        case_file = tmp_path / "case.json"
+        case_file.write_text(json.dumps(sample_case))
+        run(["exhibits", "-i", str(case_file), "--scan", str(production), "--workers", "2",
+             "--format", "json"])
+        data = json.loads(capsys.readouterr().out)["data"]
+        assert [e["pages"] for e in data["entries"]] == [3, 5, 0]
+        assert data["entries"][0]["source_file"] == "Medical Records/er_visit_2025-06-15.pdf"
+
+
 class TestFormatting:
     """Test exhibit index formatting."""
 
@@ -9,7 +9,23 @@ from ftc_engine.exporter import (
     _setup_document,
     _fill_placeholders,
     _extract_legal_text,
+    _tokenize,
+    _parse_and_render,
+    _render_tokens,
+    compile_template,
+    load_compiled_template,
+    clear_template_cache,
+    page_limit_kind,
+    page_limit_warning,
     ExportResult,
+    T_BLANK,
+    T_CAPTION,
+    T_HEADING,
+    T_SIGNATURE,
+    T_CHECKBOX,
+    T_NUMBERED,
+    T_LETTERED,
+    T_ROMAN,
 )
 
 
@@ -41,6 +57,43 @@ class TestSetupDocument:
         assert style.paragraph_format.line_spacing == 2.0
 
 
+class TestBaseDocument:
+    """Test the cached, pre-styled base documents."""
+
+    def test_base_built_once_per_profile(self):
+        from ftc_engine.exporter import _base_document_bytes
+        assert _base_document_bytes() is _base_document_bytes()
+
+    def test_clones_are_independent(self):
+        a = _setup_document()
+        a.add_paragraph("only in a")
+        b = _setup_document()
+        assert all(p.text != "only in a" for p in b.paragraphs)
+
+    def test_named_styles_present(self):
+        from ftc_engine.exporter import STYLE_BODY, STYLE_HEADING, STYLE_RIGHT
+        doc = _setup_document()
+        assert doc.styles[STYLE_HEADING].font.bold
+        assert doc.styles[STYLE_RIGHT].paragraph_format.line_spacing == 1.0
+        assert doc.styles[STYLE_BODY].paragraph_format.first_line_indent == 457200
+
+    def test_helpers_apply_styles(self):
+        from ftc_engine.exporter import STYLE_LETTERED
+        doc = _setup_document()
+        _parse_and_render(doc, "Body text\n      a. lettered item")
+        styles = [p.style.name for p in doc.paragraphs if p.text]
+        assert styles == ["FTC Body", STYLE_LETTERED]
+        assert all(not r.font.name for p in doc.paragraphs for r in p.runs)
+
+    def test_district_profile(self):
+        from ftc_engine.exporter import _formatting_profile
+        from ftc_engine.districts import get_formatting_config
+        fmt = get_formatting_config("ndcal")
+        doc = _setup_document("ndcal")
+        assert doc.styles["Normal"].font.name == fmt["font_name"]
+        assert _formatting_profile("ndcal")[1] == float(fmt["font_size_pt"])
+
+
 class TestFillPlaceholders:
     """Test placeholder replacement in templates."""
 
@@ -91,6 +144,63 @@ class TestExtractLegalText:
         assert result == text
 
 
+class TestTokenize:
+    """Test single-pass line classification."""
+
+    def test_one_token_per_line(self):
+        text = "a\n\nb\n"
+        assert len(_tokenize(text)) == 4
+
+    def test_blank_and_caption(self):
+        tokens = _tokenize("UNITED STATES DISTRICT COURT\n   ")
+        assert tokens[0].flags & T_CAPTION
+        assert tokens[1].flags == T_BLANK
+
+    def test_structural_lines(self):
+        tokens = _tokenize(
+            "     MOTION TO DISMISS\n"
+            "   1. The plaintiff alleges\n"
+            "      a. lettered item\n"
+            "   [ ] 3. checkbox para\n"
+            "                    Respectfully submitted,\n"
+            "II. ARGUMENT"
+        )
+        assert tokens[0].flags & T_HEADING
+        assert tokens[1].flags & T_NUMBERED
+        assert tokens[1].groups == ("1", "The plaintiff alleges")
+        assert tokens[2].flags & T_LETTERED
+        assert tokens[2].groups == ("a", "lettered item")
+        assert tokens[3].flags & T_CHECKBOX
+        assert tokens[3].groups == ("3", "checkbox para")
+        assert tokens[4].flags & T_SIGNATURE
+        assert tokens[5].flags & T_ROMAN
+
+    def test_text_is_stripped(self):
+        assert _tokenize("   body text   ")[0].text == "body text"
+
+
+class TestRender:
+    """Test rendering of the token stream."""
+
+    def _paragraphs(self, text):
+        doc = _setup_document()
+        _parse_and_render(doc, text)
+        return [p.text for p in doc.paragraphs if p.text]
+
+    def test_numbered_continuation_joined(self):
+        paras = self._paragraphs("   1. First line\ncontinues here\n   2. Second")
+        assert paras == ["1. First line continues here", "2. Second"]
+
+    def test_body_stops_at_lettered(self):
+        paras = self._paragraphs("Body text\n      a. item")
+        assert paras == ["Body text", "a. item"]
+
+    def test_heading_count_after_caption(self):
+        doc = _setup_document()
+        text = "UNITED STATES DISTRICT COURT\n________\n     MOTION TO DISMISS\n\n     CONCLUSION"
+        assert _parse_and_render(doc, text) == 2
+
+
 class TestListTemplates:
     """Test template listing."""
 
@@ -161,6 +271,186 @@ class TestExportTemplate:
         assert Path(result.output_path).exists()
 
 
+TEMPLATE_MD = """# Motion Template
+
+```
+UNITED STATES DISTRICT COURT
+MIDDLE DISTRICT OF FLORIDA
+
+{{PLAINTIFF_NAME}},
+     Plaintiff,
+v.                                  Case No. {{CASE_NO}}
+{{DEFENDANT_NAME}},
+     Defendant.
+______________________________
+
+     MOTION TO DISMISS
+
+   1. Plaintiff {{PLAINTIFF_NAME}} moves to dismiss
+the claims against {{DEFENDANT_NAME}}.
+
+                    Respectfully submitted,
+                    /s/ {{ATTORNEY_NAME}}
+```
+"""
+
+
+@pytest.fixture
+def template_dir(tmp_path, monkeypatch):
+    """Temporary template tree with one motion template."""
+    import ftc_engine.exporter as exporter
+    root = tmp_path / "templates"
+    (root / "motions").mkdir(parents=True)
+    (root / "motions" / "motion_test.md").write_text(TEMPLATE_MD)
+    monkeypatch.setattr(exporter, "TEMPLATES_DIR", root)
+    clear_template_cache()
+    yield root
+    clear_template_cache()
+
+
+def _doc_xml(tokens):
+    doc = _setup_document()
+    _render_tokens(doc, tokens)
+    return doc.element.xml
+
+
+class TestCompiledTemplate:
+    """Test the parsed-template cache."""
+
+    def test_slots_mark_placeholder_lines(self):
+        compiled = compile_template(TEMPLATE_MD)
+        assert compiled.slots
+        assert all("{{" in compiled.lines[i] for i in compiled.slots)
+
+    def test_fill_matches_fill_then_tokenize(self, sample_case):
+        compiled = compile_template(TEMPLATE_MD)
+        expected = _tokenize(_fill_placeholders(_extract_legal_text(TEMPLATE_MD), sample_case))
+        assert compiled.fill(sample_case) == expected
+        assert compiled.fill({}) == _tokenize(_fill_placeholders(_extract_legal_text(TEMPLATE_MD), {}))
+
+    def test_multiline_value_splits_line(self):
+        compiled = compile_template("```\n   1. Served at {{ADDRESS}}\n```")
+        case = {"attorney": {"address": "1 Main St\nSuite 2"}}
+        assert compiled.fill(case) == _tokenize(_fill_placeholders("   1. Served at {{ADDRESS}}\n", case))
+
+    def test_filled_render_identical(self, sample_case):
+        compiled = compile_template(TEMPLATE_MD)
+        text = _fill_placeholders(_extract_legal_text(TEMPLATE_MD), sample_case)
+        assert _doc_xml(compiled.fill(sample_case)) == _doc_xml(_tokenize(text))
+
+    def test_memory_cache_reused(self, template_dir):
+        path = template_dir / "motions" / "motion_test.md"
+        assert load_compiled_template(path) is load_compiled_template(path)
+
+    def test_disk_cache_survives_memory_clear(self, template_dir, monkeypatch):
+        import ftc_engine.exporter as exporter
+        path = template_dir / "motions" / "motion_test.md"
+        first = load_compiled_template(path)
+        clear_template_cache()
+        monkeypatch.setattr(exporter, "compile_template",
+                            lambda *a, **k: pytest.fail("template re-parsed"))
+        assert load_compiled_template(path).tokens == first.tokens
+
+    def test_edit_invalidates(self, template_dir):
+        path = template_dir / "motions" / "motion_test.md"
+        load_compiled_template(path)
+        path.write_text(TEMPLATE_MD.replace("MOTION TO DISMISS", "MOTION TO STRIKE PLEADINGS"))
+        compiled = load_compiled_template(path)
+        assert any(t.text == "MOTION TO STRIKE PLEADINGS" for t in compiled.tokens)
+
+    def test_export_template_uses_cache(self, template_dir, sample_case, tmp_path):
+        out = tmp_path / "motion.docx"
+        result = export_template("motion_test", sample_case, str(out))
+        assert out.exists()
+        assert result.sections == 1
+        assert result.unknown_placeholders == []
+
+    def test_unknown_placeholders_reported(self, template_dir, tmp_path):
+        path = template_dir / "motions" / "motion_test.md"
+        path.write_text(TEMPLATE_MD.replace("{{ATTORNEY_NAME}}", "{{ATTORNY_NAME}}"))
+        result = export_template("motion_test", {}, str(tmp_path / "m.docx"))
+        assert result.unknown_placeholders == ["ATTORNY_NAME"]
+
+
+def _paragraph_signature(path):
+    from docx import Document
+    doc = Document(str(path))
+    return [(p.style.name, p.text, [bool(r.bold) for r in p.runs]) for p in doc.paragraphs]
+
+
+class TestStreamingExport:
+    """Test the streaming OOXML backend."""
+
+    def test_matches_python_docx_output(self, sample_case, tmp_path):
+        from ftc_engine.drafter import generate_complaint
+        text = generate_complaint(sample_case)
+        export_text(text, str(tmp_path / "a.docx"))
+        export_text(text, str(tmp_path / "b.docx"), stream=True)
+        assert _paragraph_signature(tmp_path / "a.docx") == _paragraph_signature(tmp_path / "b.docx")
+
+    def test_escapes_and_breaks(self, tmp_path):
+        text = "UNITED STATES DISTRICT COURT\n____\n     SMITH & JONES (LLC)\n     AND OTHERS\n\nA <b> & c\n\nTab\there"
+        export_text(text, str(tmp_path / "a.docx"))
+        export_text(text, str(tmp_path / "b.docx"), stream=True)
+        sig = _paragraph_signature(tmp_path / "b.docx")
+        assert sig == _paragraph_signature(tmp_path / "a.docx")
+        assert any(t == "SMITH & JONES (LLC)\nAND OTHERS" for _, t, _ in sig)
+        assert any(t == "A <b> & c" for _, t, _ in sig)
+
+    def test_keeps_formatting_parts(self, tmp_path):
+        from docx import Document
+        export_text("Body", str(tmp_path / "b.docx"), stream=True)
+        doc = Document(str(tmp_path / "b.docx"))
+        assert doc.sections[0].left_margin == 914400
+        assert doc.styles["Normal"].font.name == "Times New Roman"
+
+    def test_result_sections(self, tmp_path):
+        text = "UNITED STATES DISTRICT COURT\n________\n     MOTION TO DISMISS"
+        result = export_text(text, str(tmp_path / "b.docx"), stream=True)
+        assert result.sections == 1
+
+    def test_failed_render_leaves_no_docx(self, tmp_path):
+        from ftc_engine.docx_stream import StreamingDocument
+        from ftc_engine.exporter import _base_document_bytes
+        out = tmp_path / "b.docx"
+        out.write_bytes(b"previous export")
+        with pytest.raises(RuntimeError):
+            with StreamingDocument(_base_document_bytes(None), str(out)) as doc:
+                doc.paragraph("1. The plaintiff alleges ...", "FTCBody")
+                raise RuntimeError("render failed")
+        assert out.read_bytes() == b"previous export"
+        assert [p.name for p in tmp_path.iterdir()] == ["b.docx"]
+
+
+class TestPageEstimate:
+    """Test page estimates and page-limit warnings."""
+
+    def test_estimate_grows_with_length(self, tmp_path):
+        short = export_text("     1. A short paragraph.", str(tmp_path / "a.docx"))
+        body = "\n\n".join(f"     {i}. " + "The defendant breached the contract. " * 8 for i in range(1, 60))
+        long = export_text(body, str(tmp_path / "b.docx"))
+        assert short.pages_estimate == 1
+        assert long.pages_estimate > 10
+        assert long.lines_estimate > short.lines_estimate
+
+    def test_stream_and_docx_estimates_agree(self, sample_case, tmp_path):
+        a = export_draft(sample_case, str(tmp_path / "a.docx"))
+        b = export_draft(sample_case, str(tmp_path / "b.docx"), stream=True)
+        assert (a.pages_estimate, a.lines_estimate) == (b.pages_estimate, b.lines_estimate)
+        assert a.pages_estimate >= 2
+
+    def test_limit_kinds(self):
+        assert page_limit_kind("motions/motion_to_dismiss") == "motion"
+        assert page_limit_kind("motions/reply_in_support") == "reply"
+        assert page_limit_kind("motions/response_in_opposition") == "response"
+        assert page_limit_kind("orders/proposed_order_mtd") is None
+
+    def test_warning_over_limit(self):
+        assert "25-page motion limit" in page_limit_warning("motions/motion_to_dismiss", 30, "mdfl")
+        assert page_limit_warning("motions/motion_to_dismiss", 5, "mdfl") == ""
+        assert page_limit_warning("orders/proposed_order_mtd", 99, "mdfl") == ""
+
+
 class TestExportText:
     """Test raw text export."""
 
@@ -170,3 +460,43 @@ class TestExportText:
         result = export_text(text, output)
         assert Path(result.output_path).exists()
         assert result.format == "docx"
+
+
+class TestDescribeFormatting:
+    """Test the formatting line printed after export."""
+
+    def test_default(self):
+        from ftc_engine.exporter import describe_formatting
+        assert describe_formatting() == 'Times New Roman 12pt, double-spaced, 1" margins'
+
+    def test_cli_reports_applied_profile(self, tmp_path, monkeypatch, capsys):
+        import ftc_engine.districts as districts
+        from ftc_engine.cli import run
+        monkeypatch.setattr(districts, "get_formatting_config", lambda code=None: {
+            "font_name": "Century Schoolbook", "font_size_pt": 14, "line_spacing": 1.5,
+            "margin_inches": 1.25})
+        source = tmp_path / "brief.txt"
+        source.write_text("MOTION\n\n     1. Paragraph.")
+        run(["export", "--text", str(source), "-o", str(tmp_path / "brief.docx"), "--district", "sdny"])
+        out = capsys.readouterr().out
+        assert 'Century Schoolbook 14pt, 1.5-spaced, 1.25" margins' in out
+
+    def test_cli_falls_back_to_active_district(self, tmp_path, monkeypatch, capsys):
+        """Without --district the layout uses the same active district as the page-limit check."""
+        import ftc_engine.districts as districts
+        from ftc_engine.cli import run
+        seen = []
+
+        def fake_formatting(code=None):
+            seen.append(code)
+            return {"font_name": "Century Schoolbook", "font_size_pt": 14, "line_spacing": 1.5,
+                    "margin_inches": 1.25}
+
+        monkeypatch.setattr(districts, "get_formatting_config", fake_formatting)
+        monkeypatch.setattr(districts, "get_active_district",
+                            lambda: districts.DistrictContext(config=districts.DISTRICTS["ndill"]))
+        source = tmp_path / "brief.txt"
+        source.write_text("MOTION\n\n     1. Paragraph.")
+        run(["export", "--text", str(source), "-o", str(tmp_path / "brief.docx")])
+        assert seen and set(seen) == {"ndill"}
+        assert 'Century Schoolbook 14pt' in capsys.readouterr().out
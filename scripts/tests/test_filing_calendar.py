@@ -83,12 +83,19 @@ class TestServiceEntries:
         assert len(entries) == len(defendants)
 
     def test_service_deadline_90_days(self, sample_case):
-        fd = date(2026, 3, 1)
+        fd = date(2026, 1, 6)
         entries = _build_service_entries(fd, sample_case)
         for e in entries:
             assert e.deadline == fd + timedelta(days=90)
             assert e.relative_days == 90
 
+    def test_service_deadline_rolls_past_weekend(self, sample_case):
+        # Day 90 from 2026-03-01 is Saturday 2026-05-30 (FRCP 6(a)(1)(C))
+        entries = _build_service_entries(date(2026, 3, 1), sample_case)
+        for e in entries:
+            assert e.deadline == date(2026, 6, 1)
+            assert e.relative_days == 92
+
     def test_federal_service_frcp_4i(self, minimal_case):
         minimal_case["parties"]["defendants"] = [
             {"name": "DOJ", "type": "federal", "entity_type": "federal_agency"},
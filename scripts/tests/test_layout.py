@@ -0,0 +1,101 @@
+"""Tests for the layout (line and page count) estimator."""
+import pytest
+from ftc_engine.layout import PageLayout, ParagraphFormat, font_metrics
+
+
+class TestFontMetrics:
+    """Test per-font character width tables."""
+
+    def test_times_widths(self):
+        m = font_metrics("Times New Roman")
+        assert m.widths["m"] == pytest.approx(0.778)
+        assert m.widths[" "] == pytest.approx(0.25)
+
+    def test_bold_is_wider(self):
+        text = "MOTION TO DISMISS"
+        regular = font_metrics("Times New Roman")
+        bold = font_metrics("Times New Roman", True)
+        assert sum(bold.widths[c] for c in text) > sum(regular.widths[c] for c in text)
+
+    def test_courier_is_monospace(self):
+        m = font_metrics("Courier New")
+        assert m.widths["i"] == m.widths["W"] == pytest.approx(0.6)
+
+    def test_scaled_families(self):
+        assert font_metrics("Century Schoolbook").widths["a"] > font_metrics("Times New Roman").widths["a"]
+        assert font_metrics("Arial").widths["a"] == pytest.approx(0.556)
+
+    def test_tables_cached(self):
+        assert font_metrics("Times New Roman") is font_metrics("Times New Roman")
+
+
+class TestWrap:
+    """Test greedy line wrapping."""
+
+    def test_short_line(self):
+        layout = PageLayout()
+        assert layout.wrap("Short.", layout.text_width_pt) == 1
+
+    def test_wrap_count_matches_width(self):
+        layout = PageLayout()
+        word = "abcde"
+        text = " ".join([word] * 200)
+        per_line = int((layout.text_width_pt + layout.text_width(" ")) //
+                       (layout.text_width(word) + layout.text_width(" ")))
+        assert layout.wrap(text, layout.text_width_pt) == -(-200 // per_line)
+
+    def test_first_line_indent_can_add_a_line(self):
+        layout = PageLayout()
+        text = "x" * 10
+        while layout.wrap(text, layout.text_width_pt) == 1:
+            text += " xxxxxxxxxx"
+        text = text.rsplit(" ", 1)[0]  # exactly one line without indent
+        assert layout.wrap(text, layout.text_width_pt) == 1
+        assert layout.wrap(text, layout.text_width_pt, 36) == 2
+
+    def test_line_breaks_and_long_words(self):
+        layout = PageLayout()
+        assert layout.wrap("A\nB\nC", layout.text_width_pt) == 3
+        assert layout.wrap("W" * 300, layout.text_width_pt) >= 3
+
+
+class TestPagination:
+    """Test stacking lines onto pages."""
+
+    def test_double_spaced_lines_per_page(self):
+        layout = PageLayout("Times New Roman", 12, 2.0, 1.0)
+        for _ in range(23):
+            layout.blank()
+        assert layout.pages == 1
+        layout.blank()
+        assert layout.pages == 2
+
+    def test_single_spacing_fits_twice_as_many(self):
+        layout = PageLayout()
+        single = ParagraphFormat(line_spacing=1.0)
+        for _ in range(46):
+            layout.paragraph("Line", single)
+        assert layout.pages == 1
+
+    def test_narrower_margins_fit_more(self):
+        text = "The defendant breached the contract. " * 400
+        wide = PageLayout(margin_inches=1.5)
+        narrow = PageLayout(margin_inches=1.0)
+        wide.paragraph(text)
+        narrow.paragraph(text)
+        assert narrow.lines < wide.lines
+        assert narrow.pages < wide.pages
+
+    def test_larger_font_takes_more_pages(self):
+        text = "The defendant breached the contract. " * 400
+        small, large = PageLayout(font_size_pt=12), PageLayout(font_size_pt=14)
+        small.paragraph(text)
+        large.paragraph(text)
+        assert large.pages > small.pages
+
+    def test_indent_narrows_column(self):
+        text = "The defendant breached the contract. " * 40
+        flush, indented = PageLayout(), PageLayout()
+        flush.paragraph(text)
+        indented.paragraph(text, ParagraphFormat(left_indent_in=1.0))
+        assert indented.lines > flush.lines
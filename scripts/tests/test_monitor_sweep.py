@@ -0,0 +1,180 @@
+"""Tests for the portfolio-wide Rule 11 monitor sweep."""
+import json
+import pytest
+from ftc_engine.case_manager import create_case, save_case_data
+from ftc_engine.monitor_sweep import (
+    SEVERITY_RANK,
+    SWEEP_FILENAME,
+    format_docket_monitor,
+    sweep_cases,
+)
+from ftc_engine.cli import run
+import ftc_engine.case_manager as cm
+import ftc_engine.rule11_monitor as monitor
+
+
+@pytest.fixture
+def isolated_cases(tmp_path, monkeypatch):
+    """Redirect CASES_DIR to a temp folder for isolation."""
+    test_dir = tmp_path / "cases"
+    test_dir.mkdir()
+    monkeypatch.setattr(cm, "CASES_DIR", test_dir)
+    return test_dir
+
+
+@pytest.fixture
+def docket(isolated_cases, sample_case):
+    """Three cases sharing claim keys."""
+    claims = {
+        "case-a": ["bivens_fourth_search_seizure", "1983_fourth_excessive_force"],
+        "case-b": ["1983_fourth_excessive_force"],
+        "case-c": ["bivens_fourth_search_seizure", "1983_monell_municipal_liability"],
+    }
+    for number, keys in claims.items():
+        create_case(number)
+        save_case_data(number, dict(sample_case, claims_requested=keys))
+    return isolated_cases
+
+
+@pytest.fixture
+def lookup_calls(monkeypatch):
+    """Record every built-in knowledge lookup."""
+    calls = []
+    original = monitor._check_built_in_viability
+
+    def counting(claim_key):
+        calls.append(claim_key)
+        return original(claim_key)
+    monkeypatch.setattr(monitor, "_check_built_in_viability", counting)
+    return calls
+
+
+class TestSweep:
+    """Test grouping, ordering and incremental re-checks."""
+
+    def test_one_lookup_per_distinct_claim(self, docket, lookup_calls):
+        report = sweep_cases()
+        assert sorted(lookup_calls) == sorted({
+            "bivens_fourth_search_seizure", "1983_fourth_excessive_force",
+            "1983_monell_municipal_liability",
+        })
+        assert report.claims_looked_up == 3
+        assert len(report.cases) == 3 and report.rechecked == 3
+
+    def test_matches_single_case_reports(self, docket, sample_case):
+        report = sweep_cases()
+        case_b = next(c for c in report.cases if c.case_number == "case-b")
+        single = monitor.generate_monitor_report(
+            dict(sample_case, claims_requested=["1983_fourth_excessive_force"]))
+        assert case_b.report == single
+
+    def test_online_queries_once_per_claim(self, docket, monkeypatch):
+        batches = []
+
+        def prefetch(claim_keys):
+            batches.append(list(claim_keys))
+            return {}
+        monkeypatch.setitem(monitor._SOURCES, "courtlistener", prefetch)
+        sweep_cases(mode="online")
+        assert len(batches) == 1
+        assert sorted(batches[0]) == sorted(set(batches[0])) and len(batches[0]) == 3
+
+    def test_findings_sorted_by_severity(self, docket):
+        findings = sweep_cases().findings
+        assert findings
+        ranks = [SEVERITY_RANK[f.severity] for f in findings]
+        assert ranks == sorted(ranks)
+        assert findings[0].severity == "critical"
+
+    def test_cases_sorted_by_compliance(self, docket):
+        order = {"non_compliant": 0, "review_needed": 1, "compliant": 2}
+        ranks = [order[c.report.overall_compliance] for c in sweep_cases().cases]
+        assert ranks == sorted(ranks)
+
+    def test_unchanged_cases_reused(self, docket, lookup_calls, sample_case):
+        first = sweep_cases()
+        lookup_calls.clear()
+        second = sweep_cases()
+        assert second.rechecked == 0 and lookup_calls == []
+        assert [c.report for c in second.cases] == [c.report for c in first.cases]
+        assert (docket / SWEEP_FILENAME).exists()
+
+    def test_only_changed_case_rechecked(self, docket, lookup_calls, sample_case):
+        sweep_cases()
+        lookup_calls.clear()
+        case_file = docket / "case-b" / "case.json"
+        case_file.write_text(json.dumps(dict(sample_case, claims_requested=["ftca_negligence"])))
+        report = sweep_cases()
+        assert [c.case_number for c in report.cases if c.rechecked] == ["case-b"]
+        assert lookup_calls == ["ftca_negligence"]
+
+    def test_mode_change_and_recheck_all(self, docket, monkeypatch):
+        sweep_cases()
+        monkeypatch.setitem(monitor._SOURCES, "courtlistener", lambda keys: {})
+        assert sweep_cases(mode="online").rechecked == 3
+        assert sweep_cases(mode="online").rechecked == 0
+        assert sweep_cases(mode="online", recheck_all=True).rechecked == 3
+
+    def test_earlier_day_rechecked(self, docket):
+        sweep_cases()
+        path = docket / SWEEP_FILENAME
+        state = json.loads(path.read_text())
+        state["cases"]["case-b"]["swept"] = "2020-01-01"
+        path.write_text(json.dumps(state))
+        report = sweep_cases()
+        assert [c.case_number for c in report.cases if c.rechecked] == ["case-b"]
+
+    def test_online_results_expire_with_cache_ttl(self, docket, monkeypatch):
+        monkeypatch.setitem(monitor._SOURCES, "courtlistener", lambda keys: {})
+        monkeypatch.setenv("FTC_COURTLISTENER_TTL", "3600")
+        sweep_cases(mode="online")
+        assert sweep_cases(mode="online").rechecked == 0
+        monkeypatch.setenv("FTC_COURTLISTENER_TTL", "0")
+        assert sweep_cases(mode="online").rechecked == 3
+
+    def test_local_mirror_reimport_rechecks(self, docket, tmp_path, monkeypatch):
+        from ftc_engine.caselaw_mirror import import_files
+        monkeypatch.setenv("FTC_CASELAW_DB", str(tmp_path / "opinions.db"))
+        export = tmp_path / "opinions.jsonl"
+        export.write_text(json.dumps({"id": 1, "case_name": "A v. B", "court": "ca11",
+                                      "date_filed": "2024-01-01", "plain_text": "Monell"}) + "\n")
+        import_files([export])
+        assert sweep_cases(mode="online", source="local").rechecked == 3
+        assert sweep_cases(mode="online", source="local").rechecked == 0
+        export.write_text(json.dumps({"id": 2, "case_name": "C v. D", "court": "ca11",
+                                      "date_filed": "2025-01-01", "plain_text": "Bivens"}) + "\n")
+        import_files([export])
+        assert sweep_cases(mode="online", source="local").rechecked == 3
+
+    def test_corrupt_state_rechecks(self, docket):
+        sweep_cases()
+        (docket / SWEEP_FILENAME).write_text("{oops")
+        assert sweep_cases().rechecked == 3
+
+    def test_case_without_data_skipped(self, isolated_cases):
+        create_case("empty")
+        assert sweep_cases().cases == []
+
+
+class TestFormatAndCli:
+    """Test the docket report text and `ftc monitor --all-cases`."""
+
+    def test_format(self, docket):
+        report = sweep_cases()
+        text = format_docket_monitor(report)
+        assert "DOCKET SWEEP" in text
+        assert "case-a" in text and "case-c" in text
+        assert "3 re-checked" in text
+        verbose = format_docket_monitor(report, verbose=True)
+        assert len(verbose) > len(text)
+
+    def test_empty_docket(self, isolated_cases):
+        assert "No saved cases" in format_docket_monitor(sweep_cases())
+
+    def test_cli(self, docket, capsys):
+        run(["monitor", "--all-cases"])
+        assert "DOCKET SWEEP" in capsys.readouterr().out
+        run(["monitor", "--all-cases", "--format", "json"])
+        data = json.loads(capsys.readouterr().out)["data"]
+        assert len(data["cases"]) == 3
+        assert all(not c["rechecked"] for c in data["cases"])
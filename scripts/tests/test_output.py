@@ -0,0 +1,120 @@
+"""Tests for structured (--format json/msgpack) output."""
+import io
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
+import pytest
+from ftc_engine.output import SCHEMA_VERSION, decode, encode, envelope, to_data, write_structured
+from ftc_engine.cli import run
+
+
+@dataclass
+class Inner:
+    when: date
+    tags: set = field(default_factory=set)
+
+
+@dataclass
+class Outer:
+    name: str
+    inner: Inner
+    items: list = field(default_factory=list)
+
+
+class TestToData:
+    """Test conversion of result objects to JSON-compatible data."""
+
+    def test_nested_dataclasses(self):
+        obj = Outer("x", Inner(date(2025, 3, 1), {"b", "a"}), [Inner(date(2024, 1, 2))])
+        assert to_data(obj) == {
+            "name": "x",
+            "inner": {"when": "2025-03-01", "tags": ["a", "b"]},
+            "items": [{"when": "2024-01-02", "tags": []}],
+        }
+
+    def test_containers_and_paths(self):
+        assert to_data({1: (Path("a/b"), None)}) == {"1": ["a/b", None]}
+
+    def test_matches_asdict_for_engine_results(self, sample_case):
+        from dataclasses import asdict
+        from ftc_engine.risk import calculate_mtd_risk
+        result = calculate_mtd_risk(sample_case, "1983_fourth_excessive_force")
+        assert to_data(result) == json.loads(json.dumps(asdict(result)))
+
+    def test_unknown_type(self):
+        with pytest.raises(TypeError, match="object"):
+            to_data(object())
+
+
+class TestEnvelope:
+    """Test the versioned envelope and encoders."""
+
+    def test_fields(self):
+        payload = envelope("risk", {"a": 1})
+        assert payload["schema"] == "ftc.risk"
+        assert payload["schema_version"] == SCHEMA_VERSION
+        assert payload["engine_version"]
+        assert payload["generated_at"].endswith("Z")
+        assert payload["data"] == {"a": 1}
+
+    def test_json_round_trip(self):
+        payload = envelope("sol", [Inner(date(2025, 1, 1))])
+        data = encode(payload, "json")
+        assert data.endswith(b"\n") and data.count(b"\n") == 1
+        assert decode(data, "json") == payload
+
+    def test_msgpack_round_trip(self):
+        pytest.importorskip("msgpack")
+        payload = envelope("claims", {"k": Outer("n", Inner(date(2025, 1, 1)))})
+        assert decode(encode(payload, "msgpack"), "msgpack") == payload
+
+    def test_msgpack_missing(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgpack", None)
+        with pytest.raises(RuntimeError, match="msgpack"):
+            encode(envelope("risk", {}), "msgpack")
+
+    def test_write_structured(self):
+        out = io.BytesIO()
+        written = write_structured("cases", [], "json", out)
+        assert written == len(out.getvalue())
+        assert json.loads(out.getvalue())["data"] == []
+
+
+class TestFormatCli:
+    """Test --format json on the CLI."""
+
+    def _json(self, argv, capsys) -> dict:
+        run(argv)
+        return json.loads(capsys.readouterr().out)
+
+    def test_risk(self, sample_case, tmp_path, capsys):
+        case = tmp_path / "case.json"
+        case.write_text(json.dumps(sample_case))
+        payload = self._json(["risk", "-i", str(case), "-c", "1983_fourth_excessive_force",
+                              "--format", "json"], capsys)
+        assert payload["schema"] == "ftc.risk"
+        assert 0 <= payload["data"]["1983_fourth_excessive_force"]["overall_score"] <= 100
+
+    def test_sol(self, capsys):
+        payload = self._json(["sol", "-c", "1983_fourth_excessive_force", "-d", "2024-01-01",
+                              "--format", "json"], capsys)
+        assert payload["data"][0]["injury_date"] == "2024-01-01"
+
+    def test_claims(self, capsys):
+        from ftc_engine.claims import CLAIM_LIBRARY
+        assert set(self._json(["claims", "--format", "json"], capsys)["data"]) == set(CLAIM_LIBRARY)
+
+    def test_calendar_to_file(self, sample_case, tmp_path, capsys):
+        case = tmp_path / "case.json"
+        case.write_text(json.dumps(sample_case))
+        dest = tmp_path / "calendar.json"
+        run(["calendar", "-i", str(case), "--format", "json", "-o", str(dest)])
+        assert str(dest) in capsys.readouterr().out
+        assert json.loads(dest.read_text())["data"]["entries"]
+
+    def test_text_is_default(self, capsys):
+        run(["claims"])
+        assert not capsys.readouterr().out.lstrip().startswith("{")
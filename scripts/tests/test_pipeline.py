@@ -0,0 +1,65 @@
+"""Tests for the stage pipeline executor."""
+import threading
+import pytest
+from ftc_engine.pipeline import Stage, run_stages
+
+
+class TestRunStages:
+    """Test dependency-ordered stage execution."""
+
+    def test_dependencies_receive_results(self):
+        stages = [
+            Stage("a", lambda deps: 2),
+            Stage("b", lambda deps: deps["a"] * 10, ("a",)),
+            Stage("c", lambda deps: deps["a"] + deps["b"], ("a", "b")),
+        ]
+        results = run_stages(stages)
+        assert [r.value for r in results.values()] == [2, 20, 22]
+        assert all(r.ok for r in results.values())
+
+    def test_shared_upstream_runs_once(self):
+        calls = []
+        stages = [Stage("shared", lambda deps: calls.append(1) or "x")]
+        stages += [Stage(f"doc{i}", lambda deps: deps["shared"], ("shared",)) for i in range(5)]
+        results = run_stages(stages, workers=4)
+        assert len(calls) == 1
+        assert all(results[f"doc{i}"].value == "x" for i in range(5))
+
+    def test_independent_stages_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        stages = [Stage("a", lambda deps: barrier.wait()), Stage("b", lambda deps: barrier.wait())]
+        results = run_stages(stages, workers=2)
+        assert all(r.ok for r in results.values())
+
+    def test_failure_propagates_downstream_only(self):
+        def boom(deps):
+            raise RuntimeError("no data")
+        stages = [
+            Stage("bad", boom),
+            Stage("child", lambda deps: 1, ("bad",)),
+            Stage("grandchild", lambda deps: 1, ("child",)),
+            Stage("other", lambda deps: "fine"),
+        ]
+        results = run_stages(stages)
+        assert results["bad"].error == "RuntimeError: no data"
+        assert "'bad' failed" in results["child"].error
+        assert not results["grandchild"].ok
+        assert results["other"].value == "fine"
+
+    def test_on_done_sees_every_stage(self):
+        seen = []
+        run_stages([Stage("a", lambda d: 1), Stage("b", lambda d: 2, ("a",))],
+                   on_done=lambda r: seen.append(r.name))
+        assert seen == ["a", "b"]
+
+    def test_timings_recorded(self):
+        results = run_stages([Stage("a", lambda d: sum(range(10000)))])
+        assert results["a"].seconds > 0
+
+    def test_invalid_graphs(self):
+        with pytest.raises(ValueError, match="unknown"):
+            run_stages([Stage("a", lambda d: 1, ("missing",))])
+        with pytest.raises(ValueError, match="cycle"):
+            run_stages([Stage("a", lambda d: 1, ("b",)), Stage("b", lambda d: 1, ("a",))])
+        with pytest.raises(ValueError, match="Duplicate"):
+            run_stages([Stage("a", lambda d: 1), Stage("a", lambda d: 1)])
@@ -0,0 +1,78 @@
+"""Tests for the placeholder engine."""
+import pytest
+from ftc_engine.placeholders import (
+    fill_placeholders,
+    PlaceholderContext,
+    register_placeholder,
+    list_placeholders,
+    _RESOLVERS,
+)
+
+
+@pytest.fixture
+def scratch_registry(monkeypatch):
+    """Let a test register resolvers without leaking them."""
+    monkeypatch.setattr("ftc_engine.placeholders._RESOLVERS", dict(_RESOLVERS))
+
+
+class TestFill:
+    """Test single-pass substitution."""
+
+    def test_builtin_fields(self, sample_case):
+        text, unknown = fill_placeholders("{{PLAINTIFF_NAME}} v. {{DEFENDANT_NAME}}", sample_case)
+        assert text == "JOHN SMITH v. OFFICER JAMES BROWN"
+        assert unknown == []
+
+    def test_repeated_key(self, sample_case):
+        text, _ = fill_placeholders("{{CASE_NO}}/{{CASE_NO}}", {"case_number": "8:26-cv-1"})
+        assert text == "8:26-cv-1/8:26-cv-1"
+
+    def test_unknown_reported_and_kept(self):
+        text, unknown = fill_placeholders("Dear {{JUDGE}}, {{JUDGE}} {{DATE}}", {})
+        assert unknown == ["JUDGE"]
+        assert "{{JUDGE}}" in text
+        assert "____________" in text
+
+    def test_values_not_reexpanded(self):
+        text, _ = fill_placeholders("{{ATTORNEY_NAME}}", {"attorney": {"name": "{{CASE_NO}}"}})
+        assert text == "{{CASE_NO}}"
+
+    def test_text_without_placeholders_untouched(self):
+        assert fill_placeholders("plain text", {}) == ("plain text", [])
+
+
+class TestResolvers:
+    """Test the lazily evaluated variables."""
+
+    def test_party_lists(self, sample_case):
+        text, _ = fill_placeholders("{{DEFENDANTS}}", sample_case)
+        assert text == "OFFICER JAMES BROWN and CITY OF TAMPA"
+
+    def test_defendant_list_one_per_line(self, sample_case):
+        text, _ = fill_placeholders("{{DEFENDANT_LIST}}", sample_case)
+        assert len(text.split("\n")) == len(sample_case["parties"]["defendants"])
+
+    def test_district_name(self, sample_case):
+        text, _ = fill_placeholders("{{DISTRICT_NAME}}, {{DIVISION}}", sample_case)
+        assert text == "MIDDLE DISTRICT OF FLORIDA, TAMPA DIVISION"
+
+    def test_count_summary_from_claims(self, sample_case):
+        case = dict(sample_case, claims_requested=["1983_fourth_excessive_force", "ftca_negligence"])
+        text, _ = fill_placeholders("{{COUNT_SUMMARY}}", case)
+        assert text.startswith("Count 1: ")
+        assert "Count 2: " in text
+
+    def test_resolver_runs_once_and_only_when_used(self, scratch_registry):
+        calls = []
+        register_placeholder("EXPENSIVE", lambda case_data: calls.append(1) or "x")
+        ctx = PlaceholderContext({})
+        ctx.substitute("{{CASE_NO}}")
+        assert calls == []
+        ctx.substitute("{{EXPENSIVE}} {{EXPENSIVE}}")
+        ctx.substitute("{{EXPENSIVE}}")
+        assert calls == [1]
+
+    def test_registry_lists_keys(self):
+        keys = list_placeholders()
+        assert "PLAINTIFF_NAME" in keys
+        assert "COUNT_SUMMARY" in keys
@@ -0,0 +1,179 @@
+"""Tests for the merged multi-case calendar."""
+import csv
+import io
+import pytest
+from datetime import date, timedelta
+from ftc_engine.case_manager import create_case, save_case_data
+from ftc_engine.filing_calendar import CalendarEntry, FilingCalendar, generate_filing_calendar
+from ftc_engine.portfolio_calendar import (
+    PortfolioEntry,
+    DeadlineIntervalTree,
+    merge_calendars,
+    iter_portfolio_entries,
+    write_csv,
+    write_ics,
+    format_portfolio_calendar,
+    format_conflicts,
+    CSV_FIELDS,
+)
+import ftc_engine.case_manager as cm
+
+
+@pytest.fixture
+def isolated_cases(tmp_path, monkeypatch):
+    """Redirect CASES_DIR to a temp folder for isolation."""
+    test_dir = tmp_path / "cases"
+    test_dir.mkdir()
+    monkeypatch.setattr(cm, "CASES_DIR", test_dir)
+    return test_dir
+
+
+def _entry(case_number: str, day: date, document: str = "Reply Brief") -> PortfolioEntry:
+    e = CalendarEntry(document=document, category="pleading", deadline=day,
+                      relative_days=0, description="Reply due")
+    return PortfolioEntry(case_number, f"{case_number} v. United States", e)
+
+
+class TestMerge:
+    """Test k-way merging of per-case calendars."""
+
+    def test_merged_stream_is_date_ordered(self, sample_case, minimal_case):
+        a = generate_filing_calendar(sample_case, filing_date_str="2026-03-01", district_code="mdfl")
+        b = generate_filing_calendar(minimal_case, filing_date_str="2026-01-15", district_code="mdfl")
+        merged = list(merge_calendars([("case-a", a), ("case-b", b)]))
+        assert len(merged) == len(a.entries) + len(b.entries)
+        assert [p.deadline for p in merged] == sorted(p.deadline for p in merged)
+        assert {p.case_number for p in merged} == {"case-a", "case-b"}
+
+    def test_merge_is_lazy(self):
+        cal = FilingCalendar(case_name="A v. B", filing_date=date(2026, 1, 1), district_code="mdfl",
+                             entries=[_entry("a", date(2026, 1, 2)).entry])
+        stream = merge_calendars([("a", cal)])
+        assert next(stream).case_number == "a"
+
+    def test_wizard_shaped_case(self, isolated_cases, monkeypatch):
+        """A case.json as the wizard writes it: district by name, filing date from the court step."""
+        import builtins
+        from ftc_engine.wizard import collect_court
+        state = create_case("6:26-cv-00001")
+        case_data = cm.load_case_data("6:26-cv-00001")
+        answers = iter(["1", "Orlando", "2026-03-02"])
+        monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+        collect_court(state, case_data)
+        entries = list(iter_portfolio_entries())
+        assert entries and {p.case_number for p in entries} == {"6:26-cv-00001"}
+        assert entries[0].entry.deadline >= date(2026, 3, 2) - timedelta(days=1)
+
+    def test_portfolio_uses_saved_cases(self, isolated_cases, sample_case):
+        create_case("case-a")
+        save_case_data("case-a", dict(sample_case, filing_date="2026-03-01"))
+        create_case("case-unfiled")
+        save_case_data("case-unfiled", sample_case)
+        entries = list(iter_portfolio_entries())
+        assert entries
+        assert {p.case_number for p in entries} == {"case-a"}
+
+    def test_priority_filter(self, isolated_cases, sample_case):
+        create_case("case-a")
+        save_case_data("case-a", dict(sample_case, filing_date="2026-03-01"))
+        entries = list(iter_portfolio_entries({"critical"}))
+        assert entries
+        assert all(p.entry.priority == "critical" for p in entries)
+
+
+class TestIntervalTree:
+    """Test range and conflict queries."""
+
+    def _brute_overlap(self, entries, lead, start, end):
+        return {id(p) for p in entries
+                if p.deadline >= start and p.deadline - timedelta(days=lead) <= end}
+
+    def test_window_query(self):
+        entries = [_entry("a", date(2026, 4, d)) for d in (1, 10, 20)]
+        tree = DeadlineIntervalTree(entries, lead_days=7)
+        hits = tree.window(date(2026, 4, 5), date(2026, 4, 20))
+        assert [p.deadline.day for p in hits] == [10, 20]
+
+    def test_overlapping_matches_brute_force(self):
+        entries = [_entry(f"c{i % 5}", date(2026, 1, 1) + timedelta(days=(i * 37) % 300))
+                   for i in range(120)]
+        tree = DeadlineIntervalTree(entries, lead_days=5)
+        for offset in range(0, 300, 13):
+            start = date(2026, 1, 1) + timedelta(days=offset)
+            end = start + timedelta(days=9)
+            got = {id(p) for p in tree.overlapping(start, end)}
+            assert got == self._brute_overlap(entries, 5, start, end)
+
+    def test_conflicts_same_week_across_cases(self):
+        entries = [
+            _entry("case-a", date(2026, 5, 4)),
+            _entry("case-b", date(2026, 5, 7)),
+            _entry("case-c", date(2026, 6, 30)),
+        ]
+        conflicts = DeadlineIntervalTree(entries, lead_days=7).conflicts()
+        assert len(conflicts) == 1
+        c = conflicts[0]
+        assert {c.first.case_number, c.second.case_number} == {"case-a", "case-b"}
+        assert c.overlap_end == date(2026, 5, 4)
+
+    def test_same_case_ignored_by_default(self):
+        entries = [_entry("case-a", date(2026, 5, 4)), _entry("case-a", date(2026, 5, 5))]
+        tree = DeadlineIntervalTree(entries)
+        assert tree.conflicts() == []
+        assert len(tree.conflicts(same_case=True)) == 1
+
+    def test_empty_tree(self):
+        tree = DeadlineIntervalTree([])
+        assert len(tree) == 0
+        assert tree.window(date(2026, 1, 1), date(2026, 12, 31)) == []
+        assert tree.conflicts() == []
+
+
+class TestWriters:
+    """Test streaming ICS and CSV output."""
+
+    def test_csv_rows(self):
+        buf = io.StringIO()
+        count = write_csv([_entry("case-a", date(2026, 5, 4))], buf)
+        rows = list(csv.reader(io.StringIO(buf.getvalue())))
+        assert count == 1
+        assert rows[0] == CSV_FIELDS
+        assert rows[1][:2] == ["2026-05-04", "case-a"]
+
+    def test_ics_events(self):
+        buf = io.StringIO()
+        count = write_ics([_entry("case-a", date(2026, 5, 4), "Reply; Brief, Final")], buf)
+        text = buf.getvalue()
+        assert count == 1
+        assert text.startswith("BEGIN:VCALENDAR\r\n")
+        assert text.rstrip().endswith("END:VCALENDAR")
+        assert "DTSTART;VALUE=DATE:20260504" in text
+        assert "DTEND;VALUE=DATE:20260505" in text
+        assert r"SUMMARY:[case-a] Reply\; Brief\, Final" in text
+
+    def test_ics_long_lines_folded(self):
+        buf = io.StringIO()
+        write_ics([_entry("case-a", date(2026, 5, 4), "X" * 200)], buf)
+        assert all(len(line.encode()) <= 75 for line in buf.getvalue().split("\r\n"))
+
+    def test_writers_consume_generators(self):
+        stream = (_entry("case-a", date(2026, 5, d)) for d in range(1, 4))
+        assert write_csv(stream, io.StringIO()) == 3
+
+
+class TestFormatting:
+    """Test portfolio CLI formatting."""
+
+    def test_portfolio_table(self):
+        output = format_portfolio_calendar([_entry("case-a", date(2026, 5, 4))])
+        assert "case-a" in output
+        assert "Reply Brief" in output
+
+    def test_empty_portfolio(self):
+        assert "No deadlines found" in format_portfolio_calendar([])
+
+    def test_conflict_report(self):
+        entries = [_entry("case-a", date(2026, 5, 4)), _entry("case-b", date(2026, 5, 7))]
+        output = format_conflicts(DeadlineIntervalTree(entries).conflicts(), 7)
+        assert "DEADLINE CONFLICTS (1)" in output
+        assert "case-b" in output
@@ -12,7 +12,10 @@ from ftc_engine.rule11_monitor import (
     _check_exhaustion_compliance,
     _check_sol_compliance,
     _check_immunity_exposure,
+    case_facts,
+    rule_issues,
 )
+import ftc_engine.rule11_monitor as monitor
 
 
 @pytest.fixture
@@ -151,6 +154,57 @@ class TestImmunityExposure:
         assert not any("qualified" in i.description.lower() for i in issues)
 
 
+class TestViabilityRules:
+    """Test the precompiled rule table and per-case facts."""
+
+    def test_facts(self, minimal_case):
+        minimal_case["parties"]["defendants"] = [
+            {"name": "USA", "type": "federal", "capacity": "official"},
+            {"name": "Agent", "type": "federal", "capacity": "individual"},
+        ]
+        minimal_case["limitations"]["key_dates"]["injury_date"] = "2099-01-01"
+        facts = case_facts(minimal_case)
+        assert facts.defendant_types == {"federal"}
+        assert facts.individual_defendants
+        assert facts.injury_date is None  # future injury: no SOL question
+
+    def test_rule_order_across_attributes(self, minimal_case):
+        minimal_case["exhaustion"] = {"ftca_admin_claim_filed": False}
+        minimal_case["limitations"]["key_dates"]["injury_date"] = "2015-01-01"
+        minimal_case["parties"]["defendants"] = [{"name": "USA", "type": "federal"}]
+        issues = rule_issues(case_facts(minimal_case), "ftca_negligence")
+        assert [i.description.split()[0] for i in issues] == ["SF-95", "Statute", "Sovereign"]
+        assert "days ago" in issues[1].description and "{" not in issues[1].description
+
+    def test_eeoc_unknown_is_high(self, minimal_case):
+        issues = rule_issues(case_facts(minimal_case), "title_vii_disparate_treatment", ("exhaustion",))
+        assert [i.severity for i in issues] == ["high"]
+
+    def test_unknown_claim_has_no_rules(self, bivens_case):
+        assert rule_issues(case_facts(bivens_case), "unknown_claim_xyz") == []
+
+    def test_report_derives_facts_once(self, sample_case, monkeypatch):
+        calls = []
+        original = monitor.case_facts
+        monkeypatch.setattr(monitor, "case_facts", lambda data: calls.append(1) or original(data))
+        sample_case["claims_requested"] = ["1983_fourth_excessive_force", "1983_fourth_false_arrest",
+                                           "1983_monell_municipal_liability"]
+        generate_monitor_report(sample_case)
+        assert calls == [1]
+
+    def test_sol_deadline_once_per_period(self, minimal_case, monkeypatch):
+        import ftc_engine.court_days as court_days
+        calls = []
+        original = court_days.compute_deadline
+        monkeypatch.setattr(court_days, "compute_deadline",
+                            lambda start, days: calls.append(days) or original(start, days))
+        minimal_case["limitations"]["key_dates"]["injury_date"] = "2025-01-15"
+        facts = case_facts(minimal_case)
+        for ck in ["1983_fourth_excessive_force", "1983_fourth_false_arrest", "ftca_negligence"]:
+            rule_issues(facts, ck)
+        assert calls == [1461, 730]
+
+
 class TestMonitorReport:
     """Test full monitor report generation."""
 
@@ -0,0 +1,136 @@
+"""Tests for the portfolio SOL watchlist."""
+import json
+import pytest
+from datetime import date, timedelta
+from ftc_engine.case_manager import create_case, save_case_data, delete_case, load_case_index
+from ftc_engine.sol_watch import (
+    get_watchlist,
+    format_watchlist,
+    compute_case_deadlines,
+    refresh_watchlist,
+    WatchItem,
+    WATCHLIST_FILENAME,
+)
+import ftc_engine.case_manager as cm
+
+
+@pytest.fixture
+def isolated_cases(tmp_path, monkeypatch):
+    """Redirect CASES_DIR to a temp folder for isolation."""
+    test_dir = tmp_path / "cases"
+    test_dir.mkdir()
+    monkeypatch.setattr(cm, "CASES_DIR", test_dir)
+    return test_dir
+
+
+def _case(days_ago: int, claims: list[str], district: str = "Middle District of Florida") -> dict:
+    injury = (date.today() - timedelta(days=days_ago)).isoformat()
+    return {
+        "court": {"district": district},
+        "parties": {"plaintiffs": [{"name": "Doe"}], "defendants": [{"name": "City"}]},
+        "claims_requested": claims,
+        "limitations": {"key_dates": {"injury_date": injury}},
+    }
+
+
+class TestComputeDeadlines:
+    """Test per-case deadline computation."""
+
+    def test_one_item_per_claim(self):
+        entry = {"case_number": "c1", "injury_date": "2025-01-10", "district": "mdfl",
+                 "claims": ["1983_fourth_excessive_force", "ftca_negligence"]}
+        items = compute_case_deadlines(entry)
+        assert [i[2] for i in items] == ["1983_fourth_excessive_force", "ftca_negligence"]
+
+    def test_district_name_resolves_state_sol(self):
+        fl = compute_case_deadlines({"case_number": "c1", "injury_date": "2025-01-10",
+                                     "district": "Middle District of Florida",
+                                     "claims": ["1983_fourth_excessive_force"]})
+        ca = compute_case_deadlines({"case_number": "c2", "injury_date": "2025-01-10",
+                                     "district": "Northern District of California",
+                                     "claims": ["1983_fourth_excessive_force"]})
+        assert fl[0][5] == "mdfl"
+        assert ca[0][5] == "ndcal"
+        assert ca[0][0] < fl[0][0]  # 2-year CA SOL runs out before 4-year FL SOL
+
+    def test_skips_unknown_claims_and_missing_date(self):
+        assert compute_case_deadlines({"case_number": "c1", "injury_date": "",
+                                       "claims": ["ftca_negligence"]}) == []
+        items = compute_case_deadlines({"case_number": "c1", "injury_date": "2025-01-10",
+                                        "claims": ["auto_suggest", "not_a_claim"]})
+        assert items == []
+
+
+class TestWatchlist:
+    """Test the on-disk, heap-ordered watchlist."""
+
+    def test_empty_portfolio(self, isolated_cases):
+        assert get_watchlist() == []
+
+    def test_save_updates_watchlist_file(self, isolated_cases):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["ftca_negligence"]))
+        data = json.loads((isolated_cases / WATCHLIST_FILENAME).read_text())
+        assert len(data["heap"]) == 1
+        assert data["heap"][0][1] == "case-a"
+
+    def test_most_urgent_first_across_cases(self, isolated_cases):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["1983_fourth_excessive_force"]))
+        create_case("case-b")
+        save_case_data("case-b", _case(700, ["ftca_negligence"]))
+        items = get_watchlist()
+        assert [i.case_number for i in items] == ["case-b", "case-a"]
+        assert all(isinstance(i, WatchItem) for i in items)
+        assert items[0].status == "urgent"
+
+    def test_limit(self, isolated_cases):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["1983_fourth_excessive_force", "ftca_negligence"]))
+        assert len(get_watchlist(limit=1)) == 1
+
+    def test_resave_replaces_case_items(self, isolated_cases):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["1983_fourth_excessive_force", "ftca_negligence"]))
+        save_case_data("case-a", _case(100, ["ftca_negligence"]))
+        items = get_watchlist()
+        assert [i.claim_key for i in items] == ["ftca_negligence"]
+
+    def test_delete_removes_items(self, isolated_cases):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["ftca_negligence"]))
+        delete_case("case-a")
+        assert get_watchlist() == []
+
+    def test_hand_edited_case_is_picked_up(self, isolated_cases):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["ftca_negligence"]))
+        case_file = isolated_cases / "case-a" / "case.json"
+        case_file.write_text(json.dumps(_case(100, ["1983_fourth_excessive_force"])))
+        items = get_watchlist()
+        assert [i.claim_key for i in items] == ["1983_fourth_excessive_force"]
+
+    def test_unchanged_cases_not_reparsed(self, isolated_cases, monkeypatch):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["ftca_negligence"]))
+        load_case_index()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("deadlines recomputed for unchanged case")
+        monkeypatch.setattr("ftc_engine.sol_watch.compute_case_deadlines", fail)
+        refresh_watchlist()
+
+
+class TestFormatWatchlist:
+    """Test watchlist formatting."""
+
+    def test_contains_case_and_claim(self, isolated_cases):
+        create_case("case-a")
+        save_case_data("case-a", _case(100, ["ftca_negligence"]))
+        output = format_watchlist(get_watchlist())
+        assert "case-a" in output
+        assert "ftca_negligence" in output
+        assert "[mdfl]" in output
+
+    def test_empty_message(self):
+        assert "No SOL deadlines" in format_watchlist([])
@@ -0,0 +1,111 @@
+"""Tests for lazy module attributes and the startup profiler."""
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from ftc_engine.lazy import lazy_attributes
+from ftc_engine.startup import (
+    IMPORT_BUDGET_MS, LIGHT_COMMANDS, RUN_BUDGET_MS, StartupProfile, format_startup_report,
+    parse_importtime, profile_command,
+)
+
+PACKAGE_ROOT = Path(__file__).parent.parent
+
+SAMPLE_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _typing
+import time:      3000 |       3120 | typing
+import time:       150 |        150 |     docx.shared
+import time:       400 |        550 |   docx
+import time:       700 |       1250 | ftc_engine.exporter
+Traceback noise that is not a timing line
+"""
+
+
+def _fresh(code: str) -> str:
+    """Run code in a new interpreter and return its stdout."""
+    proc = subprocess.run([sys.executable, "-c", code], cwd=PACKAGE_ROOT,
+                          capture_output=True, text=True, check=True)
+    return proc.stdout.strip()
+
+
+class TestLazyAttributes:
+    """Test the PEP 562 __getattr__ factory."""
+
+    def test_built_once_then_stored(self):
+        module = types.ModuleType("fake")
+        calls = []
+        module.__getattr__ = lazy_attributes(vars(module), TABLE=lambda: calls.append(1) or {"a": 1})
+        assert "TABLE" not in vars(module)
+        assert module.TABLE == {"a": 1}
+        assert module.TABLE is module.TABLE
+        assert vars(module)["TABLE"] is module.TABLE
+        assert calls == [1]
+
+    def test_unknown_attribute(self):
+        module = types.ModuleType("fake")
+        module.__getattr__ = lazy_attributes(vars(module), TABLE=dict)
+        with pytest.raises(AttributeError, match="fake"):
+            module.OTHER
+
+    def test_tables_not_built_on_import(self):
+        out = _fresh(
+            "import ftc_engine.claims as c, ftc_engine.deposition as d, ftc_engine.rule11_monitor as r\n"
+            "print(sorted(n for n in ('CLAIM_LIBRARY', 'CLAIM_ELEMENTS', 'VIABILITY_KNOWLEDGE')\n"
+            "             if n in vars(c) or n in vars(d) or n in vars(r)))\n"
+            "from ftc_engine.claims import CLAIM_LIBRARY, get_claim\n"
+            "print(get_claim('1983_fourth_excessive_force') is CLAIM_LIBRARY['1983_fourth_excessive_force'])"
+        )
+        assert out.splitlines() == ["[]", "True"]
+
+    def test_exporter_defers_python_docx(self):
+        out = _fresh(
+            "import sys, ftc_engine.exporter as e\n"
+            "print('docx' in sys.modules)\n"
+            "print(e.FIRST_LINE_INDENT.inches, 'docx' in sys.modules)"
+        )
+        assert out.splitlines() == ["False", "0.5 True"]
+
+
+class TestParseImporttime:
+    """Test parsing of -X importtime output."""
+
+    def test_parse(self):
+        timings = parse_importtime(SAMPLE_IMPORTTIME)
+        assert [(t.module, t.depth) for t in timings] == [
+            ("_typing", 1), ("typing", 0), ("docx.shared", 2), ("docx", 1), ("ftc_engine.exporter", 0),
+        ]
+        assert timings[1].self_us == 3000 and timings[1].cumulative_us == 3120
+
+    def test_profile_totals(self):
+        profile = StartupProfile(["export"], imports=parse_importtime(SAMPLE_IMPORTTIME))
+        assert profile.import_ms == pytest.approx(4.37)
+        assert profile.engine_ms == pytest.approx(0.7)
+        assert profile.heavy_modules() == ["docx"]
+        assert profile.slowest(1)[0].module == "typing"
+
+    def test_report_flags_heavy_modules(self):
+        profile = StartupProfile(["export"], imports=parse_importtime(SAMPLE_IMPORTTIME))
+        report = format_startup_report([profile])
+        assert "[!!] ftc export" in report
+        assert "loaded heavy modules: docx" in report
+
+    def test_report_flags_slow_run_with_fast_imports(self):
+        profile = StartupProfile(["claims"], wall_ms=RUN_BUDGET_MS + 1, imports=parse_importtime(SAMPLE_IMPORTTIME))
+        assert profile.import_ms < IMPORT_BUDGET_MS
+        assert "[!!] ftc claims" in format_startup_report([profile])
+
+
+class TestStartupBudget:
+    """Cold start of lightweight commands must stay within budget."""
+
+    @pytest.mark.parametrize("command", LIGHT_COMMANDS, ids=" ".join)
+    def test_light_command_within_budget(self, command, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        profile = profile_command(command)
+        assert profile.exit_code == 0
+        assert profile.heavy_modules() == []
+        assert profile.import_ms <= IMPORT_BUDGET_MS, format_startup_report([profile])
+        assert profile.wall_ms <= RUN_BUDGET_MS, format_startup_report([profile])
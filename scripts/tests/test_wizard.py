@@ -162,10 +162,26 @@ class TestCollectCourt:
                      "facts": [], "claims_requested": [], "relief_requested": [],
                      "exhaustion": {}, "limitations": {"key_dates": {}}, "goals": {}}
         # Select first district, enter division
-        monkeypatch.setattr("builtins.input", _make_input_fn(["1", "Tampa"]))
+        monkeypatch.setattr("builtins.input", _make_input_fn(["1", "Tampa", ""]))
         result = collect_court(state, case_data)
         assert result["court"]["division"] == "Tampa"
         assert result["court"]["district"] != ""
+        assert "filing_date" not in result
+
+    def test_records_filing_date(self, monkeypatch, isolated_cases):
+        from ftc_engine.case_manager import load_case_index
+        state = create_case("court-002")
+        case_data = {"court": {}, "parties": {"plaintiffs": [], "defendants": []}}
+        monkeypatch.setattr("builtins.input", _make_input_fn(["1", "Tampa", "2026-03-02"]))
+        assert collect_court(state, case_data)["filing_date"] == "2026-03-02"
+        assert load_case_index()["court-002"]["filing_date"] == "2026-03-02"
+
+    def test_invalid_filing_date_reprompted(self, monkeypatch, isolated_cases):
+        state = create_case("court-003")
+        case_data = {"court": {}, "parties": {"plaintiffs": [], "defendants": []}}
+        monkeypatch.setattr("builtins.input", _make_input_fn(["1", "Tampa", "2024-13-45", "2024-02-30",
+                                                              "2024-02-29"]))
+        assert collect_court(state, case_data)["filing_date"] == "2024-02-29"
 
 
 class TestCollectPlaintiffs:
@@ -356,6 +372,26 @@ class TestGenerateDocument:
         text = _generate_document("nonexistent", sample_case, state)
         assert text == ""
 
+    def test_analysis_generates(self, isolated_cases, sample_case):
+        state = create_case("gen-004")
+        text = _generate_document("analysis", sample_case, state)
+        assert "FULL CASE ANALYSIS REPORT" in text
+        assert "Venue:" in text
+
+    def test_deposition_generates(self, isolated_cases, sample_case):
+        state = create_case("gen-005")
+        text = _generate_document("deposition", sample_case, state)
+        assert len(text) > 0
+
+    def test_uses_upstream_results(self, isolated_cases, sample_case):
+        from ftc_engine.risk import calculate_mtd_risk
+        state = create_case("gen-006")
+        case_data = dict(sample_case, claims_requested=["1983_fourth_excessive_force"])
+        risk = {"1983_fourth_excessive_force": calculate_mtd_risk(case_data, "1983_fourth_excessive_force")}
+        risk["1983_fourth_excessive_force"].overall_score = 7
+        text = _generate_document("risk", case_data, state, {"risk": risk})
+        assert "1983_fourth_excessive_force: 7/100" in text
+
 
 # ── Document selection: format + location ──────────────────────────────────
 
@@ -442,6 +478,101 @@ class TestExecutePipelineCopy:
             assert "pipe-002" in g
 
 
+class TestPipelineGraph:
+    """Test that the generation graph shares upstream stages."""
+
+    def _state(self, case_number, docs):
+        state = create_case(case_number)
+        state.documents_selected = docs
+        state.output_format = "markdown"
+        state.output_location = ""
+        for step in STEP_KEYS[:-1]:
+            advance_step(state, step)
+        return state
+
+    def test_suggestions_computed_once(self, isolated_cases, sample_case, capsys):
+        import ftc_engine.suggest as suggest
+        state = self._state("dag-001", ["complaint", "analysis", "monitor", "deposition", "questions"])
+        calls = []
+        original = suggest.suggest_claims
+        with patch.object(suggest, "suggest_claims",
+                          side_effect=lambda *a, **k: calls.append(1) or original(*a, **k)):
+            generated = execute_pipeline(state, sample_case)
+        assert len(calls) == 1
+        assert len(generated) == 5
+        out = capsys.readouterr().out
+        assert "Stage timings:" in out
+        assert "suggestions" in out
+        assert "ERROR" not in out
+
+    def test_only_needed_upstream_stages(self, isolated_cases, sample_case, capsys):
+        state = self._state("dag-002", ["calendar"])
+        execute_pipeline(state, sample_case)
+        out = capsys.readouterr().out
+        timings = out.split("Stage timings:")[1]
+        assert "suggestions" not in timings
+        assert "Filing Calendar" in timings
+
+
+class TestIncrementalGeneration:
+    """Test that unchanged outputs are not regenerated."""
+
+    def _state(self, case_number, docs):
+        state = create_case(case_number)
+        state.documents_selected = docs
+        state.output_format = "markdown"
+        for step in STEP_KEYS[:-1]:
+            advance_step(state, step)
+        return state
+
+    def test_unchanged_outputs_skipped(self, isolated_cases, sample_case, capsys):
+        state = self._state("inc-001", ["js44", "complaint"])
+        execute_pipeline(state, sample_case)
+        capsys.readouterr()
+        generated = execute_pipeline(state, sample_case)
+        out = capsys.readouterr().out
+        assert out.count("up to date") == 2
+        assert len(generated) == 2
+
+    def test_only_affected_outputs_regenerated(self, isolated_cases, sample_case, capsys):
+        state = self._state("inc-002", ["js44", "exhibits"])
+        execute_pipeline(state, sample_case)
+        capsys.readouterr()
+        changed = dict(sample_case, relief_requested=["declaratory relief only"])
+        execute_pipeline(state, changed)
+        out = capsys.readouterr().out
+        assert "JS-44 Civil Cover Sheet... done" in out
+        assert "Exhibit Index... up to date" in out
+
+    def test_force_regenerates(self, isolated_cases, sample_case, capsys):
+        state = self._state("inc-003", ["js44"])
+        execute_pipeline(state, sample_case)
+        execute_pipeline(state, sample_case, force=True)
+        assert "up to date" not in capsys.readouterr().out
+
+    def test_output_status_reports_stale(self, isolated_cases, sample_case):
+        from ftc_engine.wizard import output_status, format_output_status
+        state = self._state("inc-004", ["js44", "exhibits"])
+        execute_pipeline(state, sample_case)
+        assert dict(output_status(state, sample_case)) == {"js44": "current", "exhibits": "current"}
+        changed = dict(sample_case, relief_requested=["nominal damages"])
+        assert dict(output_status(state, changed)) == {"js44": "stale", "exhibits": "current"}
+        assert "1 output(s) out of date" in format_output_status(state, output_status(state, changed))
+
+    def test_district_change_marks_stale(self, isolated_cases, sample_case, tmp_path, monkeypatch):
+        from ftc_engine.districts import set_active_district
+        from ftc_engine.wizard import output_status
+        monkeypatch.setattr("ftc_engine.districts._CONFIG_FILE", tmp_path / "config.json")
+        monkeypatch.setattr("ftc_engine.districts._CONFIG_DIR", tmp_path)
+        set_active_district("mdfl", "Orlando")
+        state = self._state("inc-005", ["calendar", "questions", "js44"])
+        execute_pipeline(state, sample_case)
+        assert set(dict(output_status(state, sample_case)).values()) == {"current"}
+        set_active_district("mdfl", "Tampa")
+        assert dict(output_status(state, sample_case)) == {
+            "calendar": "stale", "questions": "stale", "js44": "current"}
+
+
 # ── Step collectors map ─────────────────────────────────────────────────────
 
 class TestStepCollectors: